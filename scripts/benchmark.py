@@ -0,0 +1,219 @@
+# times the generators on synthetic schemas of growing size, run from the repo root:
+#   python scripts/benchmark.py --leaves 100,1000,5000 --save-baseline benchmark.json
+#   python scripts/benchmark.py --leaves 100,1000,5000 --baseline benchmark.json
+import os
+import sys
+import math
+import json
+import time
+import random
+import shutil
+import argparse
+import tempfile
+from typing import Any, TypedDict
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import yaml
+import src.server
+import src.client
+import src.shared
+from src.config import CONFIG_PATH, DEFAULT_TABLE
+from src.schema import compile_schema
+
+BUILDERS = {
+	"shared": src.shared,
+	"client": src.client,
+	"server": src.server,
+}
+SCALAR_FIELD_TYPES = ["string", "double", "int", "boolean", "boolean?", "Color3", "DateTime", "string?", "Vector3Double"]
+LEAF_KINDS = ["int", "double", "string", "boolean"]
+REGRESSION_THRESHOLD = 0.2
+REGRESSION_FLOOR = 0.005 # seconds, below this differences are mostly noise
+
+class SchemaShape(TypedDict):
+	leaves: int
+	depth: int
+	types: int
+	container_density: float # share of leaves holding a List[] or Dict[] of a custom type
+
+class Sample(TypedDict):
+	shape: SchemaShape
+	timings: dict[str, float] # best wall time in seconds per output
+
+def generate_config(shape: SchemaShape, seed: int = 0) -> dict:
+	rng = random.Random(seed)
+
+	types: dict[str, Any] = {
+		"Rarity": ["Common", "Rare", "Epic", "Legendary"],
+	}
+	type_names: list[str] = []
+	for i in range(shape["types"]):
+		type_name = f"Item{i}"
+		definition: dict[str, Any] = {
+			"Name": "string",
+			"Rarity": "Rarity",
+		}
+		for j in range(rng.randint(3, 8)):
+			definition[f"Field{j}"] = rng.choice(SCALAR_FIELD_TYPES)
+		definition["Stats"] = {
+			"Level": "int",
+			"Boost": "double?",
+		}
+		# reference an earlier type now and then so nested types are exercised too
+		if len(type_names) > 0 and rng.random() < 0.3:
+			definition["Child"] = rng.choice(type_names) + "?"
+		types[type_name] = definition
+		type_names.append(type_name)
+
+	tree: dict[str, Any] = {}
+	for i in range(shape["leaves"]):
+		node = tree
+		for level in range(shape["depth"] - 1):
+			node = node.setdefault(f"Group{level}_{rng.randint(0, 3)}", {})
+
+		if len(type_names) > 0 and rng.random() < shape["container_density"]:
+			type_name = rng.choice(type_names)
+			if rng.random() < 0.5:
+				node[f"Leaf{i}::List[{type_name}]"] = []
+			else:
+				node[f"Leaf{i}::Dict[string, {type_name}]"] = {}
+			continue
+
+		kind = rng.choice(LEAF_KINDS)
+		if kind == "int":
+			node[f"Leaf{i}::int"] = rng.randint(0, 1000)
+		elif kind == "double":
+			node[f"Leaf{i}::double"] = round(rng.random()*100, 2)
+		elif kind == "string":
+			node[f"Leaf{i}"] = f"value {i}"
+		else:
+			node[f"Leaf{i}"] = rng.random() < 0.5
+
+	config = dict(DEFAULT_TABLE)
+	config["types"] = types
+	config["tree"] = tree
+	return config
+
+def time_builders(config: dict, repeats: int) -> dict[str, float]:
+	work_dir = tempfile.mkdtemp(prefix="datatree-bench-")
+	initial_dir = os.getcwd()
+	os.chdir(work_dir)
+	try:
+		file = open(CONFIG_PATH, "w")
+		file.write(yaml.safe_dump(config, sort_keys=False))
+		file.close()
+
+		timings: dict[str, float] = {}
+		start = time.perf_counter()
+		schema = compile_schema()
+		timings["schema"] = time.perf_counter() - start
+		for output_name, module in BUILDERS.items():
+			best = math.inf
+			for i in range(repeats):
+				start = time.perf_counter()
+				module.build(schema)
+				best = min(best, time.perf_counter() - start)
+			timings[output_name] = best
+		return timings
+	finally:
+		os.chdir(initial_dir)
+		shutil.rmtree(work_dir, ignore_errors=True)
+
+def write_unformatted(path: str, content: str, **kwargs) -> None:
+	dir_path = os.path.dirname(path)
+	if dir_path != "" and not os.path.exists(dir_path):
+		os.makedirs(dir_path)
+	file = open(path, "w")
+	file.write(content)
+	file.close()
+
+# slope of the log-log curve, 1 means time grows linearly with the leaf count
+def get_scaling_exponent(samples: list[Sample], output_name: str) -> float | None:
+	if len(samples) < 2:
+		return None
+	first, last = samples[0], samples[-1]
+	size_ratio = last["shape"]["leaves"] / first["shape"]["leaves"]
+	time_ratio = last["timings"][output_name] / max(first["timings"][output_name], 1e-9)
+	if size_ratio <= 1:
+		return None
+	return math.log(time_ratio) / math.log(size_ratio)
+
+def print_samples(samples: list[Sample], baseline: list[Sample] | None) -> list[str]:
+	output_names = list(samples[0]["timings"].keys())
+	width = 12 if baseline == None else 18
+	print("leaves".rjust(8) + "".join(name.rjust(width) for name in output_names))
+	regressions: list[str] = []
+	for i, sample in enumerate(samples):
+		line = str(sample["shape"]["leaves"]).rjust(8)
+		baseline_sample = baseline[i] if baseline != None and i < len(baseline) and baseline[i]["shape"] == sample["shape"] else None
+		for output_name in output_names:
+			duration = sample["timings"][output_name]
+			cell = f"{duration*1000:.1f}ms"
+			if baseline_sample != None and output_name in baseline_sample["timings"]:
+				change = duration / max(baseline_sample["timings"][output_name], 1e-9) - 1
+				cell += f" {change*100:+.0f}%"
+				if change > REGRESSION_THRESHOLD and duration - baseline_sample["timings"][output_name] > REGRESSION_FLOOR:
+					regressions.append(f"{output_name} at {sample['shape']['leaves']} leaves is {change*100:.0f}% slower")
+			line += cell.rjust(width)
+		print(line)
+
+	exponents = []
+	for output_name in output_names:
+		exponent = get_scaling_exponent(samples, output_name)
+		if exponent != None:
+			exponents.append(f"{output_name} ~n^{exponent:.2f}")
+	if len(exponents) > 0:
+		print("scaling: " + ", ".join(exponents))
+	return regressions
+
+def main():
+	parser = argparse.ArgumentParser(description="time the datatree generators on synthetic schemas")
+	parser.add_argument("--leaves", default="100,1000,5000", help="comma separated tree leaf counts to benchmark")
+	parser.add_argument("--depth", type=int, default=3, help="nesting depth of the tree")
+	parser.add_argument("--types", type=int, default=20, help="number of custom types")
+	parser.add_argument("--container-density", type=float, default=0.2, help="share of leaves that are lists or dicts of custom types")
+	parser.add_argument("--repeats", type=int, default=3, help="builds per output, the fastest is kept")
+	parser.add_argument("--seed", type=int, default=0)
+	parser.add_argument("--stylua", action="store_true", help="include formatting the scripts with stylua in the timings")
+	parser.add_argument("--baseline", help="compare against a recorded baseline, exiting with an error on regressions")
+	parser.add_argument("--save-baseline", help="record the results as a baseline")
+	args = parser.parse_args()
+
+	if not args.stylua:
+		# stylua is an external process, by default only the generators themselves are timed
+		for module in BUILDERS.values():
+			setattr(module, "write_script", write_unformatted)
+
+	samples: list[Sample] = []
+	for leaf_count in [int(count) for count in args.leaves.split(",")]:
+		shape: SchemaShape = {
+			"leaves": leaf_count,
+			"depth": args.depth,
+			"types": args.types,
+			"container_density": args.container_density,
+		}
+		samples.append({
+			"shape": shape,
+			"timings": time_builders(generate_config(shape, args.seed), args.repeats),
+		})
+
+	baseline: list[Sample] | None = None
+	if args.baseline != None:
+		file = open(args.baseline, "r")
+		baseline = json.loads(file.read())
+		file.close()
+
+	regressions = print_samples(samples, baseline)
+
+	if args.save_baseline != None:
+		file = open(args.save_baseline, "w")
+		file.write(json.dumps(samples, indent=2))
+		file.close()
+
+	if len(regressions) > 0:
+		print("regressions over " + f"{REGRESSION_THRESHOLD*100:.0f}%:\n" + "\n".join(regressions))
+		sys.exit(1)
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,260 @@
+# runs the generated server on a standalone luau interpreter, or translated onto luajit through lupa when there isn't
+# one, and counts the DataStore requests a play session makes with the example project or the one given:
+#   python scripts/runtime/harness.py
+#   python scripts/runtime/harness.py --update
+import os
+import re
+import sys
+import json
+import shutil
+import argparse
+import tempfile
+import subprocess
+from typing import Any, TypedDict
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import yaml
+import src.server
+import src.shared
+from src.config import CONFIG_PATH, get_config_paths
+from src.lock import LOCK_PATH
+from src.schema import compile_schema
+from translate import translate
+
+RUNTIME_DIR_PATH = os.path.dirname(os.path.abspath(__file__))
+PRELUDE_PATH = os.path.join(RUNTIME_DIR_PATH, "roblox.luau")
+SCENARIO_PATH = os.path.join(RUNTIME_DIR_PATH, "scenario.luau")
+COMPAT_PATH = os.path.join(RUNTIME_DIR_PATH, "compat.luau")
+BASELINE_PATH = os.path.join(RUNTIME_DIR_PATH, "baseline.json")
+EXAMPLE_DIR_PATH = os.path.join(os.path.dirname(os.path.dirname(RUNTIME_DIR_PATH)), "example")
+REPORT_PREFIX = "REPORT "
+SERVER_MODULE_NAME = "DataTreeService"
+MESSAGE_KEYS = ["FireClient", "FireClient bytes"]
+
+class Phase(TypedDict):
+	name: str
+	requests: dict[str, int]
+	duration: float
+	isTimedOut: bool
+
+class RuntimeReport(TypedDict):
+	players: int
+	phases: list[Phase]
+	errors: list[str]
+	warnings: list[str]
+
+def build_sources(project_dir: str, overrides: dict[str, Any]) -> tuple[dict[str, str], dict]:
+	sources: dict[str, str] = {}
+
+	def capture(name: str):
+		def write(path: str, content: str, **kwargs) -> None:
+			sources[name] = content
+		return write
+
+	src.shared.write_script = capture("shared")
+	src.server.write_script = capture("server")
+	src.shared.remove_all_path_variants = lambda *args, **kwargs: None
+	src.server.remove_all_path_variants = lambda *args, **kwargs: None
+
+	# built in a copy so the project's own outputs and build cache are left alone
+	work_dir = tempfile.mkdtemp(prefix="datatree-runtime-")
+	initial_dir = os.getcwd()
+	try:
+		os.chdir(project_dir)
+		for path in get_config_paths() + [LOCK_PATH]:
+			if os.path.exists(path):
+				dest_path = os.path.join(work_dir, path)
+				os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+				shutil.copyfile(path, dest_path)
+		if len(overrides) > 0:
+			config_path = os.path.join(work_dir, CONFIG_PATH)
+			file = open(config_path, "r")
+			config = yaml.safe_load(file.read())
+			file.close()
+			config.update(overrides)
+			file = open(config_path, "w")
+			file.write(yaml.safe_dump(config, sort_keys=False))
+			file.close()
+
+		os.chdir(work_dir)
+		schema = compile_schema()
+		src.shared.build(schema)
+		src.server.build(schema)
+		return sources, schema["config"]
+	finally:
+		os.chdir(initial_dir)
+		shutil.rmtree(work_dir, ignore_errors=True)
+
+def wrap_module(source: str) -> str:
+	# exported types are only allowed at the top level of a chunk
+	source = re.sub(r"^(\s*)export type ", r"\1type ", source, flags=re.MULTILINE)
+	return "function()\n" + source + "\nend"
+
+def read_file(path: str) -> str:
+	file = open(path, "r")
+	content = file.read()
+	file.close()
+	return content
+
+def assemble_bundle(sources: dict[str, str], config: dict, modules: dict[str, str], player_count: int) -> str:
+	shared_name = os.path.basename(config["build"]["shared_types_roblox_path"])
+	module_sources = {
+		shared_name: sources["shared"],
+		SERVER_MODULE_NAME: sources["server"],
+	}
+	for name, path in modules.items():
+		module_sources[name] = read_file(path)
+
+	lines = [read_file(PRELUDE_PATH)]
+	for name, source in module_sources.items():
+		lines.append(f"__modules[{json.dumps(name)}] = " + wrap_module(source))
+	lines += [
+		f"local PLAYER_COUNT = {player_count}",
+		f"local AUTOSAVE_INTERVAL = {max(config['autosave_interval'], 1)}",
+		read_file(SCENARIO_PATH),
+	]
+	return "\n".join(lines)
+
+def run_bundle(luau_path: str, bundle: str) -> RuntimeReport:
+	bundle_file = tempfile.NamedTemporaryFile("w", suffix=".luau", delete=False)
+	bundle_file.write(bundle)
+	bundle_file.close()
+	try:
+		result = subprocess.run([luau_path, bundle_file.name], capture_output=True, text=True)
+	finally:
+		os.remove(bundle_file.name)
+
+	report = read_report(result.stdout.splitlines())
+	if report is None:
+		raise RuntimeError(f"{luau_path} exited with {result.returncode} before reporting:\n{result.stdout}{result.stderr}")
+	return report
+
+def run_translated_bundle(bundle: str) -> RuntimeReport:
+	import lupa.luajit21
+
+	runtime = lupa.luajit21.LuaRuntime(unpack_returned_tuples=True)
+	output: list[str] = []
+	load = runtime.eval("function(source, name) local chunk, message = loadstring(source, name) return chunk, message end")
+	run = runtime.eval("function(chunk) local success, message = xpcall(chunk, debug.traceback) return success, message end")
+	runtime.globals()["print"] = runtime.eval("function(write) return function(...) local parts = {} for i = 1, select('#', ...) do parts[i] = tostring((select(i, ...))) end write(table.concat(parts, '\\t')) end end")(output.append)
+	for name, source in [("compat.luau", read_file(COMPAT_PATH)), ("bundle.luau", bundle)]:
+		chunk, message = load(translate(source), "=" + name)
+		if chunk is None:
+			raise RuntimeError(f"luajit couldn't load the translated {name}: {message}")
+		success, message = run(chunk)
+		if not success:
+			raise RuntimeError(f"luajit stopped before reporting: {message}\n" + "\n".join(output))
+
+	report = read_report(output)
+	if report is None:
+		raise RuntimeError("luajit finished without reporting:\n" + "\n".join(output))
+	return report
+
+def read_report(lines: list[str]) -> RuntimeReport | None:
+	for line in lines:
+		if line.startswith(REPORT_PREFIX):
+			report: RuntimeReport = json.loads(line[len(REPORT_PREFIX):])
+			# empty luau tables are encoded as arrays
+			for phase in report["phases"]:
+				phase["requests"] = phase["requests"] or {}
+			return report
+	return None
+
+def get_per_player(phase: Phase, players: int) -> dict[str, float]:
+	return {name: count / players for name, count in phase["requests"].items()}
+
+def print_report(report: RuntimeReport, baseline: RuntimeReport | None) -> list[str]:
+	players = report["players"]
+	baseline_phases = {phase["name"]: phase for phase in baseline["phases"]} if baseline is not None else {}
+	regressions: list[str] = []
+
+	print(f"requests per player, {players} players:")
+	for phase in report["phases"]:
+		print(f"  {phase['name']}{' (timed out)' if phase['isTimedOut'] else ''}")
+		per_player = get_per_player(phase, players)
+		baseline_per_player = get_per_player(baseline_phases[phase["name"]], baseline["players"]) if baseline is not None and phase["name"] in baseline_phases else None
+		names = sorted(set(per_player) | set(baseline_per_player or {}))
+		total = sum(count for name, count in per_player.items() if not name in MESSAGE_KEYS)
+		for name in names:
+			count = per_player.get(name, 0)
+			line = f"    {name.ljust(28)} {count:8.2f}"
+			if baseline_per_player is not None:
+				previous_count = baseline_per_player.get(name, 0)
+				line += f"  ({count - previous_count:+.2f})"
+				# any extra request is a regression, bytes sent to clients only when they grow noticeably
+				is_regression = count > previous_count * 1.1 if name == "FireClient bytes" else count > previous_count
+				if is_regression:
+					regressions.append(f"{phase['name']}: {name} went from {previous_count:.2f} to {count:.2f} per player")
+			print(line)
+		print(f"    {'total requests'.ljust(28)} {total:8.2f}")
+
+	if len(report["warnings"]) > 0:
+		print(f"warnings ({len(report['warnings'])}):")
+		for warning in sorted(set(report["warnings"])):
+			print("  " + warning)
+	if len(report["errors"]) > 0:
+		print(f"errors ({len(report['errors'])}):")
+		for error in sorted(set(report["errors"])):
+			print("  " + error)
+	return regressions
+
+def main():
+	parser = argparse.ArgumentParser(description="count the DataStore requests the generated server makes in a simulated play session")
+	parser.add_argument("--project", default=EXAMPLE_DIR_PATH, help="directory of the datatree.yaml to build")
+	parser.add_argument("--players", type=int, default=10, help="players joining and leaving together")
+	parser.add_argument("--luau", default="luau", help="path to the luau interpreter, the bundle is translated onto luajit when it isn't found")
+	parser.add_argument("--set", action="append", default=[], metavar="KEY=YAML", help="override a top level config key, ie storage=document")
+	parser.add_argument("--module", action="append", default=[], metavar="NAME=PATH", help="luau source for a module the config requires, ie a migration")
+	parser.add_argument("--bundle", help="also write the assembled script here")
+	parser.add_argument("--baseline", default=BASELINE_PATH, help="the recorded reports, one per set of overrides")
+	parser.add_argument("--update", action="store_true", help="record the report in the baseline instead of comparing against it")
+	args = parser.parse_args()
+
+	overrides: dict[str, Any] = {}
+	for entry in args.set:
+		key, value = entry.split("=", 1)
+		overrides[key] = yaml.safe_load(value)
+	modules: dict[str, str] = {}
+	for entry in args.module:
+		name, path = entry.split("=", 1)
+		modules[name] = path
+	# reports are recorded per set of overrides, as storage modes make different requests
+	case_name = " ".join(sorted(args.set)) or "default"
+
+	sources, config = build_sources(args.project, overrides)
+	bundle = assemble_bundle(sources, config, modules, args.players)
+	if args.bundle is not None:
+		file = open(args.bundle, "w")
+		file.write(bundle)
+		file.close()
+	if shutil.which(args.luau) is not None:
+		report = run_bundle(args.luau, bundle)
+	else:
+		print(f"luau interpreter not found at '{args.luau}', running the translated bundle on luajit")
+		report = run_translated_bundle(bundle)
+
+	baselines: dict[str, RuntimeReport] = json.loads(read_file(args.baseline)) if os.path.exists(args.baseline) else {}
+	baseline = None if args.update else baselines.get(case_name)
+	if not args.update and baseline is None:
+		print(f"no baseline recorded for {case_name}, record one with --update")
+
+	regressions = print_report(report, baseline)
+	is_failed = len(report["errors"]) > 0 or any(phase["isTimedOut"] for phase in report["phases"])
+
+	if args.update and not is_failed:
+		baselines[case_name] = report
+		file = open(args.baseline, "w")
+		file.write(json.dumps(baselines, indent="\t", sort_keys=True) + "\n")
+		file.close()
+		print(f"recorded {case_name} in {args.baseline}")
+
+	if is_failed:
+		sys.exit(1)
+	if len(regressions) > 0:
+		print("request regressions:\n" + "\n".join(regressions))
+		sys.exit(1)
+
+if __name__ == '__main__':
+	main()
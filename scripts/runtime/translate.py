@@ -0,0 +1,557 @@
+# translates luau source into lua 5.1 / luajit source, so the harness can run without a luau interpreter
+# only the syntax the generated scripts and the harness use is covered: types are dropped, casts removed, compound
+# assignments expanded, if expressions turned into table lookups, and continue into a goto at the end of the loop
+# lines are kept where they were, so errors point at the same line of the luau bundle
+import re
+from typing import TypedDict
+
+KEYWORDS = [
+	"and", "break", "do", "else", "elseif", "end", "false", "for", "function", "if", "in",
+	"local", "nil", "not", "or", "repeat", "return", "then", "true", "until", "while",
+]
+# longest first, so "..=" isn't read as ".." and "="
+OPERATORS = [
+	"...", "..=", "//=",
+	"..", "::", "==", "~=", "<=", ">=", "+=", "-=", "*=", "/=", "%=", "^=", "->", "//",
+	"+", "-", "*", "/", "%", "^", "#", "&", "~", "|", "<", ">", "=", "(", ")", "{", "}", "[", "]", ";", ":", ",", ".", "?",
+]
+COMPOUND_OPERATORS = {
+	"+=": "+",
+	"-=": "-",
+	"*=": "*",
+	"/=": "/",
+	"%=": "%",
+	"^=": "^",
+	"..=": "..",
+}
+BINARY_OPERATORS = ["+", "-", "*", "/", "%", "^", "..", "==", "~=", "<", "<=", ">", ">=", "and", "or"]
+UNARY_OPERATORS = ["not", "-", "#"]
+BLOCK_ENDS = ["end", "else", "elseif", "until"]
+
+class Token(TypedDict):
+	kind: str # name, keyword, number, string, op or eof
+	text: str
+	line: int
+
+# a piece of output and the source line it came from, 0 for text the translation adds
+Piece = tuple[str, int]
+
+class Loop(TypedDict):
+	label: str
+	has_continue: bool
+
+class Parser(TypedDict):
+	tokens: list[Token]
+	index: int
+	loops: list[Loop]
+	label_count: int
+
+class TranslateError(Exception):
+	pass
+
+LONG_BRACKET_PATTERN = re.compile(r"\[(=*)\[")
+NAME_PATTERN = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+NUMBER_PATTERN = re.compile(r"0[xX][0-9a-fA-F_]+|0[bB][01_]+|(?:[0-9][0-9_]*(?:\.[0-9_]*)?|\.[0-9][0-9_]*)(?:[eE][+-]?[0-9]+)?")
+
+def _read_long_bracket(source: str, index: int, line: int) -> int:
+	match = LONG_BRACKET_PATTERN.match(source, index)
+	assert match
+	close = "]" + match.group(1) + "]"
+	end = source.find(close, match.end())
+	if end == -1:
+		raise TranslateError(f"line {line}: unfinished long string or comment")
+	return end + len(close)
+
+def tokenize(source: str) -> list[Token]:
+	tokens: list[Token] = []
+	index = 0
+	line = 1
+	while index < len(source):
+		char = source[index]
+		if char == "\n":
+			line += 1
+			index += 1
+		elif char in " \t\r":
+			index += 1
+		elif source.startswith("--", index):
+			if LONG_BRACKET_PATTERN.match(source, index + 2):
+				end = _read_long_bracket(source, index + 2, line)
+			else:
+				end = source.find("\n", index)
+				end = len(source) if end == -1 else end
+			line += source.count("\n", index, end)
+			index = end
+		elif LONG_BRACKET_PATTERN.match(source, index):
+			end = _read_long_bracket(source, index, line)
+			tokens.append({"kind": "string", "text": source[index:end], "line": line})
+			line += source.count("\n", index, end)
+			index = end
+		elif char == "\"" or char == "'":
+			end = index + 1
+			while end < len(source) and source[end] != char:
+				if source[end] == "\\":
+					end += 1
+				elif source[end] == "\n":
+					raise TranslateError(f"line {line}: unfinished string")
+				end += 1
+			end += 1
+			text = source[index:end]
+			tokens.append({"kind": "string", "text": text, "line": line})
+			# a \z escape or escaped newline can carry the string over several lines
+			line += text.count("\n")
+			index = end
+		elif char == "`":
+			raise TranslateError(f"line {line}: interpolated strings aren't supported")
+		elif NAME_PATTERN.match(source, index):
+			match = NAME_PATTERN.match(source, index)
+			assert match
+			text = match.group(0)
+			tokens.append({"kind": "keyword" if text in KEYWORDS else "name", "text": text, "line": line})
+			index = match.end()
+		elif char.isdigit() or (char == "." and source[index + 1:index + 2].isdigit()):
+			match = NUMBER_PATTERN.match(source, index)
+			assert match
+			text = match.group(0).replace("_", "")
+			if text[0:2] in ["0b", "0B"]:
+				text = str(int(text[2:], 2))
+			tokens.append({"kind": "number", "text": text, "line": line})
+			index = match.end()
+		else:
+			for operator in OPERATORS:
+				if source.startswith(operator, index):
+					tokens.append({"kind": "op", "text": operator, "line": line})
+					index += len(operator)
+					break
+			else:
+				raise TranslateError(f"line {line}: unexpected character {char!r}")
+	tokens.append({"kind": "eof", "text": "<eof>", "line": line})
+	return tokens
+
+def _peek(parser: Parser, offset: int = 0) -> Token:
+	return parser["tokens"][min(parser["index"] + offset, len(parser["tokens"]) - 1)]
+
+def _take(parser: Parser) -> Token:
+	token = _peek(parser)
+	parser["index"] += 1
+	return token
+
+def _check(parser: Parser, text: str, offset: int = 0) -> bool:
+	token = _peek(parser, offset)
+	return token["text"] == text and token["kind"] in ["op", "keyword"]
+
+def _expect(parser: Parser, text: str) -> Piece:
+	token = _take(parser)
+	if token["text"] != text or not token["kind"] in ["op", "keyword"]:
+		raise TranslateError(f"line {token['line']}: expected '{text}' near '{token['text']}'")
+	return (token["text"], token["line"])
+
+def _expect_name(parser: Parser) -> Piece:
+	token = _take(parser)
+	if token["kind"] != "name":
+		raise TranslateError(f"line {token['line']}: expected a name near '{token['text']}'")
+	return (token["text"], token["line"])
+
+def _emit(token: Token) -> Piece:
+	return (token["text"], token["line"])
+
+# types
+
+def _skip_balanced(parser: Parser, opener: str, closer: str) -> None:
+	_expect(parser, opener)
+	depth = 1
+	while depth > 0:
+		token = _take(parser)
+		if token["kind"] == "eof":
+			raise TranslateError(f"line {token['line']}: unclosed '{opener}'")
+		elif token["kind"] == "op" and token["text"] == opener:
+			depth += 1
+		elif token["kind"] == "op" and token["text"] == closer:
+			depth -= 1
+
+def _skip_simple_type(parser: Parser) -> None:
+	token = _peek(parser)
+	if token["kind"] == "name" and token["text"] == "typeof" and _check(parser, "(", 1):
+		_take(parser)
+		_skip_balanced(parser, "(", ")")
+	elif token["kind"] == "name":
+		_take(parser)
+		if _check(parser, ".") and _peek(parser, 1)["kind"] == "name":
+			_take(parser)
+			_take(parser)
+		if _check(parser, "<"):
+			_skip_balanced(parser, "<", ">")
+	elif token["kind"] == "string" or token["text"] in ["nil", "true", "false"]:
+		_take(parser)
+	elif _check(parser, "{"):
+		_skip_balanced(parser, "{", "}")
+	elif _check(parser, "(") or _check(parser, "<"):
+		# a type pack or function type, which can be generic
+		if _check(parser, "<"):
+			_skip_balanced(parser, "<", ">")
+		_skip_balanced(parser, "(", ")")
+		if _check(parser, "->"):
+			_take(parser)
+			_skip_type(parser)
+	elif _check(parser, "..."):
+		_take(parser)
+		next_token = _peek(parser)
+		if next_token["kind"] == "name" or next_token["text"] in ["(", "{"]:
+			_skip_simple_type(parser)
+	else:
+		raise TranslateError(f"line {token['line']}: expected a type near '{token['text']}'")
+
+	while _check(parser, "?"):
+		_take(parser)
+
+def _skip_type(parser: Parser) -> None:
+	if _check(parser, "|") or _check(parser, "&"):
+		_take(parser)
+	_skip_simple_type(parser)
+	while _check(parser, "|") or _check(parser, "&"):
+		_take(parser)
+		_skip_simple_type(parser)
+
+def _skip_annotation(parser: Parser) -> None:
+	if _check(parser, ":"):
+		_take(parser)
+		_skip_type(parser)
+
+def _get_if_type_declaration(parser: Parser) -> bool:
+	token = _peek(parser)
+	if token["kind"] != "name":
+		return False
+	offset = 0
+	if token["text"] == "export":
+		if _peek(parser, 1)["text"] != "type":
+			return False
+		offset = 1
+	elif token["text"] != "type":
+		return False
+	return _peek(parser, offset + 1)["kind"] == "name" and (_check(parser, "=", offset + 2) or _check(parser, "<", offset + 2))
+
+def _skip_type_declaration(parser: Parser) -> None:
+	if _peek(parser)["text"] == "export":
+		_take(parser)
+	_take(parser)
+	_expect_name(parser)
+	if _check(parser, "<"):
+		_skip_balanced(parser, "<", ">")
+	_expect(parser, "=")
+	_skip_type(parser)
+
+# expressions
+
+def _parse_expression_list(parser: Parser) -> list[Piece]:
+	pieces = _parse_expression(parser)
+	while _check(parser, ","):
+		pieces.append(_emit(_take(parser)))
+		pieces += _parse_expression(parser)
+	return pieces
+
+# operators are copied in order, so precedence only matters to luau's if expressions, which take the rest of the expression
+def _parse_expression(parser: Parser) -> list[Piece]:
+	pieces: list[Piece] = []
+	while _peek(parser)["text"] in UNARY_OPERATORS and _peek(parser)["kind"] in ["op", "keyword"]:
+		pieces.append(_emit(_take(parser)))
+	pieces += _parse_simple_expression(parser)
+	while _peek(parser)["text"] in BINARY_OPERATORS and _peek(parser)["kind"] in ["op", "keyword"]:
+		pieces.append(_emit(_take(parser)))
+		while _peek(parser)["text"] in UNARY_OPERATORS and _peek(parser)["kind"] in ["op", "keyword"]:
+			pieces.append(_emit(_take(parser)))
+		pieces += _parse_simple_expression(parser)
+	return pieces
+
+def _parse_simple_expression(parser: Parser) -> list[Piece]:
+	token = _peek(parser)
+	pieces: list[Piece]
+	if token["kind"] in ["number", "string"] or token["text"] in ["nil", "true", "false", "..."]:
+		pieces = [_emit(_take(parser))]
+	elif _check(parser, "{"):
+		pieces = _parse_table(parser)
+	elif _check(parser, "function"):
+		pieces = [_emit(_take(parser))] + _parse_function_body(parser)
+	elif _check(parser, "if"):
+		pieces = _parse_if_expression(parser)
+	else:
+		pieces = _parse_suffixed_expression(parser)
+
+	# casts only tell the type checker what the value is
+	while _check(parser, "::"):
+		_take(parser)
+		_skip_type(parser)
+	return pieces
+
+def _parse_if_expression(parser: Parser) -> list[Piece]:
+	# wrapping each branch in a table keeps nil and false results, and only the chosen branch is evaluated
+	line = _take(parser)["line"]
+	branches: list[tuple[list[Piece], list[Piece]]] = []
+	condition = _parse_expression(parser)
+	_expect(parser, "then")
+	branches.append((condition, _parse_expression(parser)))
+	while _check(parser, "elseif"):
+		_take(parser)
+		condition = _parse_expression(parser)
+		_expect(parser, "then")
+		branches.append((condition, _parse_expression(parser)))
+	_expect(parser, "else")
+	pieces: list[Piece] = [("{", line)] + _parse_expression(parser) + [("}", 0)]
+	for condition, value in reversed(branches):
+		pieces = [("((", line)] + condition + [(") and {", 0)] + value + [("} or", 0)] + pieces + [(")", 0)]
+	return pieces + [("[1]", 0)]
+
+def _parse_table(parser: Parser) -> list[Piece]:
+	pieces = [_expect(parser, "{")]
+	while not _check(parser, "}"):
+		if _check(parser, "["):
+			pieces.append(_emit(_take(parser)))
+			pieces += _parse_expression(parser)
+			pieces.append(_expect(parser, "]"))
+			pieces.append(_expect(parser, "="))
+		elif _peek(parser)["kind"] == "name" and _check(parser, "=", 1):
+			pieces.append(_emit(_take(parser)))
+			pieces.append(_emit(_take(parser)))
+		pieces += _parse_expression(parser)
+		if _check(parser, ",") or _check(parser, ";"):
+			pieces.append(_emit(_take(parser)))
+		elif not _check(parser, "}"):
+			token = _peek(parser)
+			raise TranslateError(f"line {token['line']}: expected '}}' near '{token['text']}'")
+	pieces.append(_expect(parser, "}"))
+	return pieces
+
+def _parse_call_arguments(parser: Parser) -> list[Piece]:
+	token = _peek(parser)
+	if token["kind"] == "string":
+		return [_emit(_take(parser))]
+	elif _check(parser, "{"):
+		return _parse_table(parser)
+	pieces = [_expect(parser, "(")]
+	if not _check(parser, ")"):
+		pieces += _parse_expression_list(parser)
+	pieces.append(_expect(parser, ")"))
+	return pieces
+
+def _parse_suffixed_expression(parser: Parser) -> list[Piece]:
+	token = _peek(parser)
+	pieces: list[Piece]
+	if token["kind"] == "name":
+		pieces = [_emit(_take(parser))]
+	elif _check(parser, "("):
+		pieces = [_emit(_take(parser))] + _parse_expression(parser) + [_expect(parser, ")")]
+	else:
+		raise TranslateError(f"line {token['line']}: unexpected '{token['text']}'")
+
+	while True:
+		token = _peek(parser)
+		if _check(parser, "."):
+			pieces.append(_emit(_take(parser)))
+			pieces.append(_expect_name(parser))
+		elif _check(parser, "["):
+			pieces.append(_emit(_take(parser)))
+			pieces += _parse_expression(parser)
+			pieces.append(_expect(parser, "]"))
+		elif _check(parser, ":"):
+			pieces.append(_emit(_take(parser)))
+			pieces.append(_expect_name(parser))
+			pieces += _parse_call_arguments(parser)
+		elif _check(parser, "(") or _check(parser, "{") or token["kind"] == "string":
+			pieces += _parse_call_arguments(parser)
+		else:
+			return pieces
+
+def _parse_function_body(parser: Parser) -> list[Piece]:
+	if _check(parser, "<"):
+		_skip_balanced(parser, "<", ">")
+	pieces = [_expect(parser, "(")]
+	while not _check(parser, ")"):
+		if _check(parser, "..."):
+			pieces.append(_emit(_take(parser)))
+		else:
+			pieces.append(_expect_name(parser))
+		_skip_annotation(parser)
+		if _check(parser, ","):
+			pieces.append(_emit(_take(parser)))
+	pieces.append(_expect(parser, ")"))
+	_skip_annotation(parser)
+
+	# a loop's continue can't reach out of a function defined inside it
+	loops = parser["loops"]
+	parser["loops"] = []
+	pieces += _parse_block(parser)
+	parser["loops"] = loops
+	pieces.append(_expect(parser, "end"))
+	return pieces
+
+# statements
+
+def _parse_block(parser: Parser) -> list[Piece]:
+	pieces: list[Piece] = []
+	while not (_peek(parser)["text"] in BLOCK_ENDS and _peek(parser)["kind"] == "keyword") and _peek(parser)["kind"] != "eof":
+		pieces += _parse_statement(parser)
+	return pieces
+
+def _parse_loop_body(parser: Parser) -> list[Piece]:
+	parser["label_count"] += 1
+	loop: Loop = {"label": f"__continue{parser['label_count']}", "has_continue": False}
+	parser["loops"].append(loop)
+	body = _parse_block(parser)
+	parser["loops"].pop()
+	if loop["has_continue"]:
+		# the body gets its own block, so the goto never jumps into the scope of one of its locals
+		body = [("do", 0)] + body + [("end ::" + loop["label"] + "::", 0)]
+	return body
+
+def _get_if_continue(parser: Parser) -> bool:
+	token = _peek(parser)
+	if token["kind"] != "name" or token["text"] != "continue":
+		return False
+	next_token = _peek(parser, 1)
+	return next_token["kind"] in ["keyword", "eof"] or next_token["text"] == ";" or next_token["line"] > token["line"]
+
+def _parse_statement(parser: Parser) -> list[Piece]:
+	token = _peek(parser)
+	pieces: list[Piece] = []
+	if _check(parser, ";"):
+		return [_emit(_take(parser))]
+	elif _get_if_type_declaration(parser):
+		_skip_type_declaration(parser)
+		return []
+	elif _get_if_continue(parser):
+		_take(parser)
+		if len(parser["loops"]) == 0:
+			raise TranslateError(f"line {token['line']}: continue outside of a loop")
+		loop = parser["loops"][-1]
+		loop["has_continue"] = True
+		return [("goto " + loop["label"], token["line"])]
+	elif _check(parser, "local"):
+		pieces.append(_emit(_take(parser)))
+		if _check(parser, "function"):
+			pieces.append(_emit(_take(parser)))
+			pieces.append(_expect_name(parser))
+			return pieces + _parse_function_body(parser)
+		pieces.append(_expect_name(parser))
+		_skip_annotation(parser)
+		while _check(parser, ","):
+			pieces.append(_emit(_take(parser)))
+			pieces.append(_expect_name(parser))
+			_skip_annotation(parser)
+		if _check(parser, "="):
+			pieces.append(_emit(_take(parser)))
+			pieces += _parse_expression_list(parser)
+		return pieces
+	elif _check(parser, "function"):
+		pieces.append(_emit(_take(parser)))
+		pieces.append(_expect_name(parser))
+		while _check(parser, "."):
+			pieces.append(_emit(_take(parser)))
+			pieces.append(_expect_name(parser))
+		if _check(parser, ":"):
+			pieces.append(_emit(_take(parser)))
+			pieces.append(_expect_name(parser))
+		return pieces + _parse_function_body(parser)
+	elif _check(parser, "if"):
+		pieces.append(_emit(_take(parser)))
+		pieces += _parse_expression(parser)
+		pieces.append(_expect(parser, "then"))
+		pieces += _parse_block(parser)
+		while _check(parser, "elseif"):
+			pieces.append(_emit(_take(parser)))
+			pieces += _parse_expression(parser)
+			pieces.append(_expect(parser, "then"))
+			pieces += _parse_block(parser)
+		if _check(parser, "else"):
+			pieces.append(_emit(_take(parser)))
+			pieces += _parse_block(parser)
+		pieces.append(_expect(parser, "end"))
+		return pieces
+	elif _check(parser, "while"):
+		pieces.append(_emit(_take(parser)))
+		pieces += _parse_expression(parser)
+		pieces.append(_expect(parser, "do"))
+		pieces += _parse_loop_body(parser)
+		pieces.append(_expect(parser, "end"))
+		return pieces
+	elif _check(parser, "for"):
+		pieces.append(_emit(_take(parser)))
+		pieces.append(_expect_name(parser))
+		_skip_annotation(parser)
+		if _check(parser, "="):
+			pieces.append(_emit(_take(parser)))
+			pieces += _parse_expression_list(parser)
+		else:
+			while _check(parser, ","):
+				pieces.append(_emit(_take(parser)))
+				pieces.append(_expect_name(parser))
+				_skip_annotation(parser)
+			pieces.append(_expect(parser, "in"))
+			pieces += _parse_expression_list(parser)
+		pieces.append(_expect(parser, "do"))
+		pieces += _parse_loop_body(parser)
+		pieces.append(_expect(parser, "end"))
+		return pieces
+	elif _check(parser, "do"):
+		pieces.append(_emit(_take(parser)))
+		pieces += _parse_block(parser)
+		pieces.append(_expect(parser, "end"))
+		return pieces
+	elif _check(parser, "repeat"):
+		pieces.append(_emit(_take(parser)))
+		# the until condition can see the body's locals, which a goto past them would break
+		loops = parser["loops"]
+		parser["loops"] = []
+		pieces += _parse_block(parser)
+		parser["loops"] = loops
+		pieces.append(_expect(parser, "until"))
+		return pieces + _parse_expression(parser)
+	elif _check(parser, "return"):
+		pieces.append(_emit(_take(parser)))
+		next_token = _peek(parser)
+		if not (next_token["text"] in BLOCK_ENDS and next_token["kind"] == "keyword") and next_token["kind"] != "eof" and not _check(parser, ";"):
+			pieces += _parse_expression_list(parser)
+		return pieces
+	elif _check(parser, "break"):
+		return [_emit(_take(parser))]
+
+	# a call, an assignment or a compound assignment
+	target = _parse_suffixed_expression(parser)
+	operator = _peek(parser)
+	if operator["kind"] == "op" and operator["text"] in COMPOUND_OPERATORS:
+		_take(parser)
+		# the target is evaluated twice, which is fine for the plain variables and fields it's used on
+		return target + [("=", operator["line"])] + target + [(COMPOUND_OPERATORS[operator["text"]] + " (", 0)] + _parse_expression(parser) + [(")", 0)]
+	elif _check(parser, "=") or _check(parser, ","):
+		pieces = target
+		while _check(parser, ","):
+			pieces.append(_emit(_take(parser)))
+			pieces += _parse_suffixed_expression(parser)
+		pieces.append(_expect(parser, "="))
+		return pieces + _parse_expression_list(parser)
+	elif target[-1][0] not in [")", "}"] and not target[-1][0].startswith(("\"", "'", "[")):
+		raise TranslateError(f"line {token['line']}: expected a call or an assignment near '{token['text']}'")
+	return target
+
+def join_pieces(pieces: list[Piece]) -> str:
+	out: list[str] = []
+	line = 1
+	for text, piece_line in pieces:
+		if piece_line > line:
+			out.append("\n" * (piece_line - line))
+			line = piece_line
+		elif len(out) > 0:
+			out.append(" ")
+		out.append(text)
+		line += text.count("\n")
+	return "".join(out) + "\n"
+
+def translate(source: str) -> str:
+	parser: Parser = {
+		"tokens": tokenize(source),
+		"index": 0,
+		"loops": [],
+		"label_count": 0,
+	}
+	pieces = _parse_block(parser)
+	token = _peek(parser)
+	if token["kind"] != "eof":
+		raise TranslateError(f"line {token['line']}: unexpected '{token['text']}'")
+	return join_pieces(pieces)
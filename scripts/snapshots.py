@@ -0,0 +1,226 @@
+# builds a matrix of schemas and compares the generated scripts against the recorded ones, run from the repo root:
+#   python scripts/snapshots.py
+#   python scripts/snapshots.py --update
+#   python scripts/snapshots.py --growth 100,1000,5000
+import os
+import sys
+import math
+import shutil
+import difflib
+import argparse
+import tempfile
+from typing import Any, TypedDict
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import yaml
+import src.server
+import src.client
+import src.shared
+from src.config import CONFIG_PATH
+from src.lock import LOCK_PATH
+from src.schema import compile_schema
+from benchmark import SchemaShape, generate_config
+
+SNAPSHOT_DIR_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "snapshots")
+CASES_PATH = os.path.join(SNAPSHOT_DIR_PATH, "cases.yaml")
+EXAMPLE_DIR_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "example")
+BUILDERS = {
+	"shared": src.shared,
+	"client": src.client,
+	"server": src.server,
+}
+DIFF_LINE_LIMIT = 40
+
+class Budget(TypedDict, total=False):
+	server_bytes: int
+	server_lines: int
+	smaller_than: str # name of a case whose server script this one has to be smaller than
+
+class SnapshotCase(TypedDict, total=False):
+	overrides: dict[str, Any] # top level config keys replaced on the example or synthetic config
+	synthetic: SchemaShape # generate the config like the benchmark does instead
+	budget: Budget
+
+class SnapshotManifest(TypedDict):
+	budget: Budget
+	cases: dict[str, SnapshotCase]
+
+def load_manifest() -> SnapshotManifest:
+	file = open(CASES_PATH, "r")
+	data = yaml.safe_load(file.read())
+	file.close()
+	return {
+		"budget": data.get("budget") or {},
+		"cases": data.get("cases") or {},
+	}
+
+def capture_builders(sources: dict[str, str]) -> None:
+	for output_name, module in BUILDERS.items():
+		def write(path: str, content: str, output_name=output_name, **kwargs) -> None:
+			sources[output_name] = content
+		setattr(module, "write_script", write)
+		setattr(module, "remove_all_path_variants", lambda *args, **kwargs: None)
+
+# scripts are compared before stylua runs, so the recorded output doesn't depend on its version
+def build_outputs(config: dict, lock_text: str | None) -> dict[str, str]:
+	sources: dict[str, str] = {}
+	capture_builders(sources)
+
+	work_dir = tempfile.mkdtemp(prefix="datatree-snapshot-")
+	initial_dir = os.getcwd()
+	os.chdir(work_dir)
+	try:
+		file = open(CONFIG_PATH, "w")
+		file.write(yaml.safe_dump(config, sort_keys=False))
+		file.close()
+		if lock_text != None:
+			file = open(LOCK_PATH, "w")
+			file.write(lock_text)
+			file.close()
+
+		schema = compile_schema()
+		for module in BUILDERS.values():
+			module.build(schema)
+		return sources
+	finally:
+		os.chdir(initial_dir)
+		shutil.rmtree(work_dir, ignore_errors=True)
+
+def read_file(path: str) -> str | None:
+	if not os.path.exists(path):
+		return None
+	file = open(path, "r")
+	content = file.read()
+	file.close()
+	return content
+
+def get_case_config(case: SnapshotCase) -> tuple[dict, str | None]:
+	synthetic = case.get("synthetic")
+	if synthetic != None:
+		config = generate_config(synthetic)
+		lock_text = None
+	else:
+		config = yaml.safe_load(read_file(os.path.join(EXAMPLE_DIR_PATH, CONFIG_PATH)) or "")
+		lock_text = read_file(os.path.join(EXAMPLE_DIR_PATH, LOCK_PATH))
+	config.update(case.get("overrides") or {})
+	return config, lock_text
+
+def get_snapshot_path(case_name: str, output_name: str) -> str:
+	return os.path.join(SNAPSHOT_DIR_PATH, case_name, output_name + ".lua")
+
+def get_line_count(content: str) -> int:
+	return content.count("\n") + 1
+
+def check_budget(case_name: str, server: str, budget: Budget) -> list[str]:
+	failures: list[str] = []
+	byte_count = len(server.encode("utf-8"))
+	line_count = get_line_count(server)
+	if "server_bytes" in budget and byte_count > budget["server_bytes"]:
+		failures.append(f"{case_name}: server is {byte_count} bytes, over the budget of {budget['server_bytes']}")
+	if "server_lines" in budget and line_count > budget["server_lines"]:
+		failures.append(f"{case_name}: server is {line_count} lines, over the budget of {budget['server_lines']}")
+	return failures
+
+def check_smaller_than(case_name: str, server: str, other_case_name: str, other_server: str) -> list[str]:
+	byte_count = len(server.encode("utf-8"))
+	other_byte_count = len(other_server.encode("utf-8"))
+	if byte_count >= other_byte_count:
+		return [f"{case_name}: server is {byte_count} bytes, not smaller than the {other_byte_count} of {other_case_name}"]
+	return []
+
+def check_case(case_name: str, outputs: dict[str, str], is_update: bool) -> list[str]:
+	failures: list[str] = []
+	for output_name, content in outputs.items():
+		path = get_snapshot_path(case_name, output_name)
+		if is_update:
+			os.makedirs(os.path.dirname(path), exist_ok=True)
+			file = open(path, "w")
+			file.write(content)
+			file.close()
+			continue
+
+		recorded = read_file(path)
+		if recorded == None:
+			failures.append(f"{case_name}: no recorded {output_name}, run with --update to record it")
+		elif recorded != content:
+			diff = list(difflib.unified_diff(recorded.splitlines(), content.splitlines(), f"{case_name}/{output_name} recorded", f"{case_name}/{output_name} built", lineterm=""))
+			if len(diff) > DIFF_LINE_LIMIT:
+				diff = diff[:DIFF_LINE_LIMIT] + [f"... {len(diff) - DIFF_LINE_LIMIT} more diff lines"]
+			failures.append(f"{case_name}: {output_name} differs from the recorded output\n" + "\n".join(diff))
+	return failures
+
+def print_growth(leaf_counts: list[int], type_count: int, overrides: dict[str, Any]) -> None:
+	print("leaves".rjust(8) + "server bytes".rjust(14) + "lines".rjust(10) + "bytes/leaf".rjust(12))
+	sizes: list[tuple[int, int]] = []
+	for leaf_count in leaf_counts:
+		shape: SchemaShape = {
+			"leaves": leaf_count,
+			"depth": 3,
+			"types": type_count,
+			"container_density": 0.2,
+		}
+		config = generate_config(shape)
+		config.update(overrides)
+		server = build_outputs(config, None)["server"]
+		byte_count = len(server.encode("utf-8"))
+		sizes.append((leaf_count, byte_count))
+		print(str(leaf_count).rjust(8) + str(byte_count).rjust(14) + str(get_line_count(server)).rjust(10) + f"{byte_count / leaf_count:.0f}".rjust(12))
+
+	# slope of the log-log curve, 1 means the script grows linearly with the leaf count
+	if len(sizes) > 1 and sizes[-1][0] > sizes[0][0]:
+		exponent = math.log(sizes[-1][1] / sizes[0][1]) / math.log(sizes[-1][0] / sizes[0][0])
+		marginal = (sizes[-1][1] - sizes[0][1]) / (sizes[-1][0] - sizes[0][0])
+		print(f"scaling: server ~n^{exponent:.2f}, {marginal:.0f} bytes per added leaf")
+
+def main():
+	parser = argparse.ArgumentParser(description="compare the generated scripts against recorded snapshots and size budgets")
+	parser.add_argument("cases", nargs="*", help="only check these cases")
+	parser.add_argument("--update", action="store_true", help="record the built scripts as the new snapshots")
+	parser.add_argument("--growth", help="comma separated leaf counts to report the server size of on synthetic schemas")
+	parser.add_argument("--types", type=int, default=20, help="number of custom types in the --growth schemas")
+	parser.add_argument("--set", action="append", default=[], metavar="KEY=YAML", help="override a top level config key of the --growth schemas, ie serializers=tables")
+	args = parser.parse_args()
+
+	manifest = load_manifest()
+	case_names = args.cases if len(args.cases) > 0 else list(manifest["cases"].keys())
+	failures: list[str] = []
+	servers: dict[str, str] = {}
+	for case_name in case_names:
+		assert case_name in manifest["cases"], f"no snapshot case named {case_name} in {CASES_PATH}"
+		case = manifest["cases"][case_name]
+		config, lock_text = get_case_config(case)
+		outputs = build_outputs(config, lock_text)
+		servers[case_name] = outputs["server"]
+
+		case_failures = check_case(case_name, outputs, args.update)
+		case_failures += check_budget(case_name, outputs["server"], {**manifest["budget"], **(case.get("budget") or {})})
+		failures += case_failures
+
+		server = outputs["server"]
+		status = "updated" if args.update else ("ok" if len(case_failures) == 0 else "FAILED")
+		print(f"{case_name.ljust(24)} server {len(server.encode('utf-8')):8d} bytes {get_line_count(server):6d} lines  {status}")
+
+	# compared once every case is built, building the other case too when it wasn't selected
+	for case_name in case_names:
+		other_case_name = {**manifest["budget"], **(manifest["cases"][case_name].get("budget") or {})}.get("smaller_than")
+		if other_case_name == None:
+			continue
+		assert other_case_name in manifest["cases"], f"no snapshot case named {other_case_name} in {CASES_PATH}"
+		if not other_case_name in servers:
+			servers[other_case_name] = build_outputs(*get_case_config(manifest["cases"][other_case_name]))["server"]
+		failures += check_smaller_than(case_name, servers[case_name], other_case_name, servers[other_case_name])
+
+	if args.growth != None:
+		overrides: dict[str, Any] = {}
+		for entry in args.set:
+			key, value = entry.split("=", 1)
+			overrides[key] = yaml.safe_load(value)
+		print_growth([int(count) for count in args.growth.split(",")], args.types, overrides)
+
+	if len(failures) > 0:
+		print("\n" + "\n\n".join(failures))
+		sys.exit(1)
+
+if __name__ == '__main__':
+	main()
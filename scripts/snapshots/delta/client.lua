@@ -0,0 +1,167 @@
+--!strict
+-- this script was generated by nightcycle/datatree, do not manually edit
+
+--Services
+local RunService = game:GetService("RunService")
+local Players = game:GetService("Players")
+
+--Packages
+local NetworkUtil = require(script:WaitForChild("Packages"):WaitForChild("NetworkUtil"))
+local Maid = require(script:WaitForChild("Packages"):WaitForChild("Maid"))
+local ServiceProxy = require(script:WaitForChild("Packages"):WaitForChild("ServiceProxy"))
+
+--Modules
+local DataTypes = require(game:GetService("ReplicatedStorage"):WaitForChild("Shared"):WaitForChild("DataTreeTypes"))
+
+--Types
+type Maid = Maid.Maid
+export type Receiver<T> = () -> T
+type DeltaChange = { any }
+export type VehicleType = DataTypes.VehicleType
+export type PermissionData = DataTypes.PermissionData
+export type PerformanceData = DataTypes.PerformanceData
+export type VehicleData = DataTypes.VehicleData
+
+export type DataTree = {
+	CompanyName: Receiver<string>,
+	State: Receiver<Enum.HumanoidStateType>,
+	Location: Receiver<CFrame>,
+	init: (maid: Maid) -> nil,
+	Currency: {
+		Cash: Receiver<number>,
+		VehicleCredits: Receiver<number>,
+	},
+	Garage: {
+		Slots: Receiver<{[number]: VehicleData}>,
+		Permissions: Receiver<{[number]: PermissionData?}>,
+	},
+}
+
+--Constants
+local GET_SUFFIX = "DATA_TREE_CLT_GET"
+local UPDATE_SUFFIX = "DATA_TREE_CLT_UPDATE"
+local SNAPSHOT_SUFFIX = "DATA_TREE_CLT_SNAPSHOT"
+
+-- Class
+local tree: DataTree = {} :: any
+local values = {}
+local versions: { [string]: number } = {}
+
+-- returns a copy of value with the change applied, only the tables along its path are copied
+function _applyChange(value: any, keys: { any }, depth: number, change: DeltaChange): any
+	if depth <= #keys then
+		local key = keys[depth]
+		local copy = if type(value) == "table" then table.clone(value) else {}
+		copy[key] = _applyChange(copy[key], keys, depth + 1, change)
+		return copy
+	end
+	
+	local action = change[1]
+	if action == "s" then
+		return change[3]
+	elseif action == "r" then
+		return nil
+	end
+	local list = table.clone(value)
+	if action == "i" then
+		table.insert(list, change[3], change[4])
+	else
+		table.remove(list, change[3])
+	end
+	return list
+end
+
+function tree.init(maid: Maid): nil
+	local function connectUpdate(scope: string, callback: (...any) -> ())
+		local updateKey = scope .. "_" .. UPDATE_SUFFIX
+		if RunService:IsRunning() then
+			maid:GiveTask(NetworkUtil.onClientEventAt(updateKey, Players.LocalPlayer, callback))
+		else
+			maid:GiveTask(NetworkUtil.getBindableEvent(updateKey).Event:Connect(callback))
+		end
+	end
+	
+	local function fetchValue(scope: string): ...any
+		local getKey = scope .. "_" .. GET_SUFFIX
+		if RunService:IsRunning() then
+			return NetworkUtil.getRemoteFunction(getKey, Players.LocalPlayer):InvokeServer()
+		else
+			return NetworkUtil.getBindableFunction(getKey):Invoke()
+		end
+	end
+	
+	-- every value is fetched in one round trip, receivers missing from it fall back to fetching their own
+	local snapshot: { [string]: { any } } = {}
+	local snapshotEntries: { { any } }
+	if RunService:IsRunning() then
+		snapshotEntries = NetworkUtil.getRemoteFunction(SNAPSHOT_SUFFIX, Players.LocalPlayer):InvokeServer()
+	else
+		snapshotEntries = NetworkUtil.getBindableFunction(SNAPSHOT_SUFFIX):Invoke()
+	end
+	for i, entry in ipairs(snapshotEntries) do
+		snapshot[entry[1]] = entry
+	end
+	
+	local function newReceiver<T>(scope: string): Receiver<T>
+		local isFetching = false
+		local function sync()
+			isFetching = true
+			local value, version = fetchValue(scope)
+			isFetching = false
+			if versions[scope] == nil or version > versions[scope] then
+				values[scope] = value
+				versions[scope] = version
+			end
+		end
+		
+		local entry = snapshot[scope]
+		if entry then
+			versions[scope] = entry[2]
+			values[scope] = entry[3]
+		end
+		
+		connectUpdate(scope, function(version: number, changes: { DeltaChange })
+			local currentVersion = versions[scope]
+			if currentVersion == nil or version <= currentVersion then
+				return
+			elseif version == currentVersion + 1 then
+				local value = values[scope]
+				for i, change in ipairs(changes) do
+					value = _applyChange(value, change[2], 1, change)
+				end
+				values[scope] = value
+				versions[scope] = version
+			elseif not isFetching then
+				-- a change went missing, start over from the server's current value
+				task.spawn(sync)
+			end
+		end)
+		if not entry then
+			sync()
+		end
+		
+		return function(): T
+			return values[scope] :: any
+		end
+	end
+
+	tree = {
+		["CompanyName"] = newReceiver("CompanyName"),
+		["State"] = newReceiver("State"),
+		["Location"] = newReceiver("Location"),
+		["Currency"] = {
+			["Cash"] = newReceiver("Currency/Cash"),
+			["VehicleCredits"] = newReceiver("Currency/VehicleCredits"),
+		},
+		["Garage"] = {
+			["Slots"] = newReceiver("Garage/Slots"),
+			["Permissions"] = newReceiver("Garage/Permissions"),
+		},
+		["init"] = function(maid: Maid) return nil end,
+	}
+	return nil
+end
+
+return ServiceProxy(function()
+	return tree
+end)
\ No newline at end of file
@@ -0,0 +1,134 @@
+--!strict
+-- this script was generated by nightcycle/datatree, do not manually edit
+
+--Services
+local RunService = game:GetService("RunService")
+local Players = game:GetService("Players")
+
+--Packages
+local NetworkUtil = require(script:WaitForChild("Packages"):WaitForChild("NetworkUtil"))
+local Maid = require(script:WaitForChild("Packages"):WaitForChild("Maid"))
+local ServiceProxy = require(script:WaitForChild("Packages"):WaitForChild("ServiceProxy"))
+
+--Modules
+local DataTypes = require(game:GetService("ReplicatedStorage"):WaitForChild("Shared"):WaitForChild("DataTreeTypes"))
+
+--Types
+type Maid = Maid.Maid
+export type Receiver<T> = () -> T
+export type VehicleType = DataTypes.VehicleType
+export type PermissionData = DataTypes.PermissionData
+export type PerformanceData = DataTypes.PerformanceData
+export type VehicleData = DataTypes.VehicleData
+
+export type DataTree = {
+	CompanyName: Receiver<string>,
+	State: Receiver<Enum.HumanoidStateType>,
+	Location: Receiver<CFrame>,
+	init: (maid: Maid) -> nil,
+	Currency: {
+		Cash: Receiver<number>,
+		VehicleCredits: Receiver<number>,
+	},
+	Garage: {
+		Slots: Receiver<{[number]: VehicleData}>,
+		Permissions: Receiver<{[number]: PermissionData?}>,
+	},
+}
+
+--Constants
+local GET_SUFFIX = "DATA_TREE_CLT_GET"
+local UPDATE_SUFFIX = "DATA_TREE_CLT_UPDATE"
+local SNAPSHOT_SUFFIX = "DATA_TREE_CLT_SNAPSHOT"
+local PATH_IDS = {
+	["CompanyName"] = 1,
+	["State"] = 2,
+	["Location"] = 3,
+	["Currency/Cash"] = 4,
+	["Currency/VehicleCredits"] = 5,
+	["Garage/Slots"] = 6,
+	["Garage/Permissions"] = 7,
+}
+
+-- Class
+local tree: DataTree = {} :: any
+local values = {}
+function tree.init(maid: Maid): nil
+	-- every value shares one remote pair, updates arrive once per frame as a batch of entries tagged with the path's id
+	local updateCallbacks: { [number]: (...any) -> () } = {}
+	local function onMessage(batch: { { any } })
+		-- applied in one go so no code reads a mix of old and new values
+		for i, entry in ipairs(batch) do
+			local callback = updateCallbacks[entry[1]]
+			if callback then
+				callback(entry[2], entry[3])
+			end
+		end
+		return nil
+	end
+	if RunService:IsRunning() then
+		maid:GiveTask(NetworkUtil.onClientEventAt(UPDATE_SUFFIX, Players.LocalPlayer, onMessage))
+	else
+		maid:GiveTask(NetworkUtil.getBindableEvent(UPDATE_SUFFIX).Event:Connect(onMessage))
+	end
+	
+	local function connectUpdate(scope: string, callback: (...any) -> ())
+		updateCallbacks[PATH_IDS[scope]] = callback
+	end
+	
+	local function fetchValue(scope: string): ...any
+		if RunService:IsRunning() then
+			return NetworkUtil.getRemoteFunction(GET_SUFFIX, Players.LocalPlayer):InvokeServer(PATH_IDS[scope])
+		else
+			return NetworkUtil.getBindableFunction(GET_SUFFIX):Invoke(PATH_IDS[scope])
+		end
+	end
+	
+	-- every value is fetched in one round trip, receivers missing from it fall back to fetching their own
+	local snapshot: { [string]: { any } } = {}
+	local snapshotEntries: { { any } }
+	if RunService:IsRunning() then
+		snapshotEntries = NetworkUtil.getRemoteFunction(SNAPSHOT_SUFFIX, Players.LocalPlayer):InvokeServer()
+	else
+		snapshotEntries = NetworkUtil.getBindableFunction(SNAPSHOT_SUFFIX):Invoke()
+	end
+	for i, entry in ipairs(snapshotEntries) do
+		snapshot[entry[1]] = entry
+	end
+	
+	local function newReceiver<T>(scope: string): Receiver<T>
+		connectUpdate(scope, function(val)
+			values[scope] = val
+		end)
+		local entry = snapshot[scope]
+		if entry then
+			values[scope] = entry[2]
+		else
+			values[scope] = fetchValue(scope)
+		end
+		
+		return function(): T
+			return values[scope] :: any
+		end
+	end
+
+	tree = {
+		["CompanyName"] = newReceiver("CompanyName"),
+		["State"] = newReceiver("State"),
+		["Location"] = newReceiver("Location"),
+		["Currency"] = {
+			["Cash"] = newReceiver("Currency/Cash"),
+			["VehicleCredits"] = newReceiver("Currency/VehicleCredits"),
+		},
+		["Garage"] = {
+			["Slots"] = newReceiver("Garage/Slots"),
+			["Permissions"] = newReceiver("Garage/Permissions"),
+		},
+		["init"] = function(maid: Maid) return nil end,
+	}
+	return nil
+end
+
+return ServiceProxy(function()
+	return tree
+end)
\ No newline at end of file
@@ -0,0 +1,1416 @@
+--!strict
+-- this script was generated by nightcycle/datatree, do not manually edit
+
+--Services
+local Players = game:GetService("Players")
+local DataStoreService = require(script:WaitForChild("Packages"):WaitForChild("MockDataStoreService"))
+local RunService = game:GetService("RunService")
+local HttpService = game:GetService("HttpService")
+
+--Packages
+local NetworkUtil = require(script:WaitForChild("Packages"):WaitForChild("NetworkUtil"))
+local Maid = require(script:WaitForChild("Packages"):WaitForChild("Maid"))
+local Signal = require(script:WaitForChild("Packages"):WaitForChild("Signal"))
+local Base64 = require(script:WaitForChild("Packages"):WaitForChild("Base64"))
+
+--Modules
+local DataTypes = require(game:GetService("ReplicatedStorage"):WaitForChild("Shared"):WaitForChild("DataTreeTypes"))
+
+--Types
+type Table = {[any]: any}
+type Signal = Signal.Signal
+type Maid = Maid.Maid
+export type VehicleType = DataTypes.VehicleType
+export type PermissionData = DataTypes.PermissionData
+export type PerformanceData = DataTypes.PerformanceData
+export type VehicleData = DataTypes.VehicleData
+export type UserId = number
+export type UserIdKey = string
+type Processor<V> = (val: V) -> V
+type Serializer<D,S> = (data: D) -> S
+type Deserializer<S,D> = (data: S) -> D
+export type DataHandler<T, S> = {
+	__index: DataHandler<T, S>,
+	_Maid: Maid,
+	_IsAlive: boolean,
+	_IsLoaded: boolean,
+	_IsDirty: boolean,
+	_Value: T?,
+	_EncodedValue: S?,
+	_Serialize: Serializer<T, S>,
+	_Deserialize: Deserializer<S, T>,
+	_Document: PlayerDocument,
+	OnChanged: Signal,
+	ClassName: "DataHandler",
+	Scope: string,
+	Key: UserIdKey,
+	Player: Player,
+	DataStore: DataStore,
+	SetOptions: DataStoreSetOptions,
+	IncrementOptions: DataStoreIncrementOptions,
+	init: (maid: Maid) -> nil,
+	new: (player: Player, scope: string, initialValue: T, _serializer: Serializer<T,S>?, _deserializer: Deserializer<S,T>?) -> DataHandler<T, S>,
+	Destroy: (self: DataHandler<T, S>) -> nil,
+	Get: (self: DataHandler<T, S>, force: boolean?) -> (T?, boolean),
+	Set: (self: DataHandler<T, S>, data: T, force: boolean?) -> boolean,
+	Update: (self: DataHandler<T, S>, transformer: (T) -> T, force: boolean?) -> (T?, boolean),
+	Remove: (self: DataHandler<T, S>) -> nil,
+	_Stage: (self: DataHandler<T, S>, encodedValue: S?) -> nil,
+	_Load: (self: DataHandler<T, S>) -> (S?, boolean),
+	_Save: (self: DataHandler<T, S>, encodedValue: S?, priority: number?) -> boolean,
+	_Flush: (self: DataHandler<T, S>, priority: number?) -> boolean,
+	_Init: (self: DataHandler<T, S>) -> boolean,
+	_Transform: (self: DataHandler<T, S>, transformer: (S?) -> S?) -> (S?, boolean),
+}
+type Migration = {
+	Version: { [string]: number },
+	Migrate: (scope: string, value: any) -> any,
+}
+type DataStoreRequest = {
+	RequestType: Enum.DataStoreRequestType,
+	Priority: number,
+	Order: number,
+	CoalesceKey: string?,
+	Callback: () -> any,
+	Threads: { thread },
+	Attempts: number,
+	RetryAt: number,
+}
+export type SortedDataEntry = {
+	UserId: number,
+	Value: number,
+}
+type Leaderboard = {
+	DataStore: OrderedDataStore,
+	IsAscending: boolean,
+	Entries: { [number]: SortedDataEntry },
+	Pages: DataStorePages?,
+	IsFinished: boolean,
+	RefreshedAt: number,
+	Loading: Signal?,
+}
+export type NumberDataHandler = DataHandler<number, number> & {
+	ClassName: "NumberDataHandler",
+	DataStore: OrderedDataStore,
+	_EncodedValue: number?,
+	_Serialize: Processor<number>,
+	_Deserialize: Processor<number>,
+	_Value: number?,
+	Increment: (self: NumberDataHandler, delta: number, force: boolean?) -> (number?, boolean),
+	_Increment: (self: NumberDataHandler, delta: number) -> (number?, boolean),
+	new: (player: Player, scope: string, initialValue: number, _processor: Processor<number>?) -> NumberDataHandler,
+	GetSortedList: (self: NumberDataHandler, limit: number, isAscending: boolean?) -> { [number]: SortedDataEntry },
+}
+export type PlayerDocument = {
+	__index: PlayerDocument,
+	_Maid: Maid,
+	_IsAlive: boolean,
+	_IsLoaded: boolean,
+	_Loading: Signal?,
+	_IsDirty: boolean,
+	_Data: { [string]: any },
+	_OrderedDataStores: { [string]: OrderedDataStore },
+	_OrderedValues: { [string]: number },
+	Key: UserIdKey,
+	Player: Player,
+	DataStore: DataStore,
+	SetOptions: DataStoreSetOptions,
+	new: (player: Player) -> PlayerDocument,
+	Destroy: (self: PlayerDocument) -> nil,
+	Load: (self: PlayerDocument) -> boolean,
+	Save: (self: PlayerDocument, priority: number?) -> boolean,
+	_Flush: (self: PlayerDocument, priority: number?) -> boolean,
+	GetEntry: (self: PlayerDocument, scope: string) -> any,
+	SetEntry: (self: PlayerDocument, scope: string, value: any) -> nil,
+	AddOrderedDataStore: (self: PlayerDocument, scope: string, orderedDataStore: OrderedDataStore) -> nil,
+}
+export type DataTree = {
+	CompanyName: DataHandler<string, string>,
+	State: DataHandler<Enum.HumanoidStateType, string>,
+	Location: DataHandler<CFrame, string>,
+	Currency: {
+		Cash: NumberDataHandler,
+		VehicleCredits: NumberDataHandler,
+	},
+	Garage: {
+		Slots: DataHandler<{[number]: VehicleData}, string>,
+		Permissions: DataHandler<{[number]: PermissionData?}, string>,
+	},
+}
+
+--Constants
+local BASE_DOMAIN = "gamedata"
+local GET_SUFFIX = "DATA_TREE_CLT_GET"
+local UPDATE_SUFFIX = "DATA_TREE_CLT_UPDATE"
+local SNAPSHOT_SUFFIX = "DATA_TREE_CLT_SNAPSHOT"
+local PAGE_LENGTH = 100
+local RETRY_LIMIT = 10
+local RETRY_DELAY = 0.5
+-- lower values are sent first when the request budget is low
+local PRIORITY_LEAVE = 1
+local PRIORITY_WRITE = 2
+local PRIORITY_READ = 3
+local PRIORITY_AUTOSAVE = 4
+local SHUTDOWN_TIMEOUT = 25
+local LOAD_CONCURRENCY = 8
+local LOAD_FAILED_MESSAGE = "Your data failed to load, please rejoin"
+local AUTOSAVE_INTERVAL = 60
+local LEADERBOARD_INTERVAL = 60
+local LEADERBOARD_SIZE = 100
+local LEADERBOARD_PAGE_LENGTH = math.min(PAGE_LENGTH, LEADERBOARD_SIZE)
+local SORTED_SCOPES = {
+	["Currency/Cash"] = true,
+	["Currency/VehicleCredits"] = true,
+}
+local DOCUMENT_SCOPE = "__document"
+local METADATA = {
+	["saved_at::DateTime"] = "NOW",
+	["major"] = 1,
+	["minor"] = 2,
+	["patch"] = 3,
+}
+local VERSION_KEYS = {"major","minor","patch",}
+local MIGRATIONS: { Migration } = {
+	{
+		Version = {["major"] = 1,["minor"] = 1,},
+		Migrate = require(game:GetService("ServerScriptService"):WaitForChild("Migrations"):WaitForChild("RenameCash")),
+	},
+}
+
+-- Private functions
+local pendingRequests: { DataStoreRequest } = {}
+local queuedRequests: { [string]: DataStoreRequest } = {}
+local activeKeys: { [string]: boolean } = {}
+local activeRequestCount = 0
+local requestCount = 0
+
+function _getRequestBudget(requestType: Enum.DataStoreRequestType): number
+	local success, budget = pcall(function()
+		return DataStoreService:GetRequestBudgetForRequestType(requestType)
+	end)
+	return if success then budget else math.huge
+end
+
+function _queueRequest(request: DataStoreRequest)
+	local coalesceKey = request.CoalesceKey
+	if coalesceKey then
+		local queuedRequest = queuedRequests[coalesceKey]
+		if queuedRequest and queuedRequest ~= request then
+			-- a newer request for the key arrived while this one was running, it answers both
+			for i, thread in ipairs(request.Threads) do
+				table.insert(queuedRequest.Threads, thread)
+			end
+			queuedRequest.Priority = math.min(queuedRequest.Priority, request.Priority)
+			return
+		end
+		queuedRequests[coalesceKey] = request
+	end
+	table.insert(pendingRequests, request)
+end
+
+function _runRequest(request: DataStoreRequest)
+	local success, result = pcall(request.Callback)
+	activeRequestCount -= 1
+	if request.CoalesceKey then
+		activeKeys[request.CoalesceKey] = nil
+	end
+	if not success then
+		warn(result)
+		request.Attempts += 1
+		if request.Attempts <= RETRY_LIMIT then
+			request.RetryAt = os.clock() + RETRY_DELAY * request.Attempts
+			_queueRequest(request)
+			return
+		end
+		result = nil
+	end
+	for i, thread in ipairs(request.Threads) do
+		task.spawn(thread, result, success)
+	end
+end
+
+function _drainRequests()
+	if #pendingRequests == 0 then
+		return
+	end
+	
+	local requests = pendingRequests
+	pendingRequests = {}
+	table.sort(requests, function(a: DataStoreRequest, b: DataStoreRequest)
+		if a.Priority ~= b.Priority then
+			return a.Priority < b.Priority
+		end
+		return a.Order < b.Order
+	end)
+	
+	local budgets: { [Enum.DataStoreRequestType]: number } = {}
+	local now = os.clock()
+	for i, request in ipairs(requests) do
+		local budget = budgets[request.RequestType]
+		if budget == nil then
+			budget = _getRequestBudget(request.RequestType)
+		end
+		
+		local coalesceKey = request.CoalesceKey
+		local isBlocked = request.RetryAt > now or (coalesceKey ~= nil and activeKeys[coalesceKey] == true)
+		if budget > 0 and not isBlocked then
+			budgets[request.RequestType] = budget - 1
+			if coalesceKey then
+				activeKeys[coalesceKey] = true
+				if queuedRequests[coalesceKey] == request then
+					queuedRequests[coalesceKey] = nil
+				end
+			end
+			activeRequestCount += 1
+			task.spawn(_runRequest, request)
+		else
+			budgets[request.RequestType] = budget
+			table.insert(pendingRequests, request)
+		end
+	end
+end
+
+function _flushRequests(timeout: number)
+	local start = os.clock()
+	while (#pendingRequests > 0 or activeRequestCount > 0) and os.clock() - start < timeout do
+		_drainRequests()
+		task.wait()
+	end
+end
+
+-- queues a DataStore call and yields until it completes, requests for the same key are merged
+function _request(requestType: Enum.DataStoreRequestType, priority: number, coalesceKey: string?, callback: () -> any): (any, boolean)
+	local request = if coalesceKey then queuedRequests[coalesceKey] else nil
+	if request then
+		-- the latest write wins, reads share the same result
+		request.Callback = callback
+		request.Priority = math.min(request.Priority, priority)
+	else
+		requestCount += 1
+		request = {
+			RequestType = requestType,
+			Priority = priority,
+			Order = requestCount,
+			CoalesceKey = coalesceKey,
+			Callback = callback,
+			Threads = {},
+			Attempts = 0,
+			RetryAt = 0,
+		}
+		_queueRequest(request :: DataStoreRequest)
+	end
+	assert(request)
+	table.insert(request.Threads, coroutine.running())
+	return coroutine.yield()
+end
+-- handlers and documents with changes that haven't been written yet
+local dirtyObjects: { [any]: boolean } = {}
+
+function _autosave()
+	local objects = dirtyObjects
+	dirtyObjects = {}
+	for object in pairs(objects) do
+		task.spawn(object._Flush, object, PRIORITY_AUTOSAVE)
+	end
+end
+
+-- changes are collected over the frame and sent on the next Heartbeat, only the latest value of each handler is sent
+local pendingUpdates: { [any]: (...any) -> () } = {}
+
+function _flushUpdates()
+	if next(pendingUpdates) == nil then
+		return
+	end
+	local updates = pendingUpdates
+	pendingUpdates = {}
+	for handler, fireUpdate in pairs(updates) do
+		if handler._IsAlive then
+			fireUpdate(handler._Value)
+		end
+	end
+end
+
+-- sorted lists are shared by every caller on the server, and only fetched again once they're LEADERBOARD_INTERVAL old
+local leaderboards: { [string]: Leaderboard } = {}
+
+function _getLeaderboard(scope: string, isAscending: boolean): Leaderboard
+	local key = scope .. (if isAscending then "/Ascending" else "/Descending")
+	local leaderboard = leaderboards[key]
+	if not leaderboard then
+		leaderboard = {
+			DataStore = DataStoreService:GetOrderedDataStore(BASE_DOMAIN, scope),
+			IsAscending = isAscending,
+			Entries = {},
+			IsFinished = false,
+			RefreshedAt = -math.huge,
+		}
+		leaderboards[key] = leaderboard
+	end
+	assert(leaderboard)
+	return leaderboard
+end
+
+-- fetches the first page when the list is stale, otherwise the next one
+function _loadLeaderboardPage(leaderboard: Leaderboard)
+	local isRefresh = os.clock() - leaderboard.RefreshedAt >= LEADERBOARD_INTERVAL
+	local pages = leaderboard.Pages
+	local loading = Signal.new()
+	leaderboard.Loading = loading
+	
+	local result, success = _request(Enum.DataStoreRequestType.GetSortedAsync, PRIORITY_READ, nil, function()
+		if isRefresh or not pages then
+			return leaderboard.DataStore:GetSortedAsync(leaderboard.IsAscending, LEADERBOARD_PAGE_LENGTH)
+		end
+		pages:AdvanceToNextPageAsync()
+		return pages
+	end)
+	
+	if isRefresh then
+		leaderboard.RefreshedAt = os.clock()
+		if success then
+			leaderboard.Entries = {}
+			leaderboard.Pages = result
+		end
+	end
+	if success then
+		local entries = leaderboard.Entries
+		for i, data in ipairs(result:GetCurrentPage()) do
+			if #entries >= LEADERBOARD_SIZE then
+				break
+			end
+			table.insert(entries, {
+				UserId = tonumber(data.key) :: number,
+				Value = data.value,
+			})
+		end
+		leaderboard.IsFinished = result.IsFinished or #entries >= LEADERBOARD_SIZE
+	else
+		-- keep serving what's cached until the next refresh
+		leaderboard.IsFinished = true
+	end
+	
+	leaderboard.Loading = nil
+	loading:Fire()
+	loading:Destroy()
+end
+
+function _getSortedList(scope: string, limit: number, isAscending: boolean): { [number]: SortedDataEntry }
+	local leaderboard = _getLeaderboard(scope, isAscending)
+	limit = math.min(limit, LEADERBOARD_SIZE)
+	while true do
+		local loading = leaderboard.Loading
+		if loading then
+			-- one page is fetched at a time, everyone else waits for it
+			loading:Wait()
+		elseif os.clock() - leaderboard.RefreshedAt >= LEADERBOARD_INTERVAL or (#leaderboard.Entries < limit and not leaderboard.IsFinished) then
+			_loadLeaderboardPage(leaderboard)
+		else
+			break
+		end
+	end
+	return table.move(leaderboard.Entries, 1, math.min(limit, #leaderboard.Entries), 1, {})
+end
+
+function _getPendingMigrations(keyInfo: DataStoreKeyInfo?): { Migration }
+	local pending = {}
+	if keyInfo == nil then
+		return pending
+	end
+	local metadata = keyInfo:GetMetadata()
+	for _, migration in ipairs(MIGRATIONS) do
+		for _, versionKey in ipairs(VERSION_KEYS) do
+			local storedVersion = if type(metadata[versionKey]) == "number" then metadata[versionKey] else 0
+			local version = migration.Version[versionKey] or 0
+			if storedVersion ~= version then
+				if storedVersion < version then
+					table.insert(pending, migration)
+				end
+				break
+			end
+		end
+	end
+	return pending
+end
+
+function _migrate(scope: string, value: any, migrations: { Migration }): any
+	for _, migration in ipairs(migrations) do
+		value = migration.Migrate(scope, value)
+	end
+	return value
+end
+
+function _serializeList(unitMethod: (((val: any) -> Table) | ((val: any) -> string) | ((val: number) -> number) | ((val: boolean) -> boolean))): (val: { [number]: any }) -> Table
+	return function(listVal: { [number]: any }): Table
+		local out = {}
+		for i, v in ipairs(listVal) do
+			out[i] = (unitMethod :: any)(v)
+		end
+		return out
+	end
+end
+function _deserializeList(unitMethod: (((val: string) -> any) | ((val: Table) -> any) | ((val: number) -> number) | ((val: boolean) -> boolean))): (input: {[number]: any}) -> { [number]: any }
+	return function(input: Table)
+		local out = {}
+		for i, v in ipairs(input) do
+			out[i] = (unitMethod :: any)(v)
+		end
+		return out
+	end
+end
+function _serializeDict(unitMethod: (((val: any) -> Table) | ((val: any) -> string) | ((val: number) -> number) | ((val: boolean) -> boolean))): (val: { [any]: any }) -> Table
+	return function(dictVal: { [any]: any }): Table
+		local out = {}
+		for k, v in pairs(dictVal) do
+			out[k] = (unitMethod :: any)(v)
+		end
+		return out
+	end
+end
+function _deserializeDict(unitMethod: (((val: string) -> any) | ((val: Table) -> any) | ((val: number) -> number) | ((val: boolean) -> boolean))): (val: Table) -> { [any]: any }
+	return function(input: Table): { [any]: any }
+		local out = {}
+		for k, v in pairs(input) do
+			out[k] = (unitMethod :: any)(v)
+		end
+		return out
+	end
+end
+
+local _processInteger = function(value: number): number
+	return math.round(value)
+end
+local _processInt = _processInteger
+local _processDouble = function(value: number): number
+	return math.round(value*100)/100
+end
+local _processFloat = function(value: number): number
+	return value
+end
+
+
+
+local _serializeColor3 = function(value: Color3): string
+	return value:ToHex()
+end
+local _serializeNumber = function(value: number): number
+	return value
+end
+local _serializeInteger = function(value: number): number
+	return _processInteger(value)
+end
+local _serializeInt = _serializeInteger
+local _serializeDouble = function(value: number): number
+	return _processDouble(value)
+end
+local _serializeFloat = _serializeNumber
+local _serializeString = function(value: string): string
+	return value
+end
+local _serializeBoolean = function(value: boolean): boolean
+	return value
+end
+local _serializeDateTime = function(value: DateTime): string
+	return value:ToIsoDate()
+end
+local _serializeVector3 = function(value: Vector3): Table
+	return {
+		X = value.X,
+		Y = value.Y,
+		Z = value.Z
+	}
+end
+local _serializeVector3Integer = function(value: Vector3): Table
+	return {
+		X = math.round(value.X),
+		Y = math.round(value.Y),
+		Z = math.round(value.Z)
+	}
+end
+local _serializeVector3Double = function(value: Vector3): Table
+	return {
+		X = math.round(value.X*100)/100,
+		Y = math.round(value.Y*100)/100,
+		Z = math.round(value.Z*100)/100
+	}
+end
+local _serializeVector2 = function(value: Vector2): Table
+	return {
+		X = value.X,
+		Y = value.Y
+	}
+end
+local _serializeVector2Integer = function(value: Vector2): Table
+	return {
+		X = math.round(value.X),
+		Y = math.round(value.Y)
+	}
+end
+local _serializeVector2Double = function(value: Vector2): Table
+	return {
+		X = math.round(value.X*100)/100,
+		Y = math.round(value.Y*100)/100
+	}
+end
+local _serializeCFrame = function(value: CFrame): Table
+	local x,y,z = value:ToEulerAnglesYXZ()
+	return {
+		Position = _serializeVector3(value.Position),
+		Orientation = _serializeVector3(Vector3.new(math.deg(x), math.deg(y), math.deg(z))),
+	}
+end
+local _serializeCFrameDouble = function(value: CFrame): Table
+	local x,y,z = value:ToEulerAnglesYXZ()
+	return {
+		Position = _serializeVector3Double(value.Position),
+		Orientation = _serializeVector3Double(Vector3.new(math.deg(x), math.deg(y), math.deg(z))),
+	}
+end
+local _serializeCFrameInteger = function(value: CFrame): Table
+	local x,y,z = value:ToEulerAnglesYXZ()
+	return {
+		Position = _serializeVector3Integer(value.Position),
+		Orientation = _serializeVector3Integer(Vector3.new(math.deg(x), math.deg(y), math.deg(z))),
+	}
+end
+local _serializeEnum = function(value: EnumItem): string
+	return tostring(value.Value)
+end
+local _serializeEnumMaterial = _serializeEnum :: (value: Enum.Material) -> string
+local _serializeEnumHumanoidStateType = _serializeEnum :: (value: Enum.HumanoidStateType) -> string
+local _serializeVehicleType = function(value: VehicleType): string
+	local index = table.find({"Sedan","Hatchback","Truck",}, value)
+	assert(index)
+	return tostring(index)
+end
+local _serializePermissionData = function(value: PermissionData): Table
+	return {
+		["1"] = (if value["CanDrive"] then 1 else 0) + (if value["CanEdit"] then 2 else 0) + (if value["CanSell"] then 4 else 0),
+	}
+end
+local _serializePerformanceData = function(value: PerformanceData): Table
+	return {
+		["1"] = _serializeDouble(value["Speed"]),
+		["2"] = _serializeDouble(value["Acceleration"]),
+		["3"] = _serializeDouble(value["TurnSpeed"]),
+	}
+end
+local _serializeVehicleData = function(value: VehicleData): Table
+	return {
+		["1"] = _serializeString(value["Name"]),
+		["2"] = _serializeVehicleType(value["Type"]),
+		["3"] = _serializeString(value["Id"]),
+		["4"] = _serializeDateTime(value["PurchaseTime"]),
+		["5"] = _serializeDouble(value["FrictionCoefficient"]),
+		["6"] = _serializeEnumMaterial(value["Material"]),
+		["7"] = _serializePerformanceData(value["Performance"]),
+		["8"] = _serializeColor3(value["Appearance"]["Color"]),
+		["9"] = if value["Appearance"]["Skin"] ~= nil then _serializeString(value["Appearance"]["Skin"]) else nil,
+	}
+end
+
+
+
+local _isNumbered = function(data: Table): boolean
+	for key in pairs(data) do
+		return tonumber(key) ~= nil
+	end
+	return true
+end
+local _deserializeString = function(value: string): string
+	return value
+end
+local _deserializeNumber = function(value: number): number
+	return value
+end
+local _deserializeInteger = _deserializeNumber
+local _deserializeInt = _deserializeInteger
+local _deserializeDouble = _deserializeNumber
+local _deserializeFloat = _deserializeNumber
+local _deserializeBoolean = function(value: boolean): boolean
+	return value
+end
+local _deserializeColor3 = function(value: string): Color3
+	return Color3.fromHex(value)
+end
+local _deserializeDateTime = function(value: string): DateTime
+	return DateTime.fromIsoDate(value)
+end
+local _deserializeVector3 = function(value: Table): Vector3
+	return Vector3.new(value.X, value.Y, value.Z)
+end
+local _deserializeVector3Integer = function(value: Table): Vector3
+	return Vector3.new(math.round(value.X), math.round(value.Y), math.round(value.Z))
+end
+local _deserializeVector3Double = function(value: Table): Vector3
+	return Vector3.new(math.round(value.X*100)/100, math.round(value.Y*100)/100, math.round(value.Z*100)/100)
+end
+local _deserializeVector2 = function(value: Table): Vector2
+	return Vector2.new(value.X, value.Y)
+end
+local _deserializeVector2Integer = function(value: Table): Vector2
+	return Vector2.new(math.round(value.X), math.round(value.Y))
+end
+local _deserializeVector2Double = function(value: Table): Vector2
+	return Vector2.new(math.round(value.X*100)/100, math.round(value.Y*100)/100)
+end
+local _deserializeCFrame = function(value: Table): CFrame
+	local position = _deserializeVector3(value["Position"])
+	local orientation = _deserializeVector3(value["Orientation"])
+	return CFrame.fromEulerAnglesYXZ(
+		math.rad(orientation.X),
+		math.rad(orientation.Y),
+		math.rad(orientation.Z)
+	) + position
+end
+local _deserializeCFrameInteger = function(value: Table): CFrame
+	local position = _deserializeVector3Integer(value["Position"])
+	local orientation = _deserializeVector3Integer(value["Orientation"])
+	return CFrame.fromEulerAnglesYXZ(
+		math.rad(orientation.X),
+		math.rad(orientation.Y),
+		math.rad(orientation.Z)
+	) + position
+end
+local _deserializeCFrameDouble = function(value: Table): CFrame
+	local position = _deserializeVector3Double(value["Position"])
+	local orientation = _deserializeVector3Double(value["Orientation"])
+	return CFrame.fromEulerAnglesYXZ(
+		math.rad(orientation.X),
+		math.rad(orientation.Y),
+		math.rad(orientation.Z)
+	) + position
+end
+local _enumDeserializer = function(enum: Enum): Deserializer<any, EnumItem>
+	local enumItems: { [number]: EnumItem }? = nil
+	return function(value: any): EnumItem
+		if not enumItems then
+			local items = {}
+			for i, enumItem in ipairs(enum:GetEnumItems()) do
+				items[enumItem.Value] = enumItem
+			end
+			enumItems = items
+		end
+		assert(enumItems)
+		local enumItem = enumItems[tonumber(value) :: number]
+		if not enumItem then
+			error("No enum item found in "..tostring(enum).." for value "..value)
+		end
+		return enumItem
+	end
+end
+local _deserializeEnumMaterial = _enumDeserializer(Enum.Material) :: (value: any) -> Enum.Material
+local _deserializeEnumHumanoidStateType = _enumDeserializer(Enum.HumanoidStateType) :: (value: any) -> Enum.HumanoidStateType
+local _deserializeVehicleType = function(value: number): VehicleType
+	local options = {"Sedan","Hatchback","Truck",}
+	local index = tonumber(value)
+	assert(index)
+	return options[index] :: VehicleType
+end
+local _deserializePermissionData = function(data: Table): PermissionData
+	if not _isNumbered(data) then
+		return {
+			["CanDrive"] = _deserializeBoolean(data["CanDrive"]),
+			["CanEdit"] = _deserializeBoolean(data["CanEdit"]),
+			["CanSell"] = _deserializeBoolean(data["CanSell"]),
+		} :: any
+	end
+	return {
+		["CanDrive"] = bit32.btest(data["1"] or 0, 1),
+		["CanEdit"] = bit32.btest(data["1"] or 0, 2),
+		["CanSell"] = bit32.btest(data["1"] or 0, 4),
+	} :: any
+end
+local _deserializePerformanceData = function(data: Table): PerformanceData
+	if not _isNumbered(data) then
+		return {
+			["Speed"] = _deserializeDouble(data["Speed"]),
+			["Acceleration"] = _deserializeDouble(data["Acceleration"]),
+			["TurnSpeed"] = _deserializeDouble(data["TurnSpeed"]),
+		} :: any
+	end
+	return {
+		["Speed"] = _deserializeDouble(data["1"]),
+		["Acceleration"] = _deserializeDouble(data["2"]),
+		["TurnSpeed"] = _deserializeDouble(data["3"]),
+	} :: any
+end
+local _deserializeVehicleData = function(data: Table): VehicleData
+	if not _isNumbered(data) then
+		return {
+			["Name"] = _deserializeString(data["Name"]),
+			["Type"] = _deserializeVehicleType(data["Type"]),
+			["Id"] = _deserializeString(data["Id"]),
+			["PurchaseTime"] = _deserializeDateTime(data["PurchaseTime"]),
+			["FrictionCoefficient"] = _deserializeDouble(data["FrictionCoefficient"]),
+			["Material"] = _deserializeEnumMaterial(data["Material"]),
+			["Performance"] = _deserializePerformanceData(data["Performance"]),
+			["Appearance"] = {
+				["Color"] = _deserializeColor3(data["Appearance"]["Color"]),
+				["Skin"] = if data["Appearance"]["Skin"] ~= nil then _deserializeString(data["Appearance"]["Skin"]) else nil,
+			},
+		} :: any
+	end
+	return {
+		["Name"] = _deserializeString(data["1"]),
+		["Type"] = _deserializeVehicleType(data["2"]),
+		["Id"] = _deserializeString(data["3"]),
+		["PurchaseTime"] = _deserializeDateTime(data["4"]),
+		["FrictionCoefficient"] = _deserializeDouble(data["5"]),
+		["Material"] = _deserializeEnumMaterial(data["6"]),
+		["Performance"] = _deserializePerformanceData(data["7"]),
+		["Appearance"] = {
+			["Color"] = _deserializeColor3(data["8"]),
+			["Skin"] = if data["9"] ~= nil then _deserializeString(data["9"]) else nil,
+		},
+	} :: any
+end
+
+--Class
+local PlayerDocument: PlayerDocument = {} :: any
+PlayerDocument.__index = PlayerDocument
+
+function PlayerDocument:Destroy()
+	if not self._IsAlive then
+		return
+	end
+	
+	dirtyObjects[self] = nil
+	if self._IsDirty then
+		-- saved in the background so leaving players don't block each other
+		task.spawn(self.Save, self, PRIORITY_LEAVE)
+	end
+	self._IsAlive = false
+	self._Maid:Destroy()
+	local t: any = self
+	for k, v in pairs(t) do
+		t[k] = nil
+	end
+	setmetatable(t, nil)
+	return nil
+end
+
+function PlayerDocument:Load(): boolean
+	if self._IsLoaded then
+		return true
+	end
+	-- every handler loads through the document at once, so later callers wait for the request already in flight
+	local loading = self._Loading
+	if loading then
+		loading:Wait()
+		return self._IsLoaded == true
+	end
+	loading = Signal.new()
+	self._Loading = loading
+	
+	local dataStore, key = self.DataStore, self.Key
+	local result, success = _request(Enum.DataStoreRequestType.GetAsync, PRIORITY_READ, "Get/" .. DOCUMENT_SCOPE .. "/" .. key, function()
+		local value, keyInfo = dataStore:GetAsync(key)
+		return { Value = value, KeyInfo = keyInfo }
+	end)
+	local data = if success then result.Value else nil
+	if data ~= nil and #_getPendingMigrations(result.KeyInfo) > 0 then
+		-- written back with the current metadata in the same request, so each value is only upgraded once
+		-- only the caller that owns the load gets here, and merged requests for one key still check the stored metadata
+		local scope, userIds = DOCUMENT_SCOPE, { self.Player.UserId }
+		data, success = _request(Enum.DataStoreRequestType.UpdateAsync, PRIORITY_WRITE, "Migrate/" .. scope .. "/" .. key, function()
+			return dataStore:UpdateAsync(key, function(value: any, keyInfo: DataStoreKeyInfo?)
+				if type(value) ~= "table" then
+					return nil
+				end
+				local migrations = _getPendingMigrations(keyInfo)
+				for entryScope, entry in pairs(value) do
+					value[entryScope] = _migrate(entryScope, entry, migrations)
+				end
+				return value, userIds, METADATA
+			end)
+		end)
+	end
+	if success and self._IsAlive then
+		self._Data = if type(data) == "table" then data else {}
+		self._IsLoaded = true
+		-- the ordered mirrors were written alongside the document
+		for scope, value in pairs(self._Data) do
+			if type(value) == "number" then
+				self._OrderedValues[scope] = value
+			end
+		end
+	end
+	
+	self._Loading = nil
+	loading:Fire()
+	loading:Destroy()
+	return success and self._IsLoaded == true
+end
+
+function PlayerDocument:Save(priority: number?): boolean
+	if not self._IsLoaded then
+		-- never overwrite stored data that failed to load
+		return false
+	end
+	
+	-- captured up front as the document may be destroyed while the request is queued
+	local dataStore, key, data, setOptions = self.DataStore, self.Key, self._Data, self.SetOptions
+	local orderedDataStores, orderedValues = self._OrderedDataStores, self._OrderedValues
+	local userIds = { self.Player.UserId }
+	self._IsDirty = false
+	dirtyObjects[self] = nil
+	local _, success = _request(Enum.DataStoreRequestType.SetIncrementAsync, priority or PRIORITY_WRITE, "Set/" .. DOCUMENT_SCOPE .. "/" .. key, function()
+		return dataStore:SetAsync(key, data, userIds, setOptions)
+	end)
+	if not success then
+		if self._IsAlive then
+			self._IsDirty = true
+			dirtyObjects[self] = true
+		end
+		return false
+	end
+	
+	for scope, orderedDataStore in pairs(orderedDataStores) do
+		local value = data[scope]
+		if type(value) == "number" and orderedValues[scope] ~= value then
+			task.spawn(function()
+				local _, orderedSuccess = _request(Enum.DataStoreRequestType.SetIncrementSortedAsync, priority or PRIORITY_WRITE, "Set/" .. scope .. "/" .. key, function()
+					return orderedDataStore:SetAsync(key, math.round(value), userIds)
+				end)
+				if orderedSuccess then
+					orderedValues[scope] = value
+				end
+			end)
+		end
+	end
+	return true
+end
+
+function PlayerDocument:_Flush(priority: number?): boolean
+	if not self._IsDirty then
+		return true
+	end
+	return self:Save(priority)
+end
+
+function PlayerDocument:GetEntry(scope: string): any
+	return self._Data[scope]
+end
+
+function PlayerDocument:SetEntry(scope: string, value: any): nil
+	if self._Data[scope] ~= value then
+		self._Data[scope] = value
+		self._IsDirty = true
+		dirtyObjects[self] = true
+	end
+	return nil
+end
+
+function PlayerDocument:AddOrderedDataStore(scope: string, orderedDataStore: OrderedDataStore): nil
+	self._OrderedDataStores[scope] = orderedDataStore
+	return nil
+end
+
+function PlayerDocument.new(player: Player): PlayerDocument
+	local maid = Maid.new()
+	
+	local setOptions = Instance.new("DataStoreSetOptions")
+	maid:GiveTask(setOptions)
+	setOptions:SetMetadata(METADATA)
+	
+	local self: PlayerDocument = setmetatable({
+		_Maid = maid,
+		_IsAlive = true,
+		_IsLoaded = false,
+		_IsDirty = false,
+		_Data = {},
+		_OrderedDataStores = {},
+		_OrderedValues = {},
+		Key = tostring(player.UserId),
+		Player = player,
+		DataStore = DataStoreService:GetDataStore(BASE_DOMAIN, DOCUMENT_SCOPE),
+		SetOptions = setOptions,
+	}, PlayerDocument) :: any
+	
+	return self
+end
+
+local DataHandler: DataHandler<any, string> = {} :: any
+DataHandler.__index = DataHandler
+
+function DataHandler:Destroy()
+	if not self._IsAlive then
+		return
+	end
+	
+	self._IsAlive = false
+	self._Maid:Destroy()
+	local t: any = self
+	for k, v in pairs(t) do
+		t[k] = nil
+	end
+	setmetatable(t, nil)
+	return nil
+end
+function DataHandler:_Stage(encodedValue: any): nil
+	self._Document:SetEntry(self.Scope, encodedValue)
+	return nil
+end
+function DataHandler:_Load(): (any, boolean)
+	if not self._Document:Load() then
+		return nil, false
+	end
+	return self._Document:GetEntry(self.Scope), true
+end
+function DataHandler:_Save(encodedValue: any, priority: number?): boolean
+	self:_Stage(encodedValue)
+	return self._Document:Save(priority)
+end
+function DataHandler:_Flush(priority: number?): boolean
+	return self._Document:_Flush(priority)
+end
+function DataHandler:_Transform(transformer: (any) -> any): (any, boolean)
+	local encodedValue = transformer(self._Document:GetEntry(self.Scope))
+	return encodedValue, self:_Save(encodedValue)
+end
+function DataHandler:_Increment(delta: number): (number?, boolean)
+	local value = (self._Document:GetEntry(self.Scope) or 0) + delta
+	return value, self:_Save(value)
+end
+
+function DataHandler:Set(data: any, force: boolean?)
+	local initialValue = self._EncodedValue
+	local encodedValue = if data ~= nil then self._Serialize(data) else nil
+	self:_Stage(encodedValue)
+	
+	local success = true
+	if force then
+		success = self:_Save(encodedValue)
+	end
+	
+	self._EncodedValue = encodedValue
+	self._Value = if encodedValue ~= nil then self._Deserialize(encodedValue) else nil
+	if initialValue ~= encodedValue then
+		self.OnChanged:Fire(self._Value)
+	end
+	return success
+end
+
+function DataHandler:Update(transformer: (any) -> any, force: boolean?)
+	local initialValue = self._EncodedValue
+	local function transformerWrapper(rawValue: any)
+		return self._Serialize(transformer(self._Deserialize(rawValue)))
+	end
+	
+	local encodedValue, success
+	if force then
+		encodedValue, success = self:_Transform(transformerWrapper)
+		if not success then
+			return self._Value, false
+		end
+	else
+		encodedValue, success = transformerWrapper(initialValue), true
+		self:_Stage(encodedValue)
+	end
+	
+	self._EncodedValue = encodedValue
+	self._Value = if encodedValue ~= nil then self._Deserialize(encodedValue) else nil
+	if initialValue ~= encodedValue then
+		self.OnChanged:Fire(self._Value)
+	end
+	return self._Value, success
+end
+
+function DataHandler:Get(force: boolean?): (any?, boolean)
+	if self._Value ~= nil and not force then
+		return self._Value, true
+	end
+	
+	local data, success = self:_Load()
+	if success and self._IsAlive then
+		self._EncodedValue = data
+		self._Value = if data ~= nil then self._Deserialize(data) else nil
+	end
+	
+	return self._Value, success
+end
+
+function DataHandler.new(player: Player, scope: string, initialValue: any, _serializer: Serializer<any, any>?, _deserializer: Deserializer<any, any>?, document: PlayerDocument)
+	local maid = Maid.new()
+	
+	local onChanged = Signal.new()
+	maid:GiveTask(onChanged)
+	
+	local self: DataHandler<any, string> = setmetatable({
+		_Maid = maid,
+		_IsAlive = true,
+		_IsLoaded = false,
+		_IsDirty = false,
+		_Serialize = if _serializer then
+			function(v: any)
+				if type(v) == "table" then
+					return Base64.Encode(HttpService:JSONEncode(_serializer(v)))
+				end
+				-- enum items can't be stored, so they're saved as their value
+				return if typeof(v) == "EnumItem" then _serializer(v) else v
+			end
+		else function(v: any) return v end,
+		_Deserialize = if _deserializer then 
+			function(v: any)
+				local out: any
+				local success, _msg = pcall(function()
+					out = _deserializer(HttpService:JSONDecode(Base64.Decode(v)))
+				end)
+				if not success then
+					success, _msg = pcall(function()
+						out = _deserializer(v)
+					end)
+				end
+				return if success then out else v
+			end
+		else function(v: any) return v end,
+		OnChanged = onChanged,
+		ClassName = "DataHandler",
+		_Document = document,
+		DataStore = document.DataStore,
+		SetOptions = document.SetOptions,
+		_Value = initialValue,
+		Scope = scope,
+		Key = tostring(player.UserId),
+		Player = player,
+	}, DataHandler) :: any
+	
+	local fireUpdate: (...any) -> ()
+	if RunService:IsRunning() then
+		local updateEvent = NetworkUtil.getRemoteEvent(scope .. "_" .. UPDATE_SUFFIX, player)
+		maid:GiveTask(updateEvent)
+		fireUpdate = function(...: any)
+			updateEvent:FireClient(player, ...)
+		end
+		
+		local getFunction = NetworkUtil.getRemoteFunction(scope .. "_" .. GET_SUFFIX, player)
+		maid:GiveTask(getFunction)
+		getFunction.OnServerInvoke = function(plr: Player)
+			if player.UserId == plr.UserId then
+				return self._Value
+			end
+			error("Bad player")
+		end
+	else
+		local updateEvent = NetworkUtil.getBindableEvent(scope .. "_" .. UPDATE_SUFFIX)
+		maid:GiveTask(updateEvent)
+		fireUpdate = function(...: any)
+			updateEvent:Fire(...)
+		end
+		
+		local getFunction = NetworkUtil.getBindableFunction(scope .. "_" .. GET_SUFFIX)
+		maid:GiveTask(getFunction)
+		getFunction.OnInvoke = function()
+			return self._Value
+		end
+	end
+	maid:GiveTask(onChanged:Connect(function()
+		pendingUpdates[self] = fireUpdate
+	end))
+	
+	return self
+end
+
+-- loads the stored value, falling back to the initial value when nothing was stored
+function DataHandler:_Init(): boolean
+	local initialValue = self._Value
+	local value, success = self:Get(true)
+	if not success or not self._IsAlive then
+		-- left unloaded, so the default is never saved over the stored value
+		return false
+	end
+	
+	self._IsLoaded = true
+	if value == nil then
+		local encodedValue = if initialValue ~= nil then self._Serialize(initialValue) else nil
+		self:_Stage(encodedValue)
+		self._Value = initialValue
+		self._EncodedValue = encodedValue
+	end
+	return true
+end
+
+local NumberDataHandler = {}
+NumberDataHandler.__index = NumberDataHandler
+setmetatable(NumberDataHandler, DataHandler)
+
+-- the top values of this path across every player, see _getSortedList
+function NumberDataHandler:GetSortedList(limit: number, isAscending: boolean?): { [number]: SortedDataEntry }
+	return _getSortedList(self.Scope, limit, isAscending == true)
+end
+
+function NumberDataHandler:Increment(delta: number, force: boolean?)
+	local value, success
+	if force then
+		value, success = self:_Increment(delta)
+	else
+		value, success = (self._EncodedValue or 0) + delta, true
+		self:_Stage(value)
+	end
+	
+	if success then
+		self._EncodedValue = value
+		self._Value = self._Deserialize(value)
+	end
+	
+	if success and delta ~= 0 then
+		self.OnChanged:Fire(self._Value)
+	end
+	
+	return self._Value, success
+end
+
+function NumberDataHandler.new(player: Player, scope: string, initialValue: number, _processor: Processor<number>?, document: PlayerDocument): NumberDataHandler
+	local self: NumberDataHandler = setmetatable(DataHandler.new(player, scope, initialValue, _processor :: any, _processor :: any, document), NumberDataHandler) :: any
+	
+	self.ClassName = "NumberDataHandler"
+	self.DataStore = DataStoreService:GetOrderedDataStore(BASE_DOMAIN, scope)
+	document:AddOrderedDataStore(scope, self.DataStore)
+	
+	local incrementOptions = Instance.new("DataStoreIncrementOptions")
+	self._Maid:GiveTask(incrementOptions)
+	
+	incrementOptions:SetMetadata(METADATA)
+	self.IncrementOptions = incrementOptions
+	
+	return self
+end
+local trees: { [number]: any } = {}
+-- created on demand for callers waiting on a tree that isn't ready yet
+local readySignals: { [number]: Signal } = {}
+
+-- loads the handlers with at most LOAD_CONCURRENCY of them waiting on the DataStore at once
+function _loadHandlers(handlers: { DataHandler<any, any> }, onLoaded: (success: boolean) -> ())
+	local nextIndex = 1
+	local workerCount = math.min(LOAD_CONCURRENCY, #handlers)
+	if workerCount == 0 then
+		onLoaded(true)
+		return
+	end
+	
+	local success = true
+	local function work()
+		while nextIndex <= #handlers do
+			local handler = handlers[nextIndex]
+			nextIndex += 1
+			if handler._IsAlive and not handler:_Init() then
+				success = false
+			end
+		end
+		workerCount -= 1
+		if workerCount == 0 then
+			onLoaded(success)
+		end
+	end
+	for i = 1, workerCount do
+		task.spawn(work)
+	end
+end
+
+function initPlayer(playerMaid: Maid, player: Player)
+	local document = PlayerDocument.new(player)
+	playerMaid:GiveTask(document)
+	
+	local handlers: { DataHandler<any, any> } = {}
+	
+	local function _newDataHandler<G, S>(path: string, val: any, _serializer: Serializer<G,S>?, _deserializer: Deserializer<S, G>?): DataHandler<G, S>
+		local handler: DataHandler<G,S> = DataHandler.new(player, path, val, _serializer :: any, _deserializer :: any, document) :: any
+		playerMaid:GiveTask(handler)
+		table.insert(handlers, handler :: any)
+		
+		return handler
+	end
+	
+	local function _newNumberHandler(path: string, val: number, _processor: Processor<number>?): NumberDataHandler
+		local handler: NumberDataHandler = NumberDataHandler.new(player, path, val, _processor, document) :: any
+		playerMaid:GiveTask(handler)
+		table.insert(handlers, handler :: any)
+		
+		return handler
+	end
+	
+	local treeStateVal: Enum.HumanoidStateType = Enum.HumanoidStateType.Dead
+	local treeGarageSlotsVal: {[number]:VehicleData} = {
+{
+	["Name"] = "Lightning McCar",
+	["Type"] = "Sedan",
+	["Id"] = ""..game:GetService("HttpService"):GenerateGUID(false).."",
+	["PurchaseTime"] = DateTime.now(),
+	["FrictionCoefficient"] = math.round(100*0.5)/100,
+	["Material"] = Enum.Material.SmoothPlastic,
+	["Performance"] = {
+	["Speed"] = math.round(100*12.0)/100,
+	["Acceleration"] = math.round(100*25.0)/100,
+	["TurnSpeed"] = math.round(100*5.0)/100,
+} :: PerformanceData,
+	["Appearance"] = {
+		["Color"] = Color3.fromRGB(256, 128, 64),
+		["Skin"] = "Lightning",
+	},
+} :: VehicleData,
+}
+	local treeGaragePermissionsVal: {[number]: PermissionData?} = {
+	[12345] = {
+	["CanDrive"] = false,
+	["CanEdit"] = true,
+	["CanSell"] = true,
+} :: PermissionData,
+}
+	local tree: DataTree = {
+			["CompanyName"] = _newDataHandler("CompanyName", ""..player.DisplayName.."'s Company"),
+			["State"] = _newDataHandler("State", treeStateVal, _serializeEnumHumanoidStateType, _deserializeEnumHumanoidStateType),
+			["Location"] = _newDataHandler("Location"),
+			["Currency"] = {
+				["Cash"] = _newNumberHandler("Currency/Cash", 1000, _processInt),
+				["VehicleCredits"] = _newNumberHandler("Currency/VehicleCredits", 5, _processInt),
+			},
+			["Garage"] = {
+				["Slots"] = _newDataHandler("Garage/Slots", treeGarageSlotsVal, _serializeList(_serializeVehicleData), _deserializeList(_deserializeVehicleData)) :: any,
+				["Permissions"] = _newDataHandler("Garage/Permissions", treeGaragePermissionsVal, _serializeDict(_serializePermissionData), _deserializeDict(_deserializePermissionData)) :: any,
+			},
+		}
+	
+	-- the tree is only handed out once every value has loaded
+	local isAlive = true
+	local isLoaded = false
+	local onLoaded = Signal.new()
+	playerMaid:GiveTask(onLoaded)
+	playerMaid:GiveTask(function()
+		isAlive = false
+	end)
+	
+	-- every value in one round trip for the client to start from, sent once they've all loaded
+	local function getSnapshot(): { { any } }
+		if not isLoaded then
+			onLoaded:Wait()
+		end
+		local snapshot = {}
+		for i, handler in ipairs(handlers) do
+			if handler._IsAlive then
+				table.insert(snapshot, { handler.Scope, handler._Value })
+			end
+		end
+		return snapshot
+	end
+	if RunService:IsRunning() then
+		local snapshotFunction = NetworkUtil.getRemoteFunction(SNAPSHOT_SUFFIX, player)
+		playerMaid:GiveTask(snapshotFunction)
+		snapshotFunction.OnServerInvoke = function(plr: Player)
+			if player.UserId == plr.UserId then
+				return getSnapshot()
+			end
+			error("Bad player")
+		end
+	else
+		local snapshotFunction = NetworkUtil.getBindableFunction(SNAPSHOT_SUFFIX)
+		playerMaid:GiveTask(snapshotFunction)
+		snapshotFunction.OnInvoke = getSnapshot
+	end
+	
+	_loadHandlers(handlers, function(success: boolean)
+		if not isAlive then
+			return
+		end
+		if not success then
+			-- a partly loaded tree is never handed out, as its defaults could be saved over the stored data
+			player:Kick(LOAD_FAILED_MESSAGE)
+			return
+		end
+		isLoaded = true
+		onLoaded:Fire()
+		trees[player.UserId] = tree
+		
+		local onReady = readySignals[player.UserId]
+		if onReady then
+			readySignals[player.UserId] = nil
+			onReady:Fire(tree)
+			onReady:Destroy()
+		end
+	end)
+end
+
+return {
+	init = function(maid: Maid): nil
+		local playersMaid = Maid.new()
+		maid:GiveTask(playersMaid)
+		
+		maid:GiveTask(RunService.Heartbeat:Connect(_drainRequests))
+		maid:GiveTask(RunService.Heartbeat:Connect(_flushUpdates))
+		if AUTOSAVE_INTERVAL > 0 then
+			local lastAutosave = os.clock()
+			maid:GiveTask(RunService.Heartbeat:Connect(function()
+				if os.clock() - lastAutosave >= AUTOSAVE_INTERVAL then
+					lastAutosave = os.clock()
+					_autosave()
+				end
+			end))
+		end
+		if RunService:IsRunning() then
+			game:BindToClose(function()
+				-- queue the remaining saves, then wait for them to go through
+				playersMaid:Destroy()
+				_flushRequests(SHUTDOWN_TIMEOUT)
+			end)
+		end
+		
+		local function onPlayerAdded(player: Player)
+			local playerMaid = Maid.new()
+			playersMaid:GiveTask(playerMaid)
+			initPlayer(playerMaid, player)
+			playerMaid:GiveTask(player.Destroying:Connect(function()
+				trees[player.UserId] = nil
+				playerMaid:Destroy()
+			end))
+		end
+		
+		maid:GiveTask(Players.PlayerAdded:Connect(onPlayerAdded))
+		for i, player in ipairs(Players:GetChildren()) do
+			onPlayerAdded(player :: Player)
+		end
+		
+		return nil
+	end,
+	getSortedList = function(path: string, limit: number, isAscending: boolean?): { [number]: SortedDataEntry }
+		assert(SORTED_SCOPES[path], path .. " isn't a number value")
+		return _getSortedList(path, limit, isAscending == true)
+	end,
+	get = function(userId: number, yieldDuration: number?): DataTree?
+		local tree = trees[userId]
+		if tree or not yieldDuration then
+			return tree
+		end
+		
+		local onReady = readySignals[userId]
+		if not onReady then
+			onReady = Signal.new()
+			readySignals[userId] = onReady
+		end
+		assert(onReady)
+		
+		-- resumed exactly once, by whichever comes first of the tree being ready or the timeout
+		local thread = coroutine.running()
+		local isResumed = false
+		local connection
+		local function resume(readyTree: DataTree?)
+			if isResumed then
+				return
+			end
+			isResumed = true
+			connection:Disconnect()
+			task.spawn(thread, readyTree)
+		end
+		connection = onReady:Connect(function(readyTree: DataTree)
+			resume(readyTree)
+			return nil
+		end)
+		task.delay(yieldDuration, function()
+			resume(trees[userId])
+			if readySignals[userId] == onReady and #onReady:GetConnections() == 0 then
+				-- nobody else is waiting on a player that never showed up
+				readySignals[userId] = nil
+				onReady:Destroy()
+			end
+		end)
+		return coroutine.yield()
+	end,
+}
\ No newline at end of file
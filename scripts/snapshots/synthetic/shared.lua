@@ -0,0 +1,151 @@
+--!strict
+-- this script was generated by nightcycle/datatree, do not manually edit
+export type Rarity = "Common" | "Rare" | "Epic" | "Legendary"
+
+export type Item0 = {
+	Name: string,
+	Rarity: Rarity,
+	Field0: DateTime,
+	Field1: string,
+	Field2: boolean?,
+	Field3: Vector3,
+	Field4: string?,
+	Field5: DateTime,
+	Stats: {
+		Level: number,
+		Boost: number?,
+	},
+}
+
+export type Item1 = {
+	Name: string,
+	Rarity: Rarity,
+	Field0: string?,
+	Field1: Color3,
+	Field2: boolean,
+	Field3: Vector3,
+	Field4: number,
+	Child: Item0?,
+	Stats: {
+		Level: number,
+		Boost: number?,
+	},
+}
+
+export type Item2 = {
+	Name: string,
+	Rarity: Rarity,
+	Field0: boolean?,
+	Field1: Vector3,
+	Field2: number,
+	Field3: boolean?,
+	Field4: number,
+	Field5: number,
+	Field6: Color3,
+	Stats: {
+		Level: number,
+		Boost: number?,
+	},
+}
+
+export type Item3 = {
+	Name: string,
+	Rarity: Rarity,
+	Field0: Color3,
+	Field1: DateTime,
+	Field2: Color3,
+	Stats: {
+		Level: number,
+		Boost: number?,
+	},
+}
+
+export type Item4 = {
+	Name: string,
+	Rarity: Rarity,
+	Field0: Vector3,
+	Field1: string?,
+	Field2: string?,
+	Field3: Vector3,
+	Child: Item0?,
+	Stats: {
+		Level: number,
+		Boost: number?,
+	},
+}
+
+export type Item5 = {
+	Name: string,
+	Rarity: Rarity,
+	Field0: DateTime,
+	Field1: string,
+	Field2: string?,
+	Stats: {
+		Level: number,
+		Boost: number?,
+	},
+}
+
+export type Item6 = {
+	Name: string,
+	Rarity: Rarity,
+	Field0: boolean,
+	Field1: Color3,
+	Field2: number,
+	Field3: boolean,
+	Field4: boolean,
+	Child: Item1?,
+	Stats: {
+		Level: number,
+		Boost: number?,
+	},
+}
+
+export type Item7 = {
+	Name: string,
+	Rarity: Rarity,
+	Field0: string?,
+	Field1: number,
+	Field2: number,
+	Field3: Color3,
+	Field4: Vector3,
+	Field5: string?,
+	Field6: number,
+	Stats: {
+		Level: number,
+		Boost: number?,
+	},
+}
+
+export type Item8 = {
+	Name: string,
+	Rarity: Rarity,
+	Field0: number,
+	Field1: Vector3,
+	Field2: Color3,
+	Field3: Vector3,
+	Field4: boolean,
+	Stats: {
+		Level: number,
+		Boost: number?,
+	},
+}
+
+export type Item9 = {
+	Name: string,
+	Rarity: Rarity,
+	Field0: Vector3,
+	Field1: boolean?,
+	Field2: string?,
+	Field3: number,
+	Field4: DateTime,
+	Field5: Color3,
+	Field6: boolean,
+	Child: Item3?,
+	Stats: {
+		Level: number,
+		Boost: number?,
+	},
+}
+
+return {}
\ No newline at end of file
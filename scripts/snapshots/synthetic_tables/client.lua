@@ -0,0 +1,578 @@
+--!strict
+-- this script was generated by nightcycle/datatree, do not manually edit
+
+--Services
+local RunService = game:GetService("RunService")
+local Players = game:GetService("Players")
+
+--Packages
+local NetworkUtil = require(script:WaitForChild("Packages"):WaitForChild("NetworkUtil"))
+local Maid = require(script:WaitForChild("Packages"):WaitForChild("Maid"))
+local ServiceProxy = require(script:WaitForChild("Packages"):WaitForChild("ServiceProxy"))
+
+--Modules
+local DataTypes = require(game:GetService("ReplicatedStorage"):WaitForChild("Shared"):WaitForChild("DataTreeTypes"))
+
+--Types
+type Maid = Maid.Maid
+export type Receiver<T> = () -> T
+export type Rarity = DataTypes.Rarity
+export type Item0 = DataTypes.Item0
+export type Item1 = DataTypes.Item1
+export type Item2 = DataTypes.Item2
+export type Item3 = DataTypes.Item3
+export type Item4 = DataTypes.Item4
+export type Item5 = DataTypes.Item5
+export type Item6 = DataTypes.Item6
+export type Item7 = DataTypes.Item7
+export type Item8 = DataTypes.Item8
+export type Item9 = DataTypes.Item9
+
+export type DataTree = {
+	init: (maid: Maid) -> nil,
+	Group0_1: {
+		Group1_0: {
+			Leaf0: Receiver<string>,
+			Leaf15: Receiver<number>,
+			Leaf22: Receiver<number>,
+			Leaf52: Receiver<number>,
+			Leaf59: Receiver<boolean>,
+			Leaf62: Receiver<string>,
+			Leaf70: Receiver<number>,
+			Leaf84: Receiver<boolean>,
+			Leaf95: Receiver<string>,
+			Leaf100: Receiver<{[number]: Item9}>,
+			Leaf122: Receiver<string>,
+			Leaf130: Receiver<boolean>,
+			Leaf135: Receiver<string>,
+			Leaf153: Receiver<number>,
+			Leaf170: Receiver<{[string]: Item3}>,
+			Leaf188: Receiver<number>,
+		},
+		Group1_2: {
+			Leaf26: Receiver<{[string]: Item3}>,
+			Leaf71: Receiver<string>,
+			Leaf79: Receiver<{[string]: Item8}>,
+			Leaf94: Receiver<{[number]: Item2}>,
+			Leaf113: Receiver<{[string]: Item7}>,
+			Leaf137: Receiver<{[number]: Item2}>,
+			Leaf141: Receiver<{[number]: Item2}>,
+			Leaf159: Receiver<string>,
+			Leaf161: Receiver<boolean>,
+			Leaf166: Receiver<number>,
+			Leaf184: Receiver<string>,
+		},
+		Group1_3: {
+			Leaf29: Receiver<boolean>,
+			Leaf55: Receiver<{[number]: Item1}>,
+			Leaf64: Receiver<boolean>,
+			Leaf80: Receiver<boolean>,
+			Leaf85: Receiver<number>,
+			Leaf97: Receiver<{[string]: Item5}>,
+			Leaf111: Receiver<number>,
+			Leaf115: Receiver<boolean>,
+			Leaf139: Receiver<number>,
+			Leaf157: Receiver<boolean>,
+			Leaf175: Receiver<boolean>,
+		},
+		Group1_1: {
+			Leaf58: Receiver<{[number]: Item7}>,
+			Leaf74: Receiver<string>,
+			Leaf87: Receiver<{[string]: Item8}>,
+			Leaf102: Receiver<string>,
+			Leaf134: Receiver<string>,
+			Leaf151: Receiver<string>,
+			Leaf168: Receiver<string>,
+		},
+	},
+	Group0_3: {
+		Group1_0: {
+			Leaf1: Receiver<{[string]: Item2}>,
+			Leaf31: Receiver<boolean>,
+			Leaf36: Receiver<{[string]: Item7}>,
+			Leaf48: Receiver<{[number]: Item7}>,
+			Leaf51: Receiver<{[number]: Item1}>,
+			Leaf77: Receiver<boolean>,
+			Leaf89: Receiver<boolean>,
+			Leaf104: Receiver<number>,
+			Leaf109: Receiver<number>,
+			Leaf132: Receiver<number>,
+			Leaf140: Receiver<number>,
+			Leaf158: Receiver<number>,
+			Leaf160: Receiver<string>,
+			Leaf181: Receiver<{[number]: Item0}>,
+			Leaf186: Receiver<number>,
+			Leaf190: Receiver<boolean>,
+			Leaf196: Receiver<string>,
+		},
+		Group1_3: {
+			Leaf4: Receiver<string>,
+			Leaf25: Receiver<number>,
+			Leaf27: Receiver<{[number]: Item9}>,
+			Leaf41: Receiver<number>,
+			Leaf60: Receiver<boolean>,
+			Leaf69: Receiver<boolean>,
+			Leaf91: Receiver<number>,
+			Leaf124: Receiver<string>,
+			Leaf138: Receiver<boolean>,
+			Leaf154: Receiver<number>,
+			Leaf155: Receiver<number>,
+			Leaf174: Receiver<number>,
+			Leaf185: Receiver<{[string]: Item4}>,
+		},
+		Group1_1: {
+			Leaf12: Receiver<number>,
+			Leaf17: Receiver<number>,
+			Leaf45: Receiver<boolean>,
+			Leaf90: Receiver<number>,
+			Leaf101: Receiver<number>,
+			Leaf105: Receiver<string>,
+			Leaf116: Receiver<boolean>,
+			Leaf136: Receiver<boolean>,
+			Leaf147: Receiver<string>,
+			Leaf171: Receiver<number>,
+			Leaf179: Receiver<number>,
+			Leaf183: Receiver<number>,
+			Leaf187: Receiver<{[string]: Item2}>,
+			Leaf193: Receiver<number>,
+		},
+		Group1_2: {
+			Leaf33: Receiver<{[string]: Item0}>,
+			Leaf57: Receiver<number>,
+			Leaf67: Receiver<number>,
+			Leaf83: Receiver<number>,
+			Leaf88: Receiver<number>,
+			Leaf99: Receiver<string>,
+			Leaf128: Receiver<number>,
+			Leaf144: Receiver<number>,
+			Leaf149: Receiver<number>,
+			Leaf172: Receiver<number>,
+			Leaf194: Receiver<boolean>,
+		},
+	},
+	Group0_0: {
+		Group1_0: {
+			Leaf2: Receiver<boolean>,
+			Leaf8: Receiver<number>,
+			Leaf9: Receiver<{[string]: Item3}>,
+			Leaf30: Receiver<string>,
+			Leaf34: Receiver<{[string]: Item9}>,
+			Leaf39: Receiver<{[string]: Item4}>,
+			Leaf65: Receiver<{[number]: Item2}>,
+			Leaf68: Receiver<number>,
+			Leaf75: Receiver<number>,
+			Leaf86: Receiver<number>,
+			Leaf117: Receiver<number>,
+			Leaf120: Receiver<string>,
+			Leaf131: Receiver<number>,
+			Leaf145: Receiver<{[number]: Item5}>,
+			Leaf148: Receiver<string>,
+			Leaf173: Receiver<string>,
+		},
+		Group1_2: {
+			Leaf5: Receiver<boolean>,
+			Leaf23: Receiver<{[number]: Item7}>,
+			Leaf37: Receiver<{[string]: Item8}>,
+			Leaf46: Receiver<{[string]: Item8}>,
+			Leaf82: Receiver<number>,
+			Leaf93: Receiver<number>,
+			Leaf133: Receiver<string>,
+			Leaf176: Receiver<{[string]: Item6}>,
+			Leaf178: Receiver<number>,
+			Leaf191: Receiver<boolean>,
+			Leaf195: Receiver<string>,
+			Leaf199: Receiver<string>,
+		},
+		Group1_1: {
+			Leaf7: Receiver<number>,
+			Leaf11: Receiver<number>,
+			Leaf14: Receiver<{[number]: Item4}>,
+			Leaf18: Receiver<string>,
+			Leaf28: Receiver<string>,
+			Leaf32: Receiver<boolean>,
+			Leaf76: Receiver<string>,
+			Leaf110: Receiver<boolean>,
+			Leaf114: Receiver<string>,
+			Leaf146: Receiver<{[string]: Item6}>,
+			Leaf156: Receiver<{[number]: Item2}>,
+			Leaf163: Receiver<number>,
+			Leaf189: Receiver<number>,
+		},
+		Group1_3: {
+			Leaf10: Receiver<{[number]: Item1}>,
+			Leaf13: Receiver<string>,
+			Leaf16: Receiver<{[string]: Item5}>,
+			Leaf20: Receiver<string>,
+			Leaf56: Receiver<number>,
+			Leaf66: Receiver<number>,
+			Leaf78: Receiver<number>,
+			Leaf81: Receiver<string>,
+			Leaf107: Receiver<boolean>,
+			Leaf126: Receiver<boolean>,
+			Leaf164: Receiver<number>,
+			Leaf192: Receiver<{[string]: Item4}>,
+			Leaf197: Receiver<number>,
+		},
+	},
+	Group0_2: {
+		Group1_1: {
+			Leaf3: Receiver<boolean>,
+			Leaf6: Receiver<string>,
+			Leaf44: Receiver<{[number]: Item9}>,
+			Leaf54: Receiver<string>,
+			Leaf98: Receiver<{[number]: Item3}>,
+			Leaf112: Receiver<number>,
+			Leaf123: Receiver<number>,
+			Leaf129: Receiver<number>,
+		},
+		Group1_0: {
+			Leaf19: Receiver<boolean>,
+			Leaf38: Receiver<string>,
+			Leaf40: Receiver<boolean>,
+			Leaf42: Receiver<{[number]: Item4}>,
+			Leaf43: Receiver<number>,
+			Leaf49: Receiver<boolean>,
+			Leaf63: Receiver<string>,
+			Leaf72: Receiver<string>,
+			Leaf96: Receiver<number>,
+			Leaf106: Receiver<string>,
+			Leaf121: Receiver<number>,
+			Leaf142: Receiver<string>,
+			Leaf150: Receiver<string>,
+			Leaf165: Receiver<string>,
+			Leaf169: Receiver<boolean>,
+			Leaf180: Receiver<number>,
+			Leaf182: Receiver<string>,
+		},
+		Group1_3: {
+			Leaf21: Receiver<string>,
+			Leaf47: Receiver<string>,
+			Leaf53: Receiver<number>,
+			Leaf61: Receiver<number>,
+			Leaf73: Receiver<boolean>,
+			Leaf103: Receiver<number>,
+			Leaf108: Receiver<string>,
+			Leaf118: Receiver<boolean>,
+			Leaf125: Receiver<number>,
+			Leaf143: Receiver<boolean>,
+			Leaf152: Receiver<string>,
+			Leaf198: Receiver<{[string]: Item4}>,
+		},
+		Group1_2: {
+			Leaf24: Receiver<number>,
+			Leaf35: Receiver<number>,
+			Leaf50: Receiver<number>,
+			Leaf92: Receiver<{[number]: Item1}>,
+			Leaf119: Receiver<number>,
+			Leaf127: Receiver<boolean>,
+			Leaf162: Receiver<number>,
+			Leaf167: Receiver<boolean>,
+			Leaf177: Receiver<number>,
+		},
+	},
+}
+
+--Constants
+local GET_SUFFIX = "DATA_TREE_CLT_GET"
+local UPDATE_SUFFIX = "DATA_TREE_CLT_UPDATE"
+local SNAPSHOT_SUFFIX = "DATA_TREE_CLT_SNAPSHOT"
+
+-- Class
+local tree: DataTree = {} :: any
+local values = {}
+function tree.init(maid: Maid): nil
+	local function connectUpdate(scope: string, callback: (...any) -> ())
+		local updateKey = scope .. "_" .. UPDATE_SUFFIX
+		if RunService:IsRunning() then
+			maid:GiveTask(NetworkUtil.onClientEventAt(updateKey, Players.LocalPlayer, callback))
+		else
+			maid:GiveTask(NetworkUtil.getBindableEvent(updateKey).Event:Connect(callback))
+		end
+	end
+	
+	local function fetchValue(scope: string): ...any
+		local getKey = scope .. "_" .. GET_SUFFIX
+		if RunService:IsRunning() then
+			return NetworkUtil.getRemoteFunction(getKey, Players.LocalPlayer):InvokeServer()
+		else
+			return NetworkUtil.getBindableFunction(getKey):Invoke()
+		end
+	end
+	
+	-- every value is fetched in one round trip, receivers missing from it fall back to fetching their own
+	local snapshot: { [string]: { any } } = {}
+	local snapshotEntries: { { any } }
+	if RunService:IsRunning() then
+		snapshotEntries = NetworkUtil.getRemoteFunction(SNAPSHOT_SUFFIX, Players.LocalPlayer):InvokeServer()
+	else
+		snapshotEntries = NetworkUtil.getBindableFunction(SNAPSHOT_SUFFIX):Invoke()
+	end
+	for i, entry in ipairs(snapshotEntries) do
+		snapshot[entry[1]] = entry
+	end
+	
+	local function newReceiver<T>(scope: string): Receiver<T>
+		connectUpdate(scope, function(val)
+			values[scope] = val
+		end)
+		local entry = snapshot[scope]
+		if entry then
+			values[scope] = entry[2]
+		else
+			values[scope] = fetchValue(scope)
+		end
+		
+		return function(): T
+			return values[scope] :: any
+		end
+	end
+
+	tree = {
+		["Group0_1"] = {
+			["Group1_0"] = {
+				["Leaf0"] = newReceiver("Group0_1/Group1_0/Leaf0"),
+				["Leaf15"] = newReceiver("Group0_1/Group1_0/Leaf15"),
+				["Leaf22"] = newReceiver("Group0_1/Group1_0/Leaf22"),
+				["Leaf52"] = newReceiver("Group0_1/Group1_0/Leaf52"),
+				["Leaf59"] = newReceiver("Group0_1/Group1_0/Leaf59"),
+				["Leaf62"] = newReceiver("Group0_1/Group1_0/Leaf62"),
+				["Leaf70"] = newReceiver("Group0_1/Group1_0/Leaf70"),
+				["Leaf84"] = newReceiver("Group0_1/Group1_0/Leaf84"),
+				["Leaf95"] = newReceiver("Group0_1/Group1_0/Leaf95"),
+				["Leaf100"] = newReceiver("Group0_1/Group1_0/Leaf100"),
+				["Leaf122"] = newReceiver("Group0_1/Group1_0/Leaf122"),
+				["Leaf130"] = newReceiver("Group0_1/Group1_0/Leaf130"),
+				["Leaf135"] = newReceiver("Group0_1/Group1_0/Leaf135"),
+				["Leaf153"] = newReceiver("Group0_1/Group1_0/Leaf153"),
+				["Leaf170"] = newReceiver("Group0_1/Group1_0/Leaf170"),
+				["Leaf188"] = newReceiver("Group0_1/Group1_0/Leaf188"),
+			},
+			["Group1_2"] = {
+				["Leaf26"] = newReceiver("Group0_1/Group1_2/Leaf26"),
+				["Leaf71"] = newReceiver("Group0_1/Group1_2/Leaf71"),
+				["Leaf79"] = newReceiver("Group0_1/Group1_2/Leaf79"),
+				["Leaf94"] = newReceiver("Group0_1/Group1_2/Leaf94"),
+				["Leaf113"] = newReceiver("Group0_1/Group1_2/Leaf113"),
+				["Leaf137"] = newReceiver("Group0_1/Group1_2/Leaf137"),
+				["Leaf141"] = newReceiver("Group0_1/Group1_2/Leaf141"),
+				["Leaf159"] = newReceiver("Group0_1/Group1_2/Leaf159"),
+				["Leaf161"] = newReceiver("Group0_1/Group1_2/Leaf161"),
+				["Leaf166"] = newReceiver("Group0_1/Group1_2/Leaf166"),
+				["Leaf184"] = newReceiver("Group0_1/Group1_2/Leaf184"),
+			},
+			["Group1_3"] = {
+				["Leaf29"] = newReceiver("Group0_1/Group1_3/Leaf29"),
+				["Leaf55"] = newReceiver("Group0_1/Group1_3/Leaf55"),
+				["Leaf64"] = newReceiver("Group0_1/Group1_3/Leaf64"),
+				["Leaf80"] = newReceiver("Group0_1/Group1_3/Leaf80"),
+				["Leaf85"] = newReceiver("Group0_1/Group1_3/Leaf85"),
+				["Leaf97"] = newReceiver("Group0_1/Group1_3/Leaf97"),
+				["Leaf111"] = newReceiver("Group0_1/Group1_3/Leaf111"),
+				["Leaf115"] = newReceiver("Group0_1/Group1_3/Leaf115"),
+				["Leaf139"] = newReceiver("Group0_1/Group1_3/Leaf139"),
+				["Leaf157"] = newReceiver("Group0_1/Group1_3/Leaf157"),
+				["Leaf175"] = newReceiver("Group0_1/Group1_3/Leaf175"),
+			},
+			["Group1_1"] = {
+				["Leaf58"] = newReceiver("Group0_1/Group1_1/Leaf58"),
+				["Leaf74"] = newReceiver("Group0_1/Group1_1/Leaf74"),
+				["Leaf87"] = newReceiver("Group0_1/Group1_1/Leaf87"),
+				["Leaf102"] = newReceiver("Group0_1/Group1_1/Leaf102"),
+				["Leaf134"] = newReceiver("Group0_1/Group1_1/Leaf134"),
+				["Leaf151"] = newReceiver("Group0_1/Group1_1/Leaf151"),
+				["Leaf168"] = newReceiver("Group0_1/Group1_1/Leaf168"),
+			},
+		},
+		["Group0_3"] = {
+			["Group1_0"] = {
+				["Leaf1"] = newReceiver("Group0_3/Group1_0/Leaf1"),
+				["Leaf31"] = newReceiver("Group0_3/Group1_0/Leaf31"),
+				["Leaf36"] = newReceiver("Group0_3/Group1_0/Leaf36"),
+				["Leaf48"] = newReceiver("Group0_3/Group1_0/Leaf48"),
+				["Leaf51"] = newReceiver("Group0_3/Group1_0/Leaf51"),
+				["Leaf77"] = newReceiver("Group0_3/Group1_0/Leaf77"),
+				["Leaf89"] = newReceiver("Group0_3/Group1_0/Leaf89"),
+				["Leaf104"] = newReceiver("Group0_3/Group1_0/Leaf104"),
+				["Leaf109"] = newReceiver("Group0_3/Group1_0/Leaf109"),
+				["Leaf132"] = newReceiver("Group0_3/Group1_0/Leaf132"),
+				["Leaf140"] = newReceiver("Group0_3/Group1_0/Leaf140"),
+				["Leaf158"] = newReceiver("Group0_3/Group1_0/Leaf158"),
+				["Leaf160"] = newReceiver("Group0_3/Group1_0/Leaf160"),
+				["Leaf181"] = newReceiver("Group0_3/Group1_0/Leaf181"),
+				["Leaf186"] = newReceiver("Group0_3/Group1_0/Leaf186"),
+				["Leaf190"] = newReceiver("Group0_3/Group1_0/Leaf190"),
+				["Leaf196"] = newReceiver("Group0_3/Group1_0/Leaf196"),
+			},
+			["Group1_3"] = {
+				["Leaf4"] = newReceiver("Group0_3/Group1_3/Leaf4"),
+				["Leaf25"] = newReceiver("Group0_3/Group1_3/Leaf25"),
+				["Leaf27"] = newReceiver("Group0_3/Group1_3/Leaf27"),
+				["Leaf41"] = newReceiver("Group0_3/Group1_3/Leaf41"),
+				["Leaf60"] = newReceiver("Group0_3/Group1_3/Leaf60"),
+				["Leaf69"] = newReceiver("Group0_3/Group1_3/Leaf69"),
+				["Leaf91"] = newReceiver("Group0_3/Group1_3/Leaf91"),
+				["Leaf124"] = newReceiver("Group0_3/Group1_3/Leaf124"),
+				["Leaf138"] = newReceiver("Group0_3/Group1_3/Leaf138"),
+				["Leaf154"] = newReceiver("Group0_3/Group1_3/Leaf154"),
+				["Leaf155"] = newReceiver("Group0_3/Group1_3/Leaf155"),
+				["Leaf174"] = newReceiver("Group0_3/Group1_3/Leaf174"),
+				["Leaf185"] = newReceiver("Group0_3/Group1_3/Leaf185"),
+			},
+			["Group1_1"] = {
+				["Leaf12"] = newReceiver("Group0_3/Group1_1/Leaf12"),
+				["Leaf17"] = newReceiver("Group0_3/Group1_1/Leaf17"),
+				["Leaf45"] = newReceiver("Group0_3/Group1_1/Leaf45"),
+				["Leaf90"] = newReceiver("Group0_3/Group1_1/Leaf90"),
+				["Leaf101"] = newReceiver("Group0_3/Group1_1/Leaf101"),
+				["Leaf105"] = newReceiver("Group0_3/Group1_1/Leaf105"),
+				["Leaf116"] = newReceiver("Group0_3/Group1_1/Leaf116"),
+				["Leaf136"] = newReceiver("Group0_3/Group1_1/Leaf136"),
+				["Leaf147"] = newReceiver("Group0_3/Group1_1/Leaf147"),
+				["Leaf171"] = newReceiver("Group0_3/Group1_1/Leaf171"),
+				["Leaf179"] = newReceiver("Group0_3/Group1_1/Leaf179"),
+				["Leaf183"] = newReceiver("Group0_3/Group1_1/Leaf183"),
+				["Leaf187"] = newReceiver("Group0_3/Group1_1/Leaf187"),
+				["Leaf193"] = newReceiver("Group0_3/Group1_1/Leaf193"),
+			},
+			["Group1_2"] = {
+				["Leaf33"] = newReceiver("Group0_3/Group1_2/Leaf33"),
+				["Leaf57"] = newReceiver("Group0_3/Group1_2/Leaf57"),
+				["Leaf67"] = newReceiver("Group0_3/Group1_2/Leaf67"),
+				["Leaf83"] = newReceiver("Group0_3/Group1_2/Leaf83"),
+				["Leaf88"] = newReceiver("Group0_3/Group1_2/Leaf88"),
+				["Leaf99"] = newReceiver("Group0_3/Group1_2/Leaf99"),
+				["Leaf128"] = newReceiver("Group0_3/Group1_2/Leaf128"),
+				["Leaf144"] = newReceiver("Group0_3/Group1_2/Leaf144"),
+				["Leaf149"] = newReceiver("Group0_3/Group1_2/Leaf149"),
+				["Leaf172"] = newReceiver("Group0_3/Group1_2/Leaf172"),
+				["Leaf194"] = newReceiver("Group0_3/Group1_2/Leaf194"),
+			},
+		},
+		["Group0_0"] = {
+			["Group1_0"] = {
+				["Leaf2"] = newReceiver("Group0_0/Group1_0/Leaf2"),
+				["Leaf8"] = newReceiver("Group0_0/Group1_0/Leaf8"),
+				["Leaf9"] = newReceiver("Group0_0/Group1_0/Leaf9"),
+				["Leaf30"] = newReceiver("Group0_0/Group1_0/Leaf30"),
+				["Leaf34"] = newReceiver("Group0_0/Group1_0/Leaf34"),
+				["Leaf39"] = newReceiver("Group0_0/Group1_0/Leaf39"),
+				["Leaf65"] = newReceiver("Group0_0/Group1_0/Leaf65"),
+				["Leaf68"] = newReceiver("Group0_0/Group1_0/Leaf68"),
+				["Leaf75"] = newReceiver("Group0_0/Group1_0/Leaf75"),
+				["Leaf86"] = newReceiver("Group0_0/Group1_0/Leaf86"),
+				["Leaf117"] = newReceiver("Group0_0/Group1_0/Leaf117"),
+				["Leaf120"] = newReceiver("Group0_0/Group1_0/Leaf120"),
+				["Leaf131"] = newReceiver("Group0_0/Group1_0/Leaf131"),
+				["Leaf145"] = newReceiver("Group0_0/Group1_0/Leaf145"),
+				["Leaf148"] = newReceiver("Group0_0/Group1_0/Leaf148"),
+				["Leaf173"] = newReceiver("Group0_0/Group1_0/Leaf173"),
+			},
+			["Group1_2"] = {
+				["Leaf5"] = newReceiver("Group0_0/Group1_2/Leaf5"),
+				["Leaf23"] = newReceiver("Group0_0/Group1_2/Leaf23"),
+				["Leaf37"] = newReceiver("Group0_0/Group1_2/Leaf37"),
+				["Leaf46"] = newReceiver("Group0_0/Group1_2/Leaf46"),
+				["Leaf82"] = newReceiver("Group0_0/Group1_2/Leaf82"),
+				["Leaf93"] = newReceiver("Group0_0/Group1_2/Leaf93"),
+				["Leaf133"] = newReceiver("Group0_0/Group1_2/Leaf133"),
+				["Leaf176"] = newReceiver("Group0_0/Group1_2/Leaf176"),
+				["Leaf178"] = newReceiver("Group0_0/Group1_2/Leaf178"),
+				["Leaf191"] = newReceiver("Group0_0/Group1_2/Leaf191"),
+				["Leaf195"] = newReceiver("Group0_0/Group1_2/Leaf195"),
+				["Leaf199"] = newReceiver("Group0_0/Group1_2/Leaf199"),
+			},
+			["Group1_1"] = {
+				["Leaf7"] = newReceiver("Group0_0/Group1_1/Leaf7"),
+				["Leaf11"] = newReceiver("Group0_0/Group1_1/Leaf11"),
+				["Leaf14"] = newReceiver("Group0_0/Group1_1/Leaf14"),
+				["Leaf18"] = newReceiver("Group0_0/Group1_1/Leaf18"),
+				["Leaf28"] = newReceiver("Group0_0/Group1_1/Leaf28"),
+				["Leaf32"] = newReceiver("Group0_0/Group1_1/Leaf32"),
+				["Leaf76"] = newReceiver("Group0_0/Group1_1/Leaf76"),
+				["Leaf110"] = newReceiver("Group0_0/Group1_1/Leaf110"),
+				["Leaf114"] = newReceiver("Group0_0/Group1_1/Leaf114"),
+				["Leaf146"] = newReceiver("Group0_0/Group1_1/Leaf146"),
+				["Leaf156"] = newReceiver("Group0_0/Group1_1/Leaf156"),
+				["Leaf163"] = newReceiver("Group0_0/Group1_1/Leaf163"),
+				["Leaf189"] = newReceiver("Group0_0/Group1_1/Leaf189"),
+			},
+			["Group1_3"] = {
+				["Leaf10"] = newReceiver("Group0_0/Group1_3/Leaf10"),
+				["Leaf13"] = newReceiver("Group0_0/Group1_3/Leaf13"),
+				["Leaf16"] = newReceiver("Group0_0/Group1_3/Leaf16"),
+				["Leaf20"] = newReceiver("Group0_0/Group1_3/Leaf20"),
+				["Leaf56"] = newReceiver("Group0_0/Group1_3/Leaf56"),
+				["Leaf66"] = newReceiver("Group0_0/Group1_3/Leaf66"),
+				["Leaf78"] = newReceiver("Group0_0/Group1_3/Leaf78"),
+				["Leaf81"] = newReceiver("Group0_0/Group1_3/Leaf81"),
+				["Leaf107"] = newReceiver("Group0_0/Group1_3/Leaf107"),
+				["Leaf126"] = newReceiver("Group0_0/Group1_3/Leaf126"),
+				["Leaf164"] = newReceiver("Group0_0/Group1_3/Leaf164"),
+				["Leaf192"] = newReceiver("Group0_0/Group1_3/Leaf192"),
+				["Leaf197"] = newReceiver("Group0_0/Group1_3/Leaf197"),
+			},
+		},
+		["Group0_2"] = {
+			["Group1_1"] = {
+				["Leaf3"] = newReceiver("Group0_2/Group1_1/Leaf3"),
+				["Leaf6"] = newReceiver("Group0_2/Group1_1/Leaf6"),
+				["Leaf44"] = newReceiver("Group0_2/Group1_1/Leaf44"),
+				["Leaf54"] = newReceiver("Group0_2/Group1_1/Leaf54"),
+				["Leaf98"] = newReceiver("Group0_2/Group1_1/Leaf98"),
+				["Leaf112"] = newReceiver("Group0_2/Group1_1/Leaf112"),
+				["Leaf123"] = newReceiver("Group0_2/Group1_1/Leaf123"),
+				["Leaf129"] = newReceiver("Group0_2/Group1_1/Leaf129"),
+			},
+			["Group1_0"] = {
+				["Leaf19"] = newReceiver("Group0_2/Group1_0/Leaf19"),
+				["Leaf38"] = newReceiver("Group0_2/Group1_0/Leaf38"),
+				["Leaf40"] = newReceiver("Group0_2/Group1_0/Leaf40"),
+				["Leaf42"] = newReceiver("Group0_2/Group1_0/Leaf42"),
+				["Leaf43"] = newReceiver("Group0_2/Group1_0/Leaf43"),
+				["Leaf49"] = newReceiver("Group0_2/Group1_0/Leaf49"),
+				["Leaf63"] = newReceiver("Group0_2/Group1_0/Leaf63"),
+				["Leaf72"] = newReceiver("Group0_2/Group1_0/Leaf72"),
+				["Leaf96"] = newReceiver("Group0_2/Group1_0/Leaf96"),
+				["Leaf106"] = newReceiver("Group0_2/Group1_0/Leaf106"),
+				["Leaf121"] = newReceiver("Group0_2/Group1_0/Leaf121"),
+				["Leaf142"] = newReceiver("Group0_2/Group1_0/Leaf142"),
+				["Leaf150"] = newReceiver("Group0_2/Group1_0/Leaf150"),
+				["Leaf165"] = newReceiver("Group0_2/Group1_0/Leaf165"),
+				["Leaf169"] = newReceiver("Group0_2/Group1_0/Leaf169"),
+				["Leaf180"] = newReceiver("Group0_2/Group1_0/Leaf180"),
+				["Leaf182"] = newReceiver("Group0_2/Group1_0/Leaf182"),
+			},
+			["Group1_3"] = {
+				["Leaf21"] = newReceiver("Group0_2/Group1_3/Leaf21"),
+				["Leaf47"] = newReceiver("Group0_2/Group1_3/Leaf47"),
+				["Leaf53"] = newReceiver("Group0_2/Group1_3/Leaf53"),
+				["Leaf61"] = newReceiver("Group0_2/Group1_3/Leaf61"),
+				["Leaf73"] = newReceiver("Group0_2/Group1_3/Leaf73"),
+				["Leaf103"] = newReceiver("Group0_2/Group1_3/Leaf103"),
+				["Leaf108"] = newReceiver("Group0_2/Group1_3/Leaf108"),
+				["Leaf118"] = newReceiver("Group0_2/Group1_3/Leaf118"),
+				["Leaf125"] = newReceiver("Group0_2/Group1_3/Leaf125"),
+				["Leaf143"] = newReceiver("Group0_2/Group1_3/Leaf143"),
+				["Leaf152"] = newReceiver("Group0_2/Group1_3/Leaf152"),
+				["Leaf198"] = newReceiver("Group0_2/Group1_3/Leaf198"),
+			},
+			["Group1_2"] = {
+				["Leaf24"] = newReceiver("Group0_2/Group1_2/Leaf24"),
+				["Leaf35"] = newReceiver("Group0_2/Group1_2/Leaf35"),
+				["Leaf50"] = newReceiver("Group0_2/Group1_2/Leaf50"),
+				["Leaf92"] = newReceiver("Group0_2/Group1_2/Leaf92"),
+				["Leaf119"] = newReceiver("Group0_2/Group1_2/Leaf119"),
+				["Leaf127"] = newReceiver("Group0_2/Group1_2/Leaf127"),
+				["Leaf162"] = newReceiver("Group0_2/Group1_2/Leaf162"),
+				["Leaf167"] = newReceiver("Group0_2/Group1_2/Leaf167"),
+				["Leaf177"] = newReceiver("Group0_2/Group1_2/Leaf177"),
+			},
+		},
+		["init"] = function(maid: Maid) return nil end,
+	}
+	return nil
+end
+
+return ServiceProxy(function()
+	return tree
+end)
\ No newline at end of file
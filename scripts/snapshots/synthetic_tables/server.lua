@@ -0,0 +1,1878 @@
+--!strict
+-- this script was generated by nightcycle/datatree, do not manually edit
+
+--Services
+local Players = game:GetService("Players")
+local DataStoreService = require(script:WaitForChild("Packages"):WaitForChild("MockDataStoreService"))
+local RunService = game:GetService("RunService")
+local HttpService = game:GetService("HttpService")
+
+--Packages
+local NetworkUtil = require(script:WaitForChild("Packages"):WaitForChild("NetworkUtil"))
+local Maid = require(script:WaitForChild("Packages"):WaitForChild("Maid"))
+local Signal = require(script:WaitForChild("Packages"):WaitForChild("Signal"))
+local Base64 = require(script:WaitForChild("Packages"):WaitForChild("Base64"))
+
+--Modules
+local DataTypes = require(game:GetService("ReplicatedStorage"):WaitForChild("Shared"):WaitForChild("DataTreeTypes"))
+
+--Types
+type Table = {[any]: any}
+type Signal = Signal.Signal
+type Maid = Maid.Maid
+export type Rarity = DataTypes.Rarity
+export type Item0 = DataTypes.Item0
+export type Item1 = DataTypes.Item1
+export type Item2 = DataTypes.Item2
+export type Item3 = DataTypes.Item3
+export type Item4 = DataTypes.Item4
+export type Item5 = DataTypes.Item5
+export type Item6 = DataTypes.Item6
+export type Item7 = DataTypes.Item7
+export type Item8 = DataTypes.Item8
+export type Item9 = DataTypes.Item9
+export type UserId = number
+export type UserIdKey = string
+type Processor<V> = (val: V) -> V
+type Serializer<D,S> = (data: D) -> S
+type Deserializer<S,D> = (data: S) -> D
+export type DataHandler<T, S> = {
+	__index: DataHandler<T, S>,
+	_Maid: Maid,
+	_IsAlive: boolean,
+	_IsLoaded: boolean,
+	_IsDirty: boolean,
+	_Value: T?,
+	_EncodedValue: S?,
+	_Serialize: Serializer<T, S>,
+	_Deserialize: Deserializer<S, T>,
+	OnChanged: Signal,
+	ClassName: "DataHandler",
+	Scope: string,
+	Key: UserIdKey,
+	Player: Player,
+	DataStore: DataStore,
+	SetOptions: DataStoreSetOptions,
+	IncrementOptions: DataStoreIncrementOptions,
+	init: (maid: Maid) -> nil,
+	new: (player: Player, scope: string, initialValue: T, _serializer: Serializer<T,S>?, _deserializer: Deserializer<S,T>?) -> DataHandler<T, S>,
+	Destroy: (self: DataHandler<T, S>) -> nil,
+	Get: (self: DataHandler<T, S>, force: boolean?) -> (T?, boolean),
+	Set: (self: DataHandler<T, S>, data: T, force: boolean?) -> boolean,
+	Update: (self: DataHandler<T, S>, transformer: (T) -> T, force: boolean?) -> (T?, boolean),
+	Remove: (self: DataHandler<T, S>) -> nil,
+	_Stage: (self: DataHandler<T, S>, encodedValue: S?) -> nil,
+	_Load: (self: DataHandler<T, S>) -> (S?, boolean),
+	_Save: (self: DataHandler<T, S>, encodedValue: S?, priority: number?) -> boolean,
+	_Flush: (self: DataHandler<T, S>, priority: number?) -> boolean,
+	_Init: (self: DataHandler<T, S>) -> boolean,
+	_Transform: (self: DataHandler<T, S>, transformer: (S?) -> S?) -> (S?, boolean),
+}
+type DataStoreRequest = {
+	RequestType: Enum.DataStoreRequestType,
+	Priority: number,
+	Order: number,
+	CoalesceKey: string?,
+	Callback: () -> any,
+	Threads: { thread },
+	Attempts: number,
+	RetryAt: number,
+}
+export type SortedDataEntry = {
+	UserId: number,
+	Value: number,
+}
+type Leaderboard = {
+	DataStore: OrderedDataStore,
+	IsAscending: boolean,
+	Entries: { [number]: SortedDataEntry },
+	Pages: DataStorePages?,
+	IsFinished: boolean,
+	RefreshedAt: number,
+	Loading: Signal?,
+}
+export type NumberDataHandler = DataHandler<number, number> & {
+	ClassName: "NumberDataHandler",
+	DataStore: OrderedDataStore,
+	_EncodedValue: number?,
+	_Serialize: Processor<number>,
+	_Deserialize: Processor<number>,
+	_Value: number?,
+	Increment: (self: NumberDataHandler, delta: number, force: boolean?) -> (number?, boolean),
+	_Increment: (self: NumberDataHandler, delta: number) -> (number?, boolean),
+	new: (player: Player, scope: string, initialValue: number, _processor: Processor<number>?) -> NumberDataHandler,
+	GetSortedList: (self: NumberDataHandler, limit: number, isAscending: boolean?) -> { [number]: SortedDataEntry },
+}
+export type DataTree = {
+	Group0_1: {
+		Group1_0: {
+			Leaf0: DataHandler<string, string>,
+			Leaf15: NumberDataHandler,
+			Leaf22: NumberDataHandler,
+			Leaf52: NumberDataHandler,
+			Leaf59: DataHandler<boolean, boolean>,
+			Leaf62: DataHandler<string, string>,
+			Leaf70: NumberDataHandler,
+			Leaf84: DataHandler<boolean, boolean>,
+			Leaf95: DataHandler<string, string>,
+			Leaf100: DataHandler<{[number]: Item9}, string>,
+			Leaf122: DataHandler<string, string>,
+			Leaf130: DataHandler<boolean, boolean>,
+			Leaf135: DataHandler<string, string>,
+			Leaf153: NumberDataHandler,
+			Leaf170: DataHandler<{[string]: Item3}, string>,
+			Leaf188: NumberDataHandler,
+		},
+		Group1_2: {
+			Leaf26: DataHandler<{[string]: Item3}, string>,
+			Leaf71: DataHandler<string, string>,
+			Leaf79: DataHandler<{[string]: Item8}, string>,
+			Leaf94: DataHandler<{[number]: Item2}, string>,
+			Leaf113: DataHandler<{[string]: Item7}, string>,
+			Leaf137: DataHandler<{[number]: Item2}, string>,
+			Leaf141: DataHandler<{[number]: Item2}, string>,
+			Leaf159: DataHandler<string, string>,
+			Leaf161: DataHandler<boolean, boolean>,
+			Leaf166: NumberDataHandler,
+			Leaf184: DataHandler<string, string>,
+		},
+		Group1_3: {
+			Leaf29: DataHandler<boolean, boolean>,
+			Leaf55: DataHandler<{[number]: Item1}, string>,
+			Leaf64: DataHandler<boolean, boolean>,
+			Leaf80: DataHandler<boolean, boolean>,
+			Leaf85: NumberDataHandler,
+			Leaf97: DataHandler<{[string]: Item5}, string>,
+			Leaf111: NumberDataHandler,
+			Leaf115: DataHandler<boolean, boolean>,
+			Leaf139: NumberDataHandler,
+			Leaf157: DataHandler<boolean, boolean>,
+			Leaf175: DataHandler<boolean, boolean>,
+		},
+		Group1_1: {
+			Leaf58: DataHandler<{[number]: Item7}, string>,
+			Leaf74: DataHandler<string, string>,
+			Leaf87: DataHandler<{[string]: Item8}, string>,
+			Leaf102: DataHandler<string, string>,
+			Leaf134: DataHandler<string, string>,
+			Leaf151: DataHandler<string, string>,
+			Leaf168: DataHandler<string, string>,
+		},
+	},
+	Group0_3: {
+		Group1_0: {
+			Leaf1: DataHandler<{[string]: Item2}, string>,
+			Leaf31: DataHandler<boolean, boolean>,
+			Leaf36: DataHandler<{[string]: Item7}, string>,
+			Leaf48: DataHandler<{[number]: Item7}, string>,
+			Leaf51: DataHandler<{[number]: Item1}, string>,
+			Leaf77: DataHandler<boolean, boolean>,
+			Leaf89: DataHandler<boolean, boolean>,
+			Leaf104: NumberDataHandler,
+			Leaf109: NumberDataHandler,
+			Leaf132: NumberDataHandler,
+			Leaf140: NumberDataHandler,
+			Leaf158: NumberDataHandler,
+			Leaf160: DataHandler<string, string>,
+			Leaf181: DataHandler<{[number]: Item0}, string>,
+			Leaf186: NumberDataHandler,
+			Leaf190: DataHandler<boolean, boolean>,
+			Leaf196: DataHandler<string, string>,
+		},
+		Group1_3: {
+			Leaf4: DataHandler<string, string>,
+			Leaf25: NumberDataHandler,
+			Leaf27: DataHandler<{[number]: Item9}, string>,
+			Leaf41: NumberDataHandler,
+			Leaf60: DataHandler<boolean, boolean>,
+			Leaf69: DataHandler<boolean, boolean>,
+			Leaf91: NumberDataHandler,
+			Leaf124: DataHandler<string, string>,
+			Leaf138: DataHandler<boolean, boolean>,
+			Leaf154: NumberDataHandler,
+			Leaf155: NumberDataHandler,
+			Leaf174: NumberDataHandler,
+			Leaf185: DataHandler<{[string]: Item4}, string>,
+		},
+		Group1_1: {
+			Leaf12: NumberDataHandler,
+			Leaf17: NumberDataHandler,
+			Leaf45: DataHandler<boolean, boolean>,
+			Leaf90: NumberDataHandler,
+			Leaf101: NumberDataHandler,
+			Leaf105: DataHandler<string, string>,
+			Leaf116: DataHandler<boolean, boolean>,
+			Leaf136: DataHandler<boolean, boolean>,
+			Leaf147: DataHandler<string, string>,
+			Leaf171: NumberDataHandler,
+			Leaf179: NumberDataHandler,
+			Leaf183: NumberDataHandler,
+			Leaf187: DataHandler<{[string]: Item2}, string>,
+			Leaf193: NumberDataHandler,
+		},
+		Group1_2: {
+			Leaf33: DataHandler<{[string]: Item0}, string>,
+			Leaf57: NumberDataHandler,
+			Leaf67: NumberDataHandler,
+			Leaf83: NumberDataHandler,
+			Leaf88: NumberDataHandler,
+			Leaf99: DataHandler<string, string>,
+			Leaf128: NumberDataHandler,
+			Leaf144: NumberDataHandler,
+			Leaf149: NumberDataHandler,
+			Leaf172: NumberDataHandler,
+			Leaf194: DataHandler<boolean, boolean>,
+		},
+	},
+	Group0_0: {
+		Group1_0: {
+			Leaf2: DataHandler<boolean, boolean>,
+			Leaf8: NumberDataHandler,
+			Leaf9: DataHandler<{[string]: Item3}, string>,
+			Leaf30: DataHandler<string, string>,
+			Leaf34: DataHandler<{[string]: Item9}, string>,
+			Leaf39: DataHandler<{[string]: Item4}, string>,
+			Leaf65: DataHandler<{[number]: Item2}, string>,
+			Leaf68: NumberDataHandler,
+			Leaf75: NumberDataHandler,
+			Leaf86: NumberDataHandler,
+			Leaf117: NumberDataHandler,
+			Leaf120: DataHandler<string, string>,
+			Leaf131: NumberDataHandler,
+			Leaf145: DataHandler<{[number]: Item5}, string>,
+			Leaf148: DataHandler<string, string>,
+			Leaf173: DataHandler<string, string>,
+		},
+		Group1_2: {
+			Leaf5: DataHandler<boolean, boolean>,
+			Leaf23: DataHandler<{[number]: Item7}, string>,
+			Leaf37: DataHandler<{[string]: Item8}, string>,
+			Leaf46: DataHandler<{[string]: Item8}, string>,
+			Leaf82: NumberDataHandler,
+			Leaf93: NumberDataHandler,
+			Leaf133: DataHandler<string, string>,
+			Leaf176: DataHandler<{[string]: Item6}, string>,
+			Leaf178: NumberDataHandler,
+			Leaf191: DataHandler<boolean, boolean>,
+			Leaf195: DataHandler<string, string>,
+			Leaf199: DataHandler<string, string>,
+		},
+		Group1_1: {
+			Leaf7: NumberDataHandler,
+			Leaf11: NumberDataHandler,
+			Leaf14: DataHandler<{[number]: Item4}, string>,
+			Leaf18: DataHandler<string, string>,
+			Leaf28: DataHandler<string, string>,
+			Leaf32: DataHandler<boolean, boolean>,
+			Leaf76: DataHandler<string, string>,
+			Leaf110: DataHandler<boolean, boolean>,
+			Leaf114: DataHandler<string, string>,
+			Leaf146: DataHandler<{[string]: Item6}, string>,
+			Leaf156: DataHandler<{[number]: Item2}, string>,
+			Leaf163: NumberDataHandler,
+			Leaf189: NumberDataHandler,
+		},
+		Group1_3: {
+			Leaf10: DataHandler<{[number]: Item1}, string>,
+			Leaf13: DataHandler<string, string>,
+			Leaf16: DataHandler<{[string]: Item5}, string>,
+			Leaf20: DataHandler<string, string>,
+			Leaf56: NumberDataHandler,
+			Leaf66: NumberDataHandler,
+			Leaf78: NumberDataHandler,
+			Leaf81: DataHandler<string, string>,
+			Leaf107: DataHandler<boolean, boolean>,
+			Leaf126: DataHandler<boolean, boolean>,
+			Leaf164: NumberDataHandler,
+			Leaf192: DataHandler<{[string]: Item4}, string>,
+			Leaf197: NumberDataHandler,
+		},
+	},
+	Group0_2: {
+		Group1_1: {
+			Leaf3: DataHandler<boolean, boolean>,
+			Leaf6: DataHandler<string, string>,
+			Leaf44: DataHandler<{[number]: Item9}, string>,
+			Leaf54: DataHandler<string, string>,
+			Leaf98: DataHandler<{[number]: Item3}, string>,
+			Leaf112: NumberDataHandler,
+			Leaf123: NumberDataHandler,
+			Leaf129: NumberDataHandler,
+		},
+		Group1_0: {
+			Leaf19: DataHandler<boolean, boolean>,
+			Leaf38: DataHandler<string, string>,
+			Leaf40: DataHandler<boolean, boolean>,
+			Leaf42: DataHandler<{[number]: Item4}, string>,
+			Leaf43: NumberDataHandler,
+			Leaf49: DataHandler<boolean, boolean>,
+			Leaf63: DataHandler<string, string>,
+			Leaf72: DataHandler<string, string>,
+			Leaf96: NumberDataHandler,
+			Leaf106: DataHandler<string, string>,
+			Leaf121: NumberDataHandler,
+			Leaf142: DataHandler<string, string>,
+			Leaf150: DataHandler<string, string>,
+			Leaf165: DataHandler<string, string>,
+			Leaf169: DataHandler<boolean, boolean>,
+			Leaf180: NumberDataHandler,
+			Leaf182: DataHandler<string, string>,
+		},
+		Group1_3: {
+			Leaf21: DataHandler<string, string>,
+			Leaf47: DataHandler<string, string>,
+			Leaf53: NumberDataHandler,
+			Leaf61: NumberDataHandler,
+			Leaf73: DataHandler<boolean, boolean>,
+			Leaf103: NumberDataHandler,
+			Leaf108: DataHandler<string, string>,
+			Leaf118: DataHandler<boolean, boolean>,
+			Leaf125: NumberDataHandler,
+			Leaf143: DataHandler<boolean, boolean>,
+			Leaf152: DataHandler<string, string>,
+			Leaf198: DataHandler<{[string]: Item4}, string>,
+		},
+		Group1_2: {
+			Leaf24: NumberDataHandler,
+			Leaf35: NumberDataHandler,
+			Leaf50: NumberDataHandler,
+			Leaf92: DataHandler<{[number]: Item1}, string>,
+			Leaf119: NumberDataHandler,
+			Leaf127: DataHandler<boolean, boolean>,
+			Leaf162: NumberDataHandler,
+			Leaf167: DataHandler<boolean, boolean>,
+			Leaf177: NumberDataHandler,
+		},
+	},
+}
+
+--Constants
+local BASE_DOMAIN = "gamedata"
+local GET_SUFFIX = "DATA_TREE_CLT_GET"
+local UPDATE_SUFFIX = "DATA_TREE_CLT_UPDATE"
+local SNAPSHOT_SUFFIX = "DATA_TREE_CLT_SNAPSHOT"
+local PAGE_LENGTH = 100
+local RETRY_LIMIT = 10
+local RETRY_DELAY = 0.5
+-- lower values are sent first when the request budget is low
+local PRIORITY_LEAVE = 1
+local PRIORITY_WRITE = 2
+local PRIORITY_READ = 3
+local PRIORITY_AUTOSAVE = 4
+local SHUTDOWN_TIMEOUT = 25
+local LOAD_CONCURRENCY = 8
+local LOAD_FAILED_MESSAGE = "Your data failed to load, please rejoin"
+local AUTOSAVE_INTERVAL = 60
+local LEADERBOARD_INTERVAL = 60
+local LEADERBOARD_SIZE = 100
+local LEADERBOARD_PAGE_LENGTH = math.min(PAGE_LENGTH, LEADERBOARD_SIZE)
+local SORTED_SCOPES = {
+	["Group0_1/Group1_0/Leaf15"] = true,
+	["Group0_1/Group1_0/Leaf22"] = true,
+	["Group0_1/Group1_0/Leaf52"] = true,
+	["Group0_1/Group1_0/Leaf70"] = true,
+	["Group0_1/Group1_0/Leaf153"] = true,
+	["Group0_1/Group1_0/Leaf188"] = true,
+	["Group0_1/Group1_2/Leaf166"] = true,
+	["Group0_1/Group1_3/Leaf85"] = true,
+	["Group0_1/Group1_3/Leaf111"] = true,
+	["Group0_1/Group1_3/Leaf139"] = true,
+	["Group0_3/Group1_0/Leaf104"] = true,
+	["Group0_3/Group1_0/Leaf109"] = true,
+	["Group0_3/Group1_0/Leaf132"] = true,
+	["Group0_3/Group1_0/Leaf140"] = true,
+	["Group0_3/Group1_0/Leaf158"] = true,
+	["Group0_3/Group1_0/Leaf186"] = true,
+	["Group0_3/Group1_3/Leaf25"] = true,
+	["Group0_3/Group1_3/Leaf41"] = true,
+	["Group0_3/Group1_3/Leaf91"] = true,
+	["Group0_3/Group1_3/Leaf154"] = true,
+	["Group0_3/Group1_3/Leaf155"] = true,
+	["Group0_3/Group1_3/Leaf174"] = true,
+	["Group0_3/Group1_1/Leaf12"] = true,
+	["Group0_3/Group1_1/Leaf17"] = true,
+	["Group0_3/Group1_1/Leaf90"] = true,
+	["Group0_3/Group1_1/Leaf101"] = true,
+	["Group0_3/Group1_1/Leaf171"] = true,
+	["Group0_3/Group1_1/Leaf179"] = true,
+	["Group0_3/Group1_1/Leaf183"] = true,
+	["Group0_3/Group1_1/Leaf193"] = true,
+	["Group0_3/Group1_2/Leaf57"] = true,
+	["Group0_3/Group1_2/Leaf67"] = true,
+	["Group0_3/Group1_2/Leaf83"] = true,
+	["Group0_3/Group1_2/Leaf88"] = true,
+	["Group0_3/Group1_2/Leaf128"] = true,
+	["Group0_3/Group1_2/Leaf144"] = true,
+	["Group0_3/Group1_2/Leaf149"] = true,
+	["Group0_3/Group1_2/Leaf172"] = true,
+	["Group0_0/Group1_0/Leaf8"] = true,
+	["Group0_0/Group1_0/Leaf68"] = true,
+	["Group0_0/Group1_0/Leaf75"] = true,
+	["Group0_0/Group1_0/Leaf86"] = true,
+	["Group0_0/Group1_0/Leaf117"] = true,
+	["Group0_0/Group1_0/Leaf131"] = true,
+	["Group0_0/Group1_2/Leaf82"] = true,
+	["Group0_0/Group1_2/Leaf93"] = true,
+	["Group0_0/Group1_2/Leaf178"] = true,
+	["Group0_0/Group1_1/Leaf7"] = true,
+	["Group0_0/Group1_1/Leaf11"] = true,
+	["Group0_0/Group1_1/Leaf163"] = true,
+	["Group0_0/Group1_1/Leaf189"] = true,
+	["Group0_0/Group1_3/Leaf56"] = true,
+	["Group0_0/Group1_3/Leaf66"] = true,
+	["Group0_0/Group1_3/Leaf78"] = true,
+	["Group0_0/Group1_3/Leaf164"] = true,
+	["Group0_0/Group1_3/Leaf197"] = true,
+	["Group0_2/Group1_1/Leaf112"] = true,
+	["Group0_2/Group1_1/Leaf123"] = true,
+	["Group0_2/Group1_1/Leaf129"] = true,
+	["Group0_2/Group1_0/Leaf43"] = true,
+	["Group0_2/Group1_0/Leaf96"] = true,
+	["Group0_2/Group1_0/Leaf121"] = true,
+	["Group0_2/Group1_0/Leaf180"] = true,
+	["Group0_2/Group1_3/Leaf53"] = true,
+	["Group0_2/Group1_3/Leaf61"] = true,
+	["Group0_2/Group1_3/Leaf103"] = true,
+	["Group0_2/Group1_3/Leaf125"] = true,
+	["Group0_2/Group1_2/Leaf24"] = true,
+	["Group0_2/Group1_2/Leaf35"] = true,
+	["Group0_2/Group1_2/Leaf50"] = true,
+	["Group0_2/Group1_2/Leaf119"] = true,
+	["Group0_2/Group1_2/Leaf162"] = true,
+	["Group0_2/Group1_2/Leaf177"] = true,
+}
+local METADATA = {
+}
+
+-- Private functions
+local pendingRequests: { DataStoreRequest } = {}
+local queuedRequests: { [string]: DataStoreRequest } = {}
+local activeKeys: { [string]: boolean } = {}
+local activeRequestCount = 0
+local requestCount = 0
+
+function _getRequestBudget(requestType: Enum.DataStoreRequestType): number
+	local success, budget = pcall(function()
+		return DataStoreService:GetRequestBudgetForRequestType(requestType)
+	end)
+	return if success then budget else math.huge
+end
+
+function _queueRequest(request: DataStoreRequest)
+	local coalesceKey = request.CoalesceKey
+	if coalesceKey then
+		local queuedRequest = queuedRequests[coalesceKey]
+		if queuedRequest and queuedRequest ~= request then
+			-- a newer request for the key arrived while this one was running, it answers both
+			for i, thread in ipairs(request.Threads) do
+				table.insert(queuedRequest.Threads, thread)
+			end
+			queuedRequest.Priority = math.min(queuedRequest.Priority, request.Priority)
+			return
+		end
+		queuedRequests[coalesceKey] = request
+	end
+	table.insert(pendingRequests, request)
+end
+
+function _runRequest(request: DataStoreRequest)
+	local success, result = pcall(request.Callback)
+	activeRequestCount -= 1
+	if request.CoalesceKey then
+		activeKeys[request.CoalesceKey] = nil
+	end
+	if not success then
+		warn(result)
+		request.Attempts += 1
+		if request.Attempts <= RETRY_LIMIT then
+			request.RetryAt = os.clock() + RETRY_DELAY * request.Attempts
+			_queueRequest(request)
+			return
+		end
+		result = nil
+	end
+	for i, thread in ipairs(request.Threads) do
+		task.spawn(thread, result, success)
+	end
+end
+
+function _drainRequests()
+	if #pendingRequests == 0 then
+		return
+	end
+	
+	local requests = pendingRequests
+	pendingRequests = {}
+	table.sort(requests, function(a: DataStoreRequest, b: DataStoreRequest)
+		if a.Priority ~= b.Priority then
+			return a.Priority < b.Priority
+		end
+		return a.Order < b.Order
+	end)
+	
+	local budgets: { [Enum.DataStoreRequestType]: number } = {}
+	local now = os.clock()
+	for i, request in ipairs(requests) do
+		local budget = budgets[request.RequestType]
+		if budget == nil then
+			budget = _getRequestBudget(request.RequestType)
+		end
+		
+		local coalesceKey = request.CoalesceKey
+		local isBlocked = request.RetryAt > now or (coalesceKey ~= nil and activeKeys[coalesceKey] == true)
+		if budget > 0 and not isBlocked then
+			budgets[request.RequestType] = budget - 1
+			if coalesceKey then
+				activeKeys[coalesceKey] = true
+				if queuedRequests[coalesceKey] == request then
+					queuedRequests[coalesceKey] = nil
+				end
+			end
+			activeRequestCount += 1
+			task.spawn(_runRequest, request)
+		else
+			budgets[request.RequestType] = budget
+			table.insert(pendingRequests, request)
+		end
+	end
+end
+
+function _flushRequests(timeout: number)
+	local start = os.clock()
+	while (#pendingRequests > 0 or activeRequestCount > 0) and os.clock() - start < timeout do
+		_drainRequests()
+		task.wait()
+	end
+end
+
+-- queues a DataStore call and yields until it completes, requests for the same key are merged
+function _request(requestType: Enum.DataStoreRequestType, priority: number, coalesceKey: string?, callback: () -> any): (any, boolean)
+	local request = if coalesceKey then queuedRequests[coalesceKey] else nil
+	if request then
+		-- the latest write wins, reads share the same result
+		request.Callback = callback
+		request.Priority = math.min(request.Priority, priority)
+	else
+		requestCount += 1
+		request = {
+			RequestType = requestType,
+			Priority = priority,
+			Order = requestCount,
+			CoalesceKey = coalesceKey,
+			Callback = callback,
+			Threads = {},
+			Attempts = 0,
+			RetryAt = 0,
+		}
+		_queueRequest(request :: DataStoreRequest)
+	end
+	assert(request)
+	table.insert(request.Threads, coroutine.running())
+	return coroutine.yield()
+end
+-- handlers and documents with changes that haven't been written yet
+local dirtyObjects: { [any]: boolean } = {}
+
+function _autosave()
+	local objects = dirtyObjects
+	dirtyObjects = {}
+	for object in pairs(objects) do
+		task.spawn(object._Flush, object, PRIORITY_AUTOSAVE)
+	end
+end
+
+-- changes are collected over the frame and sent on the next Heartbeat, only the latest value of each handler is sent
+local pendingUpdates: { [any]: (...any) -> () } = {}
+
+function _flushUpdates()
+	if next(pendingUpdates) == nil then
+		return
+	end
+	local updates = pendingUpdates
+	pendingUpdates = {}
+	for handler, fireUpdate in pairs(updates) do
+		if handler._IsAlive then
+			fireUpdate(handler._Value)
+		end
+	end
+end
+
+-- sorted lists are shared by every caller on the server, and only fetched again once they're LEADERBOARD_INTERVAL old
+local leaderboards: { [string]: Leaderboard } = {}
+
+function _getLeaderboard(scope: string, isAscending: boolean): Leaderboard
+	local key = scope .. (if isAscending then "/Ascending" else "/Descending")
+	local leaderboard = leaderboards[key]
+	if not leaderboard then
+		leaderboard = {
+			DataStore = DataStoreService:GetOrderedDataStore(BASE_DOMAIN, scope),
+			IsAscending = isAscending,
+			Entries = {},
+			IsFinished = false,
+			RefreshedAt = -math.huge,
+		}
+		leaderboards[key] = leaderboard
+	end
+	assert(leaderboard)
+	return leaderboard
+end
+
+-- fetches the first page when the list is stale, otherwise the next one
+function _loadLeaderboardPage(leaderboard: Leaderboard)
+	local isRefresh = os.clock() - leaderboard.RefreshedAt >= LEADERBOARD_INTERVAL
+	local pages = leaderboard.Pages
+	local loading = Signal.new()
+	leaderboard.Loading = loading
+	
+	local result, success = _request(Enum.DataStoreRequestType.GetSortedAsync, PRIORITY_READ, nil, function()
+		if isRefresh or not pages then
+			return leaderboard.DataStore:GetSortedAsync(leaderboard.IsAscending, LEADERBOARD_PAGE_LENGTH)
+		end
+		pages:AdvanceToNextPageAsync()
+		return pages
+	end)
+	
+	if isRefresh then
+		leaderboard.RefreshedAt = os.clock()
+		if success then
+			leaderboard.Entries = {}
+			leaderboard.Pages = result
+		end
+	end
+	if success then
+		local entries = leaderboard.Entries
+		for i, data in ipairs(result:GetCurrentPage()) do
+			if #entries >= LEADERBOARD_SIZE then
+				break
+			end
+			table.insert(entries, {
+				UserId = tonumber(data.key) :: number,
+				Value = data.value,
+			})
+		end
+		leaderboard.IsFinished = result.IsFinished or #entries >= LEADERBOARD_SIZE
+	else
+		-- keep serving what's cached until the next refresh
+		leaderboard.IsFinished = true
+	end
+	
+	leaderboard.Loading = nil
+	loading:Fire()
+	loading:Destroy()
+end
+
+function _getSortedList(scope: string, limit: number, isAscending: boolean): { [number]: SortedDataEntry }
+	local leaderboard = _getLeaderboard(scope, isAscending)
+	limit = math.min(limit, LEADERBOARD_SIZE)
+	while true do
+		local loading = leaderboard.Loading
+		if loading then
+			-- one page is fetched at a time, everyone else waits for it
+			loading:Wait()
+		elseif os.clock() - leaderboard.RefreshedAt >= LEADERBOARD_INTERVAL or (#leaderboard.Entries < limit and not leaderboard.IsFinished) then
+			_loadLeaderboardPage(leaderboard)
+		else
+			break
+		end
+	end
+	return table.move(leaderboard.Entries, 1, math.min(limit, #leaderboard.Entries), 1, {})
+end
+
+function _serializeList(unitMethod: (((val: any) -> Table) | ((val: any) -> string) | ((val: number) -> number) | ((val: boolean) -> boolean))): (val: { [number]: any }) -> Table
+	return function(listVal: { [number]: any }): Table
+		local out = {}
+		for i, v in ipairs(listVal) do
+			out[i] = (unitMethod :: any)(v)
+		end
+		return out
+	end
+end
+function _deserializeList(unitMethod: (((val: string) -> any) | ((val: Table) -> any) | ((val: number) -> number) | ((val: boolean) -> boolean))): (input: {[number]: any}) -> { [number]: any }
+	return function(input: Table)
+		local out = {}
+		for i, v in ipairs(input) do
+			out[i] = (unitMethod :: any)(v)
+		end
+		return out
+	end
+end
+function _serializeDict(unitMethod: (((val: any) -> Table) | ((val: any) -> string) | ((val: number) -> number) | ((val: boolean) -> boolean))): (val: { [any]: any }) -> Table
+	return function(dictVal: { [any]: any }): Table
+		local out = {}
+		for k, v in pairs(dictVal) do
+			out[k] = (unitMethod :: any)(v)
+		end
+		return out
+	end
+end
+function _deserializeDict(unitMethod: (((val: string) -> any) | ((val: Table) -> any) | ((val: number) -> number) | ((val: boolean) -> boolean))): (val: Table) -> { [any]: any }
+	return function(input: Table): { [any]: any }
+		local out = {}
+		for k, v in pairs(input) do
+			out[k] = (unitMethod :: any)(v)
+		end
+		return out
+	end
+end
+
+local _processInteger = function(value: number): number
+	return math.round(value)
+end
+local _processInt = _processInteger
+local _processDouble = function(value: number): number
+	return math.round(value*100)/100
+end
+local _processFloat = function(value: number): number
+	return value
+end
+
+
+
+local _serializeColor3 = function(value: Color3): string
+	return value:ToHex()
+end
+local _serializeNumber = function(value: number): number
+	return value
+end
+local _serializeInteger = function(value: number): number
+	return _processInteger(value)
+end
+local _serializeInt = _serializeInteger
+local _serializeDouble = function(value: number): number
+	return _processDouble(value)
+end
+local _serializeFloat = _serializeNumber
+local _serializeString = function(value: string): string
+	return value
+end
+local _serializeBoolean = function(value: boolean): boolean
+	return value
+end
+local _serializeDateTime = function(value: DateTime): string
+	return value:ToIsoDate()
+end
+local _serializeVector3 = function(value: Vector3): Table
+	return {
+		X = value.X,
+		Y = value.Y,
+		Z = value.Z
+	}
+end
+local _serializeVector3Integer = function(value: Vector3): Table
+	return {
+		X = math.round(value.X),
+		Y = math.round(value.Y),
+		Z = math.round(value.Z)
+	}
+end
+local _serializeVector3Double = function(value: Vector3): Table
+	return {
+		X = math.round(value.X*100)/100,
+		Y = math.round(value.Y*100)/100,
+		Z = math.round(value.Z*100)/100
+	}
+end
+local _serializeVector2 = function(value: Vector2): Table
+	return {
+		X = value.X,
+		Y = value.Y
+	}
+end
+local _serializeVector2Integer = function(value: Vector2): Table
+	return {
+		X = math.round(value.X),
+		Y = math.round(value.Y)
+	}
+end
+local _serializeVector2Double = function(value: Vector2): Table
+	return {
+		X = math.round(value.X*100)/100,
+		Y = math.round(value.Y*100)/100
+	}
+end
+local _serializeCFrame = function(value: CFrame): Table
+	local x,y,z = value:ToEulerAnglesYXZ()
+	return {
+		Position = _serializeVector3(value.Position),
+		Orientation = _serializeVector3(Vector3.new(math.deg(x), math.deg(y), math.deg(z))),
+	}
+end
+local _serializeCFrameDouble = function(value: CFrame): Table
+	local x,y,z = value:ToEulerAnglesYXZ()
+	return {
+		Position = _serializeVector3Double(value.Position),
+		Orientation = _serializeVector3Double(Vector3.new(math.deg(x), math.deg(y), math.deg(z))),
+	}
+end
+local _serializeCFrameInteger = function(value: CFrame): Table
+	local x,y,z = value:ToEulerAnglesYXZ()
+	return {
+		Position = _serializeVector3Integer(value.Position),
+		Orientation = _serializeVector3Integer(Vector3.new(math.deg(x), math.deg(y), math.deg(z))),
+	}
+end
+local _serializeEnum = function(value: EnumItem): string
+	return tostring(value.Value)
+end
+
+
+
+local _isNumbered = function(data: Table): boolean
+	for key in pairs(data) do
+		return tonumber(key) ~= nil
+	end
+	return true
+end
+local _deserializeString = function(value: string): string
+	return value
+end
+local _deserializeNumber = function(value: number): number
+	return value
+end
+local _deserializeInteger = _deserializeNumber
+local _deserializeInt = _deserializeInteger
+local _deserializeDouble = _deserializeNumber
+local _deserializeFloat = _deserializeNumber
+local _deserializeBoolean = function(value: boolean): boolean
+	return value
+end
+local _deserializeColor3 = function(value: string): Color3
+	return Color3.fromHex(value)
+end
+local _deserializeDateTime = function(value: string): DateTime
+	return DateTime.fromIsoDate(value)
+end
+local _deserializeVector3 = function(value: Table): Vector3
+	return Vector3.new(value.X, value.Y, value.Z)
+end
+local _deserializeVector3Integer = function(value: Table): Vector3
+	return Vector3.new(math.round(value.X), math.round(value.Y), math.round(value.Z))
+end
+local _deserializeVector3Double = function(value: Table): Vector3
+	return Vector3.new(math.round(value.X*100)/100, math.round(value.Y*100)/100, math.round(value.Z*100)/100)
+end
+local _deserializeVector2 = function(value: Table): Vector2
+	return Vector2.new(value.X, value.Y)
+end
+local _deserializeVector2Integer = function(value: Table): Vector2
+	return Vector2.new(math.round(value.X), math.round(value.Y))
+end
+local _deserializeVector2Double = function(value: Table): Vector2
+	return Vector2.new(math.round(value.X*100)/100, math.round(value.Y*100)/100)
+end
+local _deserializeCFrame = function(value: Table): CFrame
+	local position = _deserializeVector3(value["Position"])
+	local orientation = _deserializeVector3(value["Orientation"])
+	return CFrame.fromEulerAnglesYXZ(
+		math.rad(orientation.X),
+		math.rad(orientation.Y),
+		math.rad(orientation.Z)
+	) + position
+end
+local _deserializeCFrameInteger = function(value: Table): CFrame
+	local position = _deserializeVector3Integer(value["Position"])
+	local orientation = _deserializeVector3Integer(value["Orientation"])
+	return CFrame.fromEulerAnglesYXZ(
+		math.rad(orientation.X),
+		math.rad(orientation.Y),
+		math.rad(orientation.Z)
+	) + position
+end
+local _deserializeCFrameDouble = function(value: Table): CFrame
+	local position = _deserializeVector3Double(value["Position"])
+	local orientation = _deserializeVector3Double(value["Orientation"])
+	return CFrame.fromEulerAnglesYXZ(
+		math.rad(orientation.X),
+		math.rad(orientation.Y),
+		math.rad(orientation.Z)
+	) + position
+end
+local _getField = function(value: Table, keys: { string }): any
+	for i, key in ipairs(keys) do
+		value = value and value[key]
+	end
+	return value
+end
+local _setField = function(value: Table, keys: { string }, fieldValue: any)
+	for i = 1, #keys - 1 do
+		value[keys[i]] = value[keys[i]] or {}
+		value = value[keys[i]]
+	end
+	value[keys[#keys]] = fieldValue
+end
+-- fields are { keys, ordinal, serialize, deserialize, isOptional? }, or { keys, ordinal, flag, isOptional? }
+local _structCodec = function(fields: { { any } }): (Serializer<any, Table>, Deserializer<Table, any>)
+	local words = {}
+	for i, field in ipairs(fields) do
+		if type(field[1]) == "string" then
+			field[1] = { field[1] }
+		end
+		field[2] = tostring(field[2])
+		if type(field[3]) == "number" then
+			field[4], field[5] = _deserializeBoolean, field[4]
+			if not table.find(words, field[2]) then
+				table.insert(words, field[2])
+			end
+		end
+	end
+	return function(value: any): Table
+		local data = {}
+		for i, word in ipairs(words) do
+			data[word] = 0
+		end
+		for i, field in ipairs(fields) do
+			local keys, slot, serialize, _, isOptional = table.unpack(field)
+			local fieldValue = _getField(value, keys)
+			if type(serialize) == "number" then
+				data[slot] += (if isOptional and fieldValue ~= nil then serialize else 0) + (if fieldValue then serialize*(if isOptional then 2 else 1) else 0)
+			elseif fieldValue ~= nil or not isOptional then
+				data[slot] = serialize(fieldValue)
+			end
+		end
+		return data
+	end, function(data: Table): any
+		local isNumbered = _isNumbered(data)
+		local value = {}
+		for i, field in ipairs(fields) do
+			local keys, slot, flag, deserialize, isOptional = table.unpack(field)
+			local fieldValue = if isNumbered then data[slot] else _getField(data, keys)
+			if isNumbered and type(flag) == "number" then
+				local word = fieldValue or 0
+				fieldValue = if isOptional and not bit32.btest(word, flag) then nil else bit32.btest(word, flag*(if isOptional then 2 else 1))
+			elseif fieldValue ~= nil or not isOptional then
+				fieldValue = deserialize(fieldValue)
+			end
+			_setField(value, keys, fieldValue)
+		end
+		return value
+	end
+end
+local _optionsCodec = function(options: { string }): (Serializer<string, any>, Deserializer<any, string>)
+	return function(value: string): any
+		return tostring(assert(table.find(options, value)))
+	end, function(value: any): string
+		return options[assert(tonumber(value))]
+	end
+end
+local _serializeRarity, _deserializeRarity = _optionsCodec({"Common","Rare","Epic","Legendary",})
+local _serializeItem0, _deserializeItem0 = _structCodec({
+	{ "Name", 1, _serializeString, _deserializeString },
+	{ "Rarity", 2, _serializeRarity, _deserializeRarity },
+	{ "Field0", 3, _serializeDateTime, _deserializeDateTime },
+	{ "Field1", 4, _serializeString, _deserializeString },
+	{ "Field2", 10, 1, true },
+	{ "Field3", 5, _serializeVector3Double, _deserializeVector3Double },
+	{ "Field4", 6, _serializeString, _deserializeString, true },
+	{ "Field5", 7, _serializeDateTime, _deserializeDateTime },
+	{ { "Stats", "Level" }, 8, _serializeInt, _deserializeInt },
+	{ { "Stats", "Boost" }, 9, _serializeDouble, _deserializeDouble, true },
+})
+local _serializeItem1, _deserializeItem1 = _structCodec({
+	{ "Name", 1, _serializeString, _deserializeString },
+	{ "Rarity", 2, _serializeRarity, _deserializeRarity },
+	{ "Field0", 3, _serializeString, _deserializeString, true },
+	{ "Field1", 4, _serializeColor3, _deserializeColor3 },
+	{ "Field2", 10, 1 },
+	{ "Field3", 5, _serializeVector3Double, _deserializeVector3Double },
+	{ "Field4", 6, _serializeInt, _deserializeInt },
+	{ "Child", 7, _serializeItem0, _deserializeItem0, true },
+	{ { "Stats", "Level" }, 8, _serializeInt, _deserializeInt },
+	{ { "Stats", "Boost" }, 9, _serializeDouble, _deserializeDouble, true },
+})
+local _serializeItem2, _deserializeItem2 = _structCodec({
+	{ "Name", 1, _serializeString, _deserializeString },
+	{ "Rarity", 2, _serializeRarity, _deserializeRarity },
+	{ "Field0", 10, 1, true },
+	{ "Field1", 3, _serializeVector3Double, _deserializeVector3Double },
+	{ "Field2", 4, _serializeInt, _deserializeInt },
+	{ "Field3", 10, 4, true },
+	{ "Field4", 5, _serializeDouble, _deserializeDouble },
+	{ "Field5", 6, _serializeDouble, _deserializeDouble },
+	{ "Field6", 7, _serializeColor3, _deserializeColor3 },
+	{ { "Stats", "Level" }, 8, _serializeInt, _deserializeInt },
+	{ { "Stats", "Boost" }, 9, _serializeDouble, _deserializeDouble, true },
+})
+local _serializeItem3, _deserializeItem3 = _structCodec({
+	{ "Name", 1, _serializeString, _deserializeString },
+	{ "Rarity", 2, _serializeRarity, _deserializeRarity },
+	{ "Field0", 3, _serializeColor3, _deserializeColor3 },
+	{ "Field1", 4, _serializeDateTime, _deserializeDateTime },
+	{ "Field2", 5, _serializeColor3, _deserializeColor3 },
+	{ { "Stats", "Level" }, 6, _serializeInt, _deserializeInt },
+	{ { "Stats", "Boost" }, 7, _serializeDouble, _deserializeDouble, true },
+})
+local _serializeItem4, _deserializeItem4 = _structCodec({
+	{ "Name", 1, _serializeString, _deserializeString },
+	{ "Rarity", 2, _serializeRarity, _deserializeRarity },
+	{ "Field0", 3, _serializeVector3Double, _deserializeVector3Double },
+	{ "Field1", 4, _serializeString, _deserializeString, true },
+	{ "Field2", 5, _serializeString, _deserializeString, true },
+	{ "Field3", 6, _serializeVector3Double, _deserializeVector3Double },
+	{ "Child", 7, _serializeItem0, _deserializeItem0, true },
+	{ { "Stats", "Level" }, 8, _serializeInt, _deserializeInt },
+	{ { "Stats", "Boost" }, 9, _serializeDouble, _deserializeDouble, true },
+})
+local _serializeItem5, _deserializeItem5 = _structCodec({
+	{ "Name", 1, _serializeString, _deserializeString },
+	{ "Rarity", 2, _serializeRarity, _deserializeRarity },
+	{ "Field0", 3, _serializeDateTime, _deserializeDateTime },
+	{ "Field1", 4, _serializeString, _deserializeString },
+	{ "Field2", 5, _serializeString, _deserializeString, true },
+	{ { "Stats", "Level" }, 6, _serializeInt, _deserializeInt },
+	{ { "Stats", "Boost" }, 7, _serializeDouble, _deserializeDouble, true },
+})
+local _serializeItem6, _deserializeItem6 = _structCodec({
+	{ "Name", 1, _serializeString, _deserializeString },
+	{ "Rarity", 2, _serializeRarity, _deserializeRarity },
+	{ "Field0", 8, 1 },
+	{ "Field1", 3, _serializeColor3, _deserializeColor3 },
+	{ "Field2", 4, _serializeDouble, _deserializeDouble },
+	{ "Field3", 8, 2 },
+	{ "Field4", 8, 4 },
+	{ "Child", 5, _serializeItem1, _deserializeItem1, true },
+	{ { "Stats", "Level" }, 6, _serializeInt, _deserializeInt },
+	{ { "Stats", "Boost" }, 7, _serializeDouble, _deserializeDouble, true },
+})
+local _serializeItem7, _deserializeItem7 = _structCodec({
+	{ "Name", 1, _serializeString, _deserializeString },
+	{ "Rarity", 2, _serializeRarity, _deserializeRarity },
+	{ "Field0", 3, _serializeString, _deserializeString, true },
+	{ "Field1", 4, _serializeDouble, _deserializeDouble },
+	{ "Field2", 5, _serializeDouble, _deserializeDouble },
+	{ "Field3", 6, _serializeColor3, _deserializeColor3 },
+	{ "Field4", 7, _serializeVector3Double, _deserializeVector3Double },
+	{ "Field5", 8, _serializeString, _deserializeString, true },
+	{ "Field6", 9, _serializeDouble, _deserializeDouble },
+	{ { "Stats", "Level" }, 10, _serializeInt, _deserializeInt },
+	{ { "Stats", "Boost" }, 11, _serializeDouble, _deserializeDouble, true },
+})
+local _serializeItem8, _deserializeItem8 = _structCodec({
+	{ "Name", 1, _serializeString, _deserializeString },
+	{ "Rarity", 2, _serializeRarity, _deserializeRarity },
+	{ "Field0", 3, _serializeDouble, _deserializeDouble },
+	{ "Field1", 4, _serializeVector3Double, _deserializeVector3Double },
+	{ "Field2", 5, _serializeColor3, _deserializeColor3 },
+	{ "Field3", 6, _serializeVector3Double, _deserializeVector3Double },
+	{ "Field4", 9, 1 },
+	{ { "Stats", "Level" }, 7, _serializeInt, _deserializeInt },
+	{ { "Stats", "Boost" }, 8, _serializeDouble, _deserializeDouble, true },
+})
+local _serializeItem9, _deserializeItem9 = _structCodec({
+	{ "Name", 1, _serializeString, _deserializeString },
+	{ "Rarity", 2, _serializeRarity, _deserializeRarity },
+	{ "Field0", 3, _serializeVector3Double, _deserializeVector3Double },
+	{ "Field1", 11, 1, true },
+	{ "Field2", 4, _serializeString, _deserializeString, true },
+	{ "Field3", 5, _serializeDouble, _deserializeDouble },
+	{ "Field4", 6, _serializeDateTime, _deserializeDateTime },
+	{ "Field5", 7, _serializeColor3, _deserializeColor3 },
+	{ "Field6", 11, 4 },
+	{ "Child", 8, _serializeItem3, _deserializeItem3, true },
+	{ { "Stats", "Level" }, 9, _serializeInt, _deserializeInt },
+	{ { "Stats", "Boost" }, 10, _serializeDouble, _deserializeDouble, true },
+})
+
+--Class
+local DataHandler: DataHandler<any, string> = {} :: any
+DataHandler.__index = DataHandler
+
+function DataHandler:Destroy()
+	if not self._IsAlive then
+		return
+	end
+	
+	self._IsAlive = false
+	dirtyObjects[self] = nil
+	if self._IsDirty then
+		-- saved in the background so leaving players don't block each other
+		task.spawn(self._Save, self, self._EncodedValue, PRIORITY_LEAVE)
+	end
+	self._Maid:Destroy()
+	local t: any = self
+	for k, v in pairs(t) do
+		t[k] = nil
+	end
+	setmetatable(t, nil)
+	return nil
+end
+function DataHandler:_Stage(encodedValue: any): nil
+	if self._IsLoaded and encodedValue ~= self._EncodedValue then
+		self._IsDirty = true
+		dirtyObjects[self] = true
+	end
+	return nil
+end
+function DataHandler:_Load(): (any, boolean)
+	local dataStore, key = self.DataStore, self.Key
+	return _request(Enum.DataStoreRequestType.GetAsync, PRIORITY_READ, "Get/" .. self.Scope .. "/" .. key, function()
+		return dataStore:GetAsync(key)
+	end)
+end
+function DataHandler:_Save(encodedValue: any, priority: number?): boolean
+	if not self._IsLoaded then
+		-- never overwrite stored data that failed to load
+		return false
+	end
+	
+	-- captured up front as the handler may be destroyed while the request is queued
+	local dataStore, key, setOptions = self.DataStore, self.Key, self.SetOptions
+	local userIds = { self.Player.UserId }
+	local requestType = if self.ClassName == "NumberDataHandler" then Enum.DataStoreRequestType.SetIncrementSortedAsync else Enum.DataStoreRequestType.SetIncrementAsync
+	self._IsDirty = false
+	dirtyObjects[self] = nil
+	local _, success = _request(requestType, priority or PRIORITY_WRITE, "Set/" .. self.Scope .. "/" .. key, function()
+		return dataStore:SetAsync(key, encodedValue, userIds, setOptions)
+	end)
+	if not success and self._IsAlive then
+		self._IsDirty = true
+		dirtyObjects[self] = true
+	end
+	return success
+end
+function DataHandler:_Flush(priority: number?): boolean
+	if not self._IsDirty then
+		return true
+	end
+	return self:_Save(self._EncodedValue, priority)
+end
+function DataHandler:_Transform(transformer: (any) -> any): (any, boolean)
+	local dataStore, key = self.DataStore, self.Key
+	return _request(Enum.DataStoreRequestType.UpdateAsync, PRIORITY_WRITE, nil, function()
+		return dataStore:UpdateAsync(key, transformer)
+	end)
+end
+function DataHandler:_Increment(delta: number): (number?, boolean)
+	local dataStore, key, incrementOptions = self.DataStore, self.Key, self.IncrementOptions
+	local userIds = { self.Player.UserId }
+	return _request(Enum.DataStoreRequestType.SetIncrementSortedAsync, PRIORITY_WRITE, nil, function()
+		return dataStore:IncrementAsync(key, delta, userIds, incrementOptions)
+	end)
+end
+
+function DataHandler:Set(data: any, force: boolean?)
+	local initialValue = self._EncodedValue
+	local encodedValue = if data ~= nil then self._Serialize(data) else nil
+	self:_Stage(encodedValue)
+	
+	local success = true
+	if force then
+		success = self:_Save(encodedValue)
+	end
+	
+	self._EncodedValue = encodedValue
+	self._Value = if encodedValue ~= nil then self._Deserialize(encodedValue) else nil
+	if initialValue ~= encodedValue then
+		self.OnChanged:Fire(self._Value)
+	end
+	return success
+end
+
+function DataHandler:Update(transformer: (any) -> any, force: boolean?)
+	local initialValue = self._EncodedValue
+	local function transformerWrapper(rawValue: any)
+		return self._Serialize(transformer(self._Deserialize(rawValue)))
+	end
+	
+	local encodedValue, success
+	if force then
+		encodedValue, success = self:_Transform(transformerWrapper)
+		if not success then
+			return self._Value, false
+		end
+	else
+		encodedValue, success = transformerWrapper(initialValue), true
+		self:_Stage(encodedValue)
+	end
+	
+	self._EncodedValue = encodedValue
+	self._Value = if encodedValue ~= nil then self._Deserialize(encodedValue) else nil
+	if initialValue ~= encodedValue then
+		self.OnChanged:Fire(self._Value)
+	end
+	return self._Value, success
+end
+
+function DataHandler:Get(force: boolean?): (any?, boolean)
+	if self._Value ~= nil and not force then
+		return self._Value, true
+	end
+	
+	local data, success = self:_Load()
+	if success and self._IsAlive then
+		self._EncodedValue = data
+		self._Value = if data ~= nil then self._Deserialize(data) else nil
+	end
+	
+	return self._Value, success
+end
+
+function DataHandler.new(player: Player, scope: string, initialValue: any, _serializer: Serializer<any, any>?, _deserializer: Deserializer<any, any>?)
+	local maid = Maid.new()
+	
+	local dataStoreOptions = Instance.new("DataStoreOptions")
+	maid:GiveTask(dataStoreOptions)
+	
+	local setOptions = Instance.new("DataStoreSetOptions")
+	maid:GiveTask(setOptions)
+	setOptions:SetMetadata(METADATA)
+	
+	local onChanged = Signal.new()
+	maid:GiveTask(onChanged)
+	
+	local self: DataHandler<any, string> = setmetatable({
+		_Maid = maid,
+		_IsAlive = true,
+		_IsLoaded = false,
+		_IsDirty = false,
+		_Serialize = if _serializer then
+			function(v: any)
+				if type(v) == "table" then
+					return Base64.Encode(HttpService:JSONEncode(_serializer(v)))
+				end
+				-- enum items can't be stored, so they're saved as their value
+				return if typeof(v) == "EnumItem" then _serializer(v) else v
+			end
+		else function(v: any) return v end,
+		_Deserialize = if _deserializer then 
+			function(v: any)
+				local out: any
+				local success, _msg = pcall(function()
+					out = _deserializer(HttpService:JSONDecode(Base64.Decode(v)))
+				end)
+				if not success then
+					success, _msg = pcall(function()
+						out = _deserializer(v)
+					end)
+				end
+				return if success then out else v
+			end
+		else function(v: any) return v end,
+		OnChanged = onChanged,
+		ClassName = "DataHandler",
+		DataStore = DataStoreService:GetDataStore(BASE_DOMAIN, scope, dataStoreOptions),
+		SetOptions = setOptions,
+		_Value = initialValue,
+		Scope = scope,
+		Key = tostring(player.UserId),
+		Player = player,
+	}, DataHandler) :: any
+	
+	local fireUpdate: (...any) -> ()
+	if RunService:IsRunning() then
+		local updateEvent = NetworkUtil.getRemoteEvent(scope .. "_" .. UPDATE_SUFFIX, player)
+		maid:GiveTask(updateEvent)
+		fireUpdate = function(...: any)
+			updateEvent:FireClient(player, ...)
+		end
+		
+		local getFunction = NetworkUtil.getRemoteFunction(scope .. "_" .. GET_SUFFIX, player)
+		maid:GiveTask(getFunction)
+		getFunction.OnServerInvoke = function(plr: Player)
+			if player.UserId == plr.UserId then
+				return self._Value
+			end
+			error("Bad player")
+		end
+	else
+		local updateEvent = NetworkUtil.getBindableEvent(scope .. "_" .. UPDATE_SUFFIX)
+		maid:GiveTask(updateEvent)
+		fireUpdate = function(...: any)
+			updateEvent:Fire(...)
+		end
+		
+		local getFunction = NetworkUtil.getBindableFunction(scope .. "_" .. GET_SUFFIX)
+		maid:GiveTask(getFunction)
+		getFunction.OnInvoke = function()
+			return self._Value
+		end
+	end
+	maid:GiveTask(onChanged:Connect(function()
+		pendingUpdates[self] = fireUpdate
+	end))
+	
+	return self
+end
+
+-- loads the stored value, falling back to the initial value when nothing was stored
+function DataHandler:_Init(): boolean
+	local initialValue = self._Value
+	local value, success = self:Get(true)
+	if not success or not self._IsAlive then
+		-- left unloaded, so the default is never saved over the stored value
+		return false
+	end
+	
+	self._IsLoaded = true
+	if value == nil then
+		local encodedValue = if initialValue ~= nil then self._Serialize(initialValue) else nil
+		self:_Stage(encodedValue)
+		self._Value = initialValue
+		self._EncodedValue = encodedValue
+	end
+	return true
+end
+
+local NumberDataHandler = {}
+NumberDataHandler.__index = NumberDataHandler
+setmetatable(NumberDataHandler, DataHandler)
+
+-- the top values of this path across every player, see _getSortedList
+function NumberDataHandler:GetSortedList(limit: number, isAscending: boolean?): { [number]: SortedDataEntry }
+	return _getSortedList(self.Scope, limit, isAscending == true)
+end
+
+function NumberDataHandler:Increment(delta: number, force: boolean?)
+	local value, success
+	if force then
+		value, success = self:_Increment(delta)
+	else
+		value, success = (self._EncodedValue or 0) + delta, true
+		self:_Stage(value)
+	end
+	
+	if success then
+		self._EncodedValue = value
+		self._Value = self._Deserialize(value)
+	end
+	
+	if success and delta ~= 0 then
+		self.OnChanged:Fire(self._Value)
+	end
+	
+	return self._Value, success
+end
+
+function NumberDataHandler.new(player: Player, scope: string, initialValue: number, _processor: Processor<number>?): NumberDataHandler
+	local self: NumberDataHandler = setmetatable(DataHandler.new(player, scope, initialValue, _processor :: any, _processor :: any), NumberDataHandler) :: any
+	
+	self.ClassName = "NumberDataHandler"
+	self.DataStore = DataStoreService:GetOrderedDataStore(BASE_DOMAIN, scope)
+	
+	local incrementOptions = Instance.new("DataStoreIncrementOptions")
+	self._Maid:GiveTask(incrementOptions)
+	
+	incrementOptions:SetMetadata(METADATA)
+	self.IncrementOptions = incrementOptions
+	
+	return self
+end
+local trees: { [number]: any } = {}
+-- created on demand for callers waiting on a tree that isn't ready yet
+local readySignals: { [number]: Signal } = {}
+
+-- loads the handlers with at most LOAD_CONCURRENCY of them waiting on the DataStore at once
+function _loadHandlers(handlers: { DataHandler<any, any> }, onLoaded: (success: boolean) -> ())
+	local nextIndex = 1
+	local workerCount = math.min(LOAD_CONCURRENCY, #handlers)
+	if workerCount == 0 then
+		onLoaded(true)
+		return
+	end
+	
+	local success = true
+	local function work()
+		while nextIndex <= #handlers do
+			local handler = handlers[nextIndex]
+			nextIndex += 1
+			if handler._IsAlive and not handler:_Init() then
+				success = false
+			end
+		end
+		workerCount -= 1
+		if workerCount == 0 then
+			onLoaded(success)
+		end
+	end
+	for i = 1, workerCount do
+		task.spawn(work)
+	end
+end
+
+function initPlayer(playerMaid: Maid, player: Player)
+	local handlers: { DataHandler<any, any> } = {}
+	
+	local function _newDataHandler<G, S>(path: string, val: any, _serializer: Serializer<G,S>?, _deserializer: Deserializer<S, G>?): DataHandler<G, S>
+		local handler: DataHandler<G,S> = DataHandler.new(player, path, val, _serializer :: any, _deserializer :: any) :: any
+		playerMaid:GiveTask(handler)
+		table.insert(handlers, handler :: any)
+		
+		return handler
+	end
+	
+	local function _newNumberHandler(path: string, val: number, _processor: Processor<number>?): NumberDataHandler
+		local handler: NumberDataHandler = NumberDataHandler.new(player, path, val, _processor) :: any
+		playerMaid:GiveTask(handler)
+		table.insert(handlers, handler :: any)
+		
+		return handler
+	end
+	
+	local treeGroup0_1Group1_0Leaf100Val: {[number]:Item9} = {
+}
+	local treeGroup0_1Group1_0Leaf170Val: {[string]: Item3} = {
+}
+	local treeGroup0_1Group1_2Leaf26Val: {[string]: Item3} = {
+}
+	local treeGroup0_1Group1_2Leaf79Val: {[string]: Item8} = {
+}
+	local treeGroup0_1Group1_2Leaf94Val: {[number]:Item2} = {
+}
+	local treeGroup0_1Group1_2Leaf113Val: {[string]: Item7} = {
+}
+	local treeGroup0_1Group1_2Leaf137Val: {[number]:Item2} = {
+}
+	local treeGroup0_1Group1_2Leaf141Val: {[number]:Item2} = {
+}
+	local treeGroup0_1Group1_3Leaf55Val: {[number]:Item1} = {
+}
+	local treeGroup0_1Group1_3Leaf97Val: {[string]: Item5} = {
+}
+	local treeGroup0_1Group1_1Leaf58Val: {[number]:Item7} = {
+}
+	local treeGroup0_1Group1_1Leaf87Val: {[string]: Item8} = {
+}
+	local treeGroup0_3Group1_0Leaf1Val: {[string]: Item2} = {
+}
+	local treeGroup0_3Group1_0Leaf36Val: {[string]: Item7} = {
+}
+	local treeGroup0_3Group1_0Leaf48Val: {[number]:Item7} = {
+}
+	local treeGroup0_3Group1_0Leaf51Val: {[number]:Item1} = {
+}
+	local treeGroup0_3Group1_0Leaf181Val: {[number]:Item0} = {
+}
+	local treeGroup0_3Group1_3Leaf27Val: {[number]:Item9} = {
+}
+	local treeGroup0_3Group1_3Leaf185Val: {[string]: Item4} = {
+}
+	local treeGroup0_3Group1_1Leaf187Val: {[string]: Item2} = {
+}
+	local treeGroup0_3Group1_2Leaf33Val: {[string]: Item0} = {
+}
+	local treeGroup0_0Group1_0Leaf9Val: {[string]: Item3} = {
+}
+	local treeGroup0_0Group1_0Leaf34Val: {[string]: Item9} = {
+}
+	local treeGroup0_0Group1_0Leaf39Val: {[string]: Item4} = {
+}
+	local treeGroup0_0Group1_0Leaf65Val: {[number]:Item2} = {
+}
+	local treeGroup0_0Group1_0Leaf145Val: {[number]:Item5} = {
+}
+	local treeGroup0_0Group1_2Leaf23Val: {[number]:Item7} = {
+}
+	local treeGroup0_0Group1_2Leaf37Val: {[string]: Item8} = {
+}
+	local treeGroup0_0Group1_2Leaf46Val: {[string]: Item8} = {
+}
+	local treeGroup0_0Group1_2Leaf176Val: {[string]: Item6} = {
+}
+	local treeGroup0_0Group1_1Leaf14Val: {[number]:Item4} = {
+}
+	local treeGroup0_0Group1_1Leaf146Val: {[string]: Item6} = {
+}
+	local treeGroup0_0Group1_1Leaf156Val: {[number]:Item2} = {
+}
+	local treeGroup0_0Group1_3Leaf10Val: {[number]:Item1} = {
+}
+	local treeGroup0_0Group1_3Leaf16Val: {[string]: Item5} = {
+}
+	local treeGroup0_0Group1_3Leaf192Val: {[string]: Item4} = {
+}
+	local treeGroup0_2Group1_1Leaf44Val: {[number]:Item9} = {
+}
+	local treeGroup0_2Group1_1Leaf98Val: {[number]:Item3} = {
+}
+	local treeGroup0_2Group1_0Leaf42Val: {[number]:Item4} = {
+}
+	local treeGroup0_2Group1_3Leaf198Val: {[string]: Item4} = {
+}
+	local treeGroup0_2Group1_2Leaf92Val: {[number]:Item1} = {
+}
+	local tree: DataTree = {
+			["Group0_1"] = {
+				["Group1_0"] = {
+					["Leaf0"] = _newDataHandler("Group0_1/Group1_0/Leaf0", "value 0"),
+					["Leaf15"] = _newNumberHandler("Group0_1/Group1_0/Leaf15", 610, _processInt),
+					["Leaf22"] = _newNumberHandler("Group0_1/Group1_0/Leaf22", 343, _processInt),
+					["Leaf52"] = _newNumberHandler("Group0_1/Group1_0/Leaf52", 403, _processInt),
+					["Leaf59"] = _newDataHandler("Group0_1/Group1_0/Leaf59", true),
+					["Leaf62"] = _newDataHandler("Group0_1/Group1_0/Leaf62", "value 62"),
+					["Leaf70"] = _newNumberHandler("Group0_1/Group1_0/Leaf70", 758, _processInt),
+					["Leaf84"] = _newDataHandler("Group0_1/Group1_0/Leaf84", true),
+					["Leaf95"] = _newDataHandler("Group0_1/Group1_0/Leaf95", "value 95"),
+					["Leaf100"] = _newDataHandler("Group0_1/Group1_0/Leaf100", treeGroup0_1Group1_0Leaf100Val, _serializeList(_serializeItem9), _deserializeList(_deserializeItem9)) :: any,
+					["Leaf122"] = _newDataHandler("Group0_1/Group1_0/Leaf122", "value 122"),
+					["Leaf130"] = _newDataHandler("Group0_1/Group1_0/Leaf130", false),
+					["Leaf135"] = _newDataHandler("Group0_1/Group1_0/Leaf135", "value 135"),
+					["Leaf153"] = _newNumberHandler("Group0_1/Group1_0/Leaf153", 9, _processInt),
+					["Leaf170"] = _newDataHandler("Group0_1/Group1_0/Leaf170", treeGroup0_1Group1_0Leaf170Val, _serializeDict(_serializeItem3), _deserializeDict(_deserializeItem3)) :: any,
+					["Leaf188"] = _newNumberHandler("Group0_1/Group1_0/Leaf188", 24.68, _processDouble),
+				},
+				["Group1_2"] = {
+					["Leaf26"] = _newDataHandler("Group0_1/Group1_2/Leaf26", treeGroup0_1Group1_2Leaf26Val, _serializeDict(_serializeItem3), _deserializeDict(_deserializeItem3)) :: any,
+					["Leaf71"] = _newDataHandler("Group0_1/Group1_2/Leaf71", "value 71"),
+					["Leaf79"] = _newDataHandler("Group0_1/Group1_2/Leaf79", treeGroup0_1Group1_2Leaf79Val, _serializeDict(_serializeItem8), _deserializeDict(_deserializeItem8)) :: any,
+					["Leaf94"] = _newDataHandler("Group0_1/Group1_2/Leaf94", treeGroup0_1Group1_2Leaf94Val, _serializeList(_serializeItem2), _deserializeList(_deserializeItem2)) :: any,
+					["Leaf113"] = _newDataHandler("Group0_1/Group1_2/Leaf113", treeGroup0_1Group1_2Leaf113Val, _serializeDict(_serializeItem7), _deserializeDict(_deserializeItem7)) :: any,
+					["Leaf137"] = _newDataHandler("Group0_1/Group1_2/Leaf137", treeGroup0_1Group1_2Leaf137Val, _serializeList(_serializeItem2), _deserializeList(_deserializeItem2)) :: any,
+					["Leaf141"] = _newDataHandler("Group0_1/Group1_2/Leaf141", treeGroup0_1Group1_2Leaf141Val, _serializeList(_serializeItem2), _deserializeList(_deserializeItem2)) :: any,
+					["Leaf159"] = _newDataHandler("Group0_1/Group1_2/Leaf159", "value 159"),
+					["Leaf161"] = _newDataHandler("Group0_1/Group1_2/Leaf161", false),
+					["Leaf166"] = _newNumberHandler("Group0_1/Group1_2/Leaf166", 6.48, _processDouble),
+					["Leaf184"] = _newDataHandler("Group0_1/Group1_2/Leaf184", "value 184"),
+				},
+				["Group1_3"] = {
+					["Leaf29"] = _newDataHandler("Group0_1/Group1_3/Leaf29", false),
+					["Leaf55"] = _newDataHandler("Group0_1/Group1_3/Leaf55", treeGroup0_1Group1_3Leaf55Val, _serializeList(_serializeItem1), _deserializeList(_deserializeItem1)) :: any,
+					["Leaf64"] = _newDataHandler("Group0_1/Group1_3/Leaf64", true),
+					["Leaf80"] = _newDataHandler("Group0_1/Group1_3/Leaf80", true),
+					["Leaf85"] = _newNumberHandler("Group0_1/Group1_3/Leaf85", 979, _processInt),
+					["Leaf97"] = _newDataHandler("Group0_1/Group1_3/Leaf97", treeGroup0_1Group1_3Leaf97Val, _serializeDict(_serializeItem5), _deserializeDict(_deserializeItem5)) :: any,
+					["Leaf111"] = _newNumberHandler("Group0_1/Group1_3/Leaf111", 95.95, _processDouble),
+					["Leaf115"] = _newDataHandler("Group0_1/Group1_3/Leaf115", true),
+					["Leaf139"] = _newNumberHandler("Group0_1/Group1_3/Leaf139", 927, _processInt),
+					["Leaf157"] = _newDataHandler("Group0_1/Group1_3/Leaf157", false),
+					["Leaf175"] = _newDataHandler("Group0_1/Group1_3/Leaf175", false),
+				},
+				["Group1_1"] = {
+					["Leaf58"] = _newDataHandler("Group0_1/Group1_1/Leaf58", treeGroup0_1Group1_1Leaf58Val, _serializeList(_serializeItem7), _deserializeList(_deserializeItem7)) :: any,
+					["Leaf74"] = _newDataHandler("Group0_1/Group1_1/Leaf74", "value 74"),
+					["Leaf87"] = _newDataHandler("Group0_1/Group1_1/Leaf87", treeGroup0_1Group1_1Leaf87Val, _serializeDict(_serializeItem8), _deserializeDict(_deserializeItem8)) :: any,
+					["Leaf102"] = _newDataHandler("Group0_1/Group1_1/Leaf102", "value 102"),
+					["Leaf134"] = _newDataHandler("Group0_1/Group1_1/Leaf134", "value 134"),
+					["Leaf151"] = _newDataHandler("Group0_1/Group1_1/Leaf151", "value 151"),
+					["Leaf168"] = _newDataHandler("Group0_1/Group1_1/Leaf168", "value 168"),
+				},
+			},
+			["Group0_3"] = {
+				["Group1_0"] = {
+					["Leaf1"] = _newDataHandler("Group0_3/Group1_0/Leaf1", treeGroup0_3Group1_0Leaf1Val, _serializeDict(_serializeItem2), _deserializeDict(_deserializeItem2)) :: any,
+					["Leaf31"] = _newDataHandler("Group0_3/Group1_0/Leaf31", true),
+					["Leaf36"] = _newDataHandler("Group0_3/Group1_0/Leaf36", treeGroup0_3Group1_0Leaf36Val, _serializeDict(_serializeItem7), _deserializeDict(_deserializeItem7)) :: any,
+					["Leaf48"] = _newDataHandler("Group0_3/Group1_0/Leaf48", treeGroup0_3Group1_0Leaf48Val, _serializeList(_serializeItem7), _deserializeList(_deserializeItem7)) :: any,
+					["Leaf51"] = _newDataHandler("Group0_3/Group1_0/Leaf51", treeGroup0_3Group1_0Leaf51Val, _serializeList(_serializeItem1), _deserializeList(_deserializeItem1)) :: any,
+					["Leaf77"] = _newDataHandler("Group0_3/Group1_0/Leaf77", true),
+					["Leaf89"] = _newDataHandler("Group0_3/Group1_0/Leaf89", true),
+					["Leaf104"] = _newNumberHandler("Group0_3/Group1_0/Leaf104", 42.02, _processDouble),
+					["Leaf109"] = _newNumberHandler("Group0_3/Group1_0/Leaf109", 283, _processInt),
+					["Leaf132"] = _newNumberHandler("Group0_3/Group1_0/Leaf132", 635, _processInt),
+					["Leaf140"] = _newNumberHandler("Group0_3/Group1_0/Leaf140", 891, _processInt),
+					["Leaf158"] = _newNumberHandler("Group0_3/Group1_0/Leaf158", 49.0, _processDouble),
+					["Leaf160"] = _newDataHandler("Group0_3/Group1_0/Leaf160", "value 160"),
+					["Leaf181"] = _newDataHandler("Group0_3/Group1_0/Leaf181", treeGroup0_3Group1_0Leaf181Val, _serializeList(_serializeItem0), _deserializeList(_deserializeItem0)) :: any,
+					["Leaf186"] = _newNumberHandler("Group0_3/Group1_0/Leaf186", 418, _processInt),
+					["Leaf190"] = _newDataHandler("Group0_3/Group1_0/Leaf190", false),
+					["Leaf196"] = _newDataHandler("Group0_3/Group1_0/Leaf196", "value 196"),
+				},
+				["Group1_3"] = {
+					["Leaf4"] = _newDataHandler("Group0_3/Group1_3/Leaf4", "value 4"),
+					["Leaf25"] = _newNumberHandler("Group0_3/Group1_3/Leaf25", 1, _processInt),
+					["Leaf27"] = _newDataHandler("Group0_3/Group1_3/Leaf27", treeGroup0_3Group1_3Leaf27Val, _serializeList(_serializeItem9), _deserializeList(_deserializeItem9)) :: any,
+					["Leaf41"] = _newNumberHandler("Group0_3/Group1_3/Leaf41", 20.78, _processDouble),
+					["Leaf60"] = _newDataHandler("Group0_3/Group1_3/Leaf60", false),
+					["Leaf69"] = _newDataHandler("Group0_3/Group1_3/Leaf69", false),
+					["Leaf91"] = _newNumberHandler("Group0_3/Group1_3/Leaf91", 508, _processInt),
+					["Leaf124"] = _newDataHandler("Group0_3/Group1_3/Leaf124", "value 124"),
+					["Leaf138"] = _newDataHandler("Group0_3/Group1_3/Leaf138", false),
+					["Leaf154"] = _newNumberHandler("Group0_3/Group1_3/Leaf154", 939, _processInt),
+					["Leaf155"] = _newNumberHandler("Group0_3/Group1_3/Leaf155", 87, _processInt),
+					["Leaf174"] = _newNumberHandler("Group0_3/Group1_3/Leaf174", 55.55, _processDouble),
+					["Leaf185"] = _newDataHandler("Group0_3/Group1_3/Leaf185", treeGroup0_3Group1_3Leaf185Val, _serializeDict(_serializeItem4), _deserializeDict(_deserializeItem4)) :: any,
+				},
+				["Group1_1"] = {
+					["Leaf12"] = _newNumberHandler("Group0_3/Group1_1/Leaf12", 959, _processInt),
+					["Leaf17"] = _newNumberHandler("Group0_3/Group1_1/Leaf17", 96.65, _processDouble),
+					["Leaf45"] = _newDataHandler("Group0_3/Group1_1/Leaf45", false),
+					["Leaf90"] = _newNumberHandler("Group0_3/Group1_1/Leaf90", 810, _processInt),
+					["Leaf101"] = _newNumberHandler("Group0_3/Group1_1/Leaf101", 31.59, _processDouble),
+					["Leaf105"] = _newDataHandler("Group0_3/Group1_1/Leaf105", "value 105"),
+					["Leaf116"] = _newDataHandler("Group0_3/Group1_1/Leaf116", true),
+					["Leaf136"] = _newDataHandler("Group0_3/Group1_1/Leaf136", true),
+					["Leaf147"] = _newDataHandler("Group0_3/Group1_1/Leaf147", "value 147"),
+					["Leaf171"] = _newNumberHandler("Group0_3/Group1_1/Leaf171", 81.62, _processDouble),
+					["Leaf179"] = _newNumberHandler("Group0_3/Group1_1/Leaf179", 30.49, _processDouble),
+					["Leaf183"] = _newNumberHandler("Group0_3/Group1_1/Leaf183", 44.9, _processDouble),
+					["Leaf187"] = _newDataHandler("Group0_3/Group1_1/Leaf187", treeGroup0_3Group1_1Leaf187Val, _serializeDict(_serializeItem2), _deserializeDict(_deserializeItem2)) :: any,
+					["Leaf193"] = _newNumberHandler("Group0_3/Group1_1/Leaf193", 73.55, _processDouble),
+				},
+				["Group1_2"] = {
+					["Leaf33"] = _newDataHandler("Group0_3/Group1_2/Leaf33", treeGroup0_3Group1_2Leaf33Val, _serializeDict(_serializeItem0), _deserializeDict(_deserializeItem0)) :: any,
+					["Leaf57"] = _newNumberHandler("Group0_3/Group1_2/Leaf57", 970, _processInt),
+					["Leaf67"] = _newNumberHandler("Group0_3/Group1_2/Leaf67", 587, _processInt),
+					["Leaf83"] = _newNumberHandler("Group0_3/Group1_2/Leaf83", 531, _processInt),
+					["Leaf88"] = _newNumberHandler("Group0_3/Group1_2/Leaf88", 42.6, _processDouble),
+					["Leaf99"] = _newDataHandler("Group0_3/Group1_2/Leaf99", "value 99"),
+					["Leaf128"] = _newNumberHandler("Group0_3/Group1_2/Leaf128", 454, _processInt),
+					["Leaf144"] = _newNumberHandler("Group0_3/Group1_2/Leaf144", 33.72, _processDouble),
+					["Leaf149"] = _newNumberHandler("Group0_3/Group1_2/Leaf149", 194, _processInt),
+					["Leaf172"] = _newNumberHandler("Group0_3/Group1_2/Leaf172", 62.9, _processDouble),
+					["Leaf194"] = _newDataHandler("Group0_3/Group1_2/Leaf194", false),
+				},
+			},
+			["Group0_0"] = {
+				["Group1_0"] = {
+					["Leaf2"] = _newDataHandler("Group0_0/Group1_0/Leaf2", false),
+					["Leaf8"] = _newNumberHandler("Group0_0/Group1_0/Leaf8", 4.52, _processDouble),
+					["Leaf9"] = _newDataHandler("Group0_0/Group1_0/Leaf9", treeGroup0_0Group1_0Leaf9Val, _serializeDict(_serializeItem3), _deserializeDict(_deserializeItem3)) :: any,
+					["Leaf30"] = _newDataHandler("Group0_0/Group1_0/Leaf30", "value 30"),
+					["Leaf34"] = _newDataHandler("Group0_0/Group1_0/Leaf34", treeGroup0_0Group1_0Leaf34Val, _serializeDict(_serializeItem9), _deserializeDict(_deserializeItem9)) :: any,
+					["Leaf39"] = _newDataHandler("Group0_0/Group1_0/Leaf39", treeGroup0_0Group1_0Leaf39Val, _serializeDict(_serializeItem4), _deserializeDict(_deserializeItem4)) :: any,
+					["Leaf65"] = _newDataHandler("Group0_0/Group1_0/Leaf65", treeGroup0_0Group1_0Leaf65Val, _serializeList(_serializeItem2), _deserializeList(_deserializeItem2)) :: any,
+					["Leaf68"] = _newNumberHandler("Group0_0/Group1_0/Leaf68", 28.97, _processDouble),
+					["Leaf75"] = _newNumberHandler("Group0_0/Group1_0/Leaf75", 49.18, _processDouble),
+					["Leaf86"] = _newNumberHandler("Group0_0/Group1_0/Leaf86", 967, _processInt),
+					["Leaf117"] = _newNumberHandler("Group0_0/Group1_0/Leaf117", 0, _processInt),
+					["Leaf120"] = _newDataHandler("Group0_0/Group1_0/Leaf120", "value 120"),
+					["Leaf131"] = _newNumberHandler("Group0_0/Group1_0/Leaf131", 702, _processInt),
+					["Leaf145"] = _newDataHandler("Group0_0/Group1_0/Leaf145", treeGroup0_0Group1_0Leaf145Val, _serializeList(_serializeItem5), _deserializeList(_deserializeItem5)) :: any,
+					["Leaf148"] = _newDataHandler("Group0_0/Group1_0/Leaf148", "value 148"),
+					["Leaf173"] = _newDataHandler("Group0_0/Group1_0/Leaf173", "value 173"),
+				},
+				["Group1_2"] = {
+					["Leaf5"] = _newDataHandler("Group0_0/Group1_2/Leaf5", false),
+					["Leaf23"] = _newDataHandler("Group0_0/Group1_2/Leaf23", treeGroup0_0Group1_2Leaf23Val, _serializeList(_serializeItem7), _deserializeList(_deserializeItem7)) :: any,
+					["Leaf37"] = _newDataHandler("Group0_0/Group1_2/Leaf37", treeGroup0_0Group1_2Leaf37Val, _serializeDict(_serializeItem8), _deserializeDict(_deserializeItem8)) :: any,
+					["Leaf46"] = _newDataHandler("Group0_0/Group1_2/Leaf46", treeGroup0_0Group1_2Leaf46Val, _serializeDict(_serializeItem8), _deserializeDict(_deserializeItem8)) :: any,
+					["Leaf82"] = _newNumberHandler("Group0_0/Group1_2/Leaf82", 95.85, _processDouble),
+					["Leaf93"] = _newNumberHandler("Group0_0/Group1_2/Leaf93", 850, _processInt),
+					["Leaf133"] = _newDataHandler("Group0_0/Group1_2/Leaf133", "value 133"),
+					["Leaf176"] = _newDataHandler("Group0_0/Group1_2/Leaf176", treeGroup0_0Group1_2Leaf176Val, _serializeDict(_serializeItem6), _deserializeDict(_deserializeItem6)) :: any,
+					["Leaf178"] = _newNumberHandler("Group0_0/Group1_2/Leaf178", 34.32, _processDouble),
+					["Leaf191"] = _newDataHandler("Group0_0/Group1_2/Leaf191", true),
+					["Leaf195"] = _newDataHandler("Group0_0/Group1_2/Leaf195", "value 195"),
+					["Leaf199"] = _newDataHandler("Group0_0/Group1_2/Leaf199", "value 199"),
+				},
+				["Group1_1"] = {
+					["Leaf7"] = _newNumberHandler("Group0_0/Group1_1/Leaf7", 33.25, _processDouble),
+					["Leaf11"] = _newNumberHandler("Group0_0/Group1_1/Leaf11", 71.81, _processDouble),
+					["Leaf14"] = _newDataHandler("Group0_0/Group1_1/Leaf14", treeGroup0_0Group1_1Leaf14Val, _serializeList(_serializeItem4), _deserializeList(_deserializeItem4)) :: any,
+					["Leaf18"] = _newDataHandler("Group0_0/Group1_1/Leaf18", "value 18"),
+					["Leaf28"] = _newDataHandler("Group0_0/Group1_1/Leaf28", "value 28"),
+					["Leaf32"] = _newDataHandler("Group0_0/Group1_1/Leaf32", false),
+					["Leaf76"] = _newDataHandler("Group0_0/Group1_1/Leaf76", "value 76"),
+					["Leaf110"] = _newDataHandler("Group0_0/Group1_1/Leaf110", false),
+					["Leaf114"] = _newDataHandler("Group0_0/Group1_1/Leaf114", "value 114"),
+					["Leaf146"] = _newDataHandler("Group0_0/Group1_1/Leaf146", treeGroup0_0Group1_1Leaf146Val, _serializeDict(_serializeItem6), _deserializeDict(_deserializeItem6)) :: any,
+					["Leaf156"] = _newDataHandler("Group0_0/Group1_1/Leaf156", treeGroup0_0Group1_1Leaf156Val, _serializeList(_serializeItem2), _deserializeList(_deserializeItem2)) :: any,
+					["Leaf163"] = _newNumberHandler("Group0_0/Group1_1/Leaf163", 21.81, _processDouble),
+					["Leaf189"] = _newNumberHandler("Group0_0/Group1_1/Leaf189", 71.78, _processDouble),
+				},
+				["Group1_3"] = {
+					["Leaf10"] = _newDataHandler("Group0_0/Group1_3/Leaf10", treeGroup0_0Group1_3Leaf10Val, _serializeList(_serializeItem1), _deserializeList(_deserializeItem1)) :: any,
+					["Leaf13"] = _newDataHandler("Group0_0/Group1_3/Leaf13", "value 13"),
+					["Leaf16"] = _newDataHandler("Group0_0/Group1_3/Leaf16", treeGroup0_0Group1_3Leaf16Val, _serializeDict(_serializeItem5), _deserializeDict(_deserializeItem5)) :: any,
+					["Leaf20"] = _newDataHandler("Group0_0/Group1_3/Leaf20", "value 20"),
+					["Leaf56"] = _newNumberHandler("Group0_0/Group1_3/Leaf56", 11.89, _processDouble),
+					["Leaf66"] = _newNumberHandler("Group0_0/Group1_3/Leaf66", 80.06, _processDouble),
+					["Leaf78"] = _newNumberHandler("Group0_0/Group1_3/Leaf78", 33, _processInt),
+					["Leaf81"] = _newDataHandler("Group0_0/Group1_3/Leaf81", "value 81"),
+					["Leaf107"] = _newDataHandler("Group0_0/Group1_3/Leaf107", false),
+					["Leaf126"] = _newDataHandler("Group0_0/Group1_3/Leaf126", true),
+					["Leaf164"] = _newNumberHandler("Group0_0/Group1_3/Leaf164", 393, _processInt),
+					["Leaf192"] = _newDataHandler("Group0_0/Group1_3/Leaf192", treeGroup0_0Group1_3Leaf192Val, _serializeDict(_serializeItem4), _deserializeDict(_deserializeItem4)) :: any,
+					["Leaf197"] = _newNumberHandler("Group0_0/Group1_3/Leaf197", 413, _processInt),
+				},
+			},
+			["Group0_2"] = {
+				["Group1_1"] = {
+					["Leaf3"] = _newDataHandler("Group0_2/Group1_1/Leaf3", false),
+					["Leaf6"] = _newDataHandler("Group0_2/Group1_1/Leaf6", "value 6"),
+					["Leaf44"] = _newDataHandler("Group0_2/Group1_1/Leaf44", treeGroup0_2Group1_1Leaf44Val, _serializeList(_serializeItem9), _deserializeList(_deserializeItem9)) :: any,
+					["Leaf54"] = _newDataHandler("Group0_2/Group1_1/Leaf54", "value 54"),
+					["Leaf98"] = _newDataHandler("Group0_2/Group1_1/Leaf98", treeGroup0_2Group1_1Leaf98Val, _serializeList(_serializeItem3), _deserializeList(_deserializeItem3)) :: any,
+					["Leaf112"] = _newNumberHandler("Group0_2/Group1_1/Leaf112", 494, _processInt),
+					["Leaf123"] = _newNumberHandler("Group0_2/Group1_1/Leaf123", 53.14, _processDouble),
+					["Leaf129"] = _newNumberHandler("Group0_2/Group1_1/Leaf129", 908, _processInt),
+				},
+				["Group1_0"] = {
+					["Leaf19"] = _newDataHandler("Group0_2/Group1_0/Leaf19", false),
+					["Leaf38"] = _newDataHandler("Group0_2/Group1_0/Leaf38", "value 38"),
+					["Leaf40"] = _newDataHandler("Group0_2/Group1_0/Leaf40", false),
+					["Leaf42"] = _newDataHandler("Group0_2/Group1_0/Leaf42", treeGroup0_2Group1_0Leaf42Val, _serializeList(_serializeItem4), _deserializeList(_deserializeItem4)) :: any,
+					["Leaf43"] = _newNumberHandler("Group0_2/Group1_0/Leaf43", 42, _processInt),
+					["Leaf49"] = _newDataHandler("Group0_2/Group1_0/Leaf49", true),
+					["Leaf63"] = _newDataHandler("Group0_2/Group1_0/Leaf63", "value 63"),
+					["Leaf72"] = _newDataHandler("Group0_2/Group1_0/Leaf72", "value 72"),
+					["Leaf96"] = _newNumberHandler("Group0_2/Group1_0/Leaf96", 85.92, _processDouble),
+					["Leaf106"] = _newDataHandler("Group0_2/Group1_0/Leaf106", "value 106"),
+					["Leaf121"] = _newNumberHandler("Group0_2/Group1_0/Leaf121", 89.07, _processDouble),
+					["Leaf142"] = _newDataHandler("Group0_2/Group1_0/Leaf142", "value 142"),
+					["Leaf150"] = _newDataHandler("Group0_2/Group1_0/Leaf150", "value 150"),
+					["Leaf165"] = _newDataHandler("Group0_2/Group1_0/Leaf165", "value 165"),
+					["Leaf169"] = _newDataHandler("Group0_2/Group1_0/Leaf169", true),
+					["Leaf180"] = _newNumberHandler("Group0_2/Group1_0/Leaf180", 35.34, _processDouble),
+					["Leaf182"] = _newDataHandler("Group0_2/Group1_0/Leaf182", "value 182"),
+				},
+				["Group1_3"] = {
+					["Leaf21"] = _newDataHandler("Group0_2/Group1_3/Leaf21", "value 21"),
+					["Leaf47"] = _newDataHandler("Group0_2/Group1_3/Leaf47", "value 47"),
+					["Leaf53"] = _newNumberHandler("Group0_2/Group1_3/Leaf53", 42.3, _processDouble),
+					["Leaf61"] = _newNumberHandler("Group0_2/Group1_3/Leaf61", 54.28, _processDouble),
+					["Leaf73"] = _newDataHandler("Group0_2/Group1_3/Leaf73", true),
+					["Leaf103"] = _newNumberHandler("Group0_2/Group1_3/Leaf103", 60.12, _processDouble),
+					["Leaf108"] = _newDataHandler("Group0_2/Group1_3/Leaf108", "value 108"),
+					["Leaf118"] = _newDataHandler("Group0_2/Group1_3/Leaf118", true),
+					["Leaf125"] = _newNumberHandler("Group0_2/Group1_3/Leaf125", 15.71, _processDouble),
+					["Leaf143"] = _newDataHandler("Group0_2/Group1_3/Leaf143", false),
+					["Leaf152"] = _newDataHandler("Group0_2/Group1_3/Leaf152", "value 152"),
+					["Leaf198"] = _newDataHandler("Group0_2/Group1_3/Leaf198", treeGroup0_2Group1_3Leaf198Val, _serializeDict(_serializeItem4), _deserializeDict(_deserializeItem4)) :: any,
+				},
+				["Group1_2"] = {
+					["Leaf24"] = _newNumberHandler("Group0_2/Group1_2/Leaf24", 71.56, _processDouble),
+					["Leaf35"] = _newNumberHandler("Group0_2/Group1_2/Leaf35", 10.02, _processDouble),
+					["Leaf50"] = _newNumberHandler("Group0_2/Group1_2/Leaf50", 91.97, _processDouble),
+					["Leaf92"] = _newDataHandler("Group0_2/Group1_2/Leaf92", treeGroup0_2Group1_2Leaf92Val, _serializeList(_serializeItem1), _deserializeList(_deserializeItem1)) :: any,
+					["Leaf119"] = _newNumberHandler("Group0_2/Group1_2/Leaf119", 59.54, _processDouble),
+					["Leaf127"] = _newDataHandler("Group0_2/Group1_2/Leaf127", true),
+					["Leaf162"] = _newNumberHandler("Group0_2/Group1_2/Leaf162", 629, _processInt),
+					["Leaf167"] = _newDataHandler("Group0_2/Group1_2/Leaf167", true),
+					["Leaf177"] = _newNumberHandler("Group0_2/Group1_2/Leaf177", 213, _processInt),
+				},
+			},
+		}
+	
+	-- the tree is only handed out once every value has loaded
+	local isAlive = true
+	local isLoaded = false
+	local onLoaded = Signal.new()
+	playerMaid:GiveTask(onLoaded)
+	playerMaid:GiveTask(function()
+		isAlive = false
+	end)
+	
+	-- every value in one round trip for the client to start from, sent once they've all loaded
+	local function getSnapshot(): { { any } }
+		if not isLoaded then
+			onLoaded:Wait()
+		end
+		local snapshot = {}
+		for i, handler in ipairs(handlers) do
+			if handler._IsAlive then
+				table.insert(snapshot, { handler.Scope, handler._Value })
+			end
+		end
+		return snapshot
+	end
+	if RunService:IsRunning() then
+		local snapshotFunction = NetworkUtil.getRemoteFunction(SNAPSHOT_SUFFIX, player)
+		playerMaid:GiveTask(snapshotFunction)
+		snapshotFunction.OnServerInvoke = function(plr: Player)
+			if player.UserId == plr.UserId then
+				return getSnapshot()
+			end
+			error("Bad player")
+		end
+	else
+		local snapshotFunction = NetworkUtil.getBindableFunction(SNAPSHOT_SUFFIX)
+		playerMaid:GiveTask(snapshotFunction)
+		snapshotFunction.OnInvoke = getSnapshot
+	end
+	
+	_loadHandlers(handlers, function(success: boolean)
+		if not isAlive then
+			return
+		end
+		if not success then
+			-- a partly loaded tree is never handed out, as its defaults could be saved over the stored data
+			player:Kick(LOAD_FAILED_MESSAGE)
+			return
+		end
+		isLoaded = true
+		onLoaded:Fire()
+		trees[player.UserId] = tree
+		
+		local onReady = readySignals[player.UserId]
+		if onReady then
+			readySignals[player.UserId] = nil
+			onReady:Fire(tree)
+			onReady:Destroy()
+		end
+	end)
+end
+
+return {
+	init = function(maid: Maid): nil
+		local playersMaid = Maid.new()
+		maid:GiveTask(playersMaid)
+		
+		maid:GiveTask(RunService.Heartbeat:Connect(_drainRequests))
+		maid:GiveTask(RunService.Heartbeat:Connect(_flushUpdates))
+		if AUTOSAVE_INTERVAL > 0 then
+			local lastAutosave = os.clock()
+			maid:GiveTask(RunService.Heartbeat:Connect(function()
+				if os.clock() - lastAutosave >= AUTOSAVE_INTERVAL then
+					lastAutosave = os.clock()
+					_autosave()
+				end
+			end))
+		end
+		if RunService:IsRunning() then
+			game:BindToClose(function()
+				-- queue the remaining saves, then wait for them to go through
+				playersMaid:Destroy()
+				_flushRequests(SHUTDOWN_TIMEOUT)
+			end)
+		end
+		
+		local function onPlayerAdded(player: Player)
+			local playerMaid = Maid.new()
+			playersMaid:GiveTask(playerMaid)
+			initPlayer(playerMaid, player)
+			playerMaid:GiveTask(player.Destroying:Connect(function()
+				trees[player.UserId] = nil
+				playerMaid:Destroy()
+			end))
+		end
+		
+		maid:GiveTask(Players.PlayerAdded:Connect(onPlayerAdded))
+		for i, player in ipairs(Players:GetChildren()) do
+			onPlayerAdded(player :: Player)
+		end
+		
+		return nil
+	end,
+	getSortedList = function(path: string, limit: number, isAscending: boolean?): { [number]: SortedDataEntry }
+		assert(SORTED_SCOPES[path], path .. " isn't a number value")
+		return _getSortedList(path, limit, isAscending == true)
+	end,
+	get = function(userId: number, yieldDuration: number?): DataTree?
+		local tree = trees[userId]
+		if tree or not yieldDuration then
+			return tree
+		end
+		
+		local onReady = readySignals[userId]
+		if not onReady then
+			onReady = Signal.new()
+			readySignals[userId] = onReady
+		end
+		assert(onReady)
+		
+		-- resumed exactly once, by whichever comes first of the tree being ready or the timeout
+		local thread = coroutine.running()
+		local isResumed = false
+		local connection
+		local function resume(readyTree: DataTree?)
+			if isResumed then
+				return
+			end
+			isResumed = true
+			connection:Disconnect()
+			task.spawn(thread, readyTree)
+		end
+		connection = onReady:Connect(function(readyTree: DataTree)
+			resume(readyTree)
+			return nil
+		end)
+		task.delay(yieldDuration, function()
+			resume(trees[userId])
+			if readySignals[userId] == onReady and #onReady:GetConnections() == 0 then
+				-- nobody else is waiting on a player that never showed up
+				readySignals[userId] = nil
+				onReady:Destroy()
+			end
+		end)
+		return coroutine.yield()
+	end,
+}
\ No newline at end of file
@@ -0,0 +1,31 @@
+--!strict
+-- this script was generated by nightcycle/datatree, do not manually edit
+export type VehicleType = "Sedan" | "Hatchback" | "Truck"
+
+export type PermissionData = {
+	CanDrive: boolean,
+	CanEdit: boolean,
+	CanSell: boolean,
+}
+
+export type PerformanceData = {
+	Speed: number,
+	Acceleration: number,
+	TurnSpeed: number,
+}
+
+export type VehicleData = {
+	Name: string,
+	Type: VehicleType,
+	Id: string,
+	PurchaseTime: DateTime,
+	FrictionCoefficient: number,
+	Material: Enum.Material,
+	Performance: PerformanceData,
+	Appearance: {
+		Color: Color3,
+		Skin: string?,
+	},
+}
+
+return {}
\ No newline at end of file
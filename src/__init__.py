@@ -1,23 +1,146 @@
+import os
 import sys
+import cProfile
+import pstats
 import multiprocessing
-from src.config import init as config_init
+from concurrent.futures import ThreadPoolExecutor
+from src.config import init as config_init, get_data_config
 from src.server import build as build_server
 from src.client import build as build_client
 from src.shared import build as build_shared
+from src.schema import DataSchema, compile_schema
+from src.lock import load_lock, save_lock
+from src.cache import CACHE_DIR_PATH, OutputName, load_cache, save_cache, get_stale_outputs, mark_outputs_built
+from src.timing import PROFILE_PATH, BuildReport, new_report, time_phase, count_schema, measure_outputs, print_report
+from src.watch import watch
+from src.snapshot import export_snapshot, import_snapshot
 from luau.roblox.rojo import build_sourcemap
 
 INIT_TAG = "init"
 BUILD_TAG = "build"
+WATCH_TAG = "watch"
+EXPORT_TAG = "export"
+IMPORT_TAG = "import"
+FORCE_FLAG = "--force"
+PROFILE_FLAG = "--profile"
+
+OUTPUT_NAMES: list[OutputName] = ["shared", "client", "server"]
+BUILDERS = {
+	"shared": build_shared,
+	"client": build_client,
+	"server": build_server,
+}
+# below this many tree leaves a pool costs more than it saves, measured with scripts/benchmark.py
+PARALLEL_LEAF_THRESHOLD = 2000
+
+def run_builders(schema: DataSchema, output_names: list[OutputName], report: BuildReport | None = None, executor: ThreadPoolExecutor | None = None) -> tuple[dict[OutputName, str], dict[OutputName, BaseException]]:
+	# the script each output was written to, in build order
+	script_paths: dict[OutputName, str] = {}
+	errors: dict[OutputName, BaseException] = {}
+
+	# while profiling, build one at a time so each output is timed and profiled on its own
+	if len(output_names) == 1 or report is not None or len(schema["tree"]) < PARALLEL_LEAF_THRESHOLD:
+		for output_name in output_names:
+			try:
+				with time_phase(report, "build " + output_name):
+					script_paths[output_name] = BUILDERS[output_name](schema)
+			except Exception as e:
+				errors[output_name] = e
+		return script_paths, errors
+
+	# generating holds the gil, but formatting and unpacking packages don't, so large builds can overlap those
+	if executor is None:
+		with ThreadPoolExecutor(max_workers=len(output_names)) as build_executor:
+			return run_builders(schema, output_names, report, build_executor)
+
+	futures = {}
+	for output_name in output_names:
+		futures[output_name] = executor.submit(BUILDERS[output_name], schema)
+
+	# collected in a fixed order so reporting is deterministic
+	for output_name in output_names:
+		try:
+			script_paths[output_name] = futures[output_name].result()
+		except Exception as e:
+			errors[output_name] = e
+
+	return script_paths, errors
+
+def build(force: bool = False, report: BuildReport | None = None, executor: ThreadPoolExecutor | None = None) -> list[OutputName]:
+	with time_phase(report, "load config"):
+		config = get_data_config()
+	cache = load_cache()
+	if force:
+		stale_outputs = OUTPUT_NAMES
+	else:
+		stale_outputs = get_stale_outputs(cache, config, OUTPUT_NAMES)
+
+	if len(stale_outputs) == 0:
+		print("datatree is up to date")
+		return stale_outputs
+
+	with time_phase(report, "compile schema"):
+		schema = compile_schema(config)
+	# only builds record the ordinals of new fields, other commands compile against the lockfile without writing it
+	if schema["lock"] != load_lock():
+		save_lock(schema["lock"])
+	script_paths, errors = run_builders(schema, stale_outputs, report, executor)
+	built_outputs = list(script_paths.keys())
+
+	if len(built_outputs) > 0:
+		with time_phase(report, "build sourcemap"):
+			build_sourcemap()
+		print("built " + ", ".join(built_outputs))
+
+	if len(built_outputs) > 0 or len(errors) > 0:
+		mark_outputs_built(cache, config, script_paths, list(errors.keys()))
+		save_cache(cache)
+
+	if report is not None:
+		count_schema(report, schema)
+		measure_outputs(report, script_paths)
+
+	if len(errors) > 0:
+		error_messages = []
+		for output_name, error in errors.items():
+			error_messages.append(f"{output_name}: {type(error).__name__}: {error}")
+		raise ValueError("failed to build " + ", ".join(errors.keys()) + "\n" + "\n".join(error_messages))
+
+	return built_outputs
+
+def profile_build(force: bool = False) -> list[OutputName]:
+	report = new_report()
+	profiler = cProfile.Profile()
+	try:
+		built_outputs = profiler.runcall(build, force, report)
+	finally:
+		if not os.path.exists(CACHE_DIR_PATH):
+			os.makedirs(CACHE_DIR_PATH)
+		profiler.dump_stats(PROFILE_PATH)
+		print_report(report, pstats.Stats(profiler))
+	return built_outputs
 
 def main():
 	assert len(sys.argv) > 1, "no arguments provided"
 	if sys.argv[1] == INIT_TAG:
 		config_init()
 	elif sys.argv[1] == BUILD_TAG:
-		build_shared()
-		build_client()
-		build_server()
-		build_sourcemap()
+		if PROFILE_FLAG in sys.argv:
+			profile_build(force=FORCE_FLAG in sys.argv)
+		else:
+			build(force=FORCE_FLAG in sys.argv)
+	elif sys.argv[1] == WATCH_TAG:
+		# one pool for the whole session, rather than one per save
+		with ThreadPoolExecutor(max_workers=len(OUTPUT_NAMES)) as executor:
+			watch(lambda: build(executor=executor))
+	elif sys.argv[1] == EXPORT_TAG:
+		assert len(sys.argv) > 3, "usage: datatree export <snapshot.jsonl> <out.csv>"
+		row_count = export_snapshot(compile_schema(), sys.argv[2], sys.argv[3])
+		print(f"exported {row_count} players to {sys.argv[3]}")
+	elif sys.argv[1] == IMPORT_TAG:
+		assert len(sys.argv) > 3, "usage: datatree import <in.csv> <snapshot.jsonl>"
+		row_count = import_snapshot(compile_schema(), sys.argv[2], sys.argv[3])
+		print(f"imported {row_count} players to {sys.argv[3]}")
 
 # prevent from running twice
 if __name__ == '__main__':
@@ -0,0 +1,134 @@
+import os
+import json
+import hashlib
+from typing import Any, TypedDict, Literal
+from src.config import DataConfig, DATATREE_VERSION
+from src.lock import load_lock
+
+CACHE_DIR_PATH = ".datatree"
+CACHE_PATH = CACHE_DIR_PATH + "/cache.json"
+
+OutputName = Literal["shared", "client", "server"]
+
+class BuildCache(TypedDict):
+	version: str
+	config_hash: str
+	outputs: dict[str, str]
+	scripts: dict[str, str] # the script each output was last written to
+
+def _get_hash(data: Any) -> str:
+	encoded = json.dumps(data, sort_keys=True, default=str)
+	return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+def get_output_inputs(config: DataConfig, output_name: OutputName) -> dict:
+	build_config = config["build"]
+	if output_name == "shared":
+		return {
+			"types": config["types"],
+			"shared_path": build_config["out"]["shared_path"],
+		}
+	elif output_name == "client":
+		return {
+			"types": config["types"],
+			"tree": config["tree"],
+			"replication": config["replication"],
+			"transport": config["transport"],
+			"shared_types_roblox_path": build_config["shared_types_roblox_path"],
+			"client_path": build_config["out"]["client_path"],
+		}
+	else:
+		# field ordinals can be edited in the lockfile without touching the config
+		return {
+			"config": config,
+			"lock": load_lock(),
+		}
+
+def get_output_hash(config: DataConfig, output_name: OutputName) -> str:
+	return _get_hash({
+		"version": DATATREE_VERSION,
+		"output": output_name,
+		"inputs": get_output_inputs(config, output_name),
+	})
+
+def get_config_hash(config: DataConfig) -> str:
+	return _get_hash({
+		"version": DATATREE_VERSION,
+		"config": config,
+		"lock": load_lock(),
+	})
+
+def get_output_path(config: DataConfig, output_name: OutputName) -> str:
+	out_config = config["build"]["out"]
+	if output_name == "shared":
+		return out_config["shared_path"]
+	elif output_name == "client":
+		return out_config["client_path"]
+	else:
+		return out_config["server_path"]
+
+def load_cache() -> BuildCache:
+	empty_cache: BuildCache = {
+		"version": DATATREE_VERSION,
+		"config_hash": "",
+		"outputs": {},
+		"scripts": {},
+	}
+	if not os.path.exists(CACHE_PATH):
+		return empty_cache
+
+	try:
+		file = open(CACHE_PATH, "r")
+		data: Any = json.loads(file.read())
+		file.close()
+	except (OSError, ValueError):
+		return empty_cache
+
+	if type(data) != dict or data.get("version") != DATATREE_VERSION:
+		return empty_cache
+
+	return {
+		"version": DATATREE_VERSION,
+		"config_hash": data.get("config_hash", ""),
+		"outputs": data.get("outputs", {}),
+		"scripts": data.get("scripts", {}),
+	}
+
+def save_cache(cache: BuildCache) -> None:
+	if not os.path.exists(CACHE_DIR_PATH):
+		os.makedirs(CACHE_DIR_PATH)
+
+	file = open(CACHE_PATH, "w")
+	file.write(json.dumps(cache, indent=2, sort_keys=True))
+	file.close()
+
+def get_stale_outputs(cache: BuildCache, config: DataConfig, output_names: list[OutputName]) -> list[OutputName]:
+	missing_outputs: list[OutputName] = []
+	for output_name in output_names:
+		if not os.path.isfile(cache["scripts"].get(output_name, "")):
+			missing_outputs.append(output_name)
+
+	# unchanged config, only rebuild what was deleted
+	if cache["config_hash"] == get_config_hash(config):
+		return missing_outputs
+
+	stale_outputs: list[OutputName] = []
+	for output_name in output_names:
+		if output_name in missing_outputs or cache["outputs"].get(output_name) != get_output_hash(config, output_name):
+			stale_outputs.append(output_name)
+
+	return stale_outputs
+
+def mark_outputs_built(cache: BuildCache, config: DataConfig, script_paths: dict[OutputName, str], failed_output_names: list[OutputName] = []) -> None:
+	for output_name, script_path in script_paths.items():
+		cache["outputs"][output_name] = get_output_hash(config, output_name)
+		cache["scripts"][output_name] = script_path
+
+	# a failed output may have left an older script behind, it has to be built again next time
+	for output_name in failed_output_names:
+		cache["outputs"].pop(output_name, None)
+		cache["scripts"].pop(output_name, None)
+
+	if len(failed_output_names) > 0:
+		cache["config_hash"] = ""
+	else:
+		cache["config_hash"] = get_config_hash(config)
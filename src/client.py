@@ -1,14 +1,204 @@
 import dpath
-from src.util import get_raw_type_name, get_raw_key_name, get_type_name_from_key, get_roblox_type, get_package_zip_path
+from src.util import get_raw_type_name, get_roblox_type, get_package_zip_path, get_script_path
 from luau import indent_block
 from luau.convert import from_dict, mark_as_literal, from_dict_to_type
 from luau.roblox import write_script, get_package_require
 from luau.roblox.util import get_module_require
 from luau.path import get_if_module_script, remove_all_path_variants
-from src.config import get_data_config, HEADER_WARNING, GET_SUFFIX_KEY, UPDATE_SUFFIX_KEY
+from src.config import HEADER_WARNING, GET_SUFFIX_KEY, UPDATE_SUFFIX_KEY, SNAPSHOT_SUFFIX_KEY, ReplicationMode, TransportMode
+from src.schema import DataSchema, compile_schema, get_path_ids
 
-def build() -> None:
-	config = get_data_config()
+def write_transport(transport: TransportMode) -> list[str]:
+	if transport == "multiplexed":
+		return [
+			"-- every value shares one remote pair, updates arrive once per frame as a batch of entries tagged with the path's id",
+			"local updateCallbacks: { [number]: (...any) -> () } = {}",
+			"local function onMessage(batch: { { any } })",
+			] + indent_block([
+				"-- applied in one go so no code reads a mix of old and new values",
+				"for i, entry in ipairs(batch) do",
+				"\tlocal callback = updateCallbacks[entry[1]]",
+				"\tif callback then",
+				"\t\tcallback(entry[2], entry[3])",
+				"\tend",
+				"end",
+				"return nil",
+			]) + [
+			"end",
+			"if RunService:IsRunning() then",
+			"\tmaid:GiveTask(NetworkUtil.onClientEventAt(UPDATE_SUFFIX, Players.LocalPlayer, onMessage))",
+			"else",
+			"\tmaid:GiveTask(NetworkUtil.getBindableEvent(UPDATE_SUFFIX).Event:Connect(onMessage))",
+			"end",
+			"",
+			"local function connectUpdate(scope: string, callback: (...any) -> ())",
+			"\tupdateCallbacks[PATH_IDS[scope]] = callback",
+			"end",
+			"",
+			"local function fetchValue(scope: string): ...any",
+			"\tif RunService:IsRunning() then",
+			"\t\treturn NetworkUtil.getRemoteFunction(GET_SUFFIX, Players.LocalPlayer):InvokeServer(PATH_IDS[scope])",
+			"\telse",
+			"\t\treturn NetworkUtil.getBindableFunction(GET_SUFFIX):Invoke(PATH_IDS[scope])",
+			"\tend",
+			"end",
+			"",
+		]
+	else:
+		return [
+			"local function connectUpdate(scope: string, callback: (...any) -> ())",
+			] + indent_block([
+				"local updateKey = scope .. \"_\" .. UPDATE_SUFFIX",
+				"if RunService:IsRunning() then",
+				"\tmaid:GiveTask(NetworkUtil.onClientEventAt(updateKey, Players.LocalPlayer, callback))",
+				"else",
+				"\tmaid:GiveTask(NetworkUtil.getBindableEvent(updateKey).Event:Connect(callback))",
+				"end",
+			]) + [
+			"end",
+			"",
+			"local function fetchValue(scope: string): ...any",
+			] + indent_block([
+				"local getKey = scope .. \"_\" .. GET_SUFFIX",
+				"if RunService:IsRunning() then",
+				"\treturn NetworkUtil.getRemoteFunction(getKey, Players.LocalPlayer):InvokeServer()",
+				"else",
+				"\treturn NetworkUtil.getBindableFunction(getKey):Invoke()",
+				"end",
+			]) + [
+			"end",
+			"",
+		]
+
+def write_snapshot() -> list[str]:
+	return [
+		"-- every value is fetched in one round trip, receivers missing from it fall back to fetching their own",
+		"local snapshot: { [string]: { any } } = {}",
+		"local snapshotEntries: { { any } }",
+		"if RunService:IsRunning() then",
+		"\tsnapshotEntries = NetworkUtil.getRemoteFunction(SNAPSHOT_SUFFIX, Players.LocalPlayer):InvokeServer()",
+		"else",
+		"\tsnapshotEntries = NetworkUtil.getBindableFunction(SNAPSHOT_SUFFIX):Invoke()",
+		"end",
+		"for i, entry in ipairs(snapshotEntries) do",
+		"\tsnapshot[entry[1]] = entry",
+		"end",
+		"",
+	]
+
+def write_receiver_constructor(replication: ReplicationMode) -> list[str]:
+	if replication == "delta":
+		return [
+			"local function newReceiver<T>(scope: string): Receiver<T>",
+			] + indent_block([
+				"local isFetching = false",
+				"local function sync()",
+				] + indent_block([
+					"isFetching = true",
+					"local value, version = fetchValue(scope)",
+					"isFetching = false",
+					"if versions[scope] == nil or version > versions[scope] then",
+					"\tvalues[scope] = value",
+					"\tversions[scope] = version",
+					"end",
+				]) + [
+				"end",
+				"",
+				"local entry = snapshot[scope]",
+				"if entry then",
+				"\tversions[scope] = entry[2]",
+				"\tvalues[scope] = entry[3]",
+				"end",
+				"",
+				"connectUpdate(scope, function(version: number, changes: { DeltaChange })",
+				] + indent_block([
+					"local currentVersion = versions[scope]",
+					"if currentVersion == nil or version <= currentVersion then",
+					"\treturn",
+					"elseif version == currentVersion + 1 then",
+					] + indent_block([
+						"local value = values[scope]",
+						"for i, change in ipairs(changes) do",
+						"\tvalue = _applyChange(value, change[2], 1, change)",
+						"end",
+						"values[scope] = value",
+						"versions[scope] = version",
+					]) + [
+					"elseif not isFetching then",
+					"\t-- a change went missing, start over from the server's current value",
+					"\ttask.spawn(sync)",
+					"end",
+				]) + [
+				"end)",
+				"if not entry then",
+				"\tsync()",
+				"end",
+				"",
+				"return function(): T",
+				"\treturn values[scope] :: any",
+				"end",
+			]) + [
+			"end",
+		]
+	else:
+		return [
+			"local function newReceiver<T>(scope: string): Receiver<T>",
+			] + indent_block([
+				"connectUpdate(scope, function(val)",
+				"\tvalues[scope] = val",
+				"end)",
+				"local entry = snapshot[scope]",
+				"if entry then",
+				"\tvalues[scope] = entry[2]",
+				"else",
+				"\tvalues[scope] = fetchValue(scope)",
+				"end",
+				"",
+				"return function(): T",
+				"\treturn values[scope] :: any",
+				"end",
+			]) + [
+			"end",
+		]
+
+def write_delta_functions() -> list[str]:
+	return [
+		"-- returns a copy of value with the change applied, only the tables along its path are copied",
+		"function _applyChange(value: any, keys: { any }, depth: number, change: DeltaChange): any",
+		] + indent_block([
+			"if depth <= #keys then",
+			] + indent_block([
+				"local key = keys[depth]",
+				"local copy = if type(value) == \"table\" then table.clone(value) else {}",
+				"copy[key] = _applyChange(copy[key], keys, depth + 1, change)",
+				"return copy",
+			]) + [
+			"end",
+			"",
+			"local action = change[1]",
+			"if action == \"s\" then",
+			"\treturn change[3]",
+			"elseif action == \"r\" then",
+			"\treturn nil",
+			"end",
+			"local list = table.clone(value)",
+			"if action == \"i\" then",
+			"\ttable.insert(list, change[3], change[4])",
+			"else",
+			"\ttable.remove(list, change[3])",
+			"end",
+			"return list",
+		]) + [
+		"end",
+		"",
+	]
+
+def build(schema: DataSchema | None = None) -> str:
+	if schema is None:
+		schema = compile_schema()
+	config = schema["config"]
+	replication = config["replication"]
+	transport = config["transport"]
 
 	build_path = config["build"]["out"]["client_path"]
 	assert get_if_module_script(build_path), "client datatree must be a ModuleScript, please make sure the client_path only ends with .lua/luau"
@@ -22,34 +212,28 @@ def build() -> None:
 
 	type_tree: dict = {}
 	func_tree: dict = {}
-	for full_path, value in dpath.search(config["tree"], '**', yielded=True):
-		keys = full_path.split("/")
-		raw_keys = []
-		final_type: None | str = None
-		for key in keys:
-			if final_type == None:
-				raw_keys.append(get_raw_key_name(key))
-				final_type = get_type_name_from_key(key)
-
-		path = "/".join(raw_keys)
-		if len(raw_keys) < len(keys):
-			ro_type = get_roblox_type(final_type)
-			dpath.new(func_tree, path, mark_as_literal(f"newReceiver(\"{path}\")"))
-			dpath.new(type_tree, path, mark_as_literal(f"Receiver<{ro_type}>"))
-		elif type(value) == str:
-			raw_value = get_raw_type_name(value)
-			if raw_value in config["types"]:
-				dpath.new(func_tree, path, mark_as_literal(f"newReceiver(\"{path}\")"))
-				dpath.new(type_tree, path, mark_as_literal(f"Receiver<{final_type}>"))
+	for leaf in schema["tree"]:
+		path = leaf["path"]
+		leaf_type = leaf["type"]
+		value = leaf["value"]
+		if leaf_type is not None:
+			if leaf_type["raw_name"] in config["types"]:
+				ro_type = leaf_type["name"]
 			else:
-				dpath.new(func_tree, path, mark_as_literal(f"newReceiver(\"{path}\")"))
-				dpath.new(type_tree, path, mark_as_literal("Receiver<string>"))
+				ro_type = get_roblox_type(leaf_type["name"])
+		elif type(value) == str and get_raw_type_name(value) in config["types"]:
+			ro_type = value
+		elif type(value) == str:
+			ro_type = "string"
 		elif type(value) == bool:
-			dpath.new(func_tree, path, mark_as_literal(f"newReceiver(\"{path}\")"))
-			dpath.new(type_tree, path, mark_as_literal("Receiver<boolean>"))
+			ro_type = "boolean"
 		elif type(value) == int or type(value) == float:
-			dpath.new(func_tree, path, mark_as_literal(f"newReceiver(\"{path}\")"))
-			dpath.new(type_tree, path, mark_as_literal("Receiver<number>"))
+			ro_type = "number"
+		else:
+			continue
+
+		dpath.new(func_tree, path, mark_as_literal(f"newReceiver(\"{path}\")"))
+		dpath.new(type_tree, path, mark_as_literal(f"Receiver<{ro_type}>"))
 
 	type_tree["init"] = mark_as_literal("(maid: Maid) -> nil")
 	func_tree["init"] = mark_as_literal("function(maid: Maid) return nil end")
@@ -72,6 +256,9 @@ def build() -> None:
 		"--Types",
 		"type Maid = Maid.Maid",
 		"export type Receiver<T> = () -> T",
+		] + ([
+		"type DeltaChange = { any }",
+		] if replication == "delta" else []) + [
 	] + type_imports + [
 		"",
 		"export type DataTree = " + from_dict_to_type(type_tree),
@@ -79,33 +266,20 @@ def build() -> None:
 		"--Constants",
 		f"local GET_SUFFIX = \"{GET_SUFFIX_KEY}\"",
 		f"local UPDATE_SUFFIX = \"{UPDATE_SUFFIX_KEY}\"",
+		f"local SNAPSHOT_SUFFIX = \"{SNAPSHOT_SUFFIX_KEY}\"",
+		] + ([
+		"local PATH_IDS = " + from_dict(get_path_ids(schema)),
+		] if transport == "multiplexed" else []) + [
 		"",
 		"-- Class",
 		"local tree: DataTree = {} :: any",
 		"local values = {}",
-		"function tree.init(maid: Maid): nil",
-		"	local function newReceiver<T>(scope: string): Receiver<T>",
-		"		local updateKey = scope .. \"_\" .. UPDATE_SUFFIX",
-		"		local getKey = scope .. \"_\" .. GET_SUFFIX",
+		] + ([
+		"local versions: { [string]: number } = {}",
 		"",
-		"		if RunService:IsRunning() then",
-		"			maid:GiveTask(NetworkUtil.onClientEventAt(updateKey, Players.LocalPlayer, function(val)",
-		"				values[scope] = val",
-		"			end))",
-		"			values[scope] = NetworkUtil.invokeServerAt(getKey, Players.LocalPlayer)",
-		"		else",
-		"			local bindableEvent = NetworkUtil.getBindableEvent(updateKey)",
-		"			maid:GiveTask(bindableEvent.Event:Connect(function(val)",
-		"				values[scope] = val",
-		"			end))",
-		"			local bindableFunction = NetworkUtil.getBindableFunction(getKey)",
-		"			values[scope] = bindableFunction:Invoke()",
-		"		end",
-		"",
-		"		return function(): T",
-		"			return values[scope] :: any",
-		"		end",
-		"	end",
+		] + write_delta_functions() if replication == "delta" else []) + [
+		"function tree.init(maid: Maid): nil",
+		] + indent_block(write_transport(transport) + write_snapshot() + write_receiver_constructor(replication)) + [
 		"",
 		"	tree = " + from_dict(func_tree, indent_count=1, skip_initial_indent=True),
 		"	return nil",
@@ -117,4 +291,4 @@ def build() -> None:
 
 	]
 	write_script(build_path, "\n".join(content), packages_dir_zip_file_path=get_package_zip_path(), skip_source_map=True)
-	return None
+	return get_script_path(build_path, write_as_directory=True)
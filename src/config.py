@@ -1,8 +1,10 @@
 import yaml
 import os
+import copy
 from typing import Any, TypedDict, Literal
 
 CONFIG_PATH = "datatree.yaml"
+DATATREE_VERSION = "0.2.0"
 DEFAULT_TABLE = {
 	"domain_name": "gamedata",
 	"build": {
@@ -13,13 +15,29 @@ DEFAULT_TABLE = {
 			"server_path": "src/Server/DataTreeService.luau",
 		},
 	},
+	"storage": "leaf",
+	"replication": "full",
+	"transport": "per_leaf",
+	"codec": "json",
+	"serializers": "functions",
+	"autosave_interval": 60,
+	"leaderboard_interval": 60,
+	"leaderboard_size": 100,
 	"metadata": {},
+	"migrations": [],
 	"types": {},
 	"tree": {
 
 	}
 }
 
+# libyaml is several times faster on large configs, but isn't always installed
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YAML_EXTENSIONS = [".yaml", ".yml"]
+FRAGMENT_KEYS = ["types", "tree"]
+
+_yaml_cache: dict[str, tuple[float, Any]] = {}
+
 SERVICE_PROXY_PATH = "nightcycle/service-proxy@1.0.0"
 NETWORK_UTIL_WALLY_PATH = "nightcycle/network-util@1.7.0"
 MAID_WALLY_PATH = "nightcycle/maid@1.1.4"
@@ -29,6 +47,22 @@ HEADER_WARNING = "-- this script was generated by nightcycle/datatree, do not ma
 
 GET_SUFFIX_KEY = "DATA_TREE_CLT_GET"
 UPDATE_SUFFIX_KEY = "DATA_TREE_CLT_UPDATE"
+SNAPSHOT_SUFFIX_KEY = "DATA_TREE_CLT_SNAPSHOT"
+
+StorageMode = Literal["leaf", "document"]
+STORAGE_MODES: list[StorageMode] = ["leaf", "document"]
+
+ReplicationMode = Literal["full", "delta"]
+REPLICATION_MODES: list[ReplicationMode] = ["full", "delta"]
+
+TransportMode = Literal["per_leaf", "multiplexed"]
+TRANSPORT_MODES: list[TransportMode] = ["per_leaf", "multiplexed"]
+
+CodecMode = Literal["json", "compact"]
+CODEC_MODES: list[CodecMode] = ["json", "compact"]
+
+SerializerMode = Literal["functions", "tables"]
+SERIALIZER_MODES: list[SerializerMode] = ["functions", "tables"]
 
 class OutConfig(TypedDict):
 	client_path: str
@@ -39,22 +73,132 @@ class BuildConfig(TypedDict):
   shared_types_roblox_path: str
   out: OutConfig
 
+class MigrationConfig(TypedDict):
+	version: dict[str, int] # stored values with older metadata are passed through the module
+	module: str # roblox path of a ModuleScript returning (scope: string, value: any) -> any
+
 class DataConfig(TypedDict):
 	domain_name: str
 	build: BuildConfig
+	storage: StorageMode
+	replication: ReplicationMode
+	transport: TransportMode
+	codec: CodecMode
+	serializers: SerializerMode
+	autosave_interval: float
+	leaderboard_interval: float
+	leaderboard_size: int
 	metadata: dict
+	migrations: list[MigrationConfig]
 	types: dict
 	tree: dict
 
+# the numeric metadata entries, in the order they're written, are read as the version
+def get_version_keys(metadata: dict) -> list[str]:
+	return [key for key, value in metadata.items() if type(value) == int]
+
+def get_version(metadata: dict, version: dict) -> list[int]:
+	version_keys = get_version_keys(metadata)
+	for key in version:
+		assert key in version_keys, f"{key} isn't a numeric metadata entry, so can't be part of a version"
+		assert type(version[key]) == int, f"version entry {key} must be an integer, not {version[key]}"
+	return [version.get(key, 0) for key in version_keys]
+
 def init():
 	assert os.path.exists(CONFIG_PATH) == False, "datatree is already initialized"
 	file = open(CONFIG_PATH, "w")
 	file.write(yaml.safe_dump(DEFAULT_TABLE))
 	file.close()
 
+# parsed files are shared between loads, so they must never be mutated
+def load_yaml(path: str) -> Any:
+	mtime = os.stat(path).st_mtime
+	cached = _yaml_cache.get(path)
+	if cached is not None and cached[0] == mtime:
+		return cached[1]
+
+	file = open(path, "r")
+	data = yaml.load(file, Loader=YAML_LOADER)
+	file.close()
+	_yaml_cache[path] = (mtime, data)
+	return data
+
+def forget_yaml(path: str) -> None:
+	_yaml_cache.pop(path, None)
+
+def get_include_paths(include: Any) -> list[str]:
+	include_dirs = include if type(include) == list else [include]
+	config_dir = os.path.dirname(CONFIG_PATH)
+	paths: list[str] = []
+	for include_dir in include_dirs:
+		include_dir = os.path.join(config_dir, str(include_dir))
+		assert os.path.isdir(include_dir), f"included directory {include_dir} doesn't exist"
+		for dir_path, dir_names, file_names in os.walk(include_dir):
+			dir_names.sort()
+			for file_name in sorted(file_names):
+				if os.path.splitext(file_name)[1] in YAML_EXTENSIONS:
+					paths.append(os.path.join(dir_path, file_name))
+	return paths
+
+# the config and every fragment it includes
+def get_config_paths() -> list[str]:
+	if not os.path.exists(CONFIG_PATH):
+		return []
+	data = load_yaml(CONFIG_PATH)
+	if type(data) != dict or data.get("include") == None:
+		return [CONFIG_PATH]
+	return [CONFIG_PATH] + get_include_paths(data["include"])
+
+def _merge_tree(tree: dict, fragment: dict, path: str) -> dict:
+	merged = dict(tree)
+	for key, value in fragment.items():
+		if key in merged and type(merged[key]) == dict and type(value) == dict:
+			merged[key] = _merge_tree(merged[key], value, path + str(key) + "/")
+		else:
+			assert not key in merged, f"tree key {path}{key} is defined more than once"
+			merged[key] = value
+	return merged
+
+def _merge_fragment(data: dict, fragment: Any, fragment_path: str) -> None:
+	assert type(fragment) == dict, f"{fragment_path} must be a dictionary"
+	for key in fragment:
+		assert key in FRAGMENT_KEYS, f"{fragment_path} can only contain {', '.join(FRAGMENT_KEYS)}, not {key}"
+
+	types = fragment.get("types") or {}
+	for type_name in types:
+		assert not type_name in data["types"], f"type {type_name} in {fragment_path} is defined more than once"
+	data["types"] = {**data["types"], **types}
+	data["tree"] = _merge_tree(data["tree"], fragment.get("tree") or {}, "")
+
 def get_data_config() -> DataConfig:
 	assert os.path.exists(CONFIG_PATH) == True, "datatree is not initialized"
-	file = open(CONFIG_PATH, "r")
-	data: Any = yaml.safe_load(file.read())
-	file.close()
+	data: Any = dict(load_yaml(CONFIG_PATH))
+
+	# fill in settings added after the config was initialized
+	for key, value in DEFAULT_TABLE.items():
+		if not key in data or data[key] == None:
+			data[key] = copy.deepcopy(value)
+
+	include = data.pop("include", None)
+	if include != None:
+		for fragment_path in get_include_paths(include):
+			_merge_fragment(data, load_yaml(fragment_path), fragment_path)
+
+	assert data["storage"] in STORAGE_MODES, f"storage must be one of {', '.join(STORAGE_MODES)}, not {data['storage']}"
+	assert data["replication"] in REPLICATION_MODES, f"replication must be one of {', '.join(REPLICATION_MODES)}, not {data['replication']}"
+	assert data["transport"] in TRANSPORT_MODES, f"transport must be one of {', '.join(TRANSPORT_MODES)}, not {data['transport']}"
+	assert data["codec"] in CODEC_MODES, f"codec must be one of {', '.join(CODEC_MODES)}, not {data['codec']}"
+	assert data["serializers"] in SERIALIZER_MODES, f"serializers must be one of {', '.join(SERIALIZER_MODES)}, not {data['serializers']}"
+	assert type(data["autosave_interval"]) in (int, float) and data["autosave_interval"] >= 0, f"autosave_interval must be a number of seconds, not {data['autosave_interval']}"
+	assert type(data["leaderboard_interval"]) in (int, float) and data["leaderboard_interval"] > 0, f"leaderboard_interval must be a positive number of seconds, not {data['leaderboard_interval']}"
+	assert type(data["leaderboard_size"]) == int and data["leaderboard_size"] > 0, f"leaderboard_size must be a positive integer, not {data['leaderboard_size']}"
+
+	previous_version: list[int] | None = None
+	for migration in data["migrations"]:
+		assert type(migration) == dict and type(migration.get("module")) == str and type(migration.get("version")) == dict, "migrations must each have a version and a module path"
+		version = get_version(data["metadata"], migration["version"])
+		assert previous_version is None or previous_version < version, "migrations must be listed from oldest to newest version"
+		assert version <= [data["metadata"][key] for key in get_version_keys(data["metadata"])], f"migration to {migration['version']} is newer than the metadata version"
+		previous_version = version
+
 	return data 	
\ No newline at end of file
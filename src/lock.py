@@ -0,0 +1,86 @@
+import os
+import copy
+import yaml
+from typing import Any, TypedDict
+from src.config import load_yaml, forget_yaml
+
+LOCK_PATH = "datatree.lock"
+LOCK_HEADER = "# generated by datatree, commit this file next to datatree.yaml\n# it keeps the numbers custom type fields are saved under stable between builds\n"
+WORD_BIT_COUNT = 32
+
+class TypeLayout(TypedDict):
+	fields: dict[str, int] # ordinal each non-boolean field is saved under
+	bits: dict[str, list[int]] # first bit and bit count of each boolean field
+	words: list[int] # ordinal each group of 32 packed boolean bits is saved under
+	next_ordinal: int
+	next_bit: int
+
+class DataLock(TypedDict):
+	types: dict[str, TypeLayout]
+
+class LockField(TypedDict):
+	path: str
+	is_boolean: bool
+	is_optional: bool
+
+def load_lock() -> DataLock:
+	if not os.path.exists(LOCK_PATH):
+		return {"types": {}}
+
+	# copied as layouts are updated in place, and the parsed file is shared between loads
+	data: Any = copy.deepcopy(load_yaml(LOCK_PATH))
+	assert type(data) == dict and type(data.get("types", {})) == dict, f"{LOCK_PATH} is malformed"
+	return {"types": data.get("types") or {}}
+
+def save_lock(lock: DataLock) -> None:
+	untyped_lock: Any = lock
+	file = open(LOCK_PATH, "w")
+	file.write(LOCK_HEADER + yaml.safe_dump(untyped_lock, sort_keys=False))
+	file.close()
+	# a rewrite can land within the same mtime tick as the cached read
+	forget_yaml(LOCK_PATH)
+
+# ordinals are only ever appended, so removed fields keep theirs reserved and renames can be recorded by moving one
+def get_type_layout(lock: DataLock, type_name: str, fields: list[LockField]) -> TypeLayout:
+	layout: TypeLayout = lock["types"].get(type_name) or {
+		"fields": {},
+		"bits": {},
+		"words": [],
+		"next_ordinal": 1,
+		"next_bit": 0,
+	}
+
+	# values first, so a new type keeps its declaration order with the packed booleans at the end
+	for field in fields:
+		if field["is_boolean"]:
+			continue
+		if field["path"] in layout["bits"]:
+			del layout["bits"][field["path"]]
+		if not field["path"] in layout["fields"]:
+			layout["fields"][field["path"]] = layout["next_ordinal"]
+			layout["next_ordinal"] += 1
+
+	for field in fields:
+		if not field["is_boolean"]:
+			continue
+		if field["path"] in layout["fields"]:
+			del layout["fields"][field["path"]]
+
+		# optional booleans use a second bit to mark when they're set
+		bit_count = 2 if field["is_optional"] else 1
+		existing_bits = layout["bits"].get(field["path"])
+		if existing_bits is not None and existing_bits[1] == bit_count:
+			continue
+
+		bit = layout["next_bit"]
+		if bit % WORD_BIT_COUNT + bit_count > WORD_BIT_COUNT:
+			bit = (bit // WORD_BIT_COUNT + 1) * WORD_BIT_COUNT
+		layout["bits"][field["path"]] = [bit, bit_count]
+		layout["next_bit"] = bit + bit_count
+
+		while len(layout["words"]) <= (layout["next_bit"] - 1) // WORD_BIT_COUNT:
+			layout["words"].append(layout["next_ordinal"])
+			layout["next_ordinal"] += 1
+
+	lock["types"][type_name] = layout
+	return layout
@@ -0,0 +1,212 @@
+from typing import Any, TypedDict, Literal
+from src.config import DataConfig, get_data_config
+from src.lock import TypeLayout, DataLock, load_lock, get_type_layout
+from src.util import get_raw_key_name, get_type_name_from_key, get_raw_type_name, get_if_optional
+
+ContainerType = Literal["List", "Dict"]
+
+class ParsedType(TypedDict):
+	name: str # as written in the config, e.g. "Dict[number, PermissionData?]"
+	raw_name: str # name without the optional marker
+	is_optional: bool
+	container: ContainerType | None
+	key_name: str | None # key type of a Dict
+	item_name: str | None # element type of a List / value type of a Dict, as written
+	raw_item_name: str | None
+	custom_type: str | None # custom type referenced by the value or its elements
+	enum_name: str | None # roblox enum referenced by the value or its elements, e.g. "Enum.Material"
+
+class TypeField(TypedDict):
+	path: str
+	keys: list[str]
+	type: ParsedType
+
+class CustomType(TypedDict):
+	name: str
+	definition: dict | list
+	options: list[str] | None # set for custom enums defined as a list of strings
+	fields: list[TypeField]
+	layout: TypeLayout | None # ordinals the fields are saved under, None for custom enums
+
+class TreeLeaf(TypedDict):
+	path: str # path without type markers, e.g. "Currency/Cash"
+	keys: list[str]
+	full_path: str # path as written in the config, e.g. "Currency/Cash::int"
+	type: ParsedType | None # None when the key isn't typed
+	value: Any
+
+class DataSchema(TypedDict):
+	config: DataConfig
+	types: dict[str, CustomType]
+	tree: list[TreeLeaf]
+	enums: list[str]
+	lock: DataLock # the lockfile with ordinals given to any new fields, only written by build
+
+def parse_type(type_name: str, custom_types: dict | None = None) -> ParsedType:
+	custom_types = custom_types or {}
+	raw_name = get_raw_type_name(type_name)
+	container: ContainerType | None = None
+	key_name: str | None = None
+	item_name: str | None = None
+	raw_item_name: str | None = None
+
+	if raw_name[0:5] == "List[":
+		container = "List"
+		item_name = raw_name[5:(len(raw_name)-1)].strip()
+	elif raw_name[0:5] == "Dict[":
+		container = "Dict"
+		params = raw_name[5:(len(raw_name)-1)].split(",")
+		key_name = params[0].strip()
+		item_name = params[1].strip()
+
+	if item_name is not None:
+		raw_item_name = get_raw_type_name(item_name)
+		base_name = raw_item_name
+	else:
+		base_name = raw_name
+
+	custom_type: str | None = None
+	enum_name: str | None = None
+	if base_name in custom_types:
+		custom_type = base_name
+	elif base_name[0:5] == "Enum.":
+		enum_name = base_name
+
+	return {
+		"name": type_name,
+		"raw_name": raw_name,
+		"is_optional": get_if_optional(type_name),
+		"container": container,
+		"key_name": key_name,
+		"item_name": item_name,
+		"raw_item_name": raw_item_name,
+		"custom_type": custom_type,
+		"enum_name": enum_name,
+	}
+
+# yields in the same order as dpath.search(data, '**'): siblings first, then their children
+def _walk(data: dict | list, keys: list[str]):
+	items = data.items() if type(data) == dict else enumerate(data)
+	children = []
+	for k, v in items:
+		sub_keys = keys + [str(k)]
+		yield sub_keys, v
+		if type(v) == dict or type(v) == list:
+			children.append((sub_keys, v))
+
+	for sub_keys, v in children:
+		yield from _walk(v, sub_keys)
+
+def _compile_type(type_name: str, definition: dict | list, custom_types: dict) -> CustomType:
+	if type(definition) == list:
+		return {
+			"name": type_name,
+			"definition": definition,
+			"options": [str(option) for option in definition],
+			"fields": [],
+			"layout": None,
+		}
+
+	fields: list[TypeField] = []
+	for keys, value in _walk(definition, []):
+		if type(value) == str:
+			fields.append({
+				"path": "/".join(keys),
+				"keys": keys,
+				"type": parse_type(value, custom_types),
+			})
+
+	return {
+		"name": type_name,
+		"definition": definition,
+		"options": None,
+		"fields": fields,
+		"layout": None,
+	}
+
+def _compile_tree(tree: dict, custom_types: dict) -> list[TreeLeaf]:
+	leaves: list[TreeLeaf] = []
+
+	def visit(data: dict, keys: list[str], full_keys: list[str]):
+		children = []
+		for key, value in data.items():
+			key = str(key)
+			type_name = get_type_name_from_key(key)
+			sub_keys = keys + [get_raw_key_name(key)]
+			sub_full_keys = full_keys + [key]
+			if type_name is not None:
+				leaves.append({
+					"path": "/".join(sub_keys),
+					"keys": sub_keys,
+					"full_path": "/".join(sub_full_keys),
+					"type": parse_type(type_name, custom_types),
+					"value": value,
+				})
+			elif type(value) == dict:
+				children.append((value, sub_keys, sub_full_keys))
+			elif type(value) != list:
+				leaves.append({
+					"path": "/".join(sub_keys),
+					"keys": sub_keys,
+					"full_path": "/".join(sub_full_keys),
+					"type": None,
+					"value": value,
+				})
+
+		for value, sub_keys, sub_full_keys in children:
+			visit(value, sub_keys, sub_full_keys)
+
+	visit(tree, [], [])
+	return leaves
+
+def _apply_layout(lock: DataLock, custom_type: CustomType) -> None:
+	custom_type["layout"] = get_type_layout(lock, custom_type["name"], [{
+		"path": field["path"],
+		"is_boolean": field["type"]["container"] == None and field["type"]["raw_name"] == "boolean",
+		"is_optional": field["type"]["is_optional"],
+	} for field in custom_type["fields"]])
+
+# numeric ids used to tag replicated values when every path shares one remote
+def get_path_ids(schema: DataSchema) -> dict[str, int]:
+	path_ids: dict[str, int] = {}
+	for i, leaf in enumerate(schema["tree"]):
+		path_ids[leaf["path"]] = i + 1
+	return path_ids
+
+def compile_schema(config: DataConfig | None = None) -> DataSchema:
+	if config == None:
+		config = get_data_config()
+	assert config
+
+	custom_types = config["types"] or {}
+	types: dict[str, CustomType] = {}
+	for type_name, definition in custom_types.items():
+		types[type_name] = _compile_type(type_name, definition, custom_types)
+
+	lock = load_lock()
+	for custom_type in types.values():
+		if custom_type["options"] == None:
+			_apply_layout(lock, custom_type)
+
+	tree = _compile_tree(config["tree"] or {}, custom_types)
+
+	enums: list[str] = []
+	for custom_type in types.values():
+		for field in custom_type["fields"]:
+			enum_name = field["type"]["enum_name"]
+			if enum_name is not None and not enum_name in enums:
+				enums.append(enum_name)
+
+	for leaf in tree:
+		if leaf["type"] is not None:
+			enum_name = leaf["type"]["enum_name"]
+			if enum_name is not None and not enum_name in enums:
+				enums.append(enum_name)
+
+	return {
+		"config": config,
+		"types": types,
+		"tree": tree,
+		"enums": enums,
+		"lock": lock,
+	}
@@ -1,283 +1,1742 @@
 import dpath
-from src.util import get_package_zip_path, get_if_optional, write_value_from_config, write_standard_value_from_config, get_raw_key_name, get_type_name_from_key, get_roblox_type, get_raw_type_name
+from src.util import get_package_zip_path, get_script_path, write_value_from_config, get_roblox_type
 from luau import indent_block
 from luau.convert import from_dict, mark_as_literal, from_dict_to_type, from_list
 from luau.roblox import write_script, get_package_require
 from luau.roblox.util import get_module_require
 from luau.path import get_if_module_script, remove_all_path_variants
-from src.config import get_data_config, SIGNAL_WALLY_PATH, NETWORK_UTIL_WALLY_PATH, MAID_WALLY_PATH, HEADER_WARNING, GET_SUFFIX_KEY, UPDATE_SUFFIX_KEY
+from src.config import get_version_keys, HEADER_WARNING, GET_SUFFIX_KEY, UPDATE_SUFFIX_KEY, SNAPSHOT_SUFFIX_KEY, StorageMode, ReplicationMode, CodecMode
+from src.schema import DataSchema, CustomType, ParsedType, TypeField, compile_schema, get_path_ids
+from src.lock import TypeLayout, WORD_BIT_COUNT
 from typing import Any, Literal
 
-def get_if_number_in_path(path: str) -> bool:
-	has_num_in_path = False
-	for key in path.split("/"):
-		try:
-			v = int(key)
-			has_num_in_path = True
-		except:
-			key = key + ""
-	return has_num_in_path
-
 def get_function_name(text: str) -> str:
 	first_char = text[0].upper()
 	return (first_char + text[1:]).replace("Enum.", "Enum")
 
+def get_codec_function(direction: Literal["serialize", "deserialize"], parsed_type: ParsedType) -> str:
+	if parsed_type["container"] != None:
+		raw_item_name = parsed_type["raw_item_name"]
+		assert raw_item_name
+		return f"_{direction}{parsed_type['container']}(_{direction}{get_function_name(raw_item_name)})"
+	else:
+		return f"_{direction}{get_function_name(parsed_type['raw_name'])}"
+
+def write_codec_call(direction: Literal["serialize", "deserialize"], parsed_type: ParsedType, key_str: str) -> str:
+	codec_function = get_codec_function(direction, parsed_type)
+	if parsed_type["is_optional"]:
+		return f"if {key_str} ~= nil then {codec_function}({key_str}) else nil"
+	else:
+		return f"{codec_function}({key_str})"
+
+def write_document_type() -> list[str]:
+	return [
+		"export type PlayerDocument = {",
+		] + indent_block([
+			"__index: PlayerDocument,",
+			"_Maid: Maid,",
+			"_IsAlive: boolean,",
+			"_IsLoaded: boolean,",
+			"_Loading: Signal?,",
+			"_IsDirty: boolean,",
+			"_Data: { [string]: any },",
+			"_OrderedDataStores: { [string]: OrderedDataStore },",
+			"_OrderedValues: { [string]: number },",
+			"Key: UserIdKey,",
+			"Player: Player,",
+			"DataStore: DataStore,",
+			"SetOptions: DataStoreSetOptions,",
+			"new: (player: Player) -> PlayerDocument,",
+			"Destroy: (self: PlayerDocument) -> nil,",
+			"Load: (self: PlayerDocument) -> boolean,",
+			"Save: (self: PlayerDocument, priority: number?) -> boolean,",
+			"_Flush: (self: PlayerDocument, priority: number?) -> boolean,",
+			"GetEntry: (self: PlayerDocument, scope: string) -> any,",
+			"SetEntry: (self: PlayerDocument, scope: string, value: any) -> nil,",
+			"AddOrderedDataStore: (self: PlayerDocument, scope: string, orderedDataStore: OrderedDataStore) -> nil,",
+		]) + [
+		"}",
+	]
+
+def write_document_class(has_migrations: bool) -> list[str]:
+	return [
+		"local PlayerDocument: PlayerDocument = {} :: any",
+		"PlayerDocument.__index = PlayerDocument",
+		"",
+		"function PlayerDocument:Destroy()",
+		] + indent_block([
+			"if not self._IsAlive then",
+			"\treturn",
+			"end",
+			"",
+			"dirtyObjects[self] = nil",
+			"if self._IsDirty then",
+			"\t-- saved in the background so leaving players don't block each other",
+			"\ttask.spawn(self.Save, self, PRIORITY_LEAVE)",
+			"end",
+			"self._IsAlive = false",
+			"self._Maid:Destroy()",
+			"local t: any = self",
+			"for k, v in pairs(t) do",
+			"\tt[k] = nil",
+			"end",
+			"setmetatable(t, nil)",
+			"return nil",
+		]) + [
+		"end",
+		"",
+		"function PlayerDocument:Load(): boolean",
+		] + indent_block([
+			"if self._IsLoaded then",
+			"\treturn true",
+			"end",
+			"-- every handler loads through the document at once, so later callers wait for the request already in flight",
+			"local loading = self._Loading",
+			"if loading then",
+			"\tloading:Wait()",
+			"\treturn self._IsLoaded == true",
+			"end",
+			"loading = Signal.new()",
+			"self._Loading = loading",
+			"",
+			"local dataStore, key = self.DataStore, self.Key",
+			] + (write_migrated_load("DOCUMENT_SCOPE") if has_migrations else [
+			"local data, success = _request(Enum.DataStoreRequestType.GetAsync, PRIORITY_READ, \"Get/\" .. DOCUMENT_SCOPE .. \"/\" .. key, function()",
+			"\treturn dataStore:GetAsync(key)",
+			"end)",
+			]) + [
+			"if success and self._IsAlive then",
+			] + indent_block([
+				"self._Data = if type(data) == \"table\" then data else {}",
+				"self._IsLoaded = true",
+				"-- the ordered mirrors were written alongside the document",
+				"for scope, value in pairs(self._Data) do",
+				"\tif type(value) == \"number\" then",
+				"\t\tself._OrderedValues[scope] = value",
+				"\tend",
+				"end",
+			]) + [
+			"end",
+			"",
+			"self._Loading = nil",
+			"loading:Fire()",
+			"loading:Destroy()",
+			"return success and self._IsLoaded == true",
+		]) + [
+		"end",
+		"",
+		"function PlayerDocument:Save(priority: number?): boolean",
+		] + indent_block([
+			"if not self._IsLoaded then",
+			"\t-- never overwrite stored data that failed to load",
+			"\treturn false",
+			"end",
+			"",
+			"-- captured up front as the document may be destroyed while the request is queued",
+			"local dataStore, key, data, setOptions = self.DataStore, self.Key, self._Data, self.SetOptions",
+			"local orderedDataStores, orderedValues = self._OrderedDataStores, self._OrderedValues",
+			"local userIds = { self.Player.UserId }",
+			"self._IsDirty = false",
+			"dirtyObjects[self] = nil",
+			"local _, success = _request(Enum.DataStoreRequestType.SetIncrementAsync, priority or PRIORITY_WRITE, \"Set/\" .. DOCUMENT_SCOPE .. \"/\" .. key, function()",
+			"\treturn dataStore:SetAsync(key, data, userIds, setOptions)",
+			"end)",
+			"if not success then",
+			"\tif self._IsAlive then",
+			"\t\tself._IsDirty = true",
+			"\t\tdirtyObjects[self] = true",
+			"\tend",
+			"\treturn false",
+			"end",
+			"",
+			"for scope, orderedDataStore in pairs(orderedDataStores) do",
+			] + indent_block([
+				"local value = data[scope]",
+				"if type(value) == \"number\" and orderedValues[scope] ~= value then",
+				] + indent_block([
+					"task.spawn(function()",
+					] + indent_block([
+						"local _, orderedSuccess = _request(Enum.DataStoreRequestType.SetIncrementSortedAsync, priority or PRIORITY_WRITE, \"Set/\" .. scope .. \"/\" .. key, function()",
+						"\treturn orderedDataStore:SetAsync(key, math.round(value), userIds)",
+						"end)",
+						"if orderedSuccess then",
+						"\torderedValues[scope] = value",
+						"end",
+					]) + [
+					"end)",
+				]) + [
+				"end",
+			]) + [
+			"end",
+			"return true",
+		]) + [
+		"end",
+		"",
+		"function PlayerDocument:_Flush(priority: number?): boolean",
+		"\tif not self._IsDirty then",
+		"\t\treturn true",
+		"\tend",
+		"\treturn self:Save(priority)",
+		"end",
+		"",
+		"function PlayerDocument:GetEntry(scope: string): any",
+		"\treturn self._Data[scope]",
+		"end",
+		"",
+		"function PlayerDocument:SetEntry(scope: string, value: any): nil",
+		"\tif self._Data[scope] ~= value then",
+		"\t\tself._Data[scope] = value",
+		"\t\tself._IsDirty = true",
+		"\t\tdirtyObjects[self] = true",
+		"\tend",
+		"\treturn nil",
+		"end",
+		"",
+		"function PlayerDocument:AddOrderedDataStore(scope: string, orderedDataStore: OrderedDataStore): nil",
+		"\tself._OrderedDataStores[scope] = orderedDataStore",
+		"\treturn nil",
+		"end",
+		"",
+		"function PlayerDocument.new(player: Player): PlayerDocument",
+		] + indent_block([
+			"local maid = Maid.new()",
+			"",
+			"local setOptions = Instance.new(\"DataStoreSetOptions\")",
+			"maid:GiveTask(setOptions)",
+			"setOptions:SetMetadata(METADATA)",
+			"",
+			"local self: PlayerDocument = setmetatable({",
+			] + indent_block([
+				"_Maid = maid,",
+				"_IsAlive = true,",
+				"_IsLoaded = false,",
+				"_IsDirty = false,",
+				"_Data = {},",
+				"_OrderedDataStores = {},",
+				"_OrderedValues = {},",
+				"Key = tostring(player.UserId),",
+				"Player = player,",
+				"DataStore = DataStoreService:GetDataStore(BASE_DOMAIN, DOCUMENT_SCOPE),",
+				"SetOptions = setOptions,",
+			]) + [
+			"}, PlayerDocument) :: any",
+			"",
+			"return self",
+		]) + [
+		"end",
+		"",
+	]
+
+def write_migration_functions() -> list[str]:
+	return [
+		"function _getPendingMigrations(keyInfo: DataStoreKeyInfo?): { Migration }",
+		] + indent_block([
+			"local pending = {}",
+			"if keyInfo == nil then",
+			"\treturn pending",
+			"end",
+			"local metadata = keyInfo:GetMetadata()",
+			"for _, migration in ipairs(MIGRATIONS) do",
+			] + indent_block([
+				"for _, versionKey in ipairs(VERSION_KEYS) do",
+				] + indent_block([
+					"local storedVersion = if type(metadata[versionKey]) == \"number\" then metadata[versionKey] else 0",
+					"local version = migration.Version[versionKey] or 0",
+					"if storedVersion ~= version then",
+					"\tif storedVersion < version then",
+					"\t\ttable.insert(pending, migration)",
+					"\tend",
+					"\tbreak",
+					"end",
+				]) + [
+				"end",
+			]) + [
+			"end",
+			"return pending",
+		]) + [
+		"end",
+		"",
+		"function _migrate(scope: string, value: any, migrations: { Migration }): any",
+		"\tfor _, migration in ipairs(migrations) do",
+		"\t\tvalue = migration.Migrate(scope, value)",
+		"\tend",
+		"\treturn value",
+		"end",
+		"",
+	]
+
+# reads the stored value, upgrading it first when it was saved under older metadata
+def write_migrated_load(scope_str: str) -> list[str]:
+	is_document = scope_str == "DOCUMENT_SCOPE"
+	return [
+		"local result, success = _request(Enum.DataStoreRequestType.GetAsync, PRIORITY_READ, \"Get/\" .. " + scope_str + " .. \"/\" .. key, function()",
+		"\tlocal value, keyInfo = dataStore:GetAsync(key)",
+		"\treturn { Value = value, KeyInfo = keyInfo }",
+		"end)",
+		"local data = if success then result.Value else nil",
+		"if data ~= nil and #_getPendingMigrations(result.KeyInfo) > 0 then",
+		] + indent_block([
+			"-- written back with the current metadata in the same request, so each value is only upgraded once",
+			"-- only the caller that owns the load gets here, and merged requests for one key still check the stored metadata",
+			"local scope, userIds = " + scope_str + ", { self.Player.UserId }",
+			"data, success = _request(Enum.DataStoreRequestType.UpdateAsync, PRIORITY_WRITE, \"Migrate/\" .. scope .. \"/\" .. key, function()",
+			] + indent_block([
+				"return dataStore:UpdateAsync(key, function(value: any, keyInfo: DataStoreKeyInfo?)",
+				] + indent_block([
+					"if " + ("type(value) ~= \"table\"" if is_document else "value == nil") + " then",
+					"\treturn nil",
+					"end",
+					"local migrations = _getPendingMigrations(keyInfo)",
+					] + ([
+					"for entryScope, entry in pairs(value) do",
+					"\tvalue[entryScope] = _migrate(entryScope, entry, migrations)",
+					"end",
+					"return value, userIds, METADATA",
+					] if is_document else [
+					"return _migrate(scope, value, migrations), userIds, METADATA",
+				])) + [
+				"end)",
+			]) + [
+			"end)",
+		]) + [
+		"end",
+	]
+
+def write_request_scheduler() -> list[str]:
+	return [
+		"local pendingRequests: { DataStoreRequest } = {}",
+		"local queuedRequests: { [string]: DataStoreRequest } = {}",
+		"local activeKeys: { [string]: boolean } = {}",
+		"local activeRequestCount = 0",
+		"local requestCount = 0",
+		"",
+		"function _getRequestBudget(requestType: Enum.DataStoreRequestType): number",
+		] + indent_block([
+			"local success, budget = pcall(function()",
+			"\treturn DataStoreService:GetRequestBudgetForRequestType(requestType)",
+			"end)",
+			"return if success then budget else math.huge",
+		]) + [
+		"end",
+		"",
+		"function _queueRequest(request: DataStoreRequest)",
+		] + indent_block([
+			"local coalesceKey = request.CoalesceKey",
+			"if coalesceKey then",
+			] + indent_block([
+				"local queuedRequest = queuedRequests[coalesceKey]",
+				"if queuedRequest and queuedRequest ~= request then",
+				] + indent_block([
+					"-- a newer request for the key arrived while this one was running, it answers both",
+					"for i, thread in ipairs(request.Threads) do",
+					"\ttable.insert(queuedRequest.Threads, thread)",
+					"end",
+					"queuedRequest.Priority = math.min(queuedRequest.Priority, request.Priority)",
+					"return",
+				]) + [
+				"end",
+				"queuedRequests[coalesceKey] = request",
+			]) + [
+			"end",
+			"table.insert(pendingRequests, request)",
+		]) + [
+		"end",
+		"",
+		"function _runRequest(request: DataStoreRequest)",
+		] + indent_block([
+			"local success, result = pcall(request.Callback)",
+			"activeRequestCount -= 1",
+			"if request.CoalesceKey then",
+			"\tactiveKeys[request.CoalesceKey] = nil",
+			"end",
+			"if not success then",
+			] + indent_block([
+				"warn(result)",
+				"request.Attempts += 1",
+				"if request.Attempts <= RETRY_LIMIT then",
+				"\trequest.RetryAt = os.clock() + RETRY_DELAY * request.Attempts",
+				"\t_queueRequest(request)",
+				"\treturn",
+				"end",
+				"result = nil",
+			]) + [
+			"end",
+			"for i, thread in ipairs(request.Threads) do",
+			"\ttask.spawn(thread, result, success)",
+			"end",
+		]) + [
+		"end",
+		"",
+		"function _drainRequests()",
+		] + indent_block([
+			"if #pendingRequests == 0 then",
+			"\treturn",
+			"end",
+			"",
+			"local requests = pendingRequests",
+			"pendingRequests = {}",
+			"table.sort(requests, function(a: DataStoreRequest, b: DataStoreRequest)",
+			"\tif a.Priority ~= b.Priority then",
+			"\t\treturn a.Priority < b.Priority",
+			"\tend",
+			"\treturn a.Order < b.Order",
+			"end)",
+			"",
+			"local budgets: { [Enum.DataStoreRequestType]: number } = {}",
+			"local now = os.clock()",
+			"for i, request in ipairs(requests) do",
+			] + indent_block([
+				"local budget = budgets[request.RequestType]",
+				"if budget == nil then",
+				"\tbudget = _getRequestBudget(request.RequestType)",
+				"end",
+				"",
+				"local coalesceKey = request.CoalesceKey",
+				"local isBlocked = request.RetryAt > now or (coalesceKey ~= nil and activeKeys[coalesceKey] == true)",
+				"if budget > 0 and not isBlocked then",
+				] + indent_block([
+					"budgets[request.RequestType] = budget - 1",
+					"if coalesceKey then",
+					"\tactiveKeys[coalesceKey] = true",
+					"\tif queuedRequests[coalesceKey] == request then",
+					"\t\tqueuedRequests[coalesceKey] = nil",
+					"\tend",
+					"end",
+					"activeRequestCount += 1",
+					"task.spawn(_runRequest, request)",
+				]) + [
+				"else",
+				] + indent_block([
+					"budgets[request.RequestType] = budget",
+					"table.insert(pendingRequests, request)",
+				]) + [
+				"end",
+			]) + [
+			"end",
+		]) + [
+		"end",
+		"",
+		"function _flushRequests(timeout: number)",
+		] + indent_block([
+			"local start = os.clock()",
+			"while (#pendingRequests > 0 or activeRequestCount > 0) and os.clock() - start < timeout do",
+			"\t_drainRequests()",
+			"\ttask.wait()",
+			"end",
+		]) + [
+		"end",
+		"",
+		"-- queues a DataStore call and yields until it completes, requests for the same key are merged",
+		"function _request(requestType: Enum.DataStoreRequestType, priority: number, coalesceKey: string?, callback: () -> any): (any, boolean)",
+		] + indent_block([
+			"local request = if coalesceKey then queuedRequests[coalesceKey] else nil",
+			"if request then",
+			] + indent_block([
+				"-- the latest write wins, reads share the same result",
+				"request.Callback = callback",
+				"request.Priority = math.min(request.Priority, priority)",
+			]) + [
+			"else",
+			] + indent_block([
+				"requestCount += 1",
+				"request = {",
+				"\tRequestType = requestType,",
+				"\tPriority = priority,",
+				"\tOrder = requestCount,",
+				"\tCoalesceKey = coalesceKey,",
+				"\tCallback = callback,",
+				"\tThreads = {},",
+				"\tAttempts = 0,",
+				"\tRetryAt = 0,",
+				"}",
+				"_queueRequest(request :: DataStoreRequest)",
+			]) + [
+			"end",
+			"assert(request)",
+			"table.insert(request.Threads, coroutine.running())",
+			"return coroutine.yield()",
+		]) + [
+		"end",
+	]
+
+def write_autosave() -> list[str]:
+	return [
+		"-- handlers and documents with changes that haven't been written yet",
+		"local dirtyObjects: { [any]: boolean } = {}",
+		"",
+		"function _autosave()",
+		] + indent_block([
+			"local objects = dirtyObjects",
+			"dirtyObjects = {}",
+			"for object in pairs(objects) do",
+			"\ttask.spawn(object._Flush, object, PRIORITY_AUTOSAVE)",
+			"end",
+		]) + [
+		"end",
+		"",
+	]
+
+def write_leaf_updates(replication: ReplicationMode) -> list[str]:
+	if replication == "delta":
+		write_update = [
+			"local version, changes = handler:_Replicate()",
+			"if #changes > 0 then",
+			"\tfireUpdate(version, changes)",
+			"end",
+		]
+	else:
+		write_update = [
+			"fireUpdate(handler._Value)",
+		]
+
+	return [
+		"-- changes are collected over the frame and sent on the next Heartbeat, only the latest value of each handler is sent",
+		"local pendingUpdates: { [any]: (...any) -> () } = {}",
+		"",
+		"function _flushUpdates()",
+		] + indent_block([
+			"if next(pendingUpdates) == nil then",
+			"\treturn",
+			"end",
+			"local updates = pendingUpdates",
+			"pendingUpdates = {}",
+			"for handler, fireUpdate in pairs(updates) do",
+			] + indent_block([
+				"if handler._IsAlive then",
+				] + indent_block(write_update) + [
+				"end",
+			]) + [
+			"end",
+		]) + [
+		"end",
+		"",
+	]
+
+def write_leaderboards() -> list[str]:
+	return [
+		"-- sorted lists are shared by every caller on the server, and only fetched again once they're LEADERBOARD_INTERVAL old",
+		"local leaderboards: { [string]: Leaderboard } = {}",
+		"",
+		"function _getLeaderboard(scope: string, isAscending: boolean): Leaderboard",
+		] + indent_block([
+			"local key = scope .. (if isAscending then \"/Ascending\" else \"/Descending\")",
+			"local leaderboard = leaderboards[key]",
+			"if not leaderboard then",
+			] + indent_block([
+				"leaderboard = {",
+				"\tDataStore = DataStoreService:GetOrderedDataStore(BASE_DOMAIN, scope),",
+				"\tIsAscending = isAscending,",
+				"\tEntries = {},",
+				"\tIsFinished = false,",
+				"\tRefreshedAt = -math.huge,",
+				"}",
+				"leaderboards[key] = leaderboard",
+			]) + [
+			"end",
+			"assert(leaderboard)",
+			"return leaderboard",
+		]) + [
+		"end",
+		"",
+		"-- fetches the first page when the list is stale, otherwise the next one",
+		"function _loadLeaderboardPage(leaderboard: Leaderboard)",
+		] + indent_block([
+			"local isRefresh = os.clock() - leaderboard.RefreshedAt >= LEADERBOARD_INTERVAL",
+			"local pages = leaderboard.Pages",
+			"local loading = Signal.new()",
+			"leaderboard.Loading = loading",
+			"",
+			"local result, success = _request(Enum.DataStoreRequestType.GetSortedAsync, PRIORITY_READ, nil, function()",
+			] + indent_block([
+				"if isRefresh or not pages then",
+				"\treturn leaderboard.DataStore:GetSortedAsync(leaderboard.IsAscending, LEADERBOARD_PAGE_LENGTH)",
+				"end",
+				"pages:AdvanceToNextPageAsync()",
+				"return pages",
+			]) + [
+			"end)",
+			"",
+			"if isRefresh then",
+			"\tleaderboard.RefreshedAt = os.clock()",
+			"\tif success then",
+			"\t\tleaderboard.Entries = {}",
+			"\t\tleaderboard.Pages = result",
+			"\tend",
+			"end",
+			"if success then",
+			] + indent_block([
+				"local entries = leaderboard.Entries",
+				"for i, data in ipairs(result:GetCurrentPage()) do",
+				"\tif #entries >= LEADERBOARD_SIZE then",
+				"\t\tbreak",
+				"\tend",
+				"\ttable.insert(entries, {",
+				"\t\tUserId = tonumber(data.key) :: number,",
+				"\t\tValue = data.value,",
+				"\t})",
+				"end",
+				"leaderboard.IsFinished = result.IsFinished or #entries >= LEADERBOARD_SIZE",
+			]) + [
+			"else",
+			"\t-- keep serving what's cached until the next refresh",
+			"\tleaderboard.IsFinished = true",
+			"end",
+			"",
+			"leaderboard.Loading = nil",
+			"loading:Fire()",
+			"loading:Destroy()",
+		]) + [
+		"end",
+		"",
+		"function _getSortedList(scope: string, limit: number, isAscending: boolean): { [number]: SortedDataEntry }",
+		] + indent_block([
+			"local leaderboard = _getLeaderboard(scope, isAscending)",
+			"limit = math.min(limit, LEADERBOARD_SIZE)",
+			"while true do",
+			] + indent_block([
+				"local loading = leaderboard.Loading",
+				"if loading then",
+				"\t-- one page is fetched at a time, everyone else waits for it",
+				"\tloading:Wait()",
+				"elseif os.clock() - leaderboard.RefreshedAt >= LEADERBOARD_INTERVAL or (#leaderboard.Entries < limit and not leaderboard.IsFinished) then",
+				"\t_loadLeaderboardPage(leaderboard)",
+				"else",
+				"\tbreak",
+				"end",
+			]) + [
+			"end",
+			"return table.move(leaderboard.Entries, 1, math.min(limit, #leaderboard.Entries), 1, {})",
+		]) + [
+		"end",
+		"",
+	]
+
+def write_delta_functions() -> list[str]:
+	return [
+		"function _copy(value: any): any",
+		] + indent_block([
+			"if type(value) ~= \"table\" then",
+			"\treturn value",
+			"end",
+			"local copy = {}",
+			"for k, v in pairs(value) do",
+			"\tcopy[k] = _copy(v)",
+			"end",
+			"return copy",
+		]) + [
+		"end",
+		"",
+		"function _isEqual(a: any, b: any): boolean",
+		] + indent_block([
+			"if a == b then",
+			"\treturn true",
+			"elseif type(a) ~= \"table\" or type(b) ~= \"table\" then",
+			"\treturn false",
+			"end",
+			"for k, v in pairs(a) do",
+			"\tif not _isEqual(v, b[k]) then",
+			"\t\treturn false",
+			"\tend",
+			"end",
+			"for k in pairs(b) do",
+			"\tif a[k] == nil then",
+			"\t\treturn false",
+			"\tend",
+			"end",
+			"return true",
+		]) + [
+		"end",
+		"",
+		"function _isList(value: Table): boolean",
+		] + indent_block([
+			"local count = 0",
+			"for k in pairs(value) do",
+			"\tcount += 1",
+			"end",
+			"return count == #value",
+		]) + [
+		"end",
+		"",
+		"function _appendKey(keys: { any }, key: any): { any }",
+		] + indent_block([
+			"local subKeys = table.clone(keys)",
+			"table.insert(subKeys, key)",
+			"return subKeys",
+		]) + [
+		"end",
+		"",
+		"-- adds the changes that turn old into new to changes, each is one of",
+		"-- { \"s\", keys, value } set, { \"r\", keys } remove, { \"i\", keys, index, value } list insert, { \"d\", keys, index } list remove",
+		"function _diff(old: any, new: any, keys: { any }, changes: { DeltaChange })",
+		] + indent_block([
+			"if _isEqual(old, new) then",
+			"\treturn",
+			"elseif type(old) ~= \"table\" or type(new) ~= \"table\" then",
+			"\ttable.insert(changes, { \"s\", keys, new })",
+			"\treturn",
+			"end",
+			"",
+			"if _isList(old) and _isList(new) then",
+			] + indent_block([
+				"-- only the part between the unchanged start and end of the list is sent",
+				"local start = 1",
+				"while start <= #old and start <= #new and _isEqual(old[start], new[start]) do",
+				"\tstart += 1",
+				"end",
+				"local oldFinish, newFinish = #old, #new",
+				"while oldFinish >= start and newFinish >= start and _isEqual(old[oldFinish], new[newFinish]) do",
+				"\toldFinish -= 1",
+				"\tnewFinish -= 1",
+				"end",
+				"",
+				"local removeCount, insertCount = oldFinish - start + 1, newFinish - start + 1",
+				"if removeCount == insertCount then",
+				"\tfor i = start, newFinish do",
+				"\t\t_diff(old[i], new[i], _appendKey(keys, i), changes)",
+				"\tend",
+				"elseif removeCount + insertCount > #new then",
+				"\ttable.insert(changes, { \"s\", keys, new })",
+				"else",
+				] + indent_block([
+					"for i = oldFinish, start, -1 do",
+					"\ttable.insert(changes, { \"d\", keys, i })",
+					"end",
+					"for i = start, newFinish do",
+					"\ttable.insert(changes, { \"i\", keys, i, new[i] })",
+					"end",
+				]) + [
+				"end",
+				"return",
+			]) + [
+			"end",
+			"",
+			"for k, v in pairs(new) do",
+			"\t_diff(old[k], v, _appendKey(keys, k), changes)",
+			"end",
+			"for k in pairs(old) do",
+			"\tif new[k] == nil then",
+			"\t\ttable.insert(changes, { \"r\", _appendKey(keys, k) })",
+			"\tend",
+			"end",
+		]) + [
+		"end",
+		"",
+	]
+
+def write_channel(replication: ReplicationMode) -> list[str]:
+	if replication == "delta":
+		get_value = [
+			"handler:_Replicate()",
+			"return handler._ReplicatedValue, handler._ReplicatedVersion",
+		]
+		write_entry = [
+			"local version, changes = handler:_Replicate()",
+			"if #changes > 0 then",
+			"\ttable.insert(batch, { pathId, version, changes })",
+			"end",
+		]
+	else:
+		get_value = [
+			"return handler._Value",
+		]
+		write_entry = [
+			"table.insert(batch, { pathId, handler._Value })",
+		]
+
+	return [
+		"-- every value shares one remote pair per player, messages are tagged with the path's id",
+		"local function getValue(pathId: number): ...any",
+		] + indent_block([
+			"local handler = handlersById[pathId]",
+			"if not handler then",
+			"\treturn nil",
+			"end",
+			] + get_value) + [
+		"end",
+		"local fireUpdate: (...any) -> ()",
+		"if RunService:IsRunning() then",
+		] + indent_block([
+			"local updateEvent = NetworkUtil.getRemoteEvent(UPDATE_SUFFIX, player)",
+			"playerMaid:GiveTask(updateEvent)",
+			"fireUpdate = function(...: any)",
+			"\tupdateEvent:FireClient(player, ...)",
+			"end",
+			"",
+			"local getFunction = NetworkUtil.getRemoteFunction(GET_SUFFIX, player)",
+			"playerMaid:GiveTask(getFunction)",
+			"getFunction.OnServerInvoke = function(plr: Player, pathId: number)",
+			"\tif player.UserId == plr.UserId then",
+			"\t\treturn getValue(pathId)",
+			"\tend",
+			"\terror(\"Bad player\")",
+			"end",
+		]) + [
+		"else",
+		] + indent_block([
+			"local updateEvent = NetworkUtil.getBindableEvent(UPDATE_SUFFIX)",
+			"playerMaid:GiveTask(updateEvent)",
+			"fireUpdate = function(...: any)",
+			"\tupdateEvent:Fire(...)",
+			"end",
+			"",
+			"local getFunction = NetworkUtil.getBindableFunction(GET_SUFFIX)",
+			"playerMaid:GiveTask(getFunction)",
+			"getFunction.OnInvoke = getValue",
+		]) + [
+		"end",
+		"",
+		"-- changes are collected over the frame and sent together, only the latest value of each path is sent",
+		"local pendingIds: { number } = {}",
+		"local isPending: { [number]: boolean } = {}",
+		"local function flushUpdates()",
+		] + indent_block([
+			"if #pendingIds == 0 then",
+			"\treturn",
+			"end",
+			"local ids = pendingIds",
+			"pendingIds, isPending = {}, {}",
+			"",
+			"local batch = {}",
+			"for i, pathId in ipairs(ids) do",
+			] + indent_block([
+				"local handler = handlersById[pathId]",
+				"if handler._IsAlive then",
+				] + indent_block(write_entry) + [
+				"end",
+			]) + [
+			"end",
+			"if #batch > 0 then",
+			"\tfireUpdate(batch)",
+			"end",
+		]) + [
+		"end",
+		"playerMaid:GiveTask(RunService.Heartbeat:Connect(flushUpdates))",
+		"for pathId, handler in pairs(handlersById) do",
+		] + indent_block([
+			"playerMaid:GiveTask(handler.OnChanged:Connect(function()",
+			"\tif not isPending[pathId] then",
+			"\t\tisPending[pathId] = true",
+			"\t\ttable.insert(pendingIds, pathId)",
+			"\tend",
+			"end))",
+		]) + [
+		"end",
+		"",
+	]
+
+def write_snapshot_function(replication: ReplicationMode) -> list[str]:
+	if replication == "delta":
+		write_entry = [
+			"handler:_Replicate()",
+			"table.insert(snapshot, { handler.Scope, handler._ReplicatedVersion, handler._ReplicatedValue })",
+		]
+	else:
+		write_entry = [
+			"table.insert(snapshot, { handler.Scope, handler._Value })",
+		]
+
+	return [
+		"-- every value in one round trip for the client to start from, sent once they've all loaded",
+		"local function getSnapshot(): { { any } }",
+		] + indent_block([
+			"if not isLoaded then",
+			"\tonLoaded:Wait()",
+			"end",
+			"local snapshot = {}",
+			"for i, handler in ipairs(handlers) do",
+			] + indent_block([
+				"if handler._IsAlive then",
+				] + indent_block(write_entry) + [
+				"end",
+			]) + [
+			"end",
+			"return snapshot",
+		]) + [
+		"end",
+		"if RunService:IsRunning() then",
+		] + indent_block([
+			"local snapshotFunction = NetworkUtil.getRemoteFunction(SNAPSHOT_SUFFIX, player)",
+			"playerMaid:GiveTask(snapshotFunction)",
+			"snapshotFunction.OnServerInvoke = function(plr: Player)",
+			"\tif player.UserId == plr.UserId then",
+			"\t\treturn getSnapshot()",
+			"\tend",
+			"\terror(\"Bad player\")",
+			"end",
+		]) + [
+		"else",
+		] + indent_block([
+			"local snapshotFunction = NetworkUtil.getBindableFunction(SNAPSHOT_SUFFIX)",
+			"playerMaid:GiveTask(snapshotFunction)",
+			"snapshotFunction.OnInvoke = getSnapshot",
+		]) + [
+		"end",
+		"",
+	]
+
+# positional arrays instead of keyed tables, with numbers in place of strings where possible
+def write_compact_serializers() -> list[str]:
+	def write_vector_serializer(name: str, axes: list[str], rounding: str | None) -> list[str]:
+		components = []
+		for axis in axes:
+			if rounding == "integer":
+				components.append(f"math.round(value.{axis})")
+			elif rounding == "double":
+				components.append(f"math.round(value.{axis}*100)/100")
+			else:
+				components.append(f"value.{axis}")
+		return [
+			f"local _serialize{name} = function(value: {name[0:7]}): Table",
+			"\treturn { " + ", ".join(components) + " }",
+			"end",
+		]
+
+	return [
+		"local _serializeColor3 = function(value: Color3): number",
+		"\treturn math.round(value.R*255)*65536 + math.round(value.G*255)*256 + math.round(value.B*255)",
+		"end",
+		"local _serializeNumber = function(value: number): number",
+		"\treturn value",
+		"end",
+		"local _serializeInteger = function(value: number): number",
+		"\treturn _processInteger(value)",
+		"end",
+		"local _serializeInt = _serializeInteger",
+		"local _serializeDouble = function(value: number): number",
+		"\treturn _processDouble(value)",
+		"end",
+		"local _serializeFloat = _serializeNumber",
+		"local _serializeString = function(value: string): string",
+		"\treturn value",
+		"end",
+		"local _serializeBoolean = function(value: boolean): boolean",
+		"\treturn value",
+		"end",
+		"local _serializeDateTime = function(value: DateTime): number",
+		"\treturn value.UnixTimestampMillis",
+		"end",
+		] + write_vector_serializer("Vector3", ["X", "Y", "Z"], None) + write_vector_serializer("Vector3Integer", ["X", "Y", "Z"], "integer") + write_vector_serializer("Vector3Double", ["X", "Y", "Z"], "double") + write_vector_serializer("Vector2", ["X", "Y"], None) + write_vector_serializer("Vector2Integer", ["X", "Y"], "integer") + write_vector_serializer("Vector2Double", ["X", "Y"], "double") + [
+		"local _serializeCFrameWith = function(serializeVector3: (value: Vector3) -> Table): (value: CFrame) -> Table",
+		] + indent_block([
+			"return function(value: CFrame): Table",
+			] + indent_block([
+				"local x,y,z = value:ToEulerAnglesYXZ()",
+				"local position = serializeVector3(value.Position)",
+				"local orientation = serializeVector3(Vector3.new(math.deg(x), math.deg(y), math.deg(z)))",
+				"return { position[1], position[2], position[3], orientation[1], orientation[2], orientation[3] }",
+			]) + [
+			"end",
+		]) + [
+		"end",
+		"local _serializeCFrame = _serializeCFrameWith(_serializeVector3)",
+		"local _serializeCFrameDouble = _serializeCFrameWith(_serializeVector3Double)",
+		"local _serializeCFrameInteger = _serializeCFrameWith(_serializeVector3Integer)",
+		"local _serializeEnum = function(value: EnumItem): number",
+		"\treturn value.Value",
+		"end",
+	]
+
+def write_compact_deserializers() -> list[str]:
+	def write_vector_deserializer(name: str, axes: list[str], rounding: str | None) -> list[str]:
+		components = []
+		for i, axis in enumerate(axes):
+			if rounding == "integer":
+				components.append(f"math.round(value[{i+1}])")
+			elif rounding == "double":
+				components.append(f"math.round(value[{i+1}]*100)/100")
+			else:
+				components.append(f"value[{i+1}]")
+		return [
+			f"local _deserialize{name} = function(value: Table): {name[0:7]}",
+			f"\treturn {name[0:7]}.new(" + ", ".join(components) + ")",
+			"end",
+		]
+
+	return [
+		"local _deserializeString = function(value: string): string",
+		"\treturn value",
+		"end",
+		"local _deserializeNumber = function(value: number): number",
+		"\treturn value",
+		"end",
+		"local _deserializeInteger = _deserializeNumber",
+		"local _deserializeInt = _deserializeInteger",
+		"local _deserializeDouble = _deserializeNumber",
+		"local _deserializeFloat = _deserializeNumber",
+		"local _deserializeBoolean = function(value: boolean): boolean",
+		"\treturn value",
+		"end",
+		"local _deserializeColor3 = function(value: number): Color3",
+		"\treturn Color3.fromRGB(bit32.rshift(value, 16), bit32.band(bit32.rshift(value, 8), 255), bit32.band(value, 255))",
+		"end",
+		"local _deserializeDateTime = function(value: number): DateTime",
+		"\treturn DateTime.fromUnixTimestampMillis(value)",
+		"end",
+		] + write_vector_deserializer("Vector3", ["X", "Y", "Z"], None) + write_vector_deserializer("Vector3Integer", ["X", "Y", "Z"], "integer") + write_vector_deserializer("Vector3Double", ["X", "Y", "Z"], "double") + write_vector_deserializer("Vector2", ["X", "Y"], None) + write_vector_deserializer("Vector2Integer", ["X", "Y"], "integer") + write_vector_deserializer("Vector2Double", ["X", "Y"], "double") + [
+		"local _deserializeCFrameWith = function(deserializeVector3: (value: Table) -> Vector3): (value: Table) -> CFrame",
+		] + indent_block([
+			"return function(value: Table): CFrame",
+			] + indent_block([
+				"local position = deserializeVector3({ value[1], value[2], value[3] })",
+				"local orientation = deserializeVector3({ value[4], value[5], value[6] })",
+				"return CFrame.fromEulerAnglesYXZ(",
+				"\tmath.rad(orientation.X),",
+				"\tmath.rad(orientation.Y),",
+				"\tmath.rad(orientation.Z)",
+				") + position",
+			]) + [
+			"end",
+		]) + [
+		"end",
+		"local _deserializeCFrame = _deserializeCFrameWith(_deserializeVector3)",
+		"local _deserializeCFrameInteger = _deserializeCFrameWith(_deserializeVector3Integer)",
+		"local _deserializeCFrameDouble = _deserializeCFrameWith(_deserializeVector3Double)",
+	]
+
+def write_builtin_serializers(codec: CodecMode) -> list[str]:
+	if codec == "compact":
+		return write_compact_serializers()
+
+	return [
+		"local _serializeColor3 = function(value: Color3): string",
+		"\treturn value:ToHex()",
+		"end",
+		"local _serializeNumber = function(value: number): number",
+		"\treturn value",
+		"end",
+		"local _serializeInteger = function(value: number): number",
+		"\treturn _processInteger(value)",
+		"end",
+		"local _serializeInt = _serializeInteger",
+		"local _serializeDouble = function(value: number): number",
+		"\treturn _processDouble(value)",
+		"end",
+		"local _serializeFloat = _serializeNumber",
+		"local _serializeString = function(value: string): string",
+		"\treturn value",
+		"end",
+		"local _serializeBoolean = function(value: boolean): boolean",
+		"\treturn value",
+		"end",
+		"local _serializeDateTime = function(value: DateTime): string",
+		"\treturn value:ToIsoDate()",
+		"end",
+		"local _serializeVector3 = function(value: Vector3): Table",
+		] + indent_block([		
+			"return {",
+			] + indent_block([	
+				"X = value.X,",
+				"Y = value.Y,",
+				"Z = value.Z",
+			]) + [
+			"}",
+		]) + [	
+		"end",
+		"local _serializeVector3Integer = function(value: Vector3): Table",
+		] + indent_block([		
+			"return {",
+			] + indent_block([	
+				"X = math.round(value.X),",
+				"Y = math.round(value.Y),",
+				"Z = math.round(value.Z)",
+			]) + [
+			"}",
+		]) + [	
+		"end",
+		"local _serializeVector3Double = function(value: Vector3): Table",
+		] + indent_block([		
+			"return {",
+			] + indent_block([	
+				"X = math.round(value.X*100)/100,",
+				"Y = math.round(value.Y*100)/100,",
+				"Z = math.round(value.Z*100)/100",
+			]) + [
+			"}",
+		]) + [	
+		"end",
+		"local _serializeVector2 = function(value: Vector2): Table",
+		] + indent_block([		
+			"return {",
+			] + indent_block([	
+				"X = value.X,",
+				"Y = value.Y",
+			]) + [
+			"}",
+		]) + [	
+		"end",
+		"local _serializeVector2Integer = function(value: Vector2): Table",
+		] + indent_block([		
+			"return {",
+			] + indent_block([	
+				"X = math.round(value.X),",
+				"Y = math.round(value.Y)",
+			]) + [
+			"}",
+		]) + [	
+		"end",
+		"local _serializeVector2Double = function(value: Vector2): Table",
+		] + indent_block([		
+			"return {",
+			] + indent_block([	
+				"X = math.round(value.X*100)/100,",
+				"Y = math.round(value.Y*100)/100",
+			]) + [
+			"}",
+		]) + [	
+		"end",
+		"local _serializeCFrame = function(value: CFrame): Table",
+		] + indent_block([		
+			"local x,y,z = value:ToEulerAnglesYXZ()",
+			"return {",
+			] + indent_block([
+				"Position = _serializeVector3(value.Position),",
+				"Orientation = _serializeVector3(Vector3.new(math.deg(x), math.deg(y), math.deg(z))),",
+			]) + [
+			"}",
+		]) + [	
+		"end",
+		"local _serializeCFrameDouble = function(value: CFrame): Table",
+		] + indent_block([		
+			"local x,y,z = value:ToEulerAnglesYXZ()",
+			"return {",
+			] + indent_block([
+				"Position = _serializeVector3Double(value.Position),",
+				"Orientation = _serializeVector3Double(Vector3.new(math.deg(x), math.deg(y), math.deg(z))),",
+			]) + [
+			"}",
+		]) + [	
+		"end",
+		"local _serializeCFrameInteger = function(value: CFrame): Table",
+		] + indent_block([		
+			"local x,y,z = value:ToEulerAnglesYXZ()",
+			"return {",
+			] + indent_block([
+				"Position = _serializeVector3Integer(value.Position),",
+				"Orientation = _serializeVector3Integer(Vector3.new(math.deg(x), math.deg(y), math.deg(z))),",
+			]) + [
+			"}",
+		]) + [	
+		"end",
+		"local _serializeEnum = function(value: EnumItem): string",
+		"\treturn tostring(value.Value)",
+		"end",
+	]
+
+def write_builtin_deserializers(codec: CodecMode) -> list[str]:
+	if codec == "compact":
+		return write_compact_deserializers()
+
+	return [
+		"local _isNumbered = function(data: Table): boolean",
+		"\tfor key in pairs(data) do",
+		"\t\treturn tonumber(key) ~= nil",
+		"\tend",
+		"\treturn true",
+		"end",
+		"local _deserializeString = function(value: string): string",
+		"\treturn value",
+		"end",
+		"local _deserializeNumber = function(value: number): number",
+		"\treturn value",
+		"end",
+		"local _deserializeInteger = _deserializeNumber",
+		"local _deserializeInt = _deserializeInteger",
+		"local _deserializeDouble = _deserializeNumber",
+		"local _deserializeFloat = _deserializeNumber",
+		"local _deserializeBoolean = function(value: boolean): boolean",
+		"\treturn value",
+		"end",
+		"local _deserializeColor3 = function(value: string): Color3",
+		"\treturn Color3.fromHex(value)",
+		"end",
+		"local _deserializeDateTime = function(value: string): DateTime",
+		"\treturn DateTime.fromIsoDate(value)",
+		"end",	
+		"local _deserializeVector3 = function(value: Table): Vector3",
+		] + indent_block([		
+			"return Vector3.new(value.X, value.Y, value.Z)",
+		]) + [	
+		"end",
+		"local _deserializeVector3Integer = function(value: Table): Vector3",
+		] + indent_block([		
+			"return Vector3.new(math.round(value.X), math.round(value.Y), math.round(value.Z))",
+		]) + [	
+		"end",
+		"local _deserializeVector3Double = function(value: Table): Vector3",
+		] + indent_block([		
+			"return Vector3.new(math.round(value.X*100)/100, math.round(value.Y*100)/100, math.round(value.Z*100)/100)",
+		]) + [	
+		"end",
+		"local _deserializeVector2 = function(value: Table): Vector2",
+		] + indent_block([		
+			"return Vector2.new(value.X, value.Y)",
+		]) + [	
+		"end",
+		"local _deserializeVector2Integer = function(value: Table): Vector2",
+		] + indent_block([		
+			"return Vector2.new(math.round(value.X), math.round(value.Y))",
+		]) + [	
+		"end",
+		"local _deserializeVector2Double = function(value: Table): Vector2",
+		] + indent_block([		
+			"return Vector2.new(math.round(value.X*100)/100, math.round(value.Y*100)/100)",
+		]) + [	
+		"end",
+		"local _deserializeCFrame = function(value: Table): CFrame",
+		] + indent_block([		
+			"local position = _deserializeVector3(value[\"Position\"])",
+			"local orientation = _deserializeVector3(value[\"Orientation\"])",
+			"return CFrame.fromEulerAnglesYXZ(",
+			"\tmath.rad(orientation.X),",
+			"\tmath.rad(orientation.Y),",
+			"\tmath.rad(orientation.Z)",
+			") + position"
+		]) + [	
+		"end",
+		"local _deserializeCFrameInteger = function(value: Table): CFrame",
+		] + indent_block([		
+			"local position = _deserializeVector3Integer(value[\"Position\"])",
+			"local orientation = _deserializeVector3Integer(value[\"Orientation\"])",
+			"return CFrame.fromEulerAnglesYXZ(",
+			"\tmath.rad(orientation.X),",
+			"\tmath.rad(orientation.Y),",
+			"\tmath.rad(orientation.Z)",
+			") + position"
+		]) + [	
+		"end",
+		"local _deserializeCFrameDouble = function(value: Table): CFrame",
+		] + indent_block([		
+			"local position = _deserializeVector3Double(value[\"Position\"])",
+			"local orientation = _deserializeVector3Double(value[\"Orientation\"])",
+			"return CFrame.fromEulerAnglesYXZ(",
+			"\tmath.rad(orientation.X),",
+			"\tmath.rad(orientation.Y),",
+			"\tmath.rad(orientation.Z)",
+			") + position"
+		]) + [	
+		"end",
+	]
+
+# one codec shared by every custom type, reading how each is saved from its descriptor
+def write_table_codecs(codec: CodecMode) -> list[str]:
+	# in the compact codec an unset optional is saved as false, and values are never keyed by name
+	is_present_str = "fieldValue" if codec == "compact" else "fieldValue ~= nil"
+	return [
+		"local _getField = function(value: Table, keys: { string }): any",
+		"\tfor i, key in ipairs(keys) do",
+		"\t\tvalue = value and value[key]",
+		"\tend",
+		"\treturn value",
+		"end",
+		"local _setField = function(value: Table, keys: { string }, fieldValue: any)",
+		"\tfor i = 1, #keys - 1 do",
+		"\t\tvalue[keys[i]] = value[keys[i]] or {}",
+		"\t\tvalue = value[keys[i]]",
+		"\tend",
+		"\tvalue[keys[#keys]] = fieldValue",
+		"end",
+		"-- fields are { keys, ordinal, serialize, deserialize, isOptional? }, or { keys, ordinal, flag, isOptional? }",
+		# compact arrays also need their length, and the words left empty
+		"local _structCodec = function(fields: { { any } }" + (", size: number, unusedWords: { any }?" if codec == "compact" else "") + "): (Serializer<any, Table>, Deserializer<Table, any>)",
+		] + indent_block([
+			"local words = " + ("unusedWords or {}" if codec == "compact" else "{}"),
+			"for i, field in ipairs(fields) do",
+			] + indent_block([
+				"if type(field[1]) == \"string\" then",
+				"\tfield[1] = { field[1] }",
+				"end",
+				] + ([
+				"field[2] = tostring(field[2])",
+				] if codec == "json" else []) + [
+				"if type(field[3]) == \"number\" then",
+				"\tfield[4], field[5] = _deserializeBoolean, field[4]",
+				"\tif not table.find(words, field[2]) then",
+				"\t\ttable.insert(words, field[2])",
+				"\tend",
+				"end",
+			]) + [
+			"end",
+			"return function(value: any): Table",
+			] + indent_block([
+				"local data = {}",
+				] + ([
+				"-- ordinals of removed fields stay reserved, so fill them to keep the array contiguous",
+				"for ordinal = 1, size do",
+				"\tdata[ordinal] = false",
+				"end",
+				] if codec == "compact" else []) + [
+				"for i, word in ipairs(words) do",
+				"\tdata[word] = 0",
+				"end",
+				"for i, field in ipairs(fields) do",
+				] + indent_block([
+					"local keys, slot, serialize, _, isOptional = table.unpack(field)",
+					"local fieldValue = _getField(value, keys)",
+					# optional booleans take two bits, whether they're set and their value
+					"if type(serialize) == \"number\" then",
+					"\tdata[slot] += (if isOptional and fieldValue ~= nil then serialize else 0) + (if fieldValue then serialize*(if isOptional then 2 else 1) else 0)",
+					"elseif fieldValue ~= nil or not isOptional then",
+					"\tdata[slot] = serialize(fieldValue)",
+					"end",
+				]) + [
+				"end",
+				"return data",
+			]) + [
+			"end, function(data: Table): any",
+			] + indent_block([
+				# values saved before fields were numbered are keyed by name, with booleans saved as they are
+				] + ([
+				"local isNumbered = _isNumbered(data)",
+				] if codec == "json" else []) + [
+				"local value = {}",
+				"for i, field in ipairs(fields) do",
+				] + indent_block([
+					"local keys, slot, flag, deserialize, isOptional = table.unpack(field)",
+					] + ([
+					"local fieldValue = if isNumbered then data[slot] else _getField(data, keys)",
+					"if isNumbered and type(flag) == \"number\" then",
+					] if codec == "json" else [
+					"local fieldValue = data[slot]",
+					"if type(flag) == \"number\" then",
+					]) + [
+					"\tlocal word = fieldValue or 0",
+					"\tfieldValue = if isOptional and not bit32.btest(word, flag) then nil else bit32.btest(word, flag*(if isOptional then 2 else 1))",
+					"elseif " + is_present_str + " or not isOptional then",
+					"\tfieldValue = deserialize(fieldValue)",
+					] + ([
+					"else",
+					"\tfieldValue = nil",
+					] if codec == "compact" else []) + [
+					"end",
+					"_setField(value, keys, fieldValue)",
+				]) + [
+				"end",
+				"return value",
+			]) + [
+			"end",
+		]) + [
+		"end",
+		"local _optionsCodec = function(options: { string }): (Serializer<string, any>, Deserializer<any, string>)",
+		"\treturn function(value: string): any",
+		"\t\treturn " + ("assert(table.find(options, value))" if codec == "compact" else "tostring(assert(table.find(options, value)))"),
+		"\tend, function(value: any): string",
+		"\t\treturn options[assert(tonumber(value))]",
+		"\tend",
+		"end",
+	]
+
+# enum items are looked up by value in a table built on first use, rather than scanning GetEnumItems on every call
+def write_enum_deserializer_factory() -> list[str]:
+	return [
+		"local _enumDeserializer = function(enum: Enum): Deserializer<any, EnumItem>",
+		] + indent_block([
+			"local enumItems: { [number]: EnumItem }? = nil",
+			"return function(value: any): EnumItem",
+			] + indent_block([
+				"if not enumItems then",
+				"\tlocal items = {}",
+				"\tfor i, enumItem in ipairs(enum:GetEnumItems()) do",
+				"\t\titems[enumItem.Value] = enumItem",
+				"\tend",
+				"\tenumItems = items",
+				"end",
+				"assert(enumItems)",
+				"local enumItem = enumItems[tonumber(value) :: number]",
+				"if not enumItem then",
+				"\terror(\"No enum item found in \"..tostring(enum)..\" for value \"..value)",
+				"end",
+				"return enumItem",
+			]) + [
+			"end",
+		]) + [
+		"end",
+	]
+
+def write_storage_methods(storage: StorageMode, has_migrations: bool) -> list[str]:
+	if storage == "document":
+		return [
+			"function DataHandler:_Stage(encodedValue: any): nil",
+			"\tself._Document:SetEntry(self.Scope, encodedValue)",
+			"\treturn nil",
+			"end",
+			"function DataHandler:_Load(): (any, boolean)",
+			"\tif not self._Document:Load() then",
+			"\t\treturn nil, false",
+			"\tend",
+			"\treturn self._Document:GetEntry(self.Scope), true",
+			"end",
+			"function DataHandler:_Save(encodedValue: any, priority: number?): boolean",
+			"\tself:_Stage(encodedValue)",
+			"\treturn self._Document:Save(priority)",
+			"end",
+			"function DataHandler:_Flush(priority: number?): boolean",
+			"\treturn self._Document:_Flush(priority)",
+			"end",
+			"function DataHandler:_Transform(transformer: (any) -> any): (any, boolean)",
+			"\tlocal encodedValue = transformer(self._Document:GetEntry(self.Scope))",
+			"\treturn encodedValue, self:_Save(encodedValue)",
+			"end",
+			"function DataHandler:_Increment(delta: number): (number?, boolean)",
+			"\tlocal value = (self._Document:GetEntry(self.Scope) or 0) + delta",
+			"\treturn value, self:_Save(value)",
+			"end",
+			"",
+		]
+	else:
+		return [
+			"function DataHandler:_Stage(encodedValue: any): nil",
+			] + indent_block([
+				"if self._IsLoaded and encodedValue ~= self._EncodedValue then",
+				"\tself._IsDirty = true",
+				"\tdirtyObjects[self] = true",
+				"end",
+				"return nil",
+			]) + [
+			"end",
+			"function DataHandler:_Load(): (any, boolean)",
+			] + indent_block([
+				"local dataStore, key = self.DataStore, self.Key",
+				] + (write_migrated_load("self.Scope") + [
+				"return data, success",
+				] if has_migrations else [
+				"return _request(Enum.DataStoreRequestType.GetAsync, PRIORITY_READ, \"Get/\" .. self.Scope .. \"/\" .. key, function()",
+				"\treturn dataStore:GetAsync(key)",
+				"end)",
+			])) + [
+			"end",
+			"function DataHandler:_Save(encodedValue: any, priority: number?): boolean",
+			] + indent_block([
+				"if not self._IsLoaded then",
+				"\t-- never overwrite stored data that failed to load",
+				"\treturn false",
+				"end",
+				"",
+				"-- captured up front as the handler may be destroyed while the request is queued",
+				"local dataStore, key, setOptions = self.DataStore, self.Key, self.SetOptions",
+				"local userIds = { self.Player.UserId }",
+				"local requestType = if self.ClassName == \"NumberDataHandler\" then Enum.DataStoreRequestType.SetIncrementSortedAsync else Enum.DataStoreRequestType.SetIncrementAsync",
+				"self._IsDirty = false",
+				"dirtyObjects[self] = nil",
+				"local _, success = _request(requestType, priority or PRIORITY_WRITE, \"Set/\" .. self.Scope .. \"/\" .. key, function()",
+				"\treturn dataStore:SetAsync(key, encodedValue, userIds, setOptions)",
+				"end)",
+				"if not success and self._IsAlive then",
+				"\tself._IsDirty = true",
+				"\tdirtyObjects[self] = true",
+				"end",
+				"return success",
+			]) + [
+			"end",
+			"function DataHandler:_Flush(priority: number?): boolean",
+			"\tif not self._IsDirty then",
+			"\t\treturn true",
+			"\tend",
+			"\treturn self:_Save(self._EncodedValue, priority)",
+			"end",
+			"function DataHandler:_Transform(transformer: (any) -> any): (any, boolean)",
+			] + indent_block([
+				"local dataStore, key = self.DataStore, self.Key",
+				] + ([
+				"-- returning only the value would clear the metadata the migrations are keyed on",
+				"local userIds = { self.Player.UserId }",
+				"return _request(Enum.DataStoreRequestType.UpdateAsync, PRIORITY_WRITE, nil, function()",
+				"\treturn dataStore:UpdateAsync(key, function(value: any)",
+				"\t\treturn transformer(value), userIds, METADATA",
+				"\tend)",
+				"end)",
+				] if has_migrations else [
+				"return _request(Enum.DataStoreRequestType.UpdateAsync, PRIORITY_WRITE, nil, function()",
+				"\treturn dataStore:UpdateAsync(key, transformer)",
+				"end)",
+				]) + [
+			]) + [
+			"end",
+			"function DataHandler:_Increment(delta: number): (number?, boolean)",
+			] + indent_block([
+				"local dataStore, key, incrementOptions = self.DataStore, self.Key, self.IncrementOptions",
+				"local userIds = { self.Player.UserId }",
+				"return _request(Enum.DataStoreRequestType.SetIncrementSortedAsync, PRIORITY_WRITE, nil, function()",
+				"\treturn dataStore:IncrementAsync(key, delta, userIds, incrementOptions)",
+				"end)",
+			]) + [
+			"end",
+			"",
+		]
 
-def build():
-	config = get_data_config()
+def build(schema: DataSchema | None = None):
+	if schema is None:
+		schema = compile_schema()
+	config = schema["config"]
 	domain_name = config["domain_name"]
+	storage = config["storage"]
+	replication = config["replication"]
+	transport = config["transport"]
+	codec = config["codec"]
+	serializers = config["serializers"]
+	has_migrations = len(config["migrations"]) > 0
 	build_path = config["build"]["out"]["server_path"]
 	assert get_if_module_script(build_path), "server datatree must be a ModuleScript, please make sure the server_path only ends with .lua/luau"
 
 	remove_all_path_variants(build_path)
 
 	type_imports = []
-	for key in config["types"]:
+	for key in schema["types"]:
 		type_imports.append(f"export type {key} = DataTypes.{key}")
 
-
-	enum_str_list = []
-	for path, value in dpath.search(config["types"], '**', yielded=True):
-		if "Enum." in value:
-			enum_str_list.append(value)
-
-	# State::Enum.HumanoidStateType
-	for path, value in dpath.search(config["tree"], '**', yielded=True):
-		if ("Enum." in path) and ("::" in path):
-			enum_str_list.append(path.split("::")[1])
-
-	type_tree = {}
-	func_tree = {}
+	type_tree: dict = {}
+	func_tree: dict = {}
 	enum_deserializers = []
 	type_serializers = []
 	type_deserializers = []
 
-	def assemble_serializer_function(type_name: str, type_data: dict | list) -> list[str]:
+	# in the compact codec booleans are packed into the bits of trailing integers, optional ones use a second bit to mark if they're set
+	def get_slot_str(data_name: str, ordinal: int) -> str:
+		# json objects are keyed by the ordinal as a string, compact arrays by position
+		if codec == "compact":
+			return f"{data_name}[{ordinal}]"
+		return f"{data_name}[\"{ordinal}\"]"
+
+	def get_boolean_bits(layout: TypeLayout, field: TypeField) -> tuple[int, int]:
+		first_bit = layout["bits"][field["path"]][0]
+		return layout["words"][first_bit // WORD_BIT_COUNT], 2**(first_bit % WORD_BIT_COUNT)
+
+	def get_if_packed(field: TypeField) -> bool:
+		return field["type"]["container"] == None and field["type"]["raw_name"] == "boolean"
+
+	def assemble_struct_serializer_function(custom_type: CustomType) -> list[str]:
+		type_name = custom_type["name"]
+		layout = custom_type["layout"]
+		assert layout
+
+		slots: dict[int, str] = {}
+		words: dict[int, list[str]] = {}
+		for ordinal in layout["words"]:
+			words[ordinal] = []
+
+		for field in custom_type["fields"]:
+			key_str = "value"
+			for key in field["keys"]:
+				key_str += "[\""+key+"\"]"
+
+			if get_if_packed(field):
+				ordinal, flag = get_boolean_bits(layout, field)
+				if field["type"]["is_optional"]:
+					words[ordinal].append(f"(if {key_str} ~= nil then {flag} else 0)")
+					words[ordinal].append(f"(if {key_str} then {flag*2} else 0)")
+				else:
+					words[ordinal].append(f"(if {key_str} then {flag} else 0)")
+			elif codec == "compact" and field["type"]["is_optional"]:
+				# arrays can't hold nil, and nothing but a boolean serializes to false
+				slots[layout["fields"][field["path"]]] = f"if {key_str} ~= nil then {get_codec_function('serialize', field['type'])}({key_str}) else false"
+			else:
+				slots[layout["fields"][field["path"]]] = write_codec_call("serialize", field["type"], key_str)
+
+		for ordinal, terms in words.items():
+			if len(terms) > 0:
+				slots[ordinal] = " + ".join(terms)
+			elif codec == "compact":
+				slots[ordinal] = "0"
+
+		entries: list[str] = []
+		if codec == "compact":
+			# ordinals of removed fields stay reserved, so fill them to keep the array contiguous
+			for ordinal in range(1, layout["next_ordinal"]):
+				entries.append(slots.get(ordinal, "false") + ",")
+		else:
+			for ordinal in sorted(slots):
+				entries.append(f"[\"{ordinal}\"] = {slots[ordinal]},")
+
+		return [
+			f"local _serialize{get_function_name(type_name)} = function(value: {type_name}): Table",
+			"\treturn {",
+			] + indent_block(entries, indent_count=2) + [
+			"\t}",
+			"end",
+		]
+
+	def assemble_struct_deserializer_function(custom_type: CustomType) -> list[str]:
+		type_name = custom_type["name"]
+		layout = custom_type["layout"]
+		assert layout
+
+		out: dict = {}
+		for field in custom_type["fields"]:
+			if get_if_packed(field):
+				ordinal, flag = get_boolean_bits(layout, field)
+				word_str = get_slot_str("data", ordinal)
+				if field["type"]["is_optional"]:
+					dpath.new(out, field["path"], mark_as_literal(f"if bit32.btest({word_str} or 0, {flag}) then bit32.btest({word_str}, {flag*2}) else nil"))
+				else:
+					dpath.new(out, field["path"], mark_as_literal(f"bit32.btest({word_str} or 0, {flag})"))
+			else:
+				slot_str = get_slot_str("data", layout["fields"][field["path"]])
+				if codec == "compact" and field["type"]["is_optional"]:
+					dpath.new(out, field["path"], mark_as_literal(f"if {slot_str} then {get_codec_function('deserialize', field['type'])}({slot_str}) else nil"))
+				else:
+					dpath.new(out, field["path"], mark_as_literal(write_codec_call("deserialize", field["type"], slot_str)))
 
-		if type(type_data) == dict:
-			_serializer_content = [
-				f"local _serialize{get_function_name(type_name)} = function(value: {type_name}): Table",
+		_deserializer_content = [
+			f"local _deserialize{get_function_name(type_name)} = function(data: Table): {type_name}",
+		]
+		if codec == "json":
+			# values saved before fields were numbered are keyed by name
+			legacy_out: dict = {}
+			for field in custom_type["fields"]:
+				key_str = "data"
+				for key in field["keys"]:
+					key_str += "[\""+key+"\"]"
+				dpath.new(legacy_out, field["path"], mark_as_literal(write_codec_call("deserialize", field["type"], key_str)))
+
+			_deserializer_content += [
+				"\tif not _isNumbered(data) then",
+				] + indent_block(("return " + from_dict(legacy_out, skip_initial_indent=True) + " :: any").split("\n"), indent_count=2) + [
+				"\tend",
 			]
-			out: dict = {}
-			for path, value in dpath.search(type_data, '**', yielded=True):
-				if type(value) == str:
-					keys = path.split("/")
-					key_str = "value"
-					is_optional = "?" == value[len(value)-1]
-					for key in keys:
-						key_str += "[\""+key+"\"]"
-					if value in config["types"]:
-						if is_optional:
-							dpath.new(out, path, mark_as_literal(f"if {key_str} ~= nil then _serialize{get_function_name(value)}({key_str}) else nil"))
-						else:
-							dpath.new(out, path, mark_as_literal(f"_serialize{get_function_name(value)}({key_str})"))
-					else:
-						if "List[" in value:
-							true_type_name = value.replace("List[", "").replace("]", "")
-							if true_type_name[0] == " ":
-								true_type_name = true_type_name[1:]
-							if is_optional:
-								dpath.new(out, path, mark_as_literal(f"if {key_str} ~= nil then _serializeList(_serialize{get_function_name(true_type_name)})({key_str}) else nil"))
-							else:
-								dpath.new(out, path, mark_as_literal(f"_serializeList(_serialize{get_function_name(true_type_name)})({key_str})"))
-						elif "Dict[" in value:
-							true_type_name = value.replace("Dict[", "").replace("]", "").split(",")[1]
-							if true_type_name[0] == " ":
-								true_type_name = true_type_name[1:]
-							if is_optional:
-								dpath.new(out, path, mark_as_literal(f"if {key_str} ~= nil then _serializeDict(_serialize{get_function_name(true_type_name)})({key_str}) else nil"))
-							else:
-								dpath.new(out, path, mark_as_literal(f"_serializeDict(_serialize{get_function_name(true_type_name)})({key_str})"))
-						else:
-							ro_type = get_roblox_type(get_raw_type_name(value))
-							if ro_type != None:
-								assert ro_type
-								if is_optional:
-									dpath.new(out, path, mark_as_literal(f"if {key_str} ~= nil then _serialize{get_function_name(ro_type)}({key_str}) else nil"))
-								else:
-									dpath.new(out, path, mark_as_literal(f"_serialize{get_function_name(value)}({key_str})"))
-				
-			_serializer_content += indent_block(("return " + from_dict(out, skip_initial_indent=True) + "").split("\n"))
-			_serializer_content.append("end")
-
-			return _serializer_content
-		elif type(type_data) == list:
-			_serializer_content = [
-				f"local _serialize{get_function_name(type_name)} = function(value: {type_name}): string",
-				f"\tlocal index = table.find({from_list(type_data, indent_count=0, multi_line=False, skip_initial_indent=True)}, value)",
+
+		_deserializer_content += indent_block(("return " + from_dict(out, skip_initial_indent=True) + " :: any").split("\n"))
+		_deserializer_content.append("end")
+		return _deserializer_content
+
+	def assemble_serializer_function(custom_type: CustomType) -> list[str]:
+		type_name = custom_type["name"]
+		options = custom_type["options"]
+		if options == None:
+			return assemble_struct_serializer_function(custom_type)
+		else:
+			return [
+				f"local _serialize{get_function_name(type_name)} = function(value: {type_name}): " + ("number" if codec == "compact" else "string"),
+				f"\tlocal index = table.find({from_list(options, indent_count=0, multi_line=False, skip_initial_indent=True)}, value)",
 				"\tassert(index)",
-				"\treturn tostring(index)",
+				"\treturn " + ("index" if codec == "compact" else "tostring(index)"),
 				"end",
 			]
 
-			return _serializer_content
-
-		return []
-
-	def assemble_deserializer_function(type_name: str, type_data: dict | list) -> list[str]:
-		if type(type_data) == dict:
-			_deserializer_content = [
-				f"local _deserialize{get_function_name(type_name)} = function(data: Table): {type_name}",
-			]
-			out: dict = {}
-			for path, value in dpath.search(type_data, '**', yielded=True):
-				if type(value) == str:
-					keys = path.split("/")
-					key_str = "data"
-					is_optional = "?" == value[len(value)-1]
-					for key in keys:
-						key_str += "[\""+key+"\"]"
-					if value in config["types"]:
-						if is_optional:
-							dpath.new(out, path, mark_as_literal(f"if {key_str} ~= nil then _deserialize{get_function_name(value)}({key_str}) else nil"))
-						else:
-							dpath.new(out, path, mark_as_literal(f"_deserialize{get_function_name(value)}({key_str})"))
-					else:
-						if "List[" in value:
-							true_type_name = value.replace("List[", "").replace("]", "")
-							if true_type_name[0] == " ":
-								true_type_name = true_type_name[1:]
-							if is_optional:	
-								dpath.new(out, path, mark_as_literal(f"if {key_str} ~= nil then _deserializeList(_deserialize{get_function_name(true_type_name)})({key_str}) else nil"))
-							else:
-								dpath.new(out, path, mark_as_literal(f"_deserializeList(_deserialize{get_function_name(true_type_name)})({key_str})"))
-						elif "Dict[" in value:
-							true_type_name = value.replace("Dict[", "").replace("]", "").split(",")[1]
-							if true_type_name[0] == " ":
-								true_type_name = true_type_name[1:]
-							if is_optional:	
-								dpath.new(out, path, mark_as_literal(f"if {key_str} ~= nil then _deserializeDict(_deserialize{get_function_name(true_type_name)})({key_str}) else nil"))
-							else:
-								dpath.new(out, path, mark_as_literal(f"_deserializeDict(_deserialize{get_function_name(true_type_name)})({key_str})"))
-						else:
-							ro_type = get_roblox_type(get_raw_type_name(value))
-							if ro_type != None:
-								assert ro_type
-								if is_optional:
-									dpath.new(out, path, mark_as_literal(f"if {key_str} ~= nil then _deserialize{get_function_name(ro_type)}({key_str}) else nil"))
-								else:
-									dpath.new(out, path, mark_as_literal(f"_deserialize{get_function_name(ro_type)}({key_str})"))
-
-			_deserializer_content += indent_block(("return " + from_dict(out, skip_initial_indent=True) + " :: any").split("\n"))
-			_deserializer_content.append("end")
-
-			return _deserializer_content
-		elif type(type_data) == list:
-			_deserializer_content = [
+	def assemble_deserializer_function(custom_type: CustomType) -> list[str]:
+		type_name = custom_type["name"]
+		options = custom_type["options"]
+		if options == None:
+			return assemble_struct_deserializer_function(custom_type)
+		else:
+			return [
 				f"local _deserialize{get_function_name(type_name)} = function(value: number): {type_name}",
-				f"\tlocal options = {from_list(type_data, indent_count=0, multi_line=False, skip_initial_indent=True)}",
+				f"\tlocal options = {from_list(options, indent_count=0, multi_line=False, skip_initial_indent=True)}",
 				f"\tlocal index = tonumber(value)",
 				f"\tassert(index)",
 				f"\treturn options[index] :: {type_name}",
 				"end",
 			]
 
-			return _deserializer_content
-		return []
+	# a single positional entry per field, read by the codec shared between types
+	def assemble_struct_descriptor(custom_type: CustomType) -> list[str]:
+		type_name = custom_type["name"]
+		layout = custom_type["layout"]
+		assert layout
 
-	for enum_type in enum_str_list:
-		type_serializers += [
-			f"local _serialize{get_function_name(enum_type)} = _serializeEnum :: (value: {enum_type}) -> string",
-		]
+		field_entries: list[str] = []
+		used_words: list[int] = []
+		for field in custom_type["fields"]:
+			keys_str = f"\"{field['keys'][0]}\"" if len(field["keys"]) == 1 else "{ " + ", ".join(f"\"{key}\"" for key in field["keys"]) + " }"
+			# left out when false, most fields are required
+			is_optional_str = ", true" if field["type"]["is_optional"] else ""
+			if get_if_packed(field):
+				ordinal, flag = get_boolean_bits(layout, field)
+				if not ordinal in used_words:
+					used_words.append(ordinal)
+				field_entries.append(f"{{ {keys_str}, {ordinal}, {flag}{is_optional_str} }},")
+			else:
+				serializer = get_codec_function("serialize", field["type"])
+				deserializer = get_codec_function("deserialize", field["type"])
+				field_entries.append(f"{{ {keys_str}, {layout['fields'][field['path']]}, {serializer}, {deserializer}{is_optional_str} }},")
 
-	for type_name, type_data in config["types"].items():
-		type_deserializers += assemble_deserializer_function(type_name, type_data)
-		type_serializers += assemble_serializer_function(type_name, type_data)
+		# words in use are found from the entries, compact arrays also keep the ones left empty and their length
+		extra_args = ""
+		if codec == "compact":
+			extra_args = f", {layout['next_ordinal'] - 1}"
+			unused_words = [ordinal for ordinal in layout["words"] if not ordinal in used_words]
+			if len(unused_words) > 0:
+				extra_args += ", { " + ", ".join(str(ordinal) for ordinal in unused_words) + " }"
 
-	def write_enum_deserializer(enum_name: str):
-		raw_enum_name = get_raw_type_name(enum_name)
-		enum_func_name = get_function_name("Enum."+raw_enum_name)
+		function_name = get_function_name(type_name)
 		return [
-			f"local _deserialize{enum_func_name} = function(value: string): Enum.{raw_enum_name}",
-			f"\tfor i, enumItem in ipairs(Enum.{raw_enum_name}:GetEnumItems()) do if enumItem.Value == tonumber(value) then return enumItem end end",
-			f"\terror(\"No enum item found in {raw_enum_name} for value \"..value)",
-			"end",
+			f"local _serialize{function_name}, _deserialize{function_name} = _structCodec({{",
+			] + indent_block(field_entries) + [
+			"}" + extra_args + ")",
+		]
+
+	def assemble_codec_descriptor(custom_type: CustomType) -> list[str]:
+		options = custom_type["options"]
+		if options == None:
+			return assemble_struct_descriptor(custom_type)
+		function_name = get_function_name(custom_type["name"])
+		return [
+			f"local _serialize{function_name}, _deserialize{function_name} = _optionsCodec({from_list(options, indent_count=0, multi_line=False, skip_initial_indent=True)})",
+		]
+
+	for enum_name in schema["enums"]:
+		type_serializers += [
+			f"local _serialize{get_function_name(enum_name)} = _serializeEnum :: (value: {enum_name}) -> " + ("number" if codec == "compact" else "string"),
 		]
+		enum_deserializers.append(f"local _deserialize{get_function_name(enum_name)} = _enumDeserializer(Enum.{enum_name[5:]}) :: (value: any) -> {enum_name}")
+
+	for custom_type in schema["types"].values():
+		if serializers == "tables":
+			# both directions come from one descriptor, defined once the builtin deserializers they reference exist
+			type_deserializers += assemble_codec_descriptor(custom_type)
+		else:
+			type_deserializers += assemble_deserializer_function(custom_type)
+			type_serializers += assemble_serializer_function(custom_type)
 
 	out_variables = {}
+	# paths of the number values kept in OrderedDataStores, which can be read as leaderboards
+	sorted_scopes: list[str] = []
+
+	for leaf in schema["tree"]:
+		path = leaf["path"]
+		value = leaf["value"]
+		leaf_type = leaf["type"]
 
-	for full_path, value in dpath.search(config["tree"], '**', yielded=True):
-		keys = full_path.split("/")
-		raw_keys = []
-		final_type: None | str = None
-		for key in keys:
-			if final_type == None:
-				raw_keys.append(get_raw_key_name(key))
-				final_type = get_type_name_from_key(key)
-
-		path = "/".join(raw_keys)
-		
-		if final_type != None:
-			var_type = get_raw_type_name(final_type)
-
-			if "List[" in var_type:
-				var_type = (var_type.replace("List[", "")).replace("]", "")
-				var_type = "{[number]:" + var_type + "}"
-
-			if "Dict[" in var_type:
-				var_type = (var_type.replace("Dict[", "")).replace("]", "")
-				var_type = var_type.replace(",", "]:")
-				var_type = "{[" + var_type + "}"
-			
-			if get_if_optional(final_type):
+		if leaf_type is not None:
+			final_type: Any = leaf_type["name"]
+			var_type = leaf_type["raw_name"]
+
+			if leaf_type["container"] == "List":
+				var_type = "{[number]:" + str(leaf_type["item_name"]) + "}"
+			elif leaf_type["container"] == "Dict":
+				var_type = "{[" + str(leaf_type["key_name"]) + "]: " + str(leaf_type["item_name"]) + "}"
+
+			if leaf_type["is_optional"]:
 				var_type += "?"
 
-			var_name = "tree"+get_raw_key_name(full_path.replace("/", ""))+"Val"
+			var_name = "tree"+"".join(leaf["keys"])+"Val"
 			typed_var_name = var_name + ": " + var_type
-			if final_type[0:5] == "Enum.":
-				enum_deserializers += write_enum_deserializer(final_type[5:])
-				initial_value = write_value_from_config(value, final_type, config["types"])
-				
-				out_variables[typed_var_name] = initial_value
-				if value == "nil":
-					dpath.new(func_tree, path, mark_as_literal(f"_newDataHandler(\"{path}\", {var_name}, _serialize{get_function_name(final_type)}, _deserialize{get_function_name(final_type)})"))
+
+			if leaf_type["container"] != None or leaf_type["custom_type"] != None or leaf_type["enum_name"] != None:
+				out_variables[typed_var_name] = write_value_from_config(value, final_type, config["types"])
+				serializer = get_codec_function("serialize", leaf_type)
+				deserializer = get_codec_function("deserialize", leaf_type)
+				if leaf_type["container"] == "List":
+					dpath.new(func_tree, path, mark_as_literal(f"_newDataHandler(\"{path}\", {var_name}, {serializer}, {deserializer}) :: any"))
+					dpath.new(type_tree, path, mark_as_literal("DataHandler<{[number]: "+str(leaf_type["item_name"])+"}, string>"))
+				elif leaf_type["container"] == "Dict":
+					dpath.new(func_tree, path, mark_as_literal(f"_newDataHandler(\"{path}\", {var_name}, {serializer}, {deserializer}) :: any"))
+					dpath.new(type_tree, path, mark_as_literal("DataHandler<{["+str(leaf_type["key_name"])+"]: "+str(leaf_type["item_name"])+"}, string>"))
 				else:
-					dpath.new(func_tree, path, mark_as_literal(f"_newDataHandler(\"{path}\", {var_name}, _serialize{get_function_name(final_type)}, _deserialize{get_function_name(final_type)})"))
-
-				dpath.new(type_tree, path, mark_as_literal(f"DataHandler<{final_type}, string>"))
-			elif final_type[0:5] == "List[":
-				if not get_if_number_in_path(full_path):
-					initial_value = write_value_from_config(value, final_type, config["types"])
-					inner_type = final_type[5:(len(final_type)-1)]
-					raw_inner_type = get_raw_type_name(inner_type)
-					out_variables[typed_var_name] = initial_value
-
-					if raw_inner_type[0] == " ":
-						raw_inner_type = raw_inner_type[1:]
-
-					dpath.new(func_tree, path, mark_as_literal(f"_newDataHandler(\"{path}\", {var_name}, _serializeList(_serialize{get_function_name(raw_inner_type)}), _deserializeList(_deserialize{get_function_name(raw_inner_type)})) :: any"))
-					dpath.new(type_tree, path, mark_as_literal("DataHandler<{[number]: "+inner_type+"}, string>"))
-
-			elif final_type[0:5] == "Dict[":
-				if not get_if_number_in_path(full_path):
-					initial_value = write_value_from_config(value, final_type, config["types"])
-					inner_type = final_type[5:(len(final_type)-1)]
-					type_list = inner_type.split(",")
-					# print("DICT", full_path, ": ", type_list)
-					key = type_list[0]
-					val = type_list[1]
-					raw_val = get_raw_type_name(val)
-					out_variables[typed_var_name] = initial_value
-
-					if raw_val[0] == " ":
-						raw_val = raw_val[1:]
-
-					dpath.new(func_tree, path, mark_as_literal(f"_newDataHandler(\"{path}\", {var_name}, _serializeDict(_serialize{get_function_name(raw_val)}), _deserializeDict(_deserialize{get_function_name(raw_val)})) :: any"))
-					dpath.new(type_tree, path, mark_as_literal("DataHandler<{["+key+"]: "+val+"}, string>"))
+					dpath.new(func_tree, path, mark_as_literal(f"_newDataHandler(\"{path}\", {var_name}, {serializer}, {deserializer})"))
+					dpath.new(type_tree, path, mark_as_literal(f"DataHandler<{final_type}, string>"))
 			else:
 				ro_type = get_roblox_type(final_type)
 				if ro_type == "number":
-					dpath.new(func_tree, path, mark_as_literal(f"_newNumberHandler(\"{path}\", {value}, _process{get_function_name(final_type)})"))
+					dpath.new(func_tree, path, mark_as_literal(f"_newNumberHandler(\"{path}\", {value}, _process{get_function_name(leaf_type['raw_name'])})"))
+					sorted_scopes.append(path)
 					dpath.new(type_tree, path, mark_as_literal("NumberDataHandler"))
 				else:
 					dpath.new(func_tree, path, mark_as_literal(f"_newDataHandler(\"{path}\")"))
 					dpath.new(type_tree, path, mark_as_literal(f"DataHandler<{ro_type}, string>"))
-		
+
 		elif type(value) == str:
-			raw_value = get_raw_type_name(value)
-			if raw_value in config["types"]:
-				dpath.new(func_tree, path, mark_as_literal(f"_newDataHandler(\"{path}\", nil, _serialize{raw_value}, _deserialize{raw_value})"))
-				dpath.new(type_tree, path, mark_as_literal(f"DataHandler<{final_type}, string>"))
+			if value in schema["types"]:
+				dpath.new(func_tree, path, mark_as_literal(f"_newDataHandler(\"{path}\", nil, _serialize{get_function_name(value)}, _deserialize{get_function_name(value)})"))
+				dpath.new(type_tree, path, mark_as_literal(f"DataHandler<{value}, string>"))
 			else:
 				value = value.replace("{DISPLAY_NAME}", f"\"..player.DisplayName..\"")
 				value = value.replace("{USER_NAME}", f"\"..player.Name..\"")
@@ -286,21 +1745,17 @@ def build():
 				dpath.new(func_tree, path, mark_as_literal(f"_newDataHandler(\"{path}\", \"{value}\")"))
 				dpath.new(type_tree, path, mark_as_literal("DataHandler<string, string>"))
 		elif type(value) == bool:
-			dpath.new(func_tree, path, mark_as_literal(f"_newDataHandler(\"{path}\", {value})"))
+			dpath.new(func_tree, path, mark_as_literal(f"_newDataHandler(\"{path}\", {str(value).lower()})"))
 			dpath.new(type_tree, path, mark_as_literal("DataHandler<boolean, boolean>"))
 		elif type(value) == int:
 			dpath.new(func_tree, path, mark_as_literal(f"_newNumberHandler(\"{path}\", {value}, _processInt)"))
+			sorted_scopes.append(path)
 			dpath.new(type_tree, path, mark_as_literal("NumberDataHandler"))
 		elif type(value) == float:
 			dpath.new(func_tree, path, mark_as_literal(f"_newNumberHandler(\"{path}\", {value}, _processFloat)"))
+			sorted_scopes.append(path)
 			dpath.new(type_tree, path, mark_as_literal("NumberDataHandler"))
 
-	for path, value in dpath.search(config["types"], '**', yielded=True):
-		
-		if type(value) == str:
-			if value[0:5] == "Enum.":
-				enum_deserializers += write_enum_deserializer(value[5:])
-
 	out_variable_content = []
 	for k, v in out_variables.items():
 		out_variable_content.append(f"local {k} = {v}")
@@ -339,12 +1794,18 @@ def build():
 			"__index: DataHandler<T, S>,",
 			"_Maid: Maid,",
 			"_IsAlive: boolean,",
+			"_IsLoaded: boolean,",
+			"_IsDirty: boolean,",
 			"_Value: T?,",
 			"_EncodedValue: S?,",
 			"_Serialize: Serializer<T, S>,",
 			"_Deserialize: Deserializer<S, T>,",
+			] + ([
+			"_Document: PlayerDocument,",
+			] if storage == "document" else []) + [
 			"OnChanged: Signal,",
 			"ClassName: \"DataHandler\",",
+			"Scope: string,",
 			"Key: UserIdKey,",
 			"Player: Player,",
 			"DataStore: DataStore,",
@@ -357,12 +1818,55 @@ def build():
 			"Set: (self: DataHandler<T, S>, data: T, force: boolean?) -> boolean,",
 			"Update: (self: DataHandler<T, S>, transformer: (T) -> T, force: boolean?) -> (T?, boolean),",
 			"Remove: (self: DataHandler<T, S>) -> nil,",
+			"_Stage: (self: DataHandler<T, S>, encodedValue: S?) -> nil,",
+			"_Load: (self: DataHandler<T, S>) -> (S?, boolean),",
+			"_Save: (self: DataHandler<T, S>, encodedValue: S?, priority: number?) -> boolean,",
+			"_Flush: (self: DataHandler<T, S>, priority: number?) -> boolean,",
+			"_Init: (self: DataHandler<T, S>) -> boolean,",
+			] + ([
+			"_ReplicatedValue: T?,",
+			"_ReplicatedVersion: number,",
+			"_Replicate: (self: DataHandler<T, S>) -> (number, { DeltaChange }),",
+			] if replication == "delta" else []) + [
+			"_Transform: (self: DataHandler<T, S>, transformer: (S?) -> S?) -> (S?, boolean),",
+		]) + [
+		"}",
+		] + ([
+		"type DeltaChange = { any }",
+		] if replication == "delta" else []) + [
+		] + ([
+		"type Migration = {",
+		"\tVersion: { [string]: number },",
+		"\tMigrate: (scope: string, value: any) -> any,",
+		"}",
+		] if has_migrations else []) + [
+		"type DataStoreRequest = {",
+		] + indent_block([
+			"RequestType: Enum.DataStoreRequestType,",
+			"Priority: number,",
+			"Order: number,",
+			"CoalesceKey: string?,",
+			"Callback: () -> any,",
+			"Threads: { thread },",
+			"Attempts: number,",
+			"RetryAt: number,",
 		]) + [
 		"}",
 		"export type SortedDataEntry = {",
 		"\tUserId: number,",
 		"\tValue: number,",
 		"}",
+		"type Leaderboard = {",
+		] + indent_block([
+			"DataStore: OrderedDataStore,",
+			"IsAscending: boolean,",
+			"Entries: { [number]: SortedDataEntry },",
+			"Pages: DataStorePages?,",
+			"IsFinished: boolean,",
+			"RefreshedAt: number,",
+			"Loading: Signal?,",
+		]) + [
+		"}",
 		"export type NumberDataHandler = DataHandler<number, number> & {",
 		] + indent_block([
 			"ClassName: \"NumberDataHandler\",",
@@ -372,22 +1876,55 @@ def build():
 			"_Deserialize: Processor<number>,",
 			"_Value: number?,",
 			"Increment: (self: NumberDataHandler, delta: number, force: boolean?) -> (number?, boolean),",
+			"_Increment: (self: NumberDataHandler, delta: number) -> (number?, boolean),",
 			"new: (player: Player, scope: string, initialValue: number, _processor: Processor<number>?) -> NumberDataHandler,",
-			"GetSortedList: (self: NumberDataHandler, limit: number, isAscending: boolean) -> { [number]: SortedDataEntry },",
+			"GetSortedList: (self: NumberDataHandler, limit: number, isAscending: boolean?) -> { [number]: SortedDataEntry },",
 		]) + [
 		"}",
+		] + (write_document_type() if storage == "document" else []) + [
 		"export type DataTree = " + from_dict_to_type(type_tree, skip_initial_indent=True),
 		"",
 		"--Constants",
 		f"local BASE_DOMAIN = \"{domain_name}\"",
 		f"local GET_SUFFIX = \"{GET_SUFFIX_KEY}\"",
 		f"local UPDATE_SUFFIX = \"{UPDATE_SUFFIX_KEY}\"",
+		f"local SNAPSHOT_SUFFIX = \"{SNAPSHOT_SUFFIX_KEY}\"",
 		"local PAGE_LENGTH = 100",
 		"local RETRY_LIMIT = 10",
 		"local RETRY_DELAY = 0.5",
+		"-- lower values are sent first when the request budget is low",
+		"local PRIORITY_LEAVE = 1",
+		"local PRIORITY_WRITE = 2",
+		"local PRIORITY_READ = 3",
+		"local PRIORITY_AUTOSAVE = 4",
+		"local SHUTDOWN_TIMEOUT = 25",
+		"local LOAD_CONCURRENCY = 8",
+		"local LOAD_FAILED_MESSAGE = \"Your data failed to load, please rejoin\"",
+		f"local AUTOSAVE_INTERVAL = {config['autosave_interval']}",
+		f"local LEADERBOARD_INTERVAL = {config['leaderboard_interval']}",
+		f"local LEADERBOARD_SIZE = {config['leaderboard_size']}",
+		"local LEADERBOARD_PAGE_LENGTH = math.min(PAGE_LENGTH, LEADERBOARD_SIZE)",
+		"local SORTED_SCOPES = " + (from_dict({scope: True for scope in sorted_scopes}) if len(sorted_scopes) > 0 else "{}"),
+		] + ([
+		"local DOCUMENT_SCOPE = \"__document\"",
+		] if storage == "document" else []) + ([
+		"local PATH_IDS = " + from_dict(get_path_ids(schema)),
+		] if transport == "multiplexed" else []) + [
 		"local METADATA = " + from_dict(config["metadata"]),
+		] + ([
+		"local VERSION_KEYS = " + from_list(get_version_keys(config["metadata"]), indent_count=0, multi_line=False, skip_initial_indent=True),
+		"local MIGRATIONS: { Migration } = {",
+		] + indent_block([line for migration in config["migrations"] for line in [
+			"{",
+			"\tVersion = " + from_dict(migration["version"], multi_line=False, skip_initial_indent=True) + ",",
+			"\tMigrate = " + get_module_require(migration["module"]) + ",",
+			"},",
+		]]) + [
+		"}",
+		] if has_migrations else []) + [
 		"",
 		"-- Private functions",
+		] + write_request_scheduler() + write_autosave() + (write_leaf_updates(replication) if transport == "per_leaf" else []) + write_leaderboards() + (write_migration_functions() if has_migrations else []) + (write_delta_functions() if replication == "delta" else []) + [
 		"function _serializeList(unitMethod: (((val: any) -> Table) | ((val: any) -> string) | ((val: number) -> number) | ((val: boolean) -> boolean))): (val: { [number]: any }) -> Table",
 		"	return function(listVal: { [number]: any }): Table",
 		"		local out = {}",
@@ -404,251 +1941,50 @@ def build():
 		"			out[i] = (unitMethod :: any)(v)",
 		"		end",
 		"		return out",
-		"	end",
-		"end",
-		"function _serializeDict(unitMethod: (((val: any) -> Table) | ((val: any) -> string) | ((val: number) -> number) | ((val: boolean) -> boolean))): (val: { [any]: any }) -> Table",
-		"	return function(dictVal: { [any]: any }): Table",
-		"		local out = {}",
-		"		for k, v in pairs(dictVal) do",
-		"			out[k] = (unitMethod :: any)(v)",
-		"		end",
-		"		return out",
-		"	end",
-		"end",
-		"function _deserializeDict(unitMethod: (((val: string) -> any) | ((val: Table) -> any) | ((val: number) -> number) | ((val: boolean) -> boolean))): (val: Table) -> { [any]: any }",
-		"	return function(input: Table): { [any]: any }",
-		"		local out = {}",
-		"		for k, v in pairs(input) do",
-		"			out[k] = (unitMethod :: any)(v)",
-		"		end",
-		"		return out",
-		"	end",
-		"end",
-		"",
-		"local _processInteger = function(value: number): number",
-		"\treturn math.round(value)",
-		"end",
-		"local _processInt = _processInteger",
-		"local _processDouble = function(value: number): number",
-		"\treturn math.round(value*100)/100",
-		"end",
-		"local _processFloat = function(value: number): number",
-		"\treturn value",
-		"end",
-		"",
-		"",
-		"",
-		"local _serializeColor3 = function(value: Color3): string",
-		"\treturn value:ToHex()",
-		"end",
-		"local _serializeNumber = function(value: number): number",
-		"\treturn value",
-		"end",
-		"local _serializeInteger = function(value: number): number",
-		"\treturn _processInteger(value)",
-		"end",
-		"local _serializeInt = _serializeInteger",
-		"local _serializeDouble = function(value: number): number",
-		"\treturn _processDouble(value)",
-		"end",
-		"local _serializeFloat = _serializeNumber",
-		"local _serializeString = function(value: string): string",
-		"\treturn value",
-		"end",
-		"local _serializeBoolean = function(value: boolean): boolean",
-		"\treturn value",
-		"end",
-		"local _serializeDateTime = function(value: DateTime): string",
-		"\treturn value:ToIsoDate()",
-		"end",
-		"local _serializeVector3 = function(value: Vector3): Table",
-		] + indent_block([		
-			"return {",
-			] + indent_block([	
-				"X = value.X,",
-				"Y = value.Y,",
-				"Z = value.Z",
-			]) + [
-			"}",
-		]) + [	
-		"end",
-		"local _serializeVector3Integer = function(value: Vector3): Table",
-		] + indent_block([		
-			"return {",
-			] + indent_block([	
-				"X = math.round(value.X),",
-				"Y = math.round(value.Y),",
-				"Z = math.round(value.Z)",
-			]) + [
-			"}",
-		]) + [	
-		"end",
-		"local _serializeVector3Double = function(value: Vector3): Table",
-		] + indent_block([		
-			"return {",
-			] + indent_block([	
-				"X = math.round(value.X*100)/100,",
-				"Y = math.round(value.Y*100)/100,",
-				"Z = math.round(value.Z*100)/100",
-			]) + [
-			"}",
-		]) + [	
-		"end",
-		"local _serializeVector2 = function(value: Vector2): Table",
-		] + indent_block([		
-			"return {",
-			] + indent_block([	
-				"X = value.X,",
-				"Y = value.Y",
-			]) + [
-			"}",
-		]) + [	
-		"end",
-		"local _serializeVector2Integer = function(value: Vector2): Table",
-		] + indent_block([		
-			"return {",
-			] + indent_block([	
-				"X = math.round(value.X),",
-				"Y = math.round(value.Y)",
-			]) + [
-			"}",
-		]) + [	
-		"end",
-		"local _serializeVector2Double = function(value: Vector2): Table",
-		] + indent_block([		
-			"return {",
-			] + indent_block([	
-				"X = math.round(value.X*100)/100,",
-				"Y = math.round(value.Y*100)/100",
-			]) + [
-			"}",
-		]) + [	
-		"end",
-		"local _serializeCFrame = function(value: CFrame): Table",
-		] + indent_block([		
-			"local x,y,z = value:ToEulerAnglesYXZ()",
-			"return {",
-			] + indent_block([
-				"Position = _serializeVector3(value.Position),",
-				"Orientation = _serializeVector3(Vector3.new(math.deg(x), math.deg(y), math.deg(z))),",
-			]) + [
-			"}",
-		]) + [	
-		"end",
-		"local _serializeCFrameDouble = function(value: CFrame): Table",
-		] + indent_block([		
-			"local x,y,z = value:ToEulerAnglesYXZ()",
-			"return {",
-			] + indent_block([
-				"Position = _serializeVector3Double(value.Position),",
-				"Orientation = _serializeVector3Double(Vector3.new(math.deg(x), math.deg(y), math.deg(z))),",
-			]) + [
-			"}",
-		]) + [	
-		"end",
-		"local _serializeCFrameInteger = function(value: CFrame): Table",
-		] + indent_block([		
-			"local x,y,z = value:ToEulerAnglesYXZ()",
-			"return {",
-			] + indent_block([
-				"Position = _serializeVector3Integer(value.Position),",
-				"Orientation = _serializeVector3Integer(Vector3.new(math.deg(x), math.deg(y), math.deg(z))),",
-			]) + [
-			"}",
-		]) + [	
-		"end",
-		"local _serializeEnum = function(value: EnumItem): string",
-		"\treturn tostring(value.Value)",
-		"end",
-		] + type_serializers + [
-		"",
-		"",
-		"",
-		"local _deserializeString = function(value: string): string",
-		"\treturn value",
-		"end",
-		"local _deserializeNumber = function(value: number): number",
-		"\treturn value",
-		"end",
-		"local _deserializeInteger = _deserializeNumber",
-		"local _deserializeInt = _deserializeInteger",
-		"local _deserializeDouble = _deserializeNumber",
-		"local _deserializeFloat = _deserializeNumber",
-		"local _deserializeBoolean = function(value: boolean): boolean",
-		"\treturn value",
-		"end",
-		"local _deserializeColor3 = function(value: string): Color3",
-		"\treturn Color3.fromHex(value)",
-		"end",
-		"local _deserializeDateTime = function(value: string): DateTime",
-		"\treturn DateTime.fromIsoDate(value)",
-		"end",	
-		"local _deserializeVector3 = function(value: Table): Vector3",
-		] + indent_block([		
-			"return Vector3.new(value.X, value.Y, value.Z)",
-		]) + [	
-		"end",
-		"local _deserializeVector3Integer = function(value: Table): Vector3",
-		] + indent_block([		
-			"return Vector3.new(math.round(value.X), math.round(value.Y), math.round(value.Z))",
-		]) + [	
-		"end",
-		"local _deserializeVector3Double = function(value: Table): Vector3",
-		] + indent_block([		
-			"return Vector3.new(math.round(value.X*100)/100, math.round(value.Y*100)/100, math.round(value.Z*100)/100)",
-		]) + [	
-		"end",
-		"local _deserializeVector2 = function(value: Table): Vector2",
-		] + indent_block([		
-			"return Vector2.new(value.X, value.Y)",
-		]) + [	
+		"	end",
 		"end",
-		"local _deserializeVector2Integer = function(value: Table): Vector2",
-		] + indent_block([		
-			"return Vector2.new(math.round(value.X), math.round(value.Y))",
-		]) + [	
+		"function _serializeDict(unitMethod: (((val: any) -> Table) | ((val: any) -> string) | ((val: number) -> number) | ((val: boolean) -> boolean))): (val: { [any]: any }) -> Table",
+		"	return function(dictVal: { [any]: any }): Table",
+		"		local out = {}",
+		"		for k, v in pairs(dictVal) do",
+		"			out[k] = (unitMethod :: any)(v)",
+		"		end",
+		"		return out",
+		"	end",
 		"end",
-		"local _deserializeVector2Double = function(value: Table): Vector2",
-		] + indent_block([		
-			"return Vector2.new(math.round(value.X*100)/100, math.round(value.Y*100)/100)",
-		]) + [	
+		"function _deserializeDict(unitMethod: (((val: string) -> any) | ((val: Table) -> any) | ((val: number) -> number) | ((val: boolean) -> boolean))): (val: Table) -> { [any]: any }",
+		"	return function(input: Table): { [any]: any }",
+		"		local out = {}",
+		"		for k, v in pairs(input) do",
+		"			out[k] = (unitMethod :: any)(v)",
+		"		end",
+		"		return out",
+		"	end",
 		"end",
-		"local _deserializeCFrame = function(value: Table): CFrame",
-		] + indent_block([		
-			"local position = _deserializeVector3(value[\"Position\"])",
-			"local orientation = _deserializeVector3(value[\"Orientation\"])",
-			"return CFrame.fromEulerAnglesYXZ(",
-			"\tmath.rad(orientation.X),",
-			"\tmath.rad(orientation.Y),",
-			"\tmath.rad(orientation.Z)",
-			") + position"
-		]) + [	
+		"",
+		"local _processInteger = function(value: number): number",
+		"\treturn math.round(value)",
 		"end",
-		"local _deserializeCFrameInteger = function(value: Table): CFrame",
-		] + indent_block([		
-			"local position = _deserializeVector3Integer(value[\"Position\"])",
-			"local orientation = _deserializeVector3Integer(value[\"Orientation\"])",
-			"return CFrame.fromEulerAnglesYXZ(",
-			"\tmath.rad(orientation.X),",
-			"\tmath.rad(orientation.Y),",
-			"\tmath.rad(orientation.Z)",
-			") + position"
-		]) + [	
+		"local _processInt = _processInteger",
+		"local _processDouble = function(value: number): number",
+		"\treturn math.round(value*100)/100",
 		"end",
-		"local _deserializeCFrameDouble = function(value: Table): CFrame",
-		] + indent_block([		
-			"local position = _deserializeVector3Double(value[\"Position\"])",
-			"local orientation = _deserializeVector3Double(value[\"Orientation\"])",
-			"return CFrame.fromEulerAnglesYXZ(",
-			"\tmath.rad(orientation.X),",
-			"\tmath.rad(orientation.Y),",
-			"\tmath.rad(orientation.Z)",
-			") + position"
-		]) + [	
+		"local _processFloat = function(value: number): number",
+		"\treturn value",
 		"end",
+		"",
+		"",
+		"",
+		] + write_builtin_serializers(codec) + [
+		] + type_serializers + [
+		"",
+		"",
+		"",
+		] + write_builtin_deserializers(codec) + (write_enum_deserializer_factory() if len(schema["enums"]) > 0 else []) + (write_table_codecs(codec) if serializers == "tables" else []) + [
 		] + enum_deserializers + type_deserializers + [
 		"",
 		"--Class",
+		] + (write_document_class(has_migrations) if storage == "document" else []) + [
 		"local DataHandler: DataHandler<any, string> = {} :: any",
 		"DataHandler.__index = DataHandler",
 		"",
@@ -659,7 +1995,15 @@ def build():
 			"end",
 			"",
 			"self._IsAlive = false",
-			"self:Set(self._Value, true)",
+			] + ([
+			# the document is saved once for every handler when it's destroyed
+			] if storage == "document" else [
+			"dirtyObjects[self] = nil",
+			"if self._IsDirty then",
+			"\t-- saved in the background so leaving players don't block each other",
+			"\ttask.spawn(self._Save, self, self._EncodedValue, PRIORITY_LEAVE)",
+			"end",
+			]) + [
 			"self._Maid:Destroy()",
 			"local t: any = self",
 			"for k, v in pairs(t) do",
@@ -669,141 +2013,56 @@ def build():
 			"return nil",
 		]) + [	
 		"end",
+		] + write_storage_methods(storage, has_migrations) + [
 		"function DataHandler:Set(data: any, force: boolean?)",
 		] + indent_block([	
 			"local initialValue = self._EncodedValue",
-			"local function set()",
-			] + indent_block([	
-				"local success, errorMessage = pcall(function()",
-				"\tself.DataStore:SetAsync(self.Key, self._Serialize(data), { self.Player.UserId }, self.SetOptions)",
-				"end)",
-				"if not success then",
-				"\twarn(errorMessage)",
-				"end",
-				"return success",
-			]) + [	
-			"end",
-			"local success",	
+			"local encodedValue = if data ~= nil then self._Serialize(data) else nil",
+			"self:_Stage(encodedValue)",
+			"",
+			"local success = true",
 			"if force then",
-			] + indent_block([
-				"local attempts = 0",
-				"repeat",
-				] + indent_block([
-					"attempts += 1",
-					"success = set()",
-					"if not success then",
-					"\ttask.wait(RETRY_DELAY)",
-					"end",
-				]) + [
-				"until success or attempts > RETRY_LIMIT",
-			]) + [
-			"else",
-			"\tsuccess = true",
+			"\tsuccess = self:_Save(encodedValue)",
 			"end",
-			"\tif data then",
-			] + indent_block([
-				] + indent_block([
-					"if type(data) == \"string\" then",
-					"\tself._EncodedValue = self._Serialize(data) -- Base64.Encode(self._Serialize(data))",
-					"else",
-					"\tself._EncodedValue = self._Serialize(data)",
-					"end",
-				]) + [
-			]) + [
-			"\telse",
-			"\t\tself._EncodedValue = nil",
-			"\tend",
-			"\tif self._EncodedValue then",
-			] + indent_block([
-				] + indent_block([
-					"if type(self._EncodedValue) == \"string\" then",
-					"\tself._Value = self._Deserialize(self._EncodedValue) -- self._Deserialize(Base64.Decode(self._EncodedValue))",
-					"else",
-					"\t\tself._Value = self._Deserialize(self._EncodedValue)",
-					"end",
-				]) + [
-			]) + [
-			"\telse",
-			"\t\tself._Value = nil",
-			"\tend",	
-			"if initialValue ~= data then",
+			"",
+			"self._EncodedValue = encodedValue",
+			"self._Value = if encodedValue ~= nil then self._Deserialize(encodedValue) else nil",
+			"if initialValue ~= encodedValue then",
 			"\tself.OnChanged:Fire(self._Value)",
 			"end",
 			"return success",
 		]) + [
 		"end",
-		""
+		"",
 		"function DataHandler:Update(transformer: (any) -> any, force: boolean?)",
 		] + indent_block([
 			"local initialValue = self._EncodedValue",
 			"local function transformerWrapper(rawValue: any)",
-			"\t return self._Serialize(transformer(self._Deserialize(rawValue)))",
-			"end",
-			"local function update()",
-			] + indent_block([	
-				"local value = self._EncodedValue",
-				"local success, msg = pcall(function()",
-				"	value = self.DataStore:UpdateAsync(self.Key, transformerWrapper)",
-				"end)",
-				"if not success then",
-				"	warn(msg)",
-				"end",
-				"return value, success",
-			]) + [	
+			"\treturn self._Serialize(transformer(self._Deserialize(rawValue)))",
 			"end",
 			"",
-			"local value, success",
+			"local encodedValue, success",
 			"if force then",
-			] + indent_block([	
-				"local attempts = 0",
-				"repeat",
-				] + indent_block([		
-					"attempts += 1",
-					"value, success = update()",
-					"if not success then",
-					"\ttask.wait(RETRY_DELAY)",
-					"end",
-				]) + [		
-				"until success or attempts > RETRY_LIMIT",
-				"if success then",
-				"\tself._EncodedValue = value",
+			] + indent_block([
+				"encodedValue, success = self:_Transform(transformerWrapper)",
+				"if not success then",
+				"\treturn self._Value, false",
 				"end",
-			]) + [		
+			]) + [
 			"else",
-			"\tvalue = transformerWrapper(initialValue)",
-			"\tif value then",
 			] + indent_block([
-				] + indent_block([
-					"if type(value) == \"string\" then",
-					"\tself._EncodedValue = self._Serialize(value) -- Base64.Encode(self._Serialize(value))",
-					"else",
-					"\tself._EncodedValue = self._Serialize(value)",
-					"end",
-				]) + [
+				"encodedValue, success = transformerWrapper(initialValue), true",
+				"self:_Stage(encodedValue)",
 			]) + [
-			"\telse",
-			"\t\tself._EncodedValue = nil",
-			"\tend",
 			"end",
-			"\tif self._EncodedValue then",
-			] + indent_block([
-				] + indent_block([
-					"if type(self._EncodedValue) == \"string\" then",
-					"\tself._Value = self._Deserialize(self._EncodedValue) -- self._Deserialize(Base64.Decode(self._EncodedValue))",
-					"else",
-					"\t\tself._Value = self._Deserialize(self._EncodedValue)",
-					"end",
-				]) + [
-			]) + [
-			
-			"\telse",
-			"\t\tself._Value = nil",
-			"\tend",	
-			"if initialValue ~= value then",
+			"",
+			"self._EncodedValue = encodedValue",
+			"self._Value = if encodedValue ~= nil then self._Deserialize(encodedValue) else nil",
+			"if initialValue ~= encodedValue then",
 			"\tself.OnChanged:Fire(self._Value)",
 			"end",
 			"return self._Value, success",
-			]) + [
+		]) + [
 		"end",
 		"",
 		"function DataHandler:Get(force: boolean?): (any?, boolean)",
@@ -812,56 +2071,21 @@ def build():
 			"\treturn self._Value, true",
 			"end",
 			"",
-			"local function get()",
-				] + indent_block([		
-					"local data",
-					"local success, msg = pcall(function()",
-					"\tdata = self.DataStore:GetAsync(self.Key)",
-					"end)",
-					"if not success then",
-					"\twarn(msg)",
-					"end",
-					"return data, success",
-				]) + [		
-			"end",
-			"",
-			"local data, success",
-			"local attempts = 0",
-			"repeat",
-			] + indent_block([			
-				"attempts += 1",
-				"data, success = get()",
-				"if not success then",
-				"\ttask.wait(RETRY_DELAY)",
-				"end",
-			]) + [	
-			"until success or attempts > RETRY_LIMIT",
-			"",
-			"if success then",
+			"local data, success = self:_Load()",
+			"if success and self._IsAlive then",
 			"\tself._EncodedValue = data",
-			"\tif self._EncodedValue then",
-			] + indent_block([
-				] + indent_block([
-					"if type(self._EncodedValue) == \"string\" then",
-					"\tself._Value = self._Deserialize(self._EncodedValue) -- self._Deserialize(Base64.Decode(self._EncodedValue))",
-					"else",
-					"\t\tself._Value = self._Deserialize(self._EncodedValue)",
-					"end",
-				]) + [
-			]) + [
-			"\telse",
-			"\t\tself._Value = nil",
-			"\tend",
+			"\tself._Value = if data ~= nil then self._Deserialize(data) else nil",
 			"end",
 			"",
 			"return self._Value, success",
 		]) + [
 		"end",
 		"",	
-		"function DataHandler.new(player: Player, scope: string, initialValue: any, _serializer: Serializer<any, any>?, _deserializer: Deserializer<any, any>?)",
+		"function DataHandler.new(player: Player, scope: string, initialValue: any, _serializer: Serializer<any, any>?, _deserializer: Deserializer<any, any>?" + (", document: PlayerDocument" if storage == "document" else "") + ")",
 		] + indent_block([		
 			"local maid = Maid.new()",
 			"",
+			] + ([
 			"local dataStoreOptions = Instance.new(\"DataStoreOptions\")",
 			"maid:GiveTask(dataStoreOptions)",
 			"",
@@ -869,6 +2093,7 @@ def build():
 			"maid:GiveTask(setOptions)",
 			"setOptions:SetMetadata(METADATA)",
 			"",
+			] if storage == "leaf" else []) + [
 			"local onChanged = Signal.new()",
 			"maid:GiveTask(onChanged)",
 			"",
@@ -876,172 +2101,168 @@ def build():
 			] + indent_block([		
 				"_Maid = maid,",
 				"_IsAlive = true,",
+				"_IsLoaded = false,",
+				"_IsDirty = false,",
 				"_Serialize = if _serializer then",
 				"\tfunction(v: any)",
-				"\t\treturn if type(v) == \"table\" then Base64.Encode(HttpService:JSONEncode(_serializer(v))) else v",
+				"\t\tif type(v) == \"table\" then",
+				"\t\t\treturn " + ("HttpService:JSONEncode(_serializer(v))" if codec == "compact" else "Base64.Encode(HttpService:JSONEncode(_serializer(v)))"),
+				"\t\tend",
+				"\t\t-- enum items can't be stored, so they're saved as their value",
+				"\t\treturn if typeof(v) == \"EnumItem\" then _serializer(v) else v",
 				"\tend",
 				"else function(v: any) return v end,",
 				"_Deserialize = if _deserializer then ",
 				"\tfunction(v: any)",
 				"\t\tlocal out: any",
 				"\t\tlocal success, _msg = pcall(function()",
-				"\t\t\tout = _deserializer(HttpService:JSONDecode(Base64.Decode(v)))",
+				"\t\t\tout = _deserializer(HttpService:JSONDecode(" + ("v" if codec == "compact" else "Base64.Decode(v)") + "))",
 				"\t\tend)",
-				"\t\treturn if success then out else v"
+				"\t\tif not success then",
+				"\t\t\tsuccess, _msg = pcall(function()",
+				"\t\t\t\tout = _deserializer(v)",
+				"\t\t\tend)",
+				"\t\tend",
+				"\t\treturn if success then out else v",
 				"\tend",
 				"else function(v: any) return v end,",
-				# "_Serialize = if _serializer then _serializer else function(v: any) return v end,",
-				# "_Deserialize = if _deserializer then _deserializer else function(v: any) return v end,",
 				"OnChanged = onChanged,",
-				"DataStore =  DataStoreService:GetDataStore(BASE_DOMAIN, scope, dataStoreOptions),",
+				"ClassName = \"DataHandler\",",
+				] + ([
+				"_Document = document,",
+				"DataStore = document.DataStore,",
+				"SetOptions = document.SetOptions,",
+				] if storage == "document" else [
+				"DataStore = DataStoreService:GetDataStore(BASE_DOMAIN, scope, dataStoreOptions),",
+				"SetOptions = setOptions,",
+				]) + [
 				"_Value = initialValue,",
+				] + ([
+				"_ReplicatedValue = nil,",
+				"_ReplicatedVersion = 0,",
+				] if replication == "delta" else []) + [
+				"Scope = scope,",
 				"Key = tostring(player.UserId),",
-				"SetOptions = setOptions,",
 				"Player = player,",
 			]) + [
 			"}, DataHandler) :: any",
 			"",
-			"if RunService:IsRunning() then",
-			] + indent_block([				
-				"local updateEvent = NetworkUtil.getRemoteEvent(scope .. \"_\" .. UPDATE_SUFFIX, player)",
-				"maid:GiveTask(updateEvent)",
-				"",
-				"maid:GiveTask(onChanged:Connect(function(v: any)",
-				"\tupdateEvent:FireClient(player, v)",
-				"end))",
-				"",
-				"local getFunction = NetworkUtil.getRemoteFunction(scope .. \"_\" .. GET_SUFFIX, player)",
-				"maid:GiveTask(getFunction)",
-				"getFunction.OnServerInvoke = function(plr: Player)",
-				] + indent_block([	
-					"if player.UserId == plr.UserId then",
+			] + ([
+				"local fireUpdate: (...any) -> ()",
+				"if RunService:IsRunning() then",
+				] + indent_block([				
+					"local updateEvent = NetworkUtil.getRemoteEvent(scope .. \"_\" .. UPDATE_SUFFIX, player)",
+					"maid:GiveTask(updateEvent)",
+					"fireUpdate = function(...: any)",
+					"\tupdateEvent:FireClient(player, ...)",
+					"end",
+					"",
+					"local getFunction = NetworkUtil.getRemoteFunction(scope .. \"_\" .. GET_SUFFIX, player)",
+					"maid:GiveTask(getFunction)",
+					"getFunction.OnServerInvoke = function(plr: Player)",
+					] + indent_block([	
+						"if player.UserId == plr.UserId then",
+						] + ([
+						"\t-- the client starts from this version, so older changes still in flight are ignored",
+						"\tself:_Replicate()",
+						"\treturn self._ReplicatedValue, self._ReplicatedVersion",
+						] if replication == "delta" else [
+						"\treturn self._Value",
+						]) + [
+						"end",
+						"error(\"Bad player\")",
+					]) + [
+					"end",
+				]) + [		
+				"else",
+				] + indent_block([			
+					"local updateEvent = NetworkUtil.getBindableEvent(scope .. \"_\" .. UPDATE_SUFFIX)",
+					"maid:GiveTask(updateEvent)",
+					"fireUpdate = function(...: any)",
+					"\tupdateEvent:Fire(...)",
+					"end",
+					"",
+					"local getFunction = NetworkUtil.getBindableFunction(scope .. \"_\" .. GET_SUFFIX)",
+					"maid:GiveTask(getFunction)",
+					"getFunction.OnInvoke = function()",
+					] + ([
+					"\tself:_Replicate()",
+					"\treturn self._ReplicatedValue, self._ReplicatedVersion",
+					] if replication == "delta" else [
 					"\treturn self._Value",
+					]) + [
 					"end",
-					"error(\"Bad player\")",
-				]) + [
+				]) + [		
 				"end",
-			]) + [		
-			"else",
-			] + indent_block([			
-				"local updateEvent = NetworkUtil.getBindableEvent(scope .. \"_\" .. UPDATE_SUFFIX)",
-				"maid:GiveTask(updateEvent)",
-				"",
-				"maid:GiveTask(onChanged:Connect(function(v: any)",
-				"\tupdateEvent:Fire(v)",
+				"maid:GiveTask(onChanged:Connect(function()",
+				"\tpendingUpdates[self] = fireUpdate",
 				"end))",
 				"",
-				"local getFunction = NetworkUtil.getBindableFunction(scope .. \"_\" .. GET_SUFFIX)",
-				"maid:GiveTask(getFunction)",
-				"getFunction.OnInvoke = function()",
-				"\treturn self._Value",
-				"end",
-			]) + [		
-			"end",
-			"",
-			"self._Value = self:Get(true)",
-			"if self._Value == nil then self._Value = initialValue end",
+			] if transport == "per_leaf" else []) + [
 			"return self",
 		]) + [
 		"end",
 		"",
-		"local NumberDataHandler = {}",
-		"NumberDataHandler.__index = NumberDataHandler",
-		"setmetatable(NumberDataHandler, DataHandler)",
+		] + ([
+		"-- returns the changes since the value was last replicated, the version only goes up when there are any",
+		"function DataHandler:_Replicate(): (number, { DeltaChange })",
+		] + indent_block([
+			"local changes = {}",
+			"_diff(self._ReplicatedValue, self._Value, {}, changes)",
+			"if #changes > 0 then",
+			"\tself._ReplicatedValue = _copy(self._Value)",
+			"\tself._ReplicatedVersion += 1",
+			"end",
+			"return self._ReplicatedVersion, changes",
+		]) + [
+		"end",
 		"",
-		"-- @TODO",
-		"function NumberDataHandler:GetSortedList(player: Player, limit: number, isAscending: boolean)",
-		] + indent_block([	
-			"local pages = self.Datastore:GetSortedAsync(isAscending, PAGE_LENGTH)",
-			"",
-			"local list: { [number]: SortedDataEntry } = {}",
-			"local function dumpPages()",
-			] + indent_block([	
-				"local page = pages:GetCurrentPage()",
-				"",
-				"for rank: number, data in ipairs(page) do",
-				] + indent_block([	
-					"if #list >= limit then",
-					"\tbreak",
-					"end",
-					"local key = data.key",
-					"local value = data.value",
-					"table.insert(list, {",
-					"\tUserId = tonumber(key) :: number,",
-					"\tValue = value,",
-				"})",
-				]) + [	
+		] if replication == "delta" else []) + [
+		"-- loads the stored value, falling back to the initial value when nothing was stored",
+		"function DataHandler:_Init(): boolean",
+		] + indent_block([
+			"local initialValue = self._Value",
+			"local value, success = self:Get(true)",
+			"if not success or not self._IsAlive then",
+			"\t-- left unloaded, so the default is never saved over the stored value",
+			"\treturn false",
 			"end",
 			"",
-			"local success",
-			"local attempts = 0",
-			"repeat",
-			] + indent_block([	
-				"success = pcall(function() end)",
-				"attempts += 1",
-				"if not success then",
-				"\ttask.wait(RETRY_DELAY)",
-				"end",
+			"self._IsLoaded = true",
+			"if value == nil then",
+			] + indent_block([
+				"local encodedValue = if initialValue ~= nil then self._Serialize(initialValue) else nil",
+				"self:_Stage(encodedValue)",
+				"self._Value = initialValue",
+				"self._EncodedValue = encodedValue",
 			]) + [
-			"until success or attempts > RETRY_LIMIT",
-			"",
-			"if success and #list < limit then",
-			"\tpages:AdvanceToNextPageAsync()",
-			"\tdumpPages()",
 			"end",
-		]) + [	
+			"return true",
+		]) + [
 		"end",
-		"dumpPages()",
 		"",
-		"return list",
-		]) + [	
+		"local NumberDataHandler = {}",
+		"NumberDataHandler.__index = NumberDataHandler",
+		"setmetatable(NumberDataHandler, DataHandler)",
+		"",
+		"-- the top values of this path across every player, see _getSortedList",
+		"function NumberDataHandler:GetSortedList(limit: number, isAscending: boolean?): { [number]: SortedDataEntry }",
+		"\treturn _getSortedList(self.Scope, limit, isAscending == true)",
 		"end",
 		"",
 		"function NumberDataHandler:Increment(delta: number, force: boolean?)",
-			] + indent_block([	
-			"local function increment()",
-			] + indent_block([	
-				"local value = self._EncodedValue",
-				"local success, msg = pcall(function()",
-				] + indent_block([	
-					"local val = self.DataStore:IncrementAsync(self.Key, delta, { self.Player.UserId }, self.IncrementOptions)",
-					"value = val",
-					"return val",
-				]) + [
-				"end)",
-				"if not success then",
-				"\twarn(msg)",
-				"end",
-				"return value, success",
-			]) + [
-			"end",
-			"",
+		] + indent_block([	
 			"local value, success",
-			"",
 			"if force then",
-			] + indent_block([	
-				"local attempts = 0",
-				"repeat",
-				] + indent_block([	
-					"attempts += 1",
-					"value, success = increment()",
-					"if not success then",
-					"\ttask.wait(RETRY_DELAY)",
-					"end",
-				]) + [
-				"until success or attempts > RETRY_LIMIT",
-				"if success then",
-				"\tself._EncodedValue = value",
-				"\tself._Value = self.Deserialize(self._EncodedValue)"
-				"end"
-			]) + [
+			"\tvalue, success = self:_Increment(delta)",
 			"else",
-			] + indent_block([	
-				"local val: number = self._EncodedValue",
-				"val += delta",
-				"self._EncodedValue = val",
-				"self._Value = self.Deserialize(self._EncodedValue)",
-				"success = true",
-			]) + [
+			"\tvalue, success = (self._EncodedValue or 0) + delta, true",
+			"\tself:_Stage(value)",
+			"end",
+			"",
+			"if success then",
+			"\tself._EncodedValue = value",
+			"\tself._Value = self._Deserialize(value)",
 			"end",
 			"",
 			"if success and delta ~= 0 then",
@@ -1052,11 +2273,15 @@ def build():
 		]) + [	
 		"end",
 		"",
-		"function NumberDataHandler.new(player: Player, scope: string, initialValue: number, _processor: Processor<number>?): NumberDataHandler",
+		"function NumberDataHandler.new(player: Player, scope: string, initialValue: number, _processor: Processor<number>?" + (", document: PlayerDocument" if storage == "document" else "") + "): NumberDataHandler",
 		] + indent_block([	
-			"local self: NumberDataHandler = setmetatable(DataHandler.new(player, scope, initialValue, _processor :: any, _processor :: any), NumberDataHandler) :: any",
+			"local self: NumberDataHandler = setmetatable(DataHandler.new(player, scope, initialValue, _processor :: any, _processor :: any" + (", document" if storage == "document" else "") + "), NumberDataHandler) :: any",
 			"",
+			"self.ClassName = \"NumberDataHandler\"",
 			"self.DataStore = DataStoreService:GetOrderedDataStore(BASE_DOMAIN, scope)",
+			] + ([
+			"document:AddOrderedDataStore(scope, self.DataStore)",
+			] if storage == "document" else []) + [
 			"",
 			"local incrementOptions = Instance.new(\"DataStoreIncrementOptions\")",
 			"self._Maid:GiveTask(incrementOptions)",
@@ -1068,13 +2293,61 @@ def build():
 		]) + [	
 		"end",
 		"local trees: { [number]: any } = {}",
+		"-- created on demand for callers waiting on a tree that isn't ready yet",
+		"local readySignals: { [number]: Signal } = {}",
+		"",
+		"-- loads the handlers with at most LOAD_CONCURRENCY of them waiting on the DataStore at once",
+		"function _loadHandlers(handlers: { DataHandler<any, any> }, onLoaded: (success: boolean) -> ())",
+		] + indent_block([
+			"local nextIndex = 1",
+			"local workerCount = math.min(LOAD_CONCURRENCY, #handlers)",
+			"if workerCount == 0 then",
+			"\tonLoaded(true)",
+			"\treturn",
+			"end",
+			"",
+			"local success = true",
+			"local function work()",
+			] + indent_block([
+				"while nextIndex <= #handlers do",
+				"\tlocal handler = handlers[nextIndex]",
+				"\tnextIndex += 1",
+				"\tif handler._IsAlive and not handler:_Init() then",
+				"\t\tsuccess = false",
+				"\tend",
+				"end",
+				"workerCount -= 1",
+				"if workerCount == 0 then",
+				"\tonLoaded(success)",
+				"end",
+			]) + [
+			"end",
+			"for i = 1, workerCount do",
+			"\ttask.spawn(work)",
+			"end",
+		]) + [
+		"end",
 		"",
 		"function initPlayer(playerMaid: Maid, player: Player)",
 		] + indent_block([	
+			] + ([
+			"local document = PlayerDocument.new(player)",
+			"playerMaid:GiveTask(document)",
+			"",
+			] if storage == "document" else []) + [
+			"local handlers: { DataHandler<any, any> } = {}",
+			] + ([
+			"local handlersById: { [number]: DataHandler<any, any> } = {}",
+			] if transport == "multiplexed" else []) + [
+			"",
 			"local function _newDataHandler<G, S>(path: string, val: any, _serializer: Serializer<G,S>?, _deserializer: Deserializer<S, G>?): DataHandler<G, S>",
 			] + indent_block([	
-				"local handler: DataHandler<G,S> = DataHandler.new(player, path, val, _serializer :: any, _deserializer :: any) :: any",
+				"local handler: DataHandler<G,S> = DataHandler.new(player, path, val, _serializer :: any, _deserializer :: any" + (", document" if storage == "document" else "") + ") :: any",
 				"playerMaid:GiveTask(handler)",
+				"table.insert(handlers, handler :: any)",
+				] + ([
+				"handlersById[PATH_IDS[path]] = handler :: any",
+				] if transport == "multiplexed" else []) + [
 				"",
 				"return handler",
 			]) + [
@@ -1082,8 +2355,12 @@ def build():
 			"",
 			"local function _newNumberHandler(path: string, val: number, _processor: Processor<number>?): NumberDataHandler",
 			] + indent_block([	
-				"local handler: NumberDataHandler = NumberDataHandler.new(player, path, val, _processor) :: any",
+				"local handler: NumberDataHandler = NumberDataHandler.new(player, path, val, _processor" + (", document" if storage == "document" else "") + ") :: any",
 				"playerMaid:GiveTask(handler)",
+				"table.insert(handlers, handler :: any)",
+				] + ([
+				"handlersById[PATH_IDS[path]] = handler :: any",
+				] if transport == "multiplexed" else []) + [
 				"",
 				"return handler",
 			]) + [
@@ -1091,7 +2368,40 @@ def build():
 			"",
 			] + out_variable_content + [
 			"local tree: DataTree = " + from_dict(func_tree, indent_count=2, add_comma_at_end=False, skip_initial_indent=True),
-			"trees[player.UserId] = tree",
+			"",
+			] + (write_channel(replication) if transport == "multiplexed" else []) + [
+			"-- the tree is only handed out once every value has loaded",
+			"local isAlive = true",
+			"local isLoaded = false",
+			"local onLoaded = Signal.new()",
+			"playerMaid:GiveTask(onLoaded)",
+			"playerMaid:GiveTask(function()",
+			"\tisAlive = false",
+			"end)",
+			"",
+			] + write_snapshot_function(replication) + [
+			"_loadHandlers(handlers, function(success: boolean)",
+			] + indent_block([
+				"if not isAlive then",
+				"\treturn",
+				"end",
+				"if not success then",
+				"\t-- a partly loaded tree is never handed out, as its defaults could be saved over the stored data",
+				"\tplayer:Kick(LOAD_FAILED_MESSAGE)",
+				"\treturn",
+				"end",
+				"isLoaded = true",
+				"onLoaded:Fire()",
+				"trees[player.UserId] = tree",
+				"",
+				"local onReady = readySignals[player.UserId]",
+				"if onReady then",
+				"\treadySignals[player.UserId] = nil",
+				"\tonReady:Fire(tree)",
+				"\tonReady:Destroy()",
+				"end",
+			]) + [
+			"end)",
 		]) + [
 		"end",
 		"",
@@ -1099,10 +2409,36 @@ def build():
 		] + indent_block([	
 			"init = function(maid: Maid): nil",
 			] + indent_block([	
+				"local playersMaid = Maid.new()",
+				"maid:GiveTask(playersMaid)",
+				"",
+				"maid:GiveTask(RunService.Heartbeat:Connect(_drainRequests))",
+				] + ([
+				"maid:GiveTask(RunService.Heartbeat:Connect(_flushUpdates))",
+				] if transport == "per_leaf" else []) + [
+				"if AUTOSAVE_INTERVAL > 0 then",
+				] + indent_block([
+					"local lastAutosave = os.clock()",
+					"maid:GiveTask(RunService.Heartbeat:Connect(function()",
+					"\tif os.clock() - lastAutosave >= AUTOSAVE_INTERVAL then",
+					"\t\tlastAutosave = os.clock()",
+					"\t\t_autosave()",
+					"\tend",
+					"end))",
+				]) + [
+				"end",
+				"if RunService:IsRunning() then",
+				"\tgame:BindToClose(function()",
+				"\t\t-- queue the remaining saves, then wait for them to go through",
+				"\t\tplayersMaid:Destroy()",
+				"\t\t_flushRequests(SHUTDOWN_TIMEOUT)",
+				"\tend)",
+				"end",
+				"",
 				"local function onPlayerAdded(player: Player)",
 				] + indent_block([	
 				"local playerMaid = Maid.new()",
-				"maid:GiveTask(playerMaid)",
+				"playersMaid:GiveTask(playerMaid)",
 				"initPlayer(playerMaid, player)",
 				"playerMaid:GiveTask(player.Destroying:Connect(function()",
 				"\ttrees[player.UserId] = nil",
@@ -1119,27 +2455,57 @@ def build():
 				"return nil",
 			]) + [
 			"end,",
+			"getSortedList = function(path: string, limit: number, isAscending: boolean?): { [number]: SortedDataEntry }",
+			"\tassert(SORTED_SCOPES[path], path .. \" isn't a number value\")",
+			"\treturn _getSortedList(path, limit, isAscending == true)",
+			"end,",
 			"get = function(userId: number, yieldDuration: number?): DataTree?",
 			] + indent_block([	
-				"local function get()",
-				"\treturn trees[userId]",
+				"local tree = trees[userId]",
+				"if tree or not yieldDuration then",
+				"\treturn tree",
 				"end",
-				"local tree = get()",
-				"if not tree and yieldDuration then",
-				] + indent_block([	
-					"local start = tick()",
-					"repeat",
-					"\ttask.wait()",
-					"\ttree = get()",
-					"until tree or tick() - start > yieldDuration",
-					"return tree",
+				"",
+				"local onReady = readySignals[userId]",
+				"if not onReady then",
+				"\tonReady = Signal.new()",
+				"\treadySignals[userId] = onReady",
+				"end",
+				"assert(onReady)",
+				"",
+				"-- resumed exactly once, by whichever comes first of the tree being ready or the timeout",
+				"local thread = coroutine.running()",
+				"local isResumed = false",
+				"local connection",
+				"local function resume(readyTree: DataTree?)",
+				] + indent_block([
+					"if isResumed then",
+					"\treturn",
+					"end",
+					"isResumed = true",
+					"connection:Disconnect()",
+					"task.spawn(thread, readyTree)",
 				]) + [
-				"else",
-				"\treturn tree",
 				"end",
+				"connection = onReady:Connect(function(readyTree: DataTree)",
+				"\tresume(readyTree)",
+				"\treturn nil",
+				"end)",
+				"task.delay(yieldDuration, function()",
+				] + indent_block([
+					"resume(trees[userId])",
+					"if readySignals[userId] == onReady and #onReady:GetConnections() == 0 then",
+					"\t-- nobody else is waiting on a player that never showed up",
+					"\treadySignals[userId] = nil",
+					"\tonReady:Destroy()",
+					"end",
+				]) + [
+				"end)",
+				"return coroutine.yield()",
 			]) + [
 			"end,",
 		]) + [
 		"}",
 	]
 	write_script(build_path, "\n".join(content), packages_dir_zip_file_path=get_package_zip_path(), skip_source_map=True)
+	return get_script_path(build_path, write_as_directory=True)
@@ -0,0 +1,365 @@
+import csv
+import json
+import base64
+import heapq
+from datetime import datetime, timezone
+from typing import Any, BinaryIO, Iterable, Iterator, TypedDict
+from src.config import CodecMode
+from src.schema import DataSchema, CustomType, ParsedType, TreeLeaf, parse_type
+from src.lock import WORD_BIT_COUNT
+
+# matches the scope the server saves a player's document under
+DOCUMENT_SCOPE = "__document"
+KEY_COLUMN = "UserId"
+
+NUMBER_TYPES = ["Integer", "int", "Float", "float", "Double", "double", "number"]
+
+class SnapshotEntry(TypedDict):
+	key: str
+	scope: str
+	value: Any
+
+def _get_if_packed(parsed_type: ParsedType) -> bool:
+	return parsed_type["container"] is None and parsed_type["raw_name"] == "boolean"
+
+def _get_item_type(schema: DataSchema, parsed_type: ParsedType) -> ParsedType:
+	item_name = parsed_type["item_name"]
+	assert item_name
+	return parse_type(item_name, schema["types"])
+
+def _round(type_name: str, value: float) -> float:
+	if type_name in ["Integer", "int"] or type_name.endswith("Integer"):
+		return round(value)
+	elif type_name in ["Double", "double"] or type_name.endswith("Double"):
+		return round(value*100)/100
+	return value
+
+def _to_iso_date(timestamp_millis: int) -> str:
+	return datetime.fromtimestamp(timestamp_millis/1000, tz=timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+def _from_iso_date(iso_date: str) -> int:
+	return round(datetime.fromisoformat(iso_date.replace("Z", "+00:00")).timestamp()*1000)
+
+# values are decoded into the shape the json codec saves them in, with enums as their option names or numbers
+def decode_value(schema: DataSchema, parsed_type: ParsedType, value: Any) -> Any:
+	if value is None:
+		return None
+	codec = schema["config"]["codec"]
+	container = parsed_type["container"]
+	if container == "List":
+		item_type = _get_item_type(schema, parsed_type)
+		return [decode_value(schema, item_type, item) for item in value]
+	elif container == "Dict":
+		item_type = _get_item_type(schema, parsed_type)
+		return {k: decode_value(schema, item_type, v) for k, v in value.items()}
+
+	raw_name = parsed_type["raw_name"]
+	custom_type = schema["types"].get(raw_name)
+	if custom_type is not None and custom_type["options"] is not None:
+		return custom_type["options"][int(value) - 1]
+	elif custom_type is not None:
+		return _decode_custom_type(schema, custom_type, value)
+	elif parsed_type["enum_name"] is not None:
+		return int(value)
+	elif codec == "compact":
+		return _decode_compact_builtin(raw_name, value)
+	return value
+
+def encode_value(schema: DataSchema, parsed_type: ParsedType, value: Any) -> Any:
+	if value is None:
+		return None
+	codec = schema["config"]["codec"]
+	container = parsed_type["container"]
+	if container == "List":
+		item_type = _get_item_type(schema, parsed_type)
+		return [encode_value(schema, item_type, item) for item in value]
+	elif container == "Dict":
+		item_type = _get_item_type(schema, parsed_type)
+		return {k: encode_value(schema, item_type, v) for k, v in value.items()}
+
+	raw_name = parsed_type["raw_name"]
+	custom_type = schema["types"].get(raw_name)
+	if custom_type is not None and custom_type["options"] is not None:
+		index = custom_type["options"].index(value) + 1
+		return index if codec == "compact" else str(index)
+	elif custom_type is not None:
+		return _encode_custom_type(schema, custom_type, value)
+	elif parsed_type["enum_name"] is not None:
+		return int(value) if codec == "compact" else str(int(value))
+	elif codec == "compact":
+		return _encode_compact_builtin(raw_name, value)
+	elif raw_name in NUMBER_TYPES:
+		return _round(raw_name, value)
+	elif raw_name.startswith("Vector"):
+		return {axis: _round(raw_name, component) for axis, component in value.items()}
+	elif raw_name.startswith("CFrame"):
+		return {name: {axis: _round(raw_name, component) for axis, component in vector.items()} for name, vector in value.items()}
+	return value
+
+def _decode_compact_builtin(raw_name: str, value: Any) -> Any:
+	if raw_name == "Color3":
+		return f"{int(value):06x}"
+	elif raw_name == "DateTime":
+		return _to_iso_date(value)
+	elif raw_name.startswith("Vector"):
+		return dict(zip(["X", "Y", "Z"], value))
+	elif raw_name.startswith("CFrame"):
+		return {
+			"Position": dict(zip(["X", "Y", "Z"], value[0:3])),
+			"Orientation": dict(zip(["X", "Y", "Z"], value[3:6])),
+		}
+	return value
+
+def _encode_compact_builtin(raw_name: str, value: Any) -> Any:
+	if raw_name == "Color3":
+		return int(value.lstrip("#"), 16)
+	elif raw_name == "DateTime":
+		return _from_iso_date(value)
+	elif raw_name.startswith("Vector"):
+		return [_round(raw_name, value[axis]) for axis in ["X", "Y", "Z"] if axis in value]
+	elif raw_name.startswith("CFrame"):
+		return [_round(raw_name, value[name][axis]) for name in ["Position", "Orientation"] for axis in ["X", "Y", "Z"]]
+	elif raw_name in NUMBER_TYPES:
+		return _round(raw_name, value)
+	return value
+
+def _get_nested(data: dict, keys: list[str]) -> Any:
+	value: Any = data
+	for key in keys:
+		if type(value) != dict:
+			return None
+		value = value.get(key)
+	return value
+
+def _set_nested(data: dict, keys: list[str], value: Any) -> None:
+	for key in keys[0:-1]:
+		data = data.setdefault(key, {})
+	data[keys[-1]] = value
+
+def _decode_custom_type(schema: DataSchema, custom_type: CustomType, data: Any) -> dict:
+	codec: CodecMode = schema["config"]["codec"]
+	layout = custom_type["layout"]
+	assert layout
+
+	def get_slot(ordinal: int) -> Any:
+		if codec == "compact":
+			return data[ordinal - 1] if ordinal <= len(data) else None
+		return data.get(str(ordinal))
+
+	# values saved before fields were numbered are keyed by name
+	is_named = codec == "json" and any(not key.isdigit() for key in data)
+
+	out: dict = {}
+	for field in custom_type["fields"]:
+		field_type = field["type"]
+		if is_named:
+			value = decode_value(schema, field_type, _get_nested(data, field["keys"]))
+		elif _get_if_packed(field_type):
+			first_bit, _ = layout["bits"][field["path"]]
+			word = get_slot(layout["words"][first_bit // WORD_BIT_COUNT]) or 0
+			flag = 2**(first_bit % WORD_BIT_COUNT)
+			if field_type["is_optional"]:
+				value = bool(word & flag*2) if word & flag else None
+			else:
+				value = bool(word & flag)
+		else:
+			value = get_slot(layout["fields"][field["path"]])
+			if codec == "compact" and field_type["is_optional"] and value is False:
+				value = None
+			value = decode_value(schema, field_type, value)
+		_set_nested(out, field["keys"], value)
+	return out
+
+def _encode_custom_type(schema: DataSchema, custom_type: CustomType, value: dict) -> Any:
+	codec: CodecMode = schema["config"]["codec"]
+	layout = custom_type["layout"]
+	assert layout
+
+	slots: dict[int, Any] = {}
+	for ordinal in layout["words"]:
+		slots[ordinal] = 0
+
+	for field in custom_type["fields"]:
+		field_type = field["type"]
+		field_value = _get_nested(value, field["keys"])
+		if _get_if_packed(field_type):
+			first_bit, _ = layout["bits"][field["path"]]
+			ordinal = layout["words"][first_bit // WORD_BIT_COUNT]
+			flag = 2**(first_bit % WORD_BIT_COUNT)
+			if field_type["is_optional"]:
+				if field_value is not None:
+					slots[ordinal] += flag + (flag*2 if field_value else 0)
+			elif field_value:
+				slots[ordinal] += flag
+		elif field_value is not None:
+			slots[layout["fields"][field["path"]]] = encode_value(schema, field_type, field_value)
+
+	if codec == "compact":
+		# arrays can't hold nil, so unset and removed fields are saved as false
+		return [slots.get(ordinal, False) for ordinal in range(1, layout["next_ordinal"])]
+	return {str(ordinal): slot for ordinal, slot in sorted(slots.items())}
+
+# the type a leaf's values are encoded with, None when they're saved as is
+def get_leaf_codec_type(schema: DataSchema, leaf: TreeLeaf) -> ParsedType | None:
+	leaf_type = leaf["type"]
+	if leaf_type is not None:
+		if leaf_type["container"] is not None or leaf_type["custom_type"] is not None or leaf_type["enum_name"] is not None:
+			return leaf_type
+	elif type(leaf["value"]) == str and leaf["value"] in schema["types"]:
+		return parse_type(leaf["value"], schema["types"])
+	return None
+
+# enum leaves are saved as their number, while lists and dicts of them are encoded like any other table
+def _get_if_scalar_enum(codec_type: ParsedType) -> bool:
+	return codec_type["container"] is None and codec_type["enum_name"] is not None
+
+def decode_stored_value(schema: DataSchema, leaf: TreeLeaf, stored: Any) -> Any:
+	codec_type = get_leaf_codec_type(schema, leaf)
+	# only tables are encoded, anything else is saved as is
+	if codec_type is None or type(stored) != str or _get_if_scalar_enum(codec_type):
+		return stored
+	if schema["config"]["codec"] == "json":
+		stored = base64.b64decode(stored).decode("utf-8")
+	return decode_value(schema, codec_type, json.loads(stored))
+
+def encode_stored_value(schema: DataSchema, leaf: TreeLeaf, value: Any) -> Any:
+	codec_type = get_leaf_codec_type(schema, leaf)
+	if codec_type is None or value is None or _get_if_scalar_enum(codec_type):
+		return value
+	encoded = encode_value(schema, codec_type, value)
+	if type(encoded) != dict and type(encoded) != list:
+		return encoded
+	text = json.dumps(encoded, separators=(",", ":"))
+	if schema["config"]["codec"] == "json":
+		return base64.b64encode(text.encode("utf-8")).decode("ascii")
+	return text
+
+def read_snapshot(lines: Iterable[str]) -> Iterator[SnapshotEntry]:
+	for line in lines:
+		if line.strip() == "":
+			continue
+		entry: Any = json.loads(line)
+		key = str(entry["key"])
+		if entry["scope"] == DOCUMENT_SCOPE:
+			for scope, value in (entry["value"] or {}).items():
+				yield {"key": key, "scope": scope, "value": value}
+		else:
+			yield {"key": key, "scope": entry["scope"], "value": entry["value"]}
+
+def _get_if_text(schema: DataSchema, leaf: TreeLeaf) -> bool:
+	codec_type = get_leaf_codec_type(schema, leaf)
+	if codec_type is not None:
+		custom_type = schema["types"].get(codec_type["raw_name"])
+		return codec_type["container"] is None and custom_type is not None and custom_type["options"] is not None
+	elif leaf["type"] is not None:
+		return leaf["type"]["raw_name"] == "string"
+	return type(leaf["value"]) == str
+
+def _format_cell(value: Any) -> str:
+	if value is None:
+		return ""
+	elif type(value) == str:
+		return value
+	return json.dumps(value, separators=(",", ":"))
+
+def _parse_cell(schema: DataSchema, leaf: TreeLeaf, text: str) -> Any:
+	if text == "":
+		return None
+	elif _get_if_text(schema, leaf):
+		return text
+	return json.loads(text)
+
+# user ids are compared as numbers, any other key after them as text
+def _get_key_order(key: str) -> tuple[int, int, str]:
+	return (0, int(key), "") if key.isdigit() else (1, 0, key)
+
+# the offsets of the runs of lines with ascending keys, a snapshot sorted by key is one run while leaf storage is usually one per scope
+def _get_snapshot_runs(file: BinaryIO, snapshot_path: str) -> list[tuple[int, int]]:
+	runs: list[tuple[int, int]] = []
+	scopes: set[str] = set()
+	previous_order: tuple[int, int, str] | None = None
+	start = offset = 0
+	for line in file:
+		if line.strip() != b"":
+			entry: Any = json.loads(line)
+			order = _get_key_order(str(entry["key"]))
+			if previous_order is not None and order < previous_order:
+				runs.append((start, offset))
+				start = offset
+			scopes.add(entry["scope"])
+			# each scope may be a run of its own, more than that means the keys aren't sorted
+			assert len(runs) < len(scopes), f"{snapshot_path} isn't sorted, each scope's entries have to be in ascending {KEY_COLUMN} order"
+			previous_order = order
+		offset += len(line)
+	runs.append((start, offset))
+	return runs
+
+def _read_run(file: BinaryIO, start: int, end: int) -> Iterator[SnapshotEntry]:
+	offset = start
+	while offset < end:
+		# runs are read in turns from the same file, so each one seeks back to where it stopped
+		file.seek(offset)
+		line = file.readline()
+		offset += len(line)
+		yield from read_snapshot([line.decode("utf-8")])
+
+# runs are merged by key, so a player's entries arrive together and only the player being written is kept in memory
+def export_snapshot(schema: DataSchema, snapshot_path: str, csv_path: str) -> int:
+	leaves = {leaf["path"]: leaf for leaf in schema["tree"]}
+	row_count = 0
+	with open(snapshot_path, "rb") as snapshot_file, open(csv_path, "w", newline="") as csv_file:
+		writer = csv.writer(csv_file)
+		writer.writerow([KEY_COLUMN] + list(leaves.keys()))
+
+		def write_row(key: str, values: dict[str, Any]):
+			writer.writerow([key] + [_format_cell(values.get(path)) for path in leaves])
+
+		runs = [_read_run(snapshot_file, start, end) for start, end in _get_snapshot_runs(snapshot_file, snapshot_path)]
+		row_key: str | None = None
+		row_values: dict[str, Any] = {}
+		for entry in heapq.merge(*runs, key=lambda entry: _get_key_order(entry["key"])):
+			leaf = leaves.get(entry["scope"])
+			if leaf is None:
+				continue
+			if entry["key"] != row_key:
+				if row_key is not None:
+					write_row(row_key, row_values)
+					row_count += 1
+				row_key, row_values = entry["key"], {}
+			row_values[entry["scope"]] = decode_stored_value(schema, leaf, entry["value"])
+
+		if row_key is not None:
+			write_row(row_key, row_values)
+			row_count += 1
+
+	return row_count
+
+def import_snapshot(schema: DataSchema, csv_path: str, snapshot_path: str) -> int:
+	leaves = {leaf["path"]: leaf for leaf in schema["tree"]}
+	is_document = schema["config"]["storage"] == "document"
+	row_count = 0
+	with open(csv_path, "r", newline="") as csv_file, open(snapshot_path, "w") as snapshot_file:
+		def write_entry(key: str, scope: str, value: Any):
+			snapshot_file.write(json.dumps({"key": key, "scope": scope, "value": value}, separators=(",", ":")) + "\n")
+
+		for row in csv.DictReader(csv_file):
+			key = row[KEY_COLUMN]
+			document: dict[str, Any] = {}
+			for path, text in row.items():
+				leaf = leaves.get(path)
+				if leaf is None:
+					continue
+				value = _parse_cell(schema, leaf, text)
+				if value is None:
+					continue
+				stored = encode_stored_value(schema, leaf, value)
+				if is_document:
+					document[path] = stored
+				else:
+					write_entry(key, path, stored)
+
+			if is_document:
+				write_entry(key, DOCUMENT_SCOPE, document)
+			row_count += 1
+
+	return row_count
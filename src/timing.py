@@ -0,0 +1,61 @@
+import os
+import time
+import pstats
+from contextlib import contextmanager
+from typing import TypedDict
+from src.schema import DataSchema
+from src.cache import CACHE_DIR_PATH, OutputName
+
+PROFILE_PATH = CACHE_DIR_PATH + "/profile.pstats"
+TOP_FUNCTION_COUNT = 15
+
+class BuildReport(TypedDict):
+	phases: dict[str, float] # wall time in seconds, in the order they ran
+	counts: dict[str, int]
+	output_sizes: dict[str, int] # bytes of each generated script, without the packages bundled next to it
+
+def new_report() -> BuildReport:
+	return {
+		"phases": {},
+		"counts": {},
+		"output_sizes": {},
+	}
+
+@contextmanager
+def time_phase(report: BuildReport | None, name: str):
+	start = time.perf_counter()
+	try:
+		yield
+	finally:
+		if report is not None:
+			report["phases"][name] = report["phases"].get(name, 0) + time.perf_counter() - start
+
+def count_schema(report: BuildReport, schema: DataSchema) -> None:
+	report["counts"]["types"] = len(schema["types"])
+	report["counts"]["type fields"] = sum(len(custom_type["fields"]) for custom_type in schema["types"].values())
+	report["counts"]["tree leaves"] = len(schema["tree"])
+	report["counts"]["roblox enums"] = len(schema["enums"])
+
+def measure_outputs(report: BuildReport, script_paths: dict[OutputName, str]) -> None:
+	for output_name, script_path in script_paths.items():
+		report["output_sizes"][output_name] = os.path.getsize(script_path)
+
+def print_report(report: BuildReport, stats: pstats.Stats | None = None) -> None:
+	name_width = max([len(name) for name in list(report["phases"]) + list(report["counts"])] + [0])
+
+	print("phases:")
+	for name, duration in report["phases"].items():
+		print(f"  {name.ljust(name_width)}  {duration*1000:10.1f} ms")
+
+	print("nodes:")
+	for name, count in report["counts"].items():
+		print(f"  {name.ljust(name_width)}  {count:10d}")
+
+	if len(report["output_sizes"]) > 0:
+		print("generated:")
+		for name, size in report["output_sizes"].items():
+			print(f"  {name.ljust(name_width)}  {size:10d} bytes")
+
+	if stats is not None:
+		print(f"slowest functions (full profile in {PROFILE_PATH}):")
+		stats.sort_stats("cumulative").print_stats(TOP_FUNCTION_COUNT)
@@ -48,6 +48,15 @@ def get_package_zip_path() -> str:
 
 	return os.path.join(base_path, "data\\Packages.zip")
 
+# the script luau's write_script creates, scripts bundled with packages go in a directory named by removing the
+# extension, which leaves its trailing dot
+def get_script_path(build_path: str, write_as_directory: bool = False) -> str:
+	if not write_as_directory:
+		return build_path
+	dir_name, file_name = os.path.split(build_path)
+	full_ext = ".".join(build_path.split(".")[1:])
+	return (dir_name+"/"+file_name).replace(full_ext, "") + "/init." + full_ext
+
 def get_if_standard_type(type_name: str) -> bool:
 	# print("TYPE", type_name)
 	untyped_AcceptedType: Any = AcceptedType
@@ -0,0 +1,57 @@
+import os
+import time
+import traceback
+from typing import Callable
+from src.config import CONFIG_PATH, get_config_paths
+
+POLL_INTERVAL = 0.25
+DEBOUNCE_DURATION = 0.5
+
+def get_config_mtime() -> tuple | None:
+	try:
+		paths = get_config_paths()
+	except Exception:
+		# a half written config can't list its includes yet
+		paths = [CONFIG_PATH]
+
+	try:
+		# included fragments being added or removed count as a change too
+		return tuple((path, os.stat(path).st_mtime) for path in paths)
+	except OSError:
+		return None
+
+def watch(on_change: Callable[[], object], poll_interval: float = POLL_INTERVAL, debounce_duration: float = DEBOUNCE_DURATION) -> None:
+	assert os.path.exists(CONFIG_PATH), "datatree is not initialized"
+
+	def rebuild():
+		try:
+			on_change()
+		except KeyboardInterrupt:
+			raise
+		except Exception:
+			# keep watching, the next save will likely fix it
+			traceback.print_exc()
+
+	rebuild()
+	print(f"watching {CONFIG_PATH} for changes, press Ctrl+C to stop")
+
+	last_mtime = get_config_mtime()
+	try:
+		while True:
+			time.sleep(poll_interval)
+			mtime = get_config_mtime()
+			if mtime == last_mtime or mtime == None:
+				continue
+
+			# editors often write a file in several steps, wait for it to settle
+			while True:
+				time.sleep(debounce_duration)
+				settled_mtime = get_config_mtime()
+				if settled_mtime == mtime:
+					break
+				mtime = settled_mtime
+
+			last_mtime = mtime
+			rebuild()
+	except KeyboardInterrupt:
+		return None